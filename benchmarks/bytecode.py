@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Benchmarks for the MLIR bytecode reader and writer of the xDSL implementation."""
+
+from io import BytesIO
+
+from benchmarks.workloads import WorkloadBuilder
+from xdsl.bytecode.reader import read_bytecode
+from xdsl.bytecode.writer import write_bytecode
+from xdsl.context import Context
+from xdsl.dialects.arith import Arith
+from xdsl.dialects.builtin import Builtin, ModuleOp
+from xdsl.dialects.func import Func
+
+CTX = Context(allow_unregistered=True)
+CTX.load_dialect(Arith)
+CTX.load_dialect(Builtin)
+CTX.load_dialect(Func)
+
+
+def _to_bytecode(module: ModuleOp) -> bytes:
+    stream = BytesIO()
+    write_bytecode(module, stream, CTX.loaded_dialects)
+    return stream.getvalue()
+
+
+class Bytecode:
+    """Benchmark reading and writing MLIR bytecode."""
+
+    MODULE_MANY_FUNCTIONS_1000 = WorkloadBuilder.many_functions_module(1000)
+    MODULE_LARGE_DENSE_ATTR = WorkloadBuilder.large_dense_attr_module()
+    BYTECODE_MANY_FUNCTIONS_1000 = _to_bytecode(MODULE_MANY_FUNCTIONS_1000)
+    BYTECODE_LARGE_DENSE_ATTR = _to_bytecode(MODULE_LARGE_DENSE_ATTR)
+
+    def time_write_many_functions_1000(self) -> None:
+        """Time writing a module of 1000 functions."""
+        write_bytecode(
+            Bytecode.MODULE_MANY_FUNCTIONS_1000, BytesIO(), CTX.loaded_dialects
+        )
+
+    def time_write_dense_attr(self) -> None:
+        """Time writing a 1024x1024xi8 dense attribute."""
+        write_bytecode(Bytecode.MODULE_LARGE_DENSE_ATTR, BytesIO(), CTX.loaded_dialects)
+
+    def time_read_many_functions_1000(self) -> None:
+        """Time reading a module of 1000 functions."""
+        read_bytecode(CTX, Bytecode.BYTECODE_MANY_FUNCTIONS_1000)
+
+    def time_read_many_functions_1000_lazy(self) -> None:
+        """Time reading a module of 1000 functions, with lazily read bodies."""
+        read_bytecode(
+            CTX, Bytecode.BYTECODE_MANY_FUNCTIONS_1000, lazy_isolated_regions=True
+        )
+
+    def time_read_dense_attr(self) -> None:
+        """Time reading a 1024x1024xi8 dense attribute."""
+        read_bytecode(CTX, Bytecode.BYTECODE_LARGE_DENSE_ATTR)
+
+
+if __name__ == "__main__":
+    from bench_utils import Benchmark, profile
+
+    BYTECODE = Bytecode()
+    profile(
+        {
+            "Bytecode.write_many_functions_1000": Benchmark(
+                BYTECODE.time_write_many_functions_1000
+            ),
+            "Bytecode.write_dense_attr": Benchmark(BYTECODE.time_write_dense_attr),
+            "Bytecode.read_many_functions_1000": Benchmark(
+                BYTECODE.time_read_many_functions_1000
+            ),
+            "Bytecode.read_many_functions_1000_lazy": Benchmark(
+                BYTECODE.time_read_many_functions_1000_lazy
+            ),
+            "Bytecode.read_dense_attr": Benchmark(BYTECODE.time_read_dense_attr),
+        }
+    )
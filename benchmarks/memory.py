@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Benchmarks for the memory footprint of the xDSL implementation."""
+
+import gc
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from benchmarks.workloads import WorkloadBuilder
+from xdsl.context import Context
+from xdsl.dialects.arith import Arith
+from xdsl.dialects.builtin import Builtin, ModuleOp
+from xdsl.dialects.test import TestOp
+from xdsl.ir import Block
+from xdsl.parser import Parser
+
+CTX = Context(allow_unregistered=True)
+CTX.load_dialect(Arith)
+CTX.load_dialect(Builtin)
+
+NUM_OPS = 1_000
+
+
+def peak_bytes_per_op(build: Callable[[], Any], num_ops: int = NUM_OPS) -> float:
+    """
+    Get the peak memory allocated while running `build`, divided by the number of
+    operations it creates.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak / num_ops
+
+
+class IRMemory:
+    """Benchmark the memory used per operation by xDSL IR."""
+
+    WORKLOAD_CONSTANT = WorkloadBuilder.constant_folding(NUM_OPS - 2)
+
+    def track_bytes_per_empty_op(self) -> float:
+        """Track the peak memory per operation of a block of empty operations."""
+        return peak_bytes_per_op(lambda: Block(TestOp() for _ in range(NUM_OPS)))
+
+    track_bytes_per_empty_op.unit = "bytes"  # pyright: ignore[reportFunctionMemberAccess]
+
+    def track_bytes_per_constant_folding_op(self) -> float:
+        """Track the peak memory per operation of building constant folding IR."""
+        return peak_bytes_per_op(
+            lambda: WorkloadBuilder.constant_folding_module(NUM_OPS - 2)
+        )
+
+    track_bytes_per_constant_folding_op.unit = "bytes"  # pyright: ignore[reportFunctionMemberAccess]
+
+    def track_bytes_per_parsed_op(self) -> float:
+        """Track the peak memory per operation of parsing constant folding IR."""
+        return peak_bytes_per_op(
+            lambda: Parser(CTX, IRMemory.WORKLOAD_CONSTANT).parse_module()
+        )
+
+    track_bytes_per_parsed_op.unit = "bytes"  # pyright: ignore[reportFunctionMemberAccess]
+
+    def track_bytes_per_cloned_op(self) -> float:
+        """Track the peak memory per operation of cloning constant folding IR."""
+        module: ModuleOp = WorkloadBuilder.constant_folding_module(NUM_OPS - 2)
+        return peak_bytes_per_op(module.clone)
+
+    track_bytes_per_cloned_op.unit = "bytes"  # pyright: ignore[reportFunctionMemberAccess]
+
+
+if __name__ == "__main__":
+    from bench_utils import Benchmark, profile
+
+    IR_MEMORY = IRMemory()
+    profile(
+        {
+            "IRMemory.bytes_per_empty_op": Benchmark(
+                IR_MEMORY.track_bytes_per_empty_op
+            ),
+            "IRMemory.bytes_per_constant_folding_op": Benchmark(
+                IR_MEMORY.track_bytes_per_constant_folding_op
+            ),
+            "IRMemory.bytes_per_parsed_op": Benchmark(
+                IR_MEMORY.track_bytes_per_parsed_op
+            ),
+            "IRMemory.bytes_per_cloned_op": Benchmark(
+                IR_MEMORY.track_bytes_per_cloned_op
+            ),
+        }
+    )
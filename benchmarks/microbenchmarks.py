@@ -3,14 +3,18 @@
 
 from __future__ import annotations
 
+from benchmarks.workloads import WorkloadBuilder
 from xdsl.dialects.arith import ConstantOp
 from xdsl.dialects.builtin import IntAttr, IntegerAttr, ModuleOp, i32
-from xdsl.ir import Block, OpResult
+from xdsl.dialects.test import TestOp
+from xdsl.ir import Block, OpResult, Region
 from xdsl.irdl import (
     IRDLOperation,
     irdl_op_definition,
     traits_def,
 )
+from xdsl.irdl.dominance import DominanceInfo, PostDominanceInfo
+from xdsl.pattern_rewriter import OperationTypeIndex
 from xdsl.traits import OpTrait
 
 
@@ -137,6 +141,200 @@ class IRTraversal:
             op  # pyright: ignore[reportUnusedExpression]
 
 
+def get_ordering_block(num_ops: int) -> Block:
+    """Get a block of empty operations for the operation ordering workload."""
+    return Block(ops=[EmptyOp() for _ in range(num_ops)])
+
+
+class OpOrdering:
+    """Benchmark querying the relative order of operations in a block."""
+
+    SMALL_BLOCK = get_ordering_block(100)
+    MEDIUM_BLOCK = get_ordering_block(1_000)
+    LARGE_BLOCK = get_ordering_block(10_000)
+
+    @staticmethod
+    def _is_before_in_block(block: Block) -> None:
+        first_op, last_op = block.first_op, block.last_op
+        assert first_op is not None
+        assert last_op is not None
+        assert first_op.is_before_in_block(last_op)
+
+    @staticmethod
+    def _get_operation_index(block: Block) -> None:
+        last_op = block.last_op
+        assert last_op is not None
+        block.get_operation_index(last_op)
+
+    def time_is_before_in_block_100(self) -> None:
+        """Time comparing the first and last operations of a block of 100 ops."""
+        OpOrdering._is_before_in_block(OpOrdering.SMALL_BLOCK)
+
+    def time_is_before_in_block_1_000(self) -> None:
+        """Time comparing the first and last operations of a block of 1000 ops."""
+        OpOrdering._is_before_in_block(OpOrdering.MEDIUM_BLOCK)
+
+    def time_is_before_in_block_10_000(self) -> None:
+        """Time comparing the first and last operations of a block of 10000 ops."""
+        OpOrdering._is_before_in_block(OpOrdering.LARGE_BLOCK)
+
+    def time_get_operation_index_100(self) -> None:
+        """Time getting the index of the last operation of a block of 100 ops."""
+        OpOrdering._get_operation_index(OpOrdering.SMALL_BLOCK)
+
+    def time_get_operation_index_1_000(self) -> None:
+        """Time getting the index of the last operation of a block of 1000 ops."""
+        OpOrdering._get_operation_index(OpOrdering.MEDIUM_BLOCK)
+
+    def time_get_operation_index_10_000(self) -> None:
+        """Time getting the index of the last operation of a block of 10000 ops."""
+        OpOrdering._get_operation_index(OpOrdering.LARGE_BLOCK)
+
+    def time_insert_and_compare_10_000(self) -> None:
+        """
+        Time inserting an operation in the middle of a block of 10000 ops, then
+        comparing it with the last operation.
+        """
+        block = OpOrdering.LARGE_BLOCK
+        last_op = block.last_op
+        assert last_op is not None
+        new_op = EmptyOp()
+        block.insert_op_before(new_op, last_op)
+        assert new_op.is_before_in_block(last_op)
+        block.detach_op(new_op)
+
+
+class BlockSplice:
+    """Benchmark moving ranges of operations between blocks of 10000 ops."""
+
+    SOURCE = get_ordering_block(10_000)
+    DEST = get_ordering_block(10_000)
+    REGION = Region(get_ordering_block(10_000))
+    MIDDLE_OP = list(REGION.block.ops)[5_000]
+
+    def time_splice_ops_10_000(self) -> None:
+        """Time moving all the operations of a block into another one, and back."""
+        source, dest = BlockSplice.SOURCE, BlockSplice.DEST
+        first_op, last_op = source.first_op, source.last_op
+        assert first_op is not None
+        assert last_op is not None
+        dest_first_op = dest.first_op
+        assert dest_first_op is not None
+        dest.splice_ops(first_op, last_op, dest_first_op)
+        source.splice_ops(first_op, last_op)
+
+    def time_split_block_10_000(self) -> None:
+        """Time splitting a block in the middle, then merging it back."""
+        block = BlockSplice.REGION.block
+        middle_op = BlockSplice.MIDDLE_OP
+        new_block = block.split_before(middle_op)
+        last_op = new_block.last_op
+        assert last_op is not None
+        block.splice_ops(middle_op, last_op)
+        BlockSplice.REGION.detach_block(new_block)
+
+
+def get_used_value(num_uses: int) -> OpResult:
+    """Get a value used twice by each of `num_uses / 2` operations."""
+    value = TestOp(result_types=[i32]).results[0]
+    for _ in range(num_uses // 2):
+        TestOp((value, value))
+    return value
+
+
+class UseQueries:
+    """Benchmark querying the uses of a value with 10000 uses."""
+
+    VALUE = get_used_value(10_000)
+
+    def time_num_uses(self) -> None:
+        """Time getting the number of uses of the value."""
+        UseQueries.VALUE.uses.get_length()
+
+    def time_all_users_are(self) -> None:
+        """Time checking that all the distinct users of the value are test ops."""
+        assert all(isinstance(op, TestOp) for op in UseQueries.VALUE.users())
+
+    def time_unique_user(self) -> None:
+        """Time checking whether all the uses of the value are from one operation."""
+        UseQueries.VALUE.get_unique_user()
+
+
+def get_nested_module(num_outer: int, num_inner: int) -> ModuleOp:
+    """Get a module of operations each holding a region of empty operations."""
+    return ModuleOp(
+        [
+            TestOp(regions=[Region(Block(EmptyOp() for _ in range(num_inner)))])
+            for _ in range(num_outer)
+        ]
+    )
+
+
+class TypedWalk:
+    """Benchmark iterating the operations of a given type in a module of 10000 ops."""
+
+    MODULE = get_nested_module(100, 100)
+    INDEX = OperationTypeIndex(MODULE)
+
+    def time_walk_ops_of_type(self) -> None:
+        """Time iterating the operations of a given type by walking the module."""
+        for _ in TypedWalk.MODULE.walk_ops_of_type(TestOp):
+            pass
+
+    def time_index_walk_ops_of_type(self) -> None:
+        """Time iterating the operations of a given type using an index."""
+        for _ in TypedWalk.INDEX.walk_ops_of_type(TestOp):
+            pass
+
+
+def get_cfg_region(num_blocks: int) -> Region:
+    """
+    Get a region of blocks, each branching to the next one and back to the entry
+    block.
+    """
+    blocks = [Block() for _ in range(num_blocks)]
+    for block, next_block in zip(blocks, blocks[1:]):
+        block.add_op(TestOp.create(successors=(next_block, blocks[0])))
+    return Region(blocks)
+
+
+class Dominance:
+    """Benchmark computing the dominance relation of a region of 1000 blocks."""
+
+    REGION = get_cfg_region(1_000)
+
+    def time_dominance_info(self) -> None:
+        """Time computing the dominance information of the region."""
+        DominanceInfo(Dominance.REGION)
+
+    def time_post_dominance_info(self) -> None:
+        """Time computing the post-dominance information of the region."""
+        PostDominanceInfo(Dominance.REGION)
+
+
+class StructuralHashing:
+    """Benchmark computing the structural hash of a module of 10000 ops."""
+
+    MODULE = get_nested_module(100, 100)
+
+    def time_hash_module(self) -> None:
+        """Time hashing a module with no cached hashes."""
+        for op in StructuralHashing.MODULE.walk():
+            op.invalidate_structural_hash()
+        StructuralHashing.MODULE.structural_hash()
+
+    def time_rehash_module_after_modification(self) -> None:
+        """Time rehashing a module after a single nested operation was modified."""
+        module = StructuralHashing.MODULE
+        module.structural_hash()
+        last_op = module.body.block.last_op
+        assert last_op is not None
+        nested_op = last_op.regions[0].block.first_op
+        assert nested_op is not None
+        nested_op.invalidate_structural_hash()
+        module.structural_hash()
+
+
 class Extensibility:
     """Benchmark the time to check interface and trait properties."""
 
@@ -252,10 +450,20 @@ def get_clone_op() -> ModuleOp:
     return module
 
 
+def get_large_clone_op() -> ModuleOp:
+    """
+    Get a module of about 100000 operations to clone, made of 100 nested constant
+    folding workloads of 1000 operations.
+    """
+    body = WorkloadBuilder.constant_folding_module(998).body
+    return ModuleOp([TestOp(regions=[body.clone()]) for _ in range(100)])
+
+
 class OpCreation:
     """Benchmark creating an operation in xDSL."""
 
     CLONE_OPERATION = get_clone_op()
+    LARGE_CLONE_OPERATION = get_large_clone_op()
     EMPTY_OP = EmptyOp()
 
     def time_operation_create(self) -> None:
@@ -349,6 +557,10 @@ class OpCreation:
         """Time cloning an empty operation."""
         OpCreation.EMPTY_OP.clone()
 
+    def time_operation_clone_100_000(self) -> None:
+        """Time cloning a module of 100000 operations with operands and attributes."""
+        OpCreation.LARGE_CLONE_OPERATION.clone()
+
 
 if __name__ == "__main__":
     from bench_utils import Benchmark, profile
@@ -356,6 +568,12 @@ if __name__ == "__main__":
     EXTENSIBILITY = Extensibility()
     IR_TRAVERSAL = IRTraversal()
     OP_CREATION = OpCreation()
+    OP_ORDERING = OpOrdering()
+    STRUCTURAL_HASHING = StructuralHashing()
+    TYPED_WALK = TypedWalk()
+    DOMINANCE = Dominance()
+    BLOCK_SPLICE = BlockSplice()
+    USE_QUERIES = UseQueries()
     profile(
         {
             "IRTraversal.iterate_ops": Benchmark(IR_TRAVERSAL.time_iterate_ops),
@@ -363,6 +581,50 @@ if __name__ == "__main__":
                 IR_TRAVERSAL.time_iterate_block_ops
             ),
             "IRTraversal.walk_block_ops": Benchmark(IR_TRAVERSAL.time_walk_block_ops),
+            "OpOrdering.is_before_in_block_100": Benchmark(
+                OP_ORDERING.time_is_before_in_block_100
+            ),
+            "OpOrdering.is_before_in_block_1_000": Benchmark(
+                OP_ORDERING.time_is_before_in_block_1_000
+            ),
+            "OpOrdering.is_before_in_block_10_000": Benchmark(
+                OP_ORDERING.time_is_before_in_block_10_000
+            ),
+            "OpOrdering.get_operation_index_100": Benchmark(
+                OP_ORDERING.time_get_operation_index_100
+            ),
+            "OpOrdering.get_operation_index_1_000": Benchmark(
+                OP_ORDERING.time_get_operation_index_1_000
+            ),
+            "OpOrdering.get_operation_index_10_000": Benchmark(
+                OP_ORDERING.time_get_operation_index_10_000
+            ),
+            "OpOrdering.insert_and_compare_10_000": Benchmark(
+                OP_ORDERING.time_insert_and_compare_10_000
+            ),
+            "BlockSplice.splice_ops_10_000": Benchmark(
+                BLOCK_SPLICE.time_splice_ops_10_000
+            ),
+            "BlockSplice.split_block_10_000": Benchmark(
+                BLOCK_SPLICE.time_split_block_10_000
+            ),
+            "UseQueries.num_uses": Benchmark(USE_QUERIES.time_num_uses),
+            "UseQueries.all_users_are": Benchmark(USE_QUERIES.time_all_users_are),
+            "UseQueries.unique_user": Benchmark(USE_QUERIES.time_unique_user),
+            "Dominance.dominance_info": Benchmark(DOMINANCE.time_dominance_info),
+            "Dominance.post_dominance_info": Benchmark(
+                DOMINANCE.time_post_dominance_info
+            ),
+            "TypedWalk.walk_ops_of_type": Benchmark(TYPED_WALK.time_walk_ops_of_type),
+            "TypedWalk.index_walk_ops_of_type": Benchmark(
+                TYPED_WALK.time_index_walk_ops_of_type
+            ),
+            "StructuralHashing.hash_module": Benchmark(
+                STRUCTURAL_HASHING.time_hash_module
+            ),
+            "StructuralHashing.rehash_module_after_modification": Benchmark(
+                STRUCTURAL_HASHING.time_rehash_module_after_modification
+            ),
             "Extensibility.interface_check_trait": Benchmark(
                 EXTENSIBILITY.time_interface_check_trait
             ),
@@ -385,6 +647,9 @@ if __name__ == "__main__":
                 OP_CREATION.time_operation_create_optimised
             ),
             "OpCreation.operation_clone": Benchmark(OP_CREATION.time_operation_clone),
+            "OpCreation.operation_clone_100_000": Benchmark(
+                OP_CREATION.time_operation_clone_100_000
+            ),
             "OpCreation.operation_clone_single": Benchmark(
                 OP_CREATION.time_operation_clone_single
             ),
@@ -6,13 +6,35 @@ from xdsl.context import Context
 from xdsl.dialects.arith import Arith
 from xdsl.dialects.builtin import Builtin
 from xdsl.dialects.func import Func
+from xdsl.irdl import IRDLOperation
+from xdsl.irdl.declarative_assembly_format import FormatProgram
 from xdsl.parser import Parser as XdslParser
+from xdsl.utils.lexer import Input
 
 CTX = Context(allow_unregistered=True)
 CTX.load_dialect(Arith)
 CTX.load_dialect(Builtin)
 CTX.load_dialect(Func)
 
+FORMAT_PROGRAMS = [
+    (op_def, FormatProgram.from_str(op_def.assembly_format, op_def))
+    for op in CTX.loaded_ops
+    if issubclass(op, IRDLOperation)
+    and (op_def := op.get_irdl_definition()).assembly_format is not None
+]
+
+
+def parse_with_interpreted_formats(program: str) -> None:
+    """Parse a program, interpreting the assembly formats instead of compiling them."""
+    compiled = [(op_def, op_def.format_parser) for op_def, _ in FORMAT_PROGRAMS]
+    for op_def, format_program in FORMAT_PROGRAMS:
+        op_def.format_parser = format_program.parse
+    try:
+        XdslParser(CTX, program).parse_module()
+    finally:
+        for op_def, format_parser in compiled:
+            op_def.format_parser = format_parser
+
 
 class Parser:
     """Benchmark the xDSL parser on MLIR files."""
@@ -21,9 +43,16 @@ class Parser:
     WORKLOAD_CONSTANT_1000 = WorkloadBuilder.constant_folding(1000)
     WORKLOAD_LARGE_DENSE_ATTR = WorkloadBuilder.large_dense_attr()
     WORKLOAD_LARGE_DENSE_ATTR_HEX = WorkloadBuilder.large_dense_attr_hex()
+    WORKLOAD_DENSE_ATTR_256 = WorkloadBuilder.large_dense_attr(256, 256)
+    WORKLOAD_DENSE_ATTR_F32_256 = WorkloadBuilder.large_dense_attr_f32(256, 256)
     WORKLOAD_LARGE_CONSTANT_TENSOR = str(
         WorkloadBuilder.large_constant_tensor((500, 500))
     )
+    WORKLOAD_MANY_REGIONS_10000 = WorkloadBuilder.many_regions(10_000)
+    WORKLOAD_MANY_FUNCTIONS_1000 = WorkloadBuilder.many_functions(1000)
+    WORKLOAD_SPLIT_INPUT_FILE_1000 = Input(
+        WorkloadBuilder.split_input_file(1000), "<unknown>"
+    )
 
     def time_constant_100(self) -> None:
         """Time parsing constant folding for 100 items."""
@@ -41,10 +70,45 @@ class Parser:
         """Time parsing a 1024x1024xi8 dense attribute given as a hex string."""
         XdslParser(CTX, Parser.WORKLOAD_LARGE_DENSE_ATTR_HEX).parse_module()
 
+    def time_dense_attr_256(self) -> None:
+        """Time parsing a 256x256xi8 dense attribute."""
+        XdslParser(CTX, Parser.WORKLOAD_DENSE_ATTR_256).parse_module()
+
+    def time_dense_attr_f32_256(self) -> None:
+        """Time parsing a 256x256xf32 dense attribute."""
+        XdslParser(CTX, Parser.WORKLOAD_DENSE_ATTR_F32_256).parse_module()
+
     def time_large_constant_tensor(self) -> None:
         """Time parsing a large constant tensor."""
         XdslParser(CTX, Parser.WORKLOAD_LARGE_CONSTANT_TENSOR).parse_module()
 
+    def time_many_regions_10000(self) -> None:
+        """Time parsing 10000 small regions using values of the enclosing region."""
+        XdslParser(CTX, Parser.WORKLOAD_MANY_REGIONS_10000).parse_module()
+
+    def time_many_functions_1000(self) -> None:
+        """Time parsing a module of 1000 functions."""
+        XdslParser(CTX, Parser.WORKLOAD_MANY_FUNCTIONS_1000).parse_module()
+
+    def time_many_functions_1000_interpreted_format(self) -> None:
+        """Time parsing a module of 1000 functions, interpreting assembly formats."""
+        parse_with_interpreted_formats(Parser.WORKLOAD_MANY_FUNCTIONS_1000)
+
+    def time_constant_1000_interpreted_format(self) -> None:
+        """Time parsing constant folding for 1000 items, interpreting assembly formats."""
+        parse_with_interpreted_formats(Parser.WORKLOAD_CONSTANT_1000)
+
+    def time_many_functions_1000_lazy(self) -> None:
+        """Time parsing a module of 1000 functions, with lazily parsed bodies."""
+        XdslParser(
+            CTX, Parser.WORKLOAD_MANY_FUNCTIONS_1000, lazy_isolated_regions=True
+        ).parse_module()
+
+    def time_split_input_file_1000(self) -> None:
+        """Time parsing the 1000 chunks of a file split into views."""
+        for chunk in Parser.WORKLOAD_SPLIT_INPUT_FILE_1000.split("// -----"):
+            XdslParser(CTX, chunk).parse_module()
+
 
 if __name__ == "__main__":
     from bench_utils import Benchmark, profile
@@ -54,10 +118,26 @@ if __name__ == "__main__":
         {
             "Parser.constant_100": Benchmark(PARSER.time_constant_100),
             "Parser.constant_1000": Benchmark(PARSER.time_constant_1000),
+            "Parser.constant_1000_interpreted_format": Benchmark(
+                PARSER.time_constant_1000_interpreted_format
+            ),
             "Parser.dense_attr": Benchmark(PARSER.ignore_time_dense_attr),
             "Parser.dense_attr_hex": Benchmark(PARSER.ignore_time_dense_attr_hex),
+            "Parser.dense_attr_256": Benchmark(PARSER.time_dense_attr_256),
+            "Parser.dense_attr_f32_256": Benchmark(PARSER.time_dense_attr_f32_256),
             "Parser.large_constant_tensor": Benchmark(
                 PARSER.time_large_constant_tensor
             ),
+            "Parser.split_input_file_1000": Benchmark(
+                PARSER.time_split_input_file_1000
+            ),
+            "Parser.many_regions_10000": Benchmark(PARSER.time_many_regions_10000),
+            "Parser.many_functions_1000": Benchmark(PARSER.time_many_functions_1000),
+            "Parser.many_functions_1000_interpreted_format": Benchmark(
+                PARSER.time_many_functions_1000_interpreted_format
+            ),
+            "Parser.many_functions_1000_lazy": Benchmark(
+                PARSER.time_many_functions_1000_lazy
+            ),
         }
     )
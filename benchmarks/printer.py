@@ -2,9 +2,40 @@
 """Benchmarks for the printer of the xDSL implementation."""
 
 from benchmarks.workloads import WorkloadBuilder
+from xdsl.dialects.arith import Arith
+from xdsl.dialects.builtin import Builtin, ModuleOp
+from xdsl.dialects.func import Func
+from xdsl.irdl import IRDLOperation
+from xdsl.irdl.declarative_assembly_format import FormatProgram
 from xdsl.printer import Printer as XdslPrinter
 
 MODULE_PRINTER = XdslPrinter()
+BUFFERED_MODULE_PRINTER = XdslPrinter(buffered=True)
+PARALLEL_MODULE_PRINTERS = {
+    print_jobs: XdslPrinter(buffered=True, print_jobs=print_jobs)
+    for print_jobs in (2, 4)
+}
+ELIDING_MODULE_PRINTER = XdslPrinter(elide_large_elements_attrs=16)
+
+FORMAT_PROGRAMS = [
+    (op_def, FormatProgram.from_str(op_def.assembly_format, op_def))
+    for dialect in (Arith, Builtin, Func)
+    for op in dialect.operations
+    if issubclass(op, IRDLOperation)
+    and (op_def := op.get_irdl_definition()).assembly_format is not None
+]
+
+
+def print_with_interpreted_formats(module: ModuleOp) -> None:
+    """Print a module, interpreting the assembly formats instead of compiling them."""
+    compiled = [(op_def, op_def.format_printer) for op_def, _ in FORMAT_PROGRAMS]
+    for op_def, format_program in FORMAT_PROGRAMS:
+        op_def.format_printer = format_program.print
+    try:
+        MODULE_PRINTER.print_op(module)
+    finally:
+        for op_def, format_printer in compiled:
+            op_def.format_printer = format_printer
 
 
 class Printer:
@@ -14,6 +45,7 @@ class Printer:
     WORKLOAD_CONSTANT_100 = WorkloadBuilder.constant_folding_module(100)
     WORKLOAD_CONSTANT_1000 = WorkloadBuilder.constant_folding_module(1000)
     WORKLOAD_LARGE_DENSE_ATTR = WorkloadBuilder.large_dense_attr_module()
+    WORKLOAD_MANY_FUNCTIONS_1000 = WorkloadBuilder.many_functions_module(1000)
 
     def time_constant_0(self) -> None:
         """Time printing a constant folded workload."""
@@ -27,10 +59,41 @@ class Printer:
         """Time printing constant folding for 1000 items."""
         MODULE_PRINTER.print_op(Printer.WORKLOAD_CONSTANT_1000)
 
+    def time_constant_1000_interpreted_format(self) -> None:
+        """Time printing constant folding for 1000 items, interpreting assembly formats."""
+        print_with_interpreted_formats(Printer.WORKLOAD_CONSTANT_1000)
+
+    def time_many_functions_1000(self) -> None:
+        """Time printing a module of 1000 functions."""
+        MODULE_PRINTER.print_op(Printer.WORKLOAD_MANY_FUNCTIONS_1000)
+
+    def time_many_functions_1000_buffered(self) -> None:
+        """Time printing a module of 1000 functions, writing the output in chunks."""
+        BUFFERED_MODULE_PRINTER.print_op(Printer.WORKLOAD_MANY_FUNCTIONS_1000)
+        BUFFERED_MODULE_PRINTER.flush()
+
+    def time_many_functions_1000_print_jobs_2(self) -> None:
+        """Time printing a module of 1000 functions in 2 processes."""
+        PARALLEL_MODULE_PRINTERS[2].print_op(Printer.WORKLOAD_MANY_FUNCTIONS_1000)
+        PARALLEL_MODULE_PRINTERS[2].flush()
+
+    def time_many_functions_1000_print_jobs_4(self) -> None:
+        """Time printing a module of 1000 functions in 4 processes."""
+        PARALLEL_MODULE_PRINTERS[4].print_op(Printer.WORKLOAD_MANY_FUNCTIONS_1000)
+        PARALLEL_MODULE_PRINTERS[4].flush()
+
+    def time_many_functions_1000_interpreted_format(self) -> None:
+        """Time printing a module of 1000 functions, interpreting assembly formats."""
+        print_with_interpreted_formats(Printer.WORKLOAD_MANY_FUNCTIONS_1000)
+
     def time_dense_attr(self) -> None:
         """Time printing a 1024x1024xi8 dense attribute given as a hex string."""
         MODULE_PRINTER.print_op(Printer.WORKLOAD_LARGE_DENSE_ATTR)
 
+    def time_dense_attr_elided(self) -> None:
+        """Time printing a 1024x1024xi8 dense attribute elided as a resource."""
+        ELIDING_MODULE_PRINTER.print_op(Printer.WORKLOAD_LARGE_DENSE_ATTR)
+
 
 if __name__ == "__main__":
     from bench_utils import Benchmark, profile
@@ -41,6 +104,23 @@ if __name__ == "__main__":
             "Printer.constant_0": Benchmark(PRINTER.time_constant_0),
             "Printer.constant_100": Benchmark(PRINTER.time_constant_100),
             "Printer.constant_1000": Benchmark(PRINTER.time_constant_1000),
+            "Printer.constant_1000_interpreted_format": Benchmark(
+                PRINTER.time_constant_1000_interpreted_format
+            ),
+            "Printer.many_functions_1000": Benchmark(PRINTER.time_many_functions_1000),
+            "Printer.many_functions_1000_buffered": Benchmark(
+                PRINTER.time_many_functions_1000_buffered
+            ),
+            "Printer.many_functions_1000_print_jobs_2": Benchmark(
+                PRINTER.time_many_functions_1000_print_jobs_2
+            ),
+            "Printer.many_functions_1000_print_jobs_4": Benchmark(
+                PRINTER.time_many_functions_1000_print_jobs_4
+            ),
+            "Printer.many_functions_1000_interpreted_format": Benchmark(
+                PRINTER.time_many_functions_1000_interpreted_format
+            ),
             "Printer.dense_attr": Benchmark(PRINTER.time_dense_attr),
+            "Printer.dense_attr_elided": Benchmark(PRINTER.time_dense_attr_elided),
         }
     )
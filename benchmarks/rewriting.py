@@ -16,7 +16,13 @@ from xdsl.ir import Region
 from xdsl.ir.post_order import PostOrderIterator
 from xdsl.irdl import VarIRConstruct, get_variadic_sizes
 from xdsl.parser import Parser as XdslParser
-from xdsl.pattern_rewriter import PatternRewriter, Worklist
+from xdsl.pattern_rewriter import (
+    GreedyRewritePatternApplier,
+    PatternRewriter,
+    PatternRewriteWalker,
+    Worklist,
+    collect_pattern_statistics,
+)
 from xdsl.rewriter import InsertPoint
 from xdsl.traits import (
     HasCanonicalizationPatternsTrait,
@@ -42,6 +48,12 @@ CTX.load_dialect(Builtin)
 CANONICALIZE_PASS = CanonicalizePass()
 CONSTANT_FOLDING_SIMPLE_PASS = TestConstantFoldingPass()
 CONSTANT_FOLDING_SPECIALISED_PASS = TestSpecialisedConstantFoldingPass()
+ARITH_CANONICALIZATION_PATTERNS = [
+    pattern
+    for op in Arith.operations
+    if (trait := op.get_trait(HasCanonicalizationPatternsTrait)) is not None
+    for pattern in trait.get_canonicalization_patterns()
+]
 
 
 def parse_module(context: Context, contents: str) -> ModuleOp:
@@ -99,6 +111,32 @@ class ConstantFolding:
         """Time canonicalizing constant folding for 1000 items."""
         CANONICALIZE_PASS.apply(CTX, self.workload_constant_1000)
 
+    def time_constant_folding_1000_pattern_statistics(self) -> None:
+        """Time canonicalizing constant folding for 1000 items, with statistics."""
+        with collect_pattern_statistics():
+            CANONICALIZE_PASS.apply(CTX, self.workload_constant_1000)
+
+    def time_arith_patterns_1000(self) -> None:
+        """Time applying all arith canonicalization patterns for 1000 items."""
+        PatternRewriteWalker(
+            GreedyRewritePatternApplier(ARITH_CANONICALIZATION_PATTERNS)
+        ).rewrite_module(self.workload_constant_1000)
+
+    def time_arith_patterns_1000_incremental(self) -> None:
+        """Time applying all arith canonicalization patterns for 1000 items once."""
+        PatternRewriteWalker(
+            GreedyRewritePatternApplier(ARITH_CANONICALIZATION_PATTERNS),
+            incremental=True,
+        ).rewrite_module(self.workload_constant_1000)
+
+    def time_arith_patterns_1000_by_hit_rate(self) -> None:
+        """Time applying arith canonicalization patterns ordered by hit rate."""
+        PatternRewriteWalker(
+            GreedyRewritePatternApplier(
+                ARITH_CANONICALIZATION_PATTERNS, order_by_hit_rate=True
+            )
+        ).rewrite_module(self.workload_constant_1000)
+
 
 class RewritingMicrobenchmarks:
     """Microbenchmarks for rewriting of constant folding."""
@@ -403,6 +441,22 @@ if __name__ == "__main__":
                 CONSTANT_FOLDING.time_constant_folding_1000,
                 CONSTANT_FOLDING.setup_constant_folding_1000,
             ),
+            "ConstantFolding.1000_pattern_statistics": Benchmark(
+                CONSTANT_FOLDING.time_constant_folding_1000_pattern_statistics,
+                CONSTANT_FOLDING.setup_constant_folding_1000,
+            ),
+            "ConstantFolding.arith_patterns_1000": Benchmark(
+                CONSTANT_FOLDING.time_arith_patterns_1000,
+                CONSTANT_FOLDING.setup_constant_folding_1000,
+            ),
+            "ConstantFolding.arith_patterns_1000_incremental": Benchmark(
+                CONSTANT_FOLDING.time_arith_patterns_1000_incremental,
+                CONSTANT_FOLDING.setup_constant_folding_1000,
+            ),
+            "ConstantFolding.arith_patterns_1000_by_hit_rate": Benchmark(
+                CONSTANT_FOLDING.time_arith_patterns_1000_by_hit_rate,
+                CONSTANT_FOLDING.setup_constant_folding_1000,
+            ),
             # ================================================================ #
             "General.region_walk": Benchmark(GENERAL.time_region_walk, GENERAL.setup),
             "General.worklist_push": Benchmark(
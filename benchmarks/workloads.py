@@ -75,6 +75,84 @@ class WorkloadBuilder:
         """Generate a constant folding workload of a given size."""
         return str(cls.constant_folding_module(size=size))
 
+    @classmethod
+    def many_regions(cls, size: int = 10_000) -> str:
+        """Generate a module of operations with small regions using earlier values.
+
+        The output of running the command
+        `print(WorkloadBuilder().many_regions(size=3))` is shown below:
+
+        ```mlir
+        "builtin.module"() ({
+          %0 = "test.op"() : () -> i32
+          %1 = "test.op"() ({
+            "test.op"(%0) : (i32) -> ()
+          }) : () -> i32
+          %2 = "test.op"() ({
+            "test.op"(%1) : (i32) -> ()
+          }) : () -> i32
+          %3 = "test.op"() ({
+            "test.op"(%2) : (i32) -> ()
+          }) : () -> i32
+        }) : () -> ()
+        ```
+        """
+        assert size >= 0
+        ops = ['%0 = "test.op"() : () -> i32']
+        ops.extend(
+            f'%{i} = "test.op"() ({{\n    "test.op"(%{i - 1}) : (i32) -> ()\n  }}) '
+            ": () -> i32"
+            for i in range(1, size + 1)
+        )
+        return cls.wrap_module(ops)
+
+    @classmethod
+    def many_functions_module(
+        cls, num_functions: int = 1000, size: int = 20
+    ) -> ModuleOp:
+        """Generate a module of functions, each with a constant folding body.
+
+        Args:
+            num_functions: The number of functions in the module.
+            size: The size of the constant folding body of each function.
+
+        Returns:
+            The created module containing the functions.
+        """
+        assert num_functions >= 0
+        assert size >= 0
+        random.seed(RANDOM_SEED)
+        function_type = FunctionType.from_lists(inputs=[], outputs=[i32])
+        funcs: list[Operation] = []
+        for i in range(num_functions):
+            func_op = FuncOp(name=f"f{i}", function_type=function_type)
+            ops: list[Operation] = [
+                ConstantOp(IntegerAttr(random.randint(1, 1000), i32))
+            ]
+            for j in range(1, size + 1):
+                if j % 2 == 0:
+                    ops.append(AddiOp(ops[j - 1], ops[j - 2]))
+                else:
+                    ops.append(ConstantOp(IntegerAttr(random.randint(1, 1000), i32)))
+            ops.append(ReturnOp(ops[(size // 2) * 2]))
+            func_op.body.block.add_ops(ops)
+            funcs.append(func_op)
+        return ModuleOp(funcs)
+
+    @classmethod
+    def many_functions(cls, num_functions: int = 1000, size: int = 20) -> str:
+        """Generate a module of functions, each with a constant folding body."""
+        return str(cls.many_functions_module(num_functions=num_functions, size=size))
+
+    @classmethod
+    def split_input_file(cls, num_chunks: int = 1000, size: int = 20) -> str:
+        """
+        Generate a file of constant folding modules separated by `// -----`, as
+        processed by `xdsl-opt --split-input-file`.
+        """
+        chunk = cls.constant_folding(size)
+        return "\n// -----\n".join(chunk for _ in range(num_chunks))
+
     @classmethod
     def large_dense_attr(cls, x: int = 1024, y: int = 1024) -> str:
         """Get the MLIR text representation of a large dense attr."""
@@ -110,6 +188,41 @@ class WorkloadBuilder:
             ]
         )
 
+    @classmethod
+    def large_dense_attr_f32(cls, x: int = 1024, y: int = 1024) -> str:
+        """Get the MLIR text representation of a large dense attr of floats."""
+        return str(cls.large_dense_attr_f32_module(x=x, y=y))
+
+    @classmethod
+    def large_dense_attr_f32_module(cls, x: int = 1024, y: int = 1024) -> ModuleOp:
+        """Get a module with a large dense attr of random 32-bit floats.
+
+        An example of running
+        `print(WorkloadBuilder().large_dense_attr_f32_module(x=2, y=2))`
+        is as follows:
+
+        ```mlir
+        "builtin.module"() ({
+            %0 = "arith.constant"() <{value = dense<[
+                [0.844421864, 0.757954419], [0.420571595, 0.258916736]
+            ]> : tensor<2x2xf32>}> : () -> tensor<2x2xf32>
+        }) : () -> ()
+        """
+        assert x >= 0
+        assert y >= 0
+        random.seed(RANDOM_SEED)
+        dense_attr = [random.random() for _ in range(x * y)]
+        tensor_type = TensorType(element_type=Float32Type(), shape=[x, y])
+        return ModuleOp(
+            [
+                ConstantOp(
+                    DenseIntOrFPElementsAttr.from_list(
+                        type=tensor_type, data=dense_attr
+                    )
+                )
+            ]
+        )
+
     @classmethod
     def large_dense_attr_hex(cls, x: int = 1024, y: int = 1024) -> str:
         """Get the MLIR hex representation of a large dense attr.
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Benchmarks for the xdsl-opt driver of the xDSL implementation."""
+
+import os
+import tempfile
+
+from benchmarks.workloads import WorkloadBuilder
+from xdsl.xdsl_opt_main import xDSLOptMain
+
+
+class SplitInputFile:
+    """Benchmark `xdsl-opt --split-input-file` on a file of 1000 chunks."""
+
+    WORKLOAD_1000 = WorkloadBuilder.split_input_file(1000)
+
+    input_file: str | None = None
+
+    def setup(self) -> None:
+        """Write the workload to a file."""
+        if self.input_file is not None:
+            return
+        fd, self.input_file = tempfile.mkstemp(suffix=".mlir")
+        with os.fdopen(fd, "w") as f:
+            f.write(SplitInputFile.WORKLOAD_1000)
+
+    def teardown(self) -> None:
+        """Remove the workload file."""
+        if self.input_file is not None:
+            os.remove(self.input_file)
+            self.input_file = None
+
+    def _run(self, jobs: int) -> None:
+        assert self.input_file is not None
+        xDSLOptMain(
+            args=[
+                self.input_file,
+                "--split-input-file",
+                "-p",
+                "canonicalize",
+                "-j",
+                str(jobs),
+                "-o",
+                os.devnull,
+            ]
+        ).run()
+
+    def time_split_input_file_1000(self) -> None:
+        """Time processing 1000 chunks sequentially."""
+        self._run(1)
+
+    def time_split_input_file_1000_jobs_2(self) -> None:
+        """Time processing 1000 chunks in 2 processes."""
+        self._run(2)
+
+    def time_split_input_file_1000_jobs_4(self) -> None:
+        """Time processing 1000 chunks in 4 processes."""
+        self._run(4)
+
+
+if __name__ == "__main__":
+    from bench_utils import Benchmark, profile
+
+    SPLIT_INPUT_FILE = SplitInputFile()
+    profile(
+        {
+            "SplitInputFile.split_input_file_1000": Benchmark(
+                SPLIT_INPUT_FILE.time_split_input_file_1000,
+                SPLIT_INPUT_FILE.setup,
+            ),
+            "SplitInputFile.split_input_file_1000_jobs_2": Benchmark(
+                SPLIT_INPUT_FILE.time_split_input_file_1000_jobs_2,
+                SPLIT_INPUT_FILE.setup,
+            ),
+            "SplitInputFile.split_input_file_1000_jobs_4": Benchmark(
+                SPLIT_INPUT_FILE.time_split_input_file_1000_jobs_4,
+                SPLIT_INPUT_FILE.setup,
+            ),
+        }
+    )
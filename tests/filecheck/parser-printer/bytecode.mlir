@@ -0,0 +1,58 @@
+// RUN: xdsl-opt %s -t mlirbc | xdsl-opt --frontend mlirbc | filecheck %s
+// RUN: xdsl-opt %s -t mlirbc | xdsl-opt --frontend mlirbc --lazy-parsing | filecheck %s
+
+builtin.module {
+  func.func @f(%a : i32, %b : i32) -> i32 {
+    %c = arith.addi %a, %b : i32
+    %d = arith.constant dense<[1.5, 2.5]> : tensor<2xf32>
+    %e = arith.constant dense_resource<blob> : tensor<2xf32>
+    "test.op"() {array = [i1, index], str = "s", sym = @a::@b, map = affine_map<(d0) -> (d0)>} : () -> ()
+    "test.op"() ({
+    ^bb0(%x : i32):
+      "test.termop"() [^bb1] : () -> ()
+    ^bb1:
+      "test.termop"(%x) : (i32) -> ()
+    }) : () -> ()
+    func.return %c : i32
+  }
+  func.func @g(%a : i32, %b : i32) -> i32 {
+    %c = llvm.add %a, %b {overflowFlags = #llvm.overflow<nsw>} : i32
+    func.return %c : i32
+  }
+}
+
+{-#
+  dialect_resources: {
+    builtin: {
+      blob: "0x040000000000803F00000040"
+    }
+  }
+#-}
+
+// CHECK:       builtin.module {
+// CHECK-NEXT:    func.func @f(%0 : i32, %1 : i32) -> i32 {
+// CHECK-NEXT:      %2 = arith.addi %0, %1 : i32
+// CHECK-NEXT:      %3 = arith.constant dense<[1.500000e+00, 2.500000e+00]> : tensor<2xf32>
+// CHECK-NEXT:      %4 = arith.constant dense_resource<blob> : tensor<2xf32>
+// CHECK-NEXT:      "test.op"() {array = [i1, index], str = "s", sym = @a::@b, map = affine_map<(d0) -> (d0)>} : () -> ()
+// CHECK-NEXT:      "test.op"() ({
+// CHECK-NEXT:      ^0(%5 : i32):
+// CHECK-NEXT:        "test.termop"() [^1] : () -> ()
+// CHECK-NEXT:      ^1:
+// CHECK-NEXT:        "test.termop"(%5) : (i32) -> ()
+// CHECK-NEXT:      }) : () -> ()
+// CHECK-NEXT:      func.return %2 : i32
+// CHECK-NEXT:    }
+// CHECK-NEXT:    func.func @g(%0 : i32, %1 : i32) -> i32 {
+// CHECK-NEXT:      %2 = llvm.add %0, %1 {overflowFlags = #llvm.overflow<nsw>} : i32
+// CHECK-NEXT:      func.return %2 : i32
+// CHECK-NEXT:    }
+// CHECK-NEXT:  }
+
+// CHECK:       {-#
+// CHECK-NEXT:    dialect_resources: {
+// CHECK-NEXT:      builtin: {
+// CHECK-NEXT:        blob: "0x040000000000803F00000040"
+// CHECK-NEXT:      }
+// CHECK-NEXT:    }
+// CHECK-NEXT:  #-}
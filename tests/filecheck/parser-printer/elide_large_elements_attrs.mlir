@@ -0,0 +1,18 @@
+// RUN: xdsl-opt %s --elide-large-elements-attrs 2 | filecheck %s
+// RUN: xdsl-opt %s --elide-large-elements-attrs 2 --print-op-generic | filecheck %s --check-prefix=GENERIC
+
+builtin.module {
+  %0 = arith.constant dense<[1, 2, 3]> : tensor<3xi32>
+  %1 = arith.constant dense<[1.0, 2.0]> : tensor<2xf32>
+  %2 = arith.constant dense<5> : tensor<8xi64>
+  "test.op"() {array = array<i32: 1, 2, 3>} : () -> ()
+}
+
+// CHECK:      %0 = arith.constant dense_resource<__elided__> : tensor<3xi32>
+// CHECK-NEXT: %1 = arith.constant dense<[1.000000e+00, 2.000000e+00]> : tensor<2xf32>
+// CHECK-NEXT: %2 = arith.constant dense<5> : tensor<8xi64>
+// CHECK-NEXT: "test.op"() {array = array<i32: 1, 2, 3>} : () -> ()
+
+// GENERIC:      %0 = "arith.constant"() <{value = dense_resource<__elided__> : tensor<3xi32>}> : () -> tensor<3xi32>
+// GENERIC-NEXT: %1 = "arith.constant"() <{value = dense<[1.000000e+00, 2.000000e+00]> : tensor<2xf32>}> : () -> tensor<2xf32>
+// GENERIC-NEXT: %2 = "arith.constant"() <{value = dense<5> : tensor<8xi64>}> : () -> tensor<8xi64>
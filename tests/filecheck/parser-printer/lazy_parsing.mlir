@@ -0,0 +1,23 @@
+// RUN: xdsl-opt --lazy-parsing --disable-verify %s | filecheck %s
+// RUN: xdsl-opt --lazy-parsing %s | filecheck %s --check-prefix=CHECK-VERIFIED
+
+module {
+  func.func @untouched(%arg : i32) -> i32 {
+    %0 = arith.addi %arg,   %arg : i32   // kept in the output
+    return %0 : i32
+  }
+}
+
+// CHECK:      builtin.module {
+// CHECK-NEXT:   func.func @untouched(%arg : i32) -> i32 {
+// CHECK-NEXT:     %0 = arith.addi %arg,   %arg : i32   // kept in the output
+// CHECK-NEXT:     return %0 : i32
+// CHECK-NEXT:   }
+// CHECK-NEXT: }
+
+// CHECK-VERIFIED:      builtin.module {
+// CHECK-VERIFIED-NEXT:   func.func @untouched(%arg : i32) -> i32 {
+// CHECK-VERIFIED-NEXT:     %0 = arith.addi %arg, %arg : i32
+// CHECK-VERIFIED-NEXT:     func.return %0 : i32
+// CHECK-VERIFIED-NEXT:   }
+// CHECK-VERIFIED-NEXT: }
@@ -0,0 +1,72 @@
+// RUN: xdsl-opt %s --split-input-file --print-jobs 2 | filecheck %s
+// RUN: xdsl-opt %s --split-input-file --print-jobs 2 --print-op-generic | xdsl-opt --split-input-file | filecheck %s
+
+builtin.module {
+  func.func @f(%x : i32) -> i32 {
+    %y = arith.addi %x, %x : i32
+    func.return %y : i32
+  }
+  "test.op"() {attr = 0 : i32} : () -> ()
+  func.func @g(%x : i32) -> i32 {
+    %0 = arith.constant dense_resource<blob> : tensor<2xf32>
+    func.return %x : i32
+  }
+}
+
+{-#
+  dialect_resources: {
+    builtin: {
+      blob: "0x040000000000803F00000040"
+    }
+  }
+#-}
+
+// CHECK:      builtin.module {
+// CHECK-NEXT:   func.func @f(%x : i32) -> i32 {
+// CHECK-NEXT:     %y = arith.addi %x, %x : i32
+// CHECK-NEXT:     func.return %y : i32
+// CHECK-NEXT:   }
+// CHECK-NEXT:   "test.op"() {attr = 0 : i32} : () -> ()
+// CHECK-NEXT:   func.func @g(%x : i32) -> i32 {
+// CHECK-NEXT:     %0 = arith.constant dense_resource<blob> : tensor<2xf32>
+// CHECK-NEXT:     func.return %x : i32
+// CHECK-NEXT:   }
+// CHECK-NEXT: }
+
+// CHECK:      {-#
+// CHECK-NEXT:   dialect_resources: {
+// CHECK-NEXT:     builtin: {
+// CHECK-NEXT:       blob: "0x040000000000803F00000040"
+
+// -----
+
+// Isolated operations with operands and results are printed sequentially, so that
+// they do not reuse names
+
+func.func @chained(%0 : !stencil.temp<?xf64>) {
+  %1 = stencil.apply(%2 = %0 : !stencil.temp<?xf64>) -> (!stencil.temp<?xf64>) {
+    %3 = stencil.access %2[0] : !stencil.temp<?xf64>
+    %4 = stencil.store_result %3 : !stencil.result<f64>
+    stencil.return %4 : !stencil.result<f64>
+  }
+  %5 = stencil.apply(%6 = %1 : !stencil.temp<?xf64>) -> (!stencil.temp<?xf64>) {
+    %7 = stencil.access %6[0] : !stencil.temp<?xf64>
+    %8 = stencil.store_result %7 : !stencil.result<f64>
+    stencil.return %8 : !stencil.result<f64>
+  }
+  func.return
+}
+
+// CHECK:        func.func @chained(%0 : !stencil.temp<?xf64>) {
+// CHECK-NEXT:     %1 = stencil.apply(%2 = %0 : !stencil.temp<?xf64>) -> (!stencil.temp<?xf64>) {
+// CHECK-NEXT:       %3 = stencil.access %2[0] : !stencil.temp<?xf64>
+// CHECK-NEXT:       %4 = stencil.store_result %3 : !stencil.result<f64>
+// CHECK-NEXT:       stencil.return %4 : !stencil.result<f64>
+// CHECK-NEXT:     }
+// CHECK-NEXT:     %2 = stencil.apply(%3 = %1 : !stencil.temp<?xf64>) -> (!stencil.temp<?xf64>) {
+// CHECK-NEXT:       %4 = stencil.access %3[0] : !stencil.temp<?xf64>
+// CHECK-NEXT:       %5 = stencil.store_result %4 : !stencil.result<f64>
+// CHECK-NEXT:       stencil.return %5 : !stencil.result<f64>
+// CHECK-NEXT:     }
+// CHECK-NEXT:     func.return
+// CHECK-NEXT:   }
@@ -135,11 +135,9 @@ func.func @different_ops() -> (i32, i32) {
 // CHECK-NEXT:      func.return
 // CHECK-NEXT:    }
 
-// This would be checking that the constant in the second block is cse'd with the first one
-// MLIR has the notion of SSACFG regions (those) and graph regions.
-// This works on SSACFG regions only - at least in MLIR implementation.
-// We do not have this Region Kind disctinction; so everything here works on the pessimistic
-// Graph Rewgion assumption.
+/// Check that operation definitions are propagated down the dominance tree.
+/// Only the blocks reachable from the entry block are simplified, following the
+/// dominance order given by the control flow of the region.
 
 // CHECK-LABEL: @down_propagate()
 func.func @down_propagate() -> i32 {
@@ -157,10 +155,9 @@ func.func @down_propagate() -> i32 {
 // CHECK-NEXT:      %1 = arith.constant true
 // CHECK-NEXT:      cf.cond_br %1, ^0, ^1(%0 : i32)
 // CHECK-NEXT:    ^0:
-// CHECK-NEXT:      %2 = arith.constant 1 : i32
-// CHECK-NEXT:      cf.br ^1(%2 : i32)
-// CHECK-NEXT:    ^1(%3 : i32):
-// CHECK-NEXT:      func.return %3 : i32
+// CHECK-NEXT:      cf.br ^1(%0 : i32)
+// CHECK-NEXT:    ^1(%2 : i32):
+// CHECK-NEXT:      func.return %2 : i32
 // CHECK-NEXT:    }
 
 /// Check that operation definitions are NOT propagated up the dominance tree.
@@ -246,6 +243,37 @@ func.func @up_propagate_region() -> i32 {
 // CHECK-NEXT:      func.return %0 : i32
 // CHECK-NEXT:    }
 
+/// Check that operation definitions are not propagated to sibling blocks in the
+/// dominance tree.
+// CHECK-LABEL: func @sibling_blocks
+func.func @sibling_blocks(%arg0 : i1) -> i32 {
+    cf.cond_br %arg0, ^then, ^else
+  ^then:
+    %46 = arith.constant 1 : i32
+    cf.br ^merge(%46 : i32)
+  ^else:
+    %47 = arith.constant 1 : i32
+    %48 = arith.constant 1 : i32
+    cf.br ^merge(%48 : i32)
+  ^merge(%49 : i32):
+    %50 = arith.constant 1 : i32
+    %51 = arith.addi %49, %50 : i32
+    func.return %51 : i32
+  }
+
+// CHECK:           cf.cond_br %arg0, ^0, ^1
+// CHECK-NEXT:    ^0:
+// CHECK-NEXT:      %0 = arith.constant 1 : i32
+// CHECK-NEXT:      cf.br ^2(%0 : i32)
+// CHECK-NEXT:    ^1:
+// CHECK-NEXT:      %1 = arith.constant 1 : i32
+// CHECK-NEXT:      cf.br ^2(%1 : i32)
+// CHECK-NEXT:    ^2(%2 : i32):
+// CHECK-NEXT:      %3 = arith.constant 1 : i32
+// CHECK-NEXT:      %4 = arith.addi %2, %3 : i32
+// CHECK-NEXT:      func.return %4 : i32
+// CHECK-NEXT:    }
+
 /// This test checks that nested regions that are isolated from above are
 /// properly handled.
 // CHECK-LABEL: @nested_isolated
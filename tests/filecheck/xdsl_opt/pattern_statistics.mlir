@@ -0,0 +1,26 @@
+// RUN: xdsl-opt %s -p canonicalize --pattern-statistics 2>&1 | filecheck %s
+// RUN: xdsl-opt %s -p canonicalize --pattern-statistics json 2>&1 | filecheck %s --check-prefix=JSON
+
+builtin.module {
+  %0 = arith.constant 1 : i32
+  %1 = arith.constant 2 : i32
+  %2 = arith.addi %0, %1 : i32
+  "test.op"(%2) : (i32) -> ()
+}
+
+// CHECK:      Pattern statistics:
+// CHECK-NEXT:   Pattern {{ +}} Attempts  Successes  Time (ms)  Created  Erased
+// CHECK-DAG:    SignlessIntegerBinaryOperationConstantProp {{ +}} 1 {{ +}} 1 {{ +}} {{[0-9.]+}} {{ +}} 1 {{ +}} 1
+// CHECK-DAG:    RemoveUnusedOperations {{ +}} {{[0-9]+}} {{ +}} 2 {{ +}} {{[0-9.]+}} {{ +}} 0 {{ +}} 2
+
+// CHECK:      builtin.module {
+// CHECK-NEXT:   %0 = arith.constant 3 : i32
+// CHECK-NEXT:   "test.op"(%0) : (i32) -> ()
+// CHECK-NEXT: }
+
+// JSON:      "pattern": "xdsl.transforms.canonicalization_patterns.arith.SignlessIntegerBinaryOperationConstantProp",
+// JSON-NEXT: "attempts": 1,
+// JSON-NEXT: "successes": 1,
+// JSON-NEXT: "match_time": {{[0-9.e-]+}},
+// JSON-NEXT: "ops_created": 1,
+// JSON-NEXT: "ops_erased": 1
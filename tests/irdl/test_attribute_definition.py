@@ -4,6 +4,7 @@ Test the definition of attributes and their constraints.
 
 from __future__ import annotations
 
+import pickle
 import re
 from collections.abc import Sequence
 from dataclasses import dataclass
@@ -37,6 +38,7 @@ from xdsl.ir import (
     SpacedOpaqueSyntaxAttribute,
     StrEnum,
     TypedAttribute,
+    get_unique_attribute,
 )
 from xdsl.irdl import (
     AllOf,
@@ -877,6 +879,57 @@ def test_custom_constructor():
     assert OveriddenInitAttr.new([StringData("17")]) == OveriddenInitAttr("17")
 
 
+def test_parametrized_attribute_hash():
+    """Test the equality and cached hash of a ParametrizedAttribute."""
+
+    attr = OveriddenInitAttr(42)
+    assert hash(attr) == hash(OveriddenInitAttr(42))
+    assert attr == OveriddenInitAttr(42)
+    assert attr != OveriddenInitAttr("42")
+    assert attr != IntData(42)
+
+    # The cached hash is not pickled, as string hashes differ between interpreters
+    pickled_attr = pickle.loads(pickle.dumps(attr))
+    assert "_hash" not in pickled_attr.__dict__
+    assert pickled_attr == attr
+
+
+@irdl_attr_definition
+class CustomEqAttr(ParametrizedAttribute):
+    name = "test.custom_eq"
+
+    param: IntData
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, CustomEqAttr)
+
+    def __hash__(self) -> int:
+        return 0
+
+
+def test_parametrized_attribute_custom_eq():
+    """Test that user-defined equality is not overriden."""
+
+    assert CustomEqAttr(IntData(0)) == CustomEqAttr(IntData(1))
+    assert hash(CustomEqAttr(IntData(1))) == 0
+
+
+def test_get_unique_attribute():
+    """Test that types and string attributes are uniqued."""
+
+    assert get_unique_attribute(IntegerType(32)) is get_unique_attribute(
+        IntegerType(32)
+    )
+    assert get_unique_attribute(StringAttr("a")) is get_unique_attribute(
+        StringAttr("a")
+    )
+    assert get_unique_attribute(IntegerType(32)) is not get_unique_attribute(
+        IntegerType(64)
+    )
+    # Attributes that are not types are not uniqued
+    assert get_unique_attribute(IntAttr(1)) is not get_unique_attribute(IntAttr(1))
+
+
 @irdl_attr_definition
 class GenericAttr(Generic[AttributeInvT], ParametrizedAttribute):
     name = "test.generic_attr"
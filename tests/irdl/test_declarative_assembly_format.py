@@ -10,6 +10,7 @@ from typing_extensions import TypeVar
 
 from xdsl.context import Context
 from xdsl.dialects import test
+from xdsl.dialects.arith import Arith
 from xdsl.dialects.builtin import (
     I32,
     I64,
@@ -28,6 +29,9 @@ from xdsl.dialects.builtin import (
     UnitAttr,
     i32,
 )
+from xdsl.dialects.cf import Cf
+from xdsl.dialects.func import Func
+from xdsl.dialects.scf import Scf
 from xdsl.dialects.test import Test, TestType
 from xdsl.ir import (
     Attribute,
@@ -93,6 +97,10 @@ from xdsl.irdl.declarative_assembly_format import (
     VariadicOperandVariable,
     irdl_custom_directive,
 )
+from xdsl.irdl.declarative_assembly_format_compiler import (
+    compile_format_parser,
+    compile_format_printer,
+)
 from xdsl.parser import Parser
 from xdsl.printer import Printer
 from xdsl.utils.exceptions import (
@@ -3944,3 +3952,87 @@ def test_ref_directives():
     ctx.load_op(RefDirectivesOp)
     ctx.load_dialect(Test)
     check_roundtrip("%0 = test.ref_directives %1 i1 i2 i3 i4 {\n} ^0", ctx)
+
+
+################################################################################
+#                             Compiled formats                                 #
+################################################################################
+
+
+@pytest.mark.parametrize(
+    "program",
+    [
+        "%0 = arith.constant 1 : i32\n%1 = arith.addi %0, %0 : i32",
+        "%0 = arith.constant 1 : i32\n%1 = arith.cmpi slt, %0, %0 : i32",
+        '%0 = "test.op"() : () -> i32\nfunc.return %0 : i32',
+        "func.return",
+        '%0 = "test.op"() : () -> i32\n%1 = func.call @f(%0) : (i32) -> i32',
+        '%0 = "test.op"() : () -> i32\n%1, %2 = func.call @f(%0) : (i32) -> (i32, i64)',
+        '%0 = "test.op"() : () -> index\nscf.for %1 = %0 to %0 step %0 {\n}',
+        '%0 = "test.op"() : () -> i1\ncf.cond_br %0, ^0, ^1(%0 : i1)',
+        "test.custom_param %0 | %1 : i32, i32",
+        "%0 = test.ref_directives %1 i1 i2 i3 i4 {\n} ^0",
+    ],
+)
+def test_compiled_format_equivalence(program: str):
+    """Check that compiled formats parse and print as interpreted formats."""
+    ctx = Context()
+    ctx.load_dialect(Arith)
+    ctx.load_dialect(Cf)
+    ctx.load_dialect(Func)
+    ctx.load_dialect(Scf)
+    ctx.load_dialect(Test)
+    ctx.load_op(CustomDirectiveWithParamOp)
+    ctx.load_op(RefDirectivesOp)
+
+    def roundtrip() -> str:
+        parser = Parser(ctx, program)
+        ops: list[Operation] = []
+        while (op := parser.parse_optional_operation()) is not None:
+            ops.append(op)
+        res_io = StringIO()
+        printer = Printer(stream=res_io)
+        for op in ops:
+            printer.print_op(op)
+            printer.print_string("\n")
+        return res_io.getvalue()
+
+    compiled = roundtrip()
+
+    op_defs = [op.get_irdl_definition() for op in ctx.loaded_ops]
+    for op_def in op_defs:
+        if op_def.assembly_format is not None:
+            interpreted = FormatProgram.from_str(op_def.assembly_format, op_def)
+            op_def.format_parser = interpreted.parse
+            op_def.format_printer = interpreted.print
+    try:
+        assert roundtrip() == compiled
+    finally:
+        for op_def in op_defs:
+            op_def.format_parser = None
+            op_def.format_printer = None
+
+
+def test_compiled_format_cached():
+    ctx = Context()
+    ctx.load_dialect(Test)
+    ctx.load_op(CustomDirectiveOp)
+    op_def = CustomDirectiveOp.get_irdl_definition()
+
+    check_roundtrip("test.custom hello", ctx)
+    format_parser = op_def.format_parser
+    format_printer = op_def.format_printer
+    assert format_parser is not None
+    assert format_printer is not None
+
+    check_roundtrip("test.custom hello", ctx)
+    assert op_def.format_parser is format_parser
+    assert op_def.format_printer is format_printer
+
+
+def test_custom_directive_not_compiled():
+    op_def = CustomDirectiveWithParamOp.get_irdl_definition()
+    assert op_def.assembly_format is not None
+    program = FormatProgram.from_str(op_def.assembly_format, op_def)
+    assert compile_format_parser(program, op_def) is None
+    assert compile_format_printer(program, op_def) is None
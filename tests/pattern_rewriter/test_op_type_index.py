@@ -0,0 +1,163 @@
+from xdsl.builder import ImplicitBuilder
+from xdsl.dialects import test
+from xdsl.dialects.arith import AddiOp, ConstantOp
+from xdsl.dialects.builtin import IntegerAttr, ModuleOp, i32
+from xdsl.ir import Block, Operation, Region
+from xdsl.pattern_rewriter import (
+    OperationTypeIndex,
+    PatternRewriter,
+    PatternRewriteWalker,
+    RewritePattern,
+    op_type_rewrite_pattern,
+)
+from xdsl.rewriter import BlockInsertPoint
+
+
+def test_op_type_index_walk():
+    module = ModuleOp([])
+    with ImplicitBuilder(module.body):
+        c0 = ConstantOp(IntegerAttr(0, i32))
+        c1 = ConstantOp(IntegerAttr(1, i32))
+        add = AddiOp(c0, c1)
+        test_op = test.TestOp()
+
+    index = OperationTypeIndex(module)
+    assert list(index.walk_ops_of_type(ConstantOp)) == [c0, c1]
+    assert list(index.walk_ops_of_type(AddiOp)) == [add]
+    assert list(index.walk_ops_of_type(ModuleOp)) == [module]
+    assert set(index.walk_ops_of_type(Operation)) == {module, c0, c1, add, test_op}
+    assert list(index.walk_ops_of_type(test.TestTermOp)) == []
+
+
+class FoldAddPattern(RewritePattern):
+    @op_type_rewrite_pattern
+    def match_and_rewrite(self, op: AddiOp, rewriter: PatternRewriter):
+        lhs = op.lhs.owner
+        rhs = op.rhs.owner
+        assert isinstance(lhs, ConstantOp)
+        assert isinstance(rhs, ConstantOp)
+        lhs_value = lhs.value
+        rhs_value = rhs.value
+        assert isinstance(lhs_value, IntegerAttr)
+        assert isinstance(rhs_value, IntegerAttr)
+        rewriter.replace_matched_op(
+            ConstantOp(IntegerAttr(lhs_value.value.data + rhs_value.value.data, i32))
+        )
+
+
+def test_op_type_index_listener():
+    module = ModuleOp([])
+    with ImplicitBuilder(module.body):
+        c0 = ConstantOp(IntegerAttr(1, i32))
+        c1 = ConstantOp(IntegerAttr(2, i32))
+        AddiOp(c0, c1)
+
+    index = OperationTypeIndex(module)
+    PatternRewriteWalker(
+        FoldAddPattern(), apply_recursively=False, listener=index.listener
+    ).rewrite_module(module)
+
+    assert list(index.walk_ops_of_type(AddiOp)) == []
+    constants = list(index.walk_ops_of_type(ConstantOp))
+    assert constants[:2] == [c0, c1]
+    assert len(constants) == 3
+    assert constants[2].value == IntegerAttr(3, i32)
+    assert set(module.walk_ops_of_type(ConstantOp)) == set(constants)
+
+
+def test_op_type_index_moved_ops():
+    module = ModuleOp([])
+    with ImplicitBuilder(module.body):
+        test_op = test.TestOp()
+
+    index = OperationTypeIndex(module)
+
+    class InlineConstants(RewritePattern):
+        @op_type_rewrite_pattern
+        def match_and_rewrite(self, op: test.TestOp, rewriter: PatternRewriter):
+            # The block is not indexed, as it is not notified to the listener
+            block = Block([ConstantOp(IntegerAttr(0, i32))])
+            rewriter.inline_block_before_matched_op(block)
+
+    PatternRewriteWalker(
+        InlineConstants(), apply_recursively=False, listener=index.listener
+    ).rewrite_module(module)
+
+    constants = list(index.walk_ops_of_type(ConstantOp))
+    assert len(constants) == 1
+    assert constants[0].next_op is test_op
+
+
+def test_op_type_index_ops_moved_out():
+    module = ModuleOp([])
+    with ImplicitBuilder(module.body):
+        outer = test.TestOp(regions=[Region(Block())])
+    with ImplicitBuilder(outer.regions[0].block):
+        ConstantOp(IntegerAttr(0, i32))
+
+    index = OperationTypeIndex(outer)
+
+    class HoistBody(RewritePattern):
+        @op_type_rewrite_pattern
+        def match_and_rewrite(self, op: test.TestOp, rewriter: PatternRewriter):
+            if op.regions and op.regions[0].blocks:
+                rewriter.inline_block_before_matched_op(op.regions[0].block)
+
+    PatternRewriteWalker(
+        HoistBody(), apply_recursively=False, listener=index.listener
+    ).rewrite_module(module)
+
+    # The constant is not nested in the indexed operation anymore
+    assert isinstance(outer.prev_op, ConstantOp)
+    assert list(index.walk_ops_of_type(ConstantOp)) == []
+
+
+def test_op_type_index_nested_in():
+    module = ModuleOp([])
+    with ImplicitBuilder(module.body):
+        outer = test.TestOp(regions=[Region(Block())])
+        c0 = ConstantOp(IntegerAttr(0, i32))
+    with ImplicitBuilder(outer.regions[0].block):
+        c1 = ConstantOp(IntegerAttr(1, i32))
+
+    index = OperationTypeIndex(module)
+    assert list(index.walk_ops_of_type(ConstantOp, nested_in=outer)) == [c1]
+    assert list(index.walk_ops_of_type(ConstantOp, nested_in=c0)) == [c0]
+    assert list(index.walk_ops_of_type(ConstantOp, nested_in=module)) == [c1, c0]
+
+
+def test_op_type_index_detached_ancestor():
+    module = ModuleOp([])
+    with ImplicitBuilder(module.body):
+        outer = test.TestOp(regions=[Region(Block())])
+    with ImplicitBuilder(outer.regions[0].block):
+        ConstantOp(IntegerAttr(0, i32))
+
+    index = OperationTypeIndex(module)
+    # The operations nested in a detached operation are not in the module anymore
+    outer.detach()
+    assert list(index.walk_ops_of_type(ConstantOp)) == []
+
+
+def test_op_type_index_inlined_region():
+    module = ModuleOp([])
+    with ImplicitBuilder(module.body):
+        outer = test.TestOp(regions=[Region()])
+
+    index = OperationTypeIndex(module)
+
+    class InlineRegion(RewritePattern):
+        @op_type_rewrite_pattern
+        def match_and_rewrite(self, op: test.TestOp, rewriter: PatternRewriter):
+            if not op.regions[0].blocks:
+                # The region is not indexed, as it is not notified to the listener
+                region = Region(Block([ConstantOp(IntegerAttr(0, i32))]))
+                rewriter.inline_region(region, BlockInsertPoint.at_end(op.regions[0]))
+
+    PatternRewriteWalker(
+        InlineRegion(), apply_recursively=False, listener=index.listener
+    ).rewrite_module(module)
+
+    constants = list(index.walk_ops_of_type(ConstantOp))
+    assert len(constants) == 1
+    assert constants[0].parent_op() is outer
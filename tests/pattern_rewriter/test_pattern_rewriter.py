@@ -1,5 +1,6 @@
 import re
 from collections.abc import Sequence
+from contextlib import nullcontext
 from io import StringIO
 
 import pytest
@@ -7,7 +8,13 @@ import pytest
 from xdsl.builder import ImplicitBuilder
 from xdsl.context import Context
 from xdsl.dialects import test
-from xdsl.dialects.arith import AddiOp, Arith, ConstantOp, MuliOp
+from xdsl.dialects.arith import (
+    AddiOp,
+    Arith,
+    ConstantOp,
+    MuliOp,
+    SignlessIntegerBinaryOperation,
+)
 from xdsl.dialects.builtin import (
     Builtin,
     IndexType,
@@ -19,7 +26,7 @@ from xdsl.dialects.builtin import (
     i32,
     i64,
 )
-from xdsl.ir import Block, Operation, SSAValue
+from xdsl.ir import Block, Operation, Region, SSAValue
 from xdsl.irdl import BaseAttr
 from xdsl.parser import Parser
 from xdsl.pattern_rewriter import (
@@ -27,14 +34,18 @@ from xdsl.pattern_rewriter import (
     PatternRewriter,
     PatternRewriterListener,
     PatternRewriteWalker,
+    PatternStatistics,
     RewritePattern,
     TypeConversionPattern,
     attr_constr_rewrite_pattern,
     attr_type_rewrite_pattern,
+    collect_pattern_statistics,
+    get_root_op_types,
     op_type_rewrite_pattern,
 )
 from xdsl.printer import Printer
 from xdsl.rewriter import BlockInsertPoint, InsertPoint
+from xdsl.utils.exceptions import PassFailedException
 
 
 def rewrite_and_compare(
@@ -46,7 +57,9 @@ def rewrite_and_compare(
     op_removed: int = 0,
     op_modified: int = 0,
     op_replaced: int = 0,
+    ops_moved: int = 0,
     block_created: int = 0,
+    block_removed: int = 0,
     expect_rewrite: bool = True,
 ):
     ctx = Context(allow_unregistered=True)
@@ -58,7 +71,9 @@ def rewrite_and_compare(
     num_op_removed = 0
     num_op_modified = 0
     num_op_replaced = 0
+    num_ops_moved = 0
     num_block_created = 0
+    num_block_removed = 0
 
     def op_inserted_handler(op: Operation):
         nonlocal num_op_inserted
@@ -76,16 +91,26 @@ def rewrite_and_compare(
         nonlocal num_op_replaced
         num_op_replaced += 1
 
+    def ops_moved_handler(first: Operation, last: Operation, source: Block):
+        nonlocal num_ops_moved
+        num_ops_moved += 1
+
     def block_created_handler(block: Block):
         nonlocal num_block_created
         num_block_created += 1
 
+    def block_removed_handler(block: Block):
+        nonlocal num_block_removed
+        num_block_removed += 1
+
     listener = PatternRewriterListener()
     listener.operation_insertion_handler = [op_inserted_handler]
     listener.operation_removal_handler = [op_removed_handler]
     listener.operation_modification_handler = [op_modified_handler]
     listener.operation_replacement_handler = [op_replaced_handler]
+    listener.operations_move_handler = [ops_moved_handler]
     listener.block_creation_handler = [block_created_handler]
+    listener.block_removal_handler = [block_removed_handler]
 
     parser = Parser(ctx, prog)
     module = parser.parse_module()
@@ -103,7 +128,9 @@ def rewrite_and_compare(
     assert num_op_removed == op_removed
     assert num_op_modified == op_modified
     assert num_op_replaced == op_replaced
+    assert num_ops_moved == ops_moved
     assert num_block_created == block_created
+    assert num_block_removed == block_removed
     assert did_rewrite == expect_rewrite
 
 
@@ -354,6 +381,119 @@ def test_greedy_rewrite_pattern_applier():
     )
 
 
+def test_greedy_rewrite_pattern_applier_dispatch():
+    """Test that GreedyRewritePatternApplier only applies patterns of matching types."""
+
+    applied: list[tuple[str, str]] = []
+
+    class ConstantPattern(RewritePattern):
+        @op_type_rewrite_pattern
+        def match_and_rewrite(self, op: ConstantOp, rewriter: PatternRewriter):
+            applied.append(("constant", op.name))
+
+    class BinaryPattern(RewritePattern):
+        @op_type_rewrite_pattern
+        def match_and_rewrite(
+            self, op: SignlessIntegerBinaryOperation, rewriter: PatternRewriter
+        ):
+            applied.append(("binary", op.name))
+
+    class AnyPattern(RewritePattern):
+        def match_and_rewrite(self, op: Operation, rewriter: PatternRewriter):
+            applied.append(("any", op.name))
+
+    patterns = [ConstantPattern(), AnyPattern(), BinaryPattern()]
+    assert get_root_op_types(patterns[0]) == (ConstantOp,)
+    assert get_root_op_types(patterns[1]) is None
+    assert get_root_op_types(patterns[2]) == (SignlessIntegerBinaryOperation,)
+
+    applier = GreedyRewritePatternApplier(patterns)
+    assert applier.get_patterns_for_op_type(ConstantOp) == tuple(patterns[:2])
+    assert applier.get_patterns_for_op_type(AddiOp) == tuple(patterns[1:])
+    assert applier.get_patterns_for_op_type(test.TestOp) == (patterns[1],)
+
+    const = ConstantOp.from_int_and_width(1, i32)
+    add = AddiOp(const, const)
+    Block([const, add])
+    for op in (const, add):
+        applier.match_and_rewrite(op, PatternRewriter(op))
+    assert applied == [
+        ("constant", "arith.constant"),
+        ("any", "arith.constant"),
+        ("any", "arith.addi"),
+        ("binary", "arith.addi"),
+    ]
+
+
+def test_greedy_rewrite_pattern_applier_benefit():
+    """Test that GreedyRewritePatternApplier applies patterns by decreasing benefit."""
+
+    class Pattern(RewritePattern):
+        def __init__(self, benefit: int):
+            self.benefit = benefit
+
+        def match_and_rewrite(self, op: Operation, rewriter: PatternRewriter):
+            pass
+
+    patterns = [Pattern(1), Pattern(2), Pattern(1), Pattern(3), Pattern(2)]
+    applier = GreedyRewritePatternApplier(patterns)
+    assert applier.get_patterns_for_op_type(test.TestOp) == (
+        patterns[3],
+        patterns[1],
+        patterns[4],
+        patterns[0],
+        patterns[2],
+    )
+
+
+@pytest.mark.parametrize("collect_statistics", [False, True])
+def test_greedy_rewrite_pattern_applier_order_by_hit_rate(collect_statistics: bool):
+    """
+    Test that patterns succeeding more often are tried first, including when
+    pattern statistics are collected.
+    """
+
+    applied: list[str] = []
+
+    class NeverMatch(RewritePattern):
+        def match_and_rewrite(self, op: Operation, rewriter: PatternRewriter):
+            applied.append("never")
+
+    class AlwaysMatch(RewritePattern):
+        def match_and_rewrite(self, op: Operation, rewriter: PatternRewriter):
+            applied.append("always")
+            rewriter.has_done_action = True
+
+    class HighBenefit(NeverMatch):
+        benefit = 2
+
+    applier = GreedyRewritePatternApplier(
+        [NeverMatch(), AlwaysMatch(), HighBenefit()], order_by_hit_rate=True
+    )
+    ops = [test.TestOp() for _ in range(3)]
+    Block(ops)
+    statistics = PatternStatistics()
+    with (
+        collect_pattern_statistics(statistics) if collect_statistics else nullcontext()
+    ):
+        for op in ops:
+            applier.match_and_rewrite(op, PatternRewriter(op))
+    if collect_statistics:
+        assert statistics.statistics[AlwaysMatch].attempts == 3
+        assert statistics.statistics[NeverMatch].attempts == 1
+        assert statistics.statistics[HighBenefit].attempts == 3
+    # Patterns of higher benefit are still tried first
+    assert applied == [
+        "never",
+        "never",
+        "always",
+        "never",
+        "always",
+        "never",
+        "always",
+    ]
+
+
 def test_insert_op_before_matched_op():
     """Test rewrites where operations are inserted before the matched operation."""
 
@@ -819,6 +959,8 @@ def test_inline_block_before_matched_op():
         prog,
         expected,
         PatternRewriteWalker(Rewrite(), apply_recursively=False),
+        ops_moved=1,
+        block_removed=1,
     )
 
 
@@ -869,6 +1011,8 @@ def test_inline_block_before():
         prog,
         expected,
         PatternRewriteWalker(Rewrite(), apply_recursively=False),
+        ops_moved=1,
+        block_removed=1,
     )
 
 
@@ -910,6 +1054,8 @@ def test_inline_block_at_before_when_op_is_matched_op():
         prog,
         expected,
         PatternRewriteWalker(Rewrite(), apply_recursively=False),
+        ops_moved=1,
+        block_removed=1,
     )
 
 
@@ -966,6 +1112,8 @@ def test_inline_block_before_with_args():
         prog,
         expected,
         PatternRewriteWalker(Rewrite(), apply_recursively=False),
+        ops_moved=1,
+        block_removed=1,
     )
 
 
@@ -1017,6 +1165,8 @@ def test_inline_block_after():
         prog,
         expected,
         PatternRewriteWalker(Rewrite(), apply_recursively=False),
+        ops_moved=1,
+        block_removed=1,
     )
 
 
@@ -1070,6 +1220,8 @@ def test_inline_block_after_matched():
         prog,
         expected,
         PatternRewriteWalker(Rewrite(), apply_recursively=False),
+        ops_moved=1,
+        block_removed=1,
     )
 
 
@@ -1122,6 +1274,7 @@ def test_move_region_contents_to_new_regions():
         expected,
         PatternRewriteWalker(Rewrite(), apply_recursively=False),
         op_inserted=1,
+        block_removed=1,
     )
 
 
@@ -1241,6 +1394,8 @@ def test_inline_region_before():
         PatternRewriteWalker(Rewrite(), apply_recursively=False),
         op_inserted=0,
         op_removed=1,
+        block_created=2,
+        block_removed=2,
     )
 
 
@@ -1288,6 +1443,8 @@ def test_inline_region_after():
         PatternRewriteWalker(Rewrite(), apply_recursively=False),
         op_inserted=0,
         op_removed=1,
+        block_created=2,
+        block_removed=2,
     )
 
 
@@ -1338,6 +1495,8 @@ def test_inline_region_at_start():
         PatternRewriteWalker(Rewrite(), apply_recursively=False),
         op_inserted=0,
         op_removed=1,
+        block_created=2,
+        block_removed=2,
     )
 
 
@@ -1388,6 +1547,8 @@ def test_inline_region_at_end():
         PatternRewriteWalker(Rewrite(), apply_recursively=False),
         op_inserted=0,
         op_removed=1,
+        block_created=2,
+        block_removed=2,
     )
 
 
@@ -1885,3 +2046,132 @@ def test_pattern_rewriter_notify_op_modified():
         PatternRewriteWalker(Rewrite(), apply_recursively=True),
         op_modified=3,
     )
+
+
+@pytest.mark.parametrize("incremental, num_calls", [(False, 7), (True, 4)])
+def test_incremental_rewrite(incremental: bool, num_calls: int):
+    """Test that incremental rewriting only revisits notified operations."""
+    ops = [test.TestOp() for _ in range(3)]
+    module = ModuleOp(ops)
+    calls: list[Operation] = []
+
+    class Rewrite(RewritePattern):
+        @op_type_rewrite_pattern
+        def match_and_rewrite(self, op: test.TestOp, rewriter: PatternRewriter):
+            calls.append(op)
+            if op is ops[0] and "modified" not in op.attributes:
+                op.attributes["modified"] = UnitAttr()
+                rewriter.notify_op_modified(op)
+
+    walker = PatternRewriteWalker(Rewrite(), incremental=incremental)
+    assert walker.rewrite_module(module)
+    assert len(calls) == num_calls
+
+
+def test_incremental_rewrite_parent_op():
+    """Test that incremental rewriting revisits the parent of an erased operation."""
+    inner = test.TestOp(attributes={"erase": UnitAttr()})
+    outer = test.TestOp(regions=[Region(Block([inner]))])
+    module = ModuleOp([outer])
+
+    class Rewrite(RewritePattern):
+        @op_type_rewrite_pattern
+        def match_and_rewrite(self, op: test.TestOp, rewriter: PatternRewriter):
+            if "erase" in op.attributes:
+                rewriter.erase_matched_op()
+            elif (
+                op.regions
+                and op.regions[0].block.first_op is None
+                and "empty" not in op.attributes
+            ):
+                op.attributes["empty"] = UnitAttr()
+                rewriter.notify_op_modified(op)
+
+    walker = PatternRewriteWalker(Rewrite(), incremental=True)
+    assert walker.rewrite_module(module)
+    assert "empty" in outer.attributes
+
+
+@pytest.mark.parametrize("incremental", [False, True])
+def test_rewrite_max_iterations(incremental: bool):
+    """Test that rewriting fails if it does not converge in `max_iterations` walks."""
+    num_walks = 0
+
+    def post_walk(region: Region, listener: PatternRewriterListener) -> bool:
+        nonlocal num_walks
+        num_walks += 1
+        return True
+
+    class NoRewrite(RewritePattern):
+        def match_and_rewrite(self, op: Operation, rewriter: PatternRewriter):
+            pass
+
+    walker = PatternRewriteWalker(
+        NoRewrite(),
+        post_walk_func=post_walk,
+        incremental=incremental,
+        max_iterations=3,
+    )
+    with pytest.raises(
+        PassFailedException,
+        match="Pattern rewriting did not converge after 3 iterations",
+    ):
+        walker.rewrite_module(ModuleOp([test.TestOp()]))
+    assert num_walks == 3
+
+
+def test_rewrite_max_num_rewrites():
+    """Test that rewriting fails if it applies more than `max_num_rewrites` rewrites."""
+
+    class ReplaceForever(RewritePattern):
+        @op_type_rewrite_pattern
+        def match_and_rewrite(self, op: test.TestOp, rewriter: PatternRewriter):
+            rewriter.replace_matched_op(test.TestOp())
+
+    walker = PatternRewriteWalker(ReplaceForever(), max_num_rewrites=10)
+    with pytest.raises(
+        PassFailedException,
+        match="Pattern rewriting did not converge after 10 rewrites",
+    ):
+        walker.rewrite_module(ModuleOp([test.TestOp()]))
+
+
+def test_pattern_statistics():
+    """Test that the statistics of patterns are recorded per pattern class."""
+
+    class ReplaceAddi(RewritePattern):
+        @op_type_rewrite_pattern
+        def match_and_rewrite(self, op: AddiOp, rewriter: PatternRewriter):
+            rewriter.replace_matched_op(MuliOp(op.lhs, op.rhs))
+
+    class NoRewrite(RewritePattern):
+        def match_and_rewrite(self, op: Operation, rewriter: PatternRewriter):
+            pass
+
+    def make_walker():
+        return PatternRewriteWalker(
+            GreedyRewritePatternApplier([ReplaceAddi(), NoRewrite()])
+        )
+
+    const = ConstantOp.from_int_and_width(1, i32)
+    module = ModuleOp([const, AddiOp(const, const), AddiOp(const, const)])
+
+    with collect_pattern_statistics() as statistics:
+        make_walker().rewrite_module(module)
+
+    replace_addi = statistics.statistics[ReplaceAddi]
+    assert (replace_addi.attempts, replace_addi.successes) == (2, 2)
+    assert (replace_addi.ops_created, replace_addi.ops_erased) == (2, 2)
+    assert replace_addi.match_time > 0
+    no_rewrite = statistics.statistics[NoRewrite]
+    # The constant and the two multiplications, in each of the two walks
+    assert (no_rewrite.attempts, no_rewrite.successes) == (6, 0)
+
+    text = StringIO()
+    statistics.print_text(text)
+    assert text.getvalue().startswith("Pattern statistics:\n  Pattern ")
+    assert "ReplaceAddi" in text.getvalue()
+
+    # Nothing is recorded outside of the context
+    make_walker().rewrite_module(ModuleOp([AddiOp(const, const)]))
+    assert statistics.statistics[ReplaceAddi].attempts == 2
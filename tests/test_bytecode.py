@@ -0,0 +1,262 @@
+from io import BytesIO, StringIO
+
+import pytest
+
+from xdsl.bytecode.encoding import (
+    MAGIC,
+    BytecodeVersion,
+    EncodingReader,
+    EncodingWriter,
+    Section,
+)
+from xdsl.bytecode.reader import read_bytecode, read_bytecode_stream
+from xdsl.bytecode.writer import write_bytecode
+from xdsl.context import Context
+from xdsl.dialects.arith import Arith
+from xdsl.dialects.builtin import Builtin, ModuleOp
+from xdsl.dialects.cf import Cf
+from xdsl.dialects.func import Func, FuncOp
+from xdsl.dialects.test import Test
+from xdsl.parser import Parser
+from xdsl.printer import Printer
+from xdsl.utils.exceptions import BytecodeError
+
+
+def _ctx() -> Context:
+    ctx = Context(allow_unregistered=True)
+    ctx.load_dialect(Arith)
+    ctx.load_dialect(Builtin)
+    ctx.load_dialect(Cf)
+    ctx.load_dialect(Func)
+    ctx.load_dialect(Test)
+    return ctx
+
+
+def _parse(ctx: Context, program: str) -> ModuleOp:
+    """Parse a module, dropping the value names that bytecode does not encode."""
+    module = Parser(ctx, program).parse_module()
+    for op in module.walk():
+        for result in op.results:
+            result.name_hint = None
+        for region in op.regions:
+            for block in region.blocks:
+                for arg in block.args:
+                    arg.name_hint = None
+    return module
+
+
+def _print(module: ModuleOp) -> str:
+    stream = StringIO()
+    Printer(stream, print_generic_format=True).print_op(module)
+    return stream.getvalue()
+
+
+def _write(
+    ctx: Context, module: ModuleOp, version: int = BytecodeVersion.CURRENT
+) -> bytes:
+    stream = BytesIO()
+    write_bytecode(module, stream, ctx.loaded_dialects, version=version)
+    return stream.getvalue()
+
+
+@pytest.mark.parametrize(
+    "value, encoding",
+    [
+        (0, b"\x01"),
+        (1, b"\x03"),
+        (127, b"\xff"),
+        (128, b"\x02\x02"),
+        (2**56 - 1, b"\x80" + b"\xff" * 7),
+        (2**56, b"\x00" + (2**56).to_bytes(8, "little")),
+        (2**64 - 1, b"\x00" + b"\xff" * 8),
+    ],
+)
+def test_varint(value: int, encoding: bytes):
+    writer = EncodingWriter()
+    writer.write_varint(value)
+    assert bytes(writer.data) == encoding
+
+    reader = EncodingReader(encoding)
+    assert reader.read_varint() == value
+    assert reader.empty()
+
+
+@pytest.mark.parametrize("value", [0, 1, -1, 63, -64, 2**63 - 1, -(2**63)])
+def test_signed_varint(value: int):
+    writer = EncodingWriter()
+    writer.write_signed_varint(value)
+    reader = EncodingReader(bytes(writer.data))
+    assert reader.read_signed_varint() == value
+    assert reader.empty()
+
+
+def test_section_alignment():
+    contents = EncodingWriter()
+    contents.write_byte(1)
+    contents.align_to(8)
+    contents.write_byte(2)
+
+    writer = EncodingWriter()
+    writer.write_byte(0)
+    writer.write_section(Section.IR, contents)
+    assert writer.required_alignment == 8
+
+    reader = EncodingReader(bytes(writer.data))
+    assert reader.read_byte() == 0
+    section, section_reader = reader.read_section()
+    assert section == Section.IR
+    assert section_reader.pos % 8 == 0
+    assert section_reader.read_byte() == 1
+    section_reader.align_to(8)
+    assert section_reader.read_byte() == 2
+    assert section_reader.empty()
+
+
+_PROGRAM = """\
+builtin.module {
+  func.func @f(%a : i32, %b : i32) -> i32 {
+    %c = arith.addi %a, %b : i32
+    %t = arith.constant dense<[1.5, 2.5]> : tensor<2xf32>
+    %s = arith.constant dense<7> : tensor<4xi64>
+    "test.op"() {
+      array = [i1, index, f16, f64, none, complex<f32>],
+      dict = {unit, i = 3 : i8, f = 2.0 : f64, big = 123456789012345678901 : i128},
+      str = "a\\nb",
+      sym = @a::@b,
+      flat = @c,
+      dense_array = array<i32: 1, -2, 3>,
+      fn = (i32, tensor<?x3xf32>) -> tensor<*xi8>,
+      memref = memref<2x?xf32, strided<[?, 1]>>,
+      vector = vector<4xf32>,
+      affine = affine_map<(d0) -> (d0 + 1)>
+    } : () -> ()
+    "test.op"() ({
+      ^bb0(%x : i32):
+        "test.op"(%y) : (i32) -> ()
+        %y = "test.op"(%x) : (i32) -> i32
+        "test.termop"() [^bb1] : () -> ()
+      ^bb1:
+        "test.termop"() : () -> ()
+    }) : () -> ()
+    func.return %c : i32
+  }
+  func.func private @g(i32) -> ()
+}
+"""
+
+
+@pytest.mark.parametrize("version", list(BytecodeVersion))
+def test_round_trip(version: BytecodeVersion):
+    ctx = _ctx()
+    module = _parse(ctx, _PROGRAM)
+    bytecode = _write(ctx, module, version)
+    assert bytecode.startswith(MAGIC)
+
+    result = read_bytecode(ctx, bytecode)
+    result.verify()
+    assert _print(result) == _print(module)
+
+
+def test_unregistered_op_properties():
+    ctx = _ctx()
+    program = '"unregistered.op"() <{prop = 1 : i32}> {attr = 2 : i32} : () -> ()'
+    module = _parse(ctx, program)
+
+    result = read_bytecode(ctx, _write(ctx, module))
+    assert _print(result) == _print(module)
+
+    # Properties are only encoded separately since version 5
+    version = BytecodeVersion.NATIVE_PROPERTIES_ENCODING - 1
+    result = read_bytecode(ctx, _write(ctx, module, version))
+    assert '"unregistered.op"() {prop = 1 : i32, attr = 2 : i32}' in _print(result)
+
+
+def test_round_trip_stream():
+    ctx = _ctx()
+    module = _parse(ctx, _PROGRAM)
+    result = read_bytecode_stream(ctx, BytesIO(_write(ctx, module)))
+    assert _print(result) == _print(module)
+
+
+def test_lazy_isolated_regions():
+    ctx = _ctx()
+    module = _parse(ctx, _PROGRAM)
+    result = read_bytecode(ctx, _write(ctx, module), lazy_isolated_regions=True)
+    # Symbol tables are read eagerly
+    assert result.body.lazy_body is None
+
+    func = result.body.block.first_op
+    assert isinstance(func, FuncOp)
+    assert func.body.lazy_body is not None
+
+    # The body is read on first access
+    assert func.body.block.first_op is not None
+    assert func.body.lazy_body is None
+    result.verify()
+    assert _print(result) == _print(module)
+
+
+def test_resources():
+    ctx = _ctx()
+    program = """\
+builtin.module {
+  %0 = arith.constant dense_resource<blob> : tensor<2xf32>
+}
+
+{-#
+  dialect_resources: {
+    builtin: {
+      blob: "0x040000000000803F00000040"
+    }
+  }
+#-}
+"""
+    module = _parse(ctx, program)
+    bytecode = _write(ctx, module)
+    assert bytes.fromhex("0000803F00000040") in bytecode
+
+    result = read_bytecode(ctx, bytecode)
+    assert _print(result) == _print(module)
+    stream = StringIO()
+    printer = Printer(stream)
+    printer.print_op(result)
+    printer.print_metadata(ctx.loaded_dialects)
+    assert "0x040000000000803F00000040" in stream.getvalue()
+
+
+def test_invalid_magic():
+    with pytest.raises(BytecodeError, match="invalid bytecode magic number"):
+        read_bytecode(_ctx(), b"MLIR")
+
+
+def test_unsupported_version():
+    ctx = _ctx()
+    bytecode = bytearray(_write(ctx, ModuleOp([])))
+    bytecode[len(MAGIC)] = (BytecodeVersion.CURRENT + 1) << 1 | 1
+    with pytest.raises(BytecodeError, match="version"):
+        read_bytecode(ctx, bytes(bytecode))
+
+
+def test_unregistered_op():
+    ctx = _ctx()
+    module = Parser(ctx, '"unknown.op"() : () -> ()').parse_module()
+    bytecode = _write(ctx, module)
+    ctx_without_test = Context()
+    ctx_without_test.load_dialect(Builtin)
+    with pytest.raises(BytecodeError, match="unknown.op is not registered"):
+        read_bytecode(ctx_without_test, bytecode)
+
+
+def test_property_attribute_name_clash():
+    ctx = _ctx()
+    module = _parse(ctx, '"test.op"() <{"name" = i32}> {"name" = i64} : () -> ()')
+
+    result = read_bytecode(ctx, _write(ctx, module))
+    assert _print(result) == _print(module)
+
+    # Properties are encoded in the attribute dictionary before version 5
+    version = BytecodeVersion.NATIVE_PROPERTIES_ENCODING - 1
+    with pytest.raises(
+        BytecodeError, match="both a property and an attribute named name"
+    ):
+        _write(ctx, module, version)
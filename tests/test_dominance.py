@@ -1,9 +1,24 @@
+from collections.abc import Callable
+
 import pytest
 
 from xdsl.context import Context
 from xdsl.dialects import get_all_dialects
-from xdsl.irdl.dominance import strictly_dominates
+from xdsl.dialects.test import TestOp
+from xdsl.ir import Block, Operation, Region
+from xdsl.irdl.dominance import (
+    DominanceInfo,
+    DominanceInfoCache,
+    PostDominanceInfo,
+    strictly_dominates,
+)
 from xdsl.parser import Parser
+from xdsl.pattern_rewriter import (
+    PatternRewriter,
+    PatternRewriteWalker,
+    RewritePattern,
+)
+from xdsl.rewriter import BlockInsertPoint, InsertPoint
 
 ctx = Context()
 ctx.register_dialect("test", get_all_dialects()["test"])
@@ -65,3 +80,158 @@ def test_region_strictly_dominates_block(a: int, b: int, expected: bool):
     Test in-region block dominance.
     """
     assert strictly_dominates(blocks[a - 1], blocks[b - 1]) == expected
+
+
+@pytest.mark.parametrize(
+    ("block", "idom"),
+    [(1, None), (2, 1), (3, 2), (4, 2), (5, 2), (6, 2)],
+)
+def test_immediate_dominator(block: int, idom: int | None):
+    dominance = DominanceInfo(op.regions[0])
+    expected = None if idom is None else blocks[idom - 1]
+    assert dominance.immediate_dominator(blocks[block - 1]) is expected
+
+
+def test_dominator_tree_children():
+    dominance = DominanceInfo(op.regions[0])
+    assert dominance.dominator_tree_children(blocks[0]) == [blocks[1]]
+    assert set(dominance.dominator_tree_children(blocks[1])) == {
+        blocks[2],
+        blocks[3],
+        blocks[4],
+        blocks[5],
+    }
+    assert not dominance.dominator_tree_children(blocks[5])
+
+
+@pytest.mark.parametrize(
+    ("block", "ipdom"),
+    [(1, 2), (2, 6), (3, 5), (4, 5), (5, 2), (6, None)],
+)
+def test_immediate_post_dominator(block: int, ipdom: int | None):
+    post_dominance = PostDominanceInfo(op.regions[0])
+    expected = None if ipdom is None else blocks[ipdom - 1]
+    assert post_dominance.immediate_post_dominator(blocks[block - 1]) is expected
+
+
+def test_post_dominates():
+    post_dominance = PostDominanceInfo(op.regions[0])
+    assert post_dominance.post_dominates(blocks[5], blocks[0])
+    assert post_dominance.strictly_post_dominates(blocks[1], blocks[2])
+    assert not post_dominance.post_dominates(blocks[2], blocks[1])
+    assert not post_dominance.strictly_post_dominates(blocks[5], blocks[5])
+
+
+def test_unreachable_block():
+    entry = Block()
+    unreachable = Block()
+    exit_block = Block()
+    entry.add_op(TestOp.create(successors=[exit_block]))
+    unreachable.add_op(TestOp.create(successors=[exit_block]))
+    region = Region([entry, unreachable, exit_block])
+
+    dominance = DominanceInfo(region)
+    assert dominance.is_reachable(entry)
+    assert not dominance.is_reachable(unreachable)
+    assert dominance.dominates(entry, exit_block)
+    assert dominance.dominates(unreachable, unreachable)
+    assert not dominance.dominates(entry, unreachable)
+    assert not dominance.dominates(unreachable, exit_block)
+    assert dominance.immediate_dominator(unreachable) is None
+
+
+class _AddBlockPattern(RewritePattern):
+    def match_and_rewrite(self, op: Operation, rewriter: PatternRewriter, /):
+        if op.regions and len(op.regions[0].blocks) == 1:
+            rewriter.create_block(BlockInsertPoint.at_end(op.regions[0]))
+
+
+def test_dominance_info_cache():
+    outer = TestOp(regions=[Region(Block())])
+    top_region = Region(Block([outer]))
+    region = outer.regions[0]
+    cache = DominanceInfoCache()
+
+    dominance = cache.dominance(region)
+    post_dominance = cache.post_dominance(region)
+    assert cache.dominance(region) is dominance
+    assert cache.post_dominance(region) is post_dominance
+
+    # Creating a block in the region invalidates its dominance information
+    PatternRewriteWalker(
+        _AddBlockPattern(), apply_recursively=False, dominance_info_cache=cache
+    ).rewrite_region(top_region)
+    assert len(region.blocks) == 2
+    assert cache.dominance(region) is not dominance
+    assert cache.post_dominance(region) is not post_dominance
+    assert not cache.dominance(region).is_reachable(region.blocks[1])
+
+    dominance = cache.dominance(region)
+    cache.invalidate(region)
+    assert cache.dominance(region) is not dominance
+
+
+def _erase_block(rewriter: PatternRewriter, op: Operation):
+    rewriter.erase_block(op.regions[0].blocks[1])
+
+
+def _detach_block(rewriter: PatternRewriter, op: Operation):
+    rewriter.detach_block(op.regions[0].blocks[1])
+
+
+def _inline_block(rewriter: PatternRewriter, op: Operation):
+    region = op.regions[0]
+    rewriter.inline_block(region.blocks[1], InsertPoint.at_end(region.blocks[0]))
+
+
+def _inline_region(rewriter: PatternRewriter, op: Operation):
+    assert (dest := op.next_op) is not None
+    rewriter.inline_region(op.regions[0], BlockInsertPoint.at_end(dest.regions[0]))
+
+
+@pytest.mark.parametrize(
+    "remove_block", [_erase_block, _detach_block, _inline_block, _inline_region]
+)
+def test_dominance_info_cache_block_removal(
+    remove_block: Callable[[PatternRewriter, Operation], None],
+):
+    outer = TestOp(regions=[Region([Block([TestOp()]), Block([TestOp()])])])
+    dest = TestOp(regions=[Region(Block())])
+    top_region = Region(Block([outer, dest]))
+    cache = DominanceInfoCache()
+    dominance = cache.dominance(outer.regions[0])
+    dest_dominance = cache.dominance(dest.regions[0])
+
+    class RemoveBlockPattern(RewritePattern):
+        def match_and_rewrite(self, op: Operation, rewriter: PatternRewriter, /):
+            if op is outer:
+                remove_block(rewriter, op)
+
+    # Removing a block from the region invalidates its dominance information
+    PatternRewriteWalker(
+        RemoveBlockPattern(), apply_recursively=False, dominance_info_cache=cache
+    ).rewrite_region(top_region)
+    assert len(outer.regions[0].blocks) < 2
+    assert cache.dominance(outer.regions[0]) is not dominance
+    if remove_block is _inline_region:
+        assert cache.dominance(dest.regions[0]) is not dest_dominance
+
+
+def test_dominance_info_cache_operations_move():
+    first, middle, last = TestOp(), TestOp(), TestOp()
+    region = Region(Block([first, middle, last]))
+    cache = DominanceInfoCache()
+
+    # Moving operations that do not include a terminator keeps the information
+    dominance = cache.dominance(region)
+    cache.handle_operations_move(first, middle, region.block)
+    assert cache.dominance(region) is dominance
+
+    cache.handle_operations_move(middle, last, region.block)
+    assert cache.dominance(region) is not dominance
+
+    # Moving operations out of a block may remove its terminator
+    source_region = Region(Block())
+    dominance = cache.dominance(source_region)
+    cache.handle_operations_move(first, middle, source_region.block)
+    assert cache.dominance(source_region) is not dominance
@@ -273,6 +273,37 @@ def test_op_clone_with_regions():
     assert tuple(name_hints(pd)) == (None, None, None, None)
 
 
+def test_op_clone_with_regions_links_ir():
+    inner0 = test.TestOp.create(result_types=(i32,), attributes={"attr": i64})
+    inner1 = test.TestOp.create(operands=(inner0.results[0],))
+    block = Block([inner0, inner1], arg_types=(i32,))
+    inner2 = test.TestOp.create(operands=(block.args[0], block.args[0]))
+    block.add_op(inner2)
+    outer = test.TestOp.create(regions=[Region(block)])
+
+    cloned = outer.clone()
+    assert cloned.is_structurally_equivalent(outer)
+
+    cloned_block = cloned.regions[0].block
+    assert cloned_block.parent is cloned.regions[0]
+    assert cloned.regions[0].parent is cloned
+    cloned_ops = list(cloned_block.ops)
+    assert len(cloned_ops) == 3
+    assert all(op.parent is cloned_block for op in cloned_ops)
+    assert list(reversed(cloned_block.ops)) == cloned_ops[::-1]
+    assert cloned_ops[0].is_before_in_block(cloned_ops[2])
+    assert cloned_block.get_operation_index(cloned_ops[2]) == 2
+
+    # Uses are recorded on the cloned values only
+    assert [use.operation for use in cloned_ops[0].results[0].uses] == [cloned_ops[1]]
+    assert [use.index for use in cloned_block.args[0].uses] == [1, 0]
+    assert [use.operation for use in inner0.results[0].uses] == [inner1]
+
+    # Attribute dictionaries are not shared
+    cloned_ops[0].attributes["attr"] = i32
+    assert inner0.attributes["attr"] == i64
+
+
 def test_block_branching_to_another_region_wrong():
     """
     Tests that an operation cannot have successors that branch to blocks of
@@ -512,6 +543,91 @@ def test_split_block_args():
     assert arg_types == (i32, i64)
 
 
+def test_splice_ops_other_block():
+    source = Block((test.TestOp(), test.TestOp(), test.TestOp(), test.TestOp()))
+    a, b, c, d = source.ops
+    dest = Block((test.TestOp(), test.TestOp()))
+    x, y = dest.ops
+
+    dest.splice_ops(b, c, y)
+
+    assert list(source.ops) == [a, d]
+    assert list(dest.ops) == [x, b, c, y]
+    assert b.parent is dest
+    assert c.parent is dest
+    assert a.next_op is d
+    assert d.prev_op is a
+    assert x.next_op is b
+    assert y.prev_op is c
+    assert [dest.get_operation_index(op) for op in dest.ops] == [0, 1, 2, 3]
+    assert b.is_before_in_block(y)
+    assert x.is_before_in_block(c)
+
+    dest.splice_ops(a, d)
+
+    assert source.is_empty
+    assert list(dest.ops) == [x, b, c, y, a, d]
+    assert dest.last_op is d
+    assert a.parent is dest
+    assert d.parent is dest
+    assert y.is_before_in_block(a)
+
+
+def test_splice_ops_same_block():
+    block = Block((test.TestOp(), test.TestOp(), test.TestOp(), test.TestOp()))
+    a, b, c, d = block.ops
+
+    block.splice_ops(c, d, a)
+
+    assert list(block.ops) == [c, d, a, b]
+    assert block.first_op is c
+    assert block.last_op is b
+    assert d.is_before_in_block(a)
+    assert not b.is_before_in_block(c)
+
+    block.splice_ops(c, d)
+
+    assert list(block.ops) == [a, b, c, d]
+    assert block.last_op is d
+
+    with pytest.raises(
+        ValueError,
+        match="Can't splice operations into a block contained in the operations.",
+    ):
+        block.splice_ops(b, c, c)
+
+
+def test_invalidated_op_order():
+    block = Block((test.TestOp(), test.TestOp(), test.TestOp()))
+    a, b, c = block.ops
+
+    # Operations linked without being numbered only invalidate the order
+    a._order_index, c._order_index = c._order_index, a._order_index  # pyright: ignore[reportPrivateUsage]
+    block._invalidate_op_order()  # pyright: ignore[reportPrivateUsage]
+
+    assert [block.get_operation_index(op) for op in (a, b, c)] == [0, 1, 2]
+    assert a.is_before_in_block(c)
+
+
+def test_splice_ops_into_nested_block():
+    inner = Block()
+    a = test.TestOp(regions=[Region(inner)])
+    outer = Block((a, test.TestOp()))
+
+    with pytest.raises(
+        ValueError,
+        match="Can't splice operations into a block contained in the operations.",
+    ):
+        inner.splice_ops(a, a)
+
+    with pytest.raises(
+        ValueError, match="Can't splice operations that are not in the same block."
+    ):
+        inner.splice_ops(a, test.TestOp())
+
+    assert outer.first_op is a
+
+
 def test_region_clone_into_circular_blocks():
     """
     Test that cloning a region with circular block dependency works.
@@ -751,6 +867,60 @@ def test_is_structurally_equivalent(args: list[str], expected_result: bool):
     rhs: Operation = parser.parse_op()
 
     assert lhs.is_structurally_equivalent(rhs) == expected_result
+    if expected_result:
+        assert lhs.structural_hash() == rhs.structural_hash()
+
+
+def test_is_structurally_equivalent_result_types():
+    op32 = test.TestOp.create(result_types=[i32])
+    op32prime = test.TestOp.create(result_types=[i32])
+    op64 = test.TestOp.create(result_types=[i64])
+    assert op32.is_structurally_equivalent(op32prime)
+    assert op32.structural_hash() == op32prime.structural_hash()
+    assert not op32.is_structurally_equivalent(op64)
+    assert op32.structural_hash() != op64.structural_hash()
+
+
+def test_structural_hash_invalidation():
+    inner = test.TestOp.create(properties={"prop": i32})
+    outer = test.TestOp.create(regions=[Region(Block([inner]))])
+    outer_hash = outer.structural_hash()
+    assert outer.structural_hash() == outer_hash
+
+    # The cached hash is kept until it is invalidated
+    inner.properties["prop"] = i64
+    assert outer.structural_hash() == outer_hash
+    inner.invalidate_structural_hash()
+    assert outer.structural_hash() != outer_hash
+    assert outer.structural_hash(use_cache=False) == outer.structural_hash()
+
+
+def test_structural_hash_mutation_invalidation():
+    inner = test.TestOp.create(result_types=[i32])
+    outer = test.TestOp.create(regions=[Region(Block([inner]))])
+    block = outer.regions[0].block
+
+    def check_consistent():
+        assert outer.structural_hash() == outer.structural_hash(use_cache=False)
+
+    outer.structural_hash()
+    user = test.TestOp.create(operands=[inner.results[0]])
+    block.add_op(user)
+    check_consistent()
+
+    arg = block.insert_arg(i64, 0)
+    check_consistent()
+    user.operands = [arg]
+    check_consistent()
+    user.operands[0] = inner.results[0]
+    check_consistent()
+    block.insert_arg(i32, 0)
+    check_consistent()
+
+    block.detach_op(inner).erase(safe_erase=False)
+    check_consistent()
+    outer.regions[0].add_block(Block())
+    check_consistent()
 
 
 def test_is_structurally_equivalent_properties():
@@ -1041,6 +1211,52 @@ def test_same_block():
     assert not op1.is_before_in_block(op1)
 
 
+def test_is_before_in_block_after_modifications():
+    ops = [test.TestOp() for _ in range(4)]
+    block = Block(ops)
+
+    # Repeatedly inserting at the same position exhausts the gaps between indices
+    inserted = [test.TestOp() for _ in range(10)]
+    for op in inserted:
+        block.insert_op_before(op, ops[1])
+    block.insert_op_before(first := test.TestOp(), ops[0])
+    block.detach_op(ops[2])
+    block.add_op(last := test.TestOp())
+
+    expected = [first, ops[0], *inserted, ops[1], ops[3], last]
+    assert list(block.ops) == expected
+    for i, op in enumerate(expected):
+        assert block.get_operation_index(op) == i
+        for j, other in enumerate(expected):
+            assert op.is_before_in_block(other) == (i < j)
+
+
+def test_is_before_in_block_after_split():
+    ops = [test.TestOp() for _ in range(4)]
+    block = Block(ops)
+    Region(block)
+
+    new_block = block.split_before(ops[2])
+    new_block.insert_op_before(new_op := test.TestOp(), ops[3])
+
+    assert ops[0].is_before_in_block(ops[1])
+    assert not ops[1].is_before_in_block(ops[2])
+    assert ops[2].is_before_in_block(new_op)
+    assert new_op.is_before_in_block(ops[3])
+    assert new_block.get_operation_index(ops[3]) == 2
+
+
+def test_ir_has_no_instance_dict():
+    """The IR classes with many instances store their fields in slots."""
+    op = test.TestOp((create_ssa_value(i32),), result_types=(i32,))
+    block = Block([op], arg_types=(i32,))
+    region = Region(block)
+
+    for value in (block, region, op.results[0], block.args[0], op.operands[0]):
+        assert not hasattr(value, "__dict__")
+    assert not hasattr(op._operand_uses[0], "__dict__")  # pyright: ignore[reportPrivateUsage]
+
+
 def test_different_blocks():
     op1 = test.TestOp()
     op2 = test.TestOp()
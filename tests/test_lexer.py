@@ -1,9 +1,14 @@
+from io import StringIO
+from pathlib import Path
+
 import pytest
 
 from xdsl.utils.exceptions import ParseError
-from xdsl.utils.lexer import Input, Position
+from xdsl.utils.lexer import Input, InputStream, Position
 from xdsl.utils.mlir_lexer import MLIRLexer, MLIRToken, MLIRTokenKind
 
+# pyright: reportPrivateUsage=false
+
 
 def get_token(input: str) -> MLIRToken:
     file = Input(input, "<unknown>")
@@ -270,3 +275,77 @@ def test_get_start_of_line(
     input = Input(START_END_LINE_CONTENT, "<>")
     assert input.get_start_of_line(pos) == expected_start
     assert input.get_end_of_line(pos) == expected_end
+
+
+ALL_TOKENS_PROGRAM = """\
+{-# dialect_resources: {} #-}
+%0, %res:2 = "test.op"(%arg) <{p = @sym, q = @"sym 2"}> ({
+^bb0(%x : !test.type<"a\\\\b">):  // comment
+  "test.op"() [^bb1] {a = #attr, b = 0x1F, c = -1.5e3, d = "\\00"} : () -> ()
+}) : (i32, ...) -> (f32, memref<?x*xi32>) | 12 + 3
+  éa
+"""
+
+
+def test_lex_fast_path():
+    tokens: list[tuple[MLIRTokenKind, Position, Position]] = []
+    lexer = MLIRLexer(Input(ALL_TOKENS_PROGRAM, "<unknown>"))
+    while (token := lexer._lex_slow()).kind is not MLIRTokenKind.EOF:
+        tokens.append((token.kind, token.span.start, token.span.end))
+
+    lexer = MLIRLexer(Input(ALL_TOKENS_PROGRAM, "<unknown>"))
+    fast_tokens: list[tuple[MLIRTokenKind, Position, Position]] = []
+    while (token := lexer.lex()).kind is not MLIRTokenKind.EOF:
+        fast_tokens.append((token.kind, token.span.start, token.span.end))
+    assert fast_tokens == tokens
+
+
+def test_input_split_views():
+    input = Input("a\n// -----\nb c\n// -----\n", "<unknown>")
+    views = input.split("// -----")
+    assert [(v.start, v.len) for v in views] == [(0, 2), (10, 15), (23, 24)]
+    assert all(v.content is input.content for v in views)
+
+    lexer = MLIRLexer(views[1])
+    tokens = [lexer.lex() for _ in range(3)]
+    assert [(t.kind, t.span.start, t.span.end) for t in tokens] == [
+        (MLIRTokenKind.BARE_IDENT, 11, 12),
+        (MLIRTokenKind.BARE_IDENT, 13, 14),
+        (MLIRTokenKind.EOF, 15, 15),
+    ]
+
+    token = MLIRLexer(views[1]).lex()
+    assert token.span.get_location() == ("<unknown>", 2, 1)
+    assert token.span.print_with_context() == "<unknown>:2:1\nb c\n^\n"
+
+
+def test_input_view_slow_lexing():
+    input = Input('"a" "b"', "<unknown>")
+    lexer = MLIRLexer(input.view(0, 5))
+    assert lexer._lex_slow().text == '"a"'
+    with pytest.raises(ParseError, match="End of file reached"):
+        lexer._lex_slow()
+
+
+def test_input_from_stream(tmp_path: Path):
+    file = tmp_path / "input.mlir"
+    file.write_bytes("a\r\nb é\n".encode())
+    with open(file) as f:
+        assert Input.from_stream(f, "input").content == "a\nb é\n"
+
+    file.write_bytes(b"")
+    with open(file) as f:
+        assert Input.from_stream(f, "input").content == ""
+
+    assert Input.from_stream(StringIO("a\nb"), "input").content == "a\nb"
+
+
+def test_input_stream():
+    stream = InputStream(Input("a\nbc\nd", "<unknown>").view(2, 6))
+    assert stream.readline() == "bc\n"
+    assert stream.read(1) == "d"
+    assert stream.read() == ""
+    assert list(InputStream(Input("a\nbc\nd", "<unknown>").view(2, 6))) == [
+        "bc\n",
+        "d",
+    ]
@@ -7,9 +7,12 @@ import pytest
 
 from xdsl.context import Context
 from xdsl.dialect_interfaces import OpAsmDialectInterface
+from xdsl.dialects.arith import Arith
 from xdsl.dialects.builtin import (
+    AnyFloat,
     ArrayAttr,
     Builtin,
+    DenseIntOrFPElementsAttr,
     DictionaryAttr,
     FileLineColLoc,
     FloatAttr,
@@ -18,9 +21,14 @@ from xdsl.dialects.builtin import (
     IntegerType,
     StringAttr,
     SymbolRefAttr,
+    TensorType,
     UnknownLoc,
+    f32,
+    f64,
+    i8,
     i32,
 )
+from xdsl.dialects.func import Func, FuncOp
 from xdsl.dialects.test import Test
 from xdsl.ir import Attribute, ParametrizedAttribute
 from xdsl.irdl import (
@@ -33,6 +41,7 @@ from xdsl.irdl import (
 from xdsl.parser import Parser
 from xdsl.printer import Printer
 from xdsl.utils.exceptions import ParseError
+from xdsl.utils.lexer import Input
 from xdsl.utils.mlir_lexer import MLIRTokenKind, PunctuationSpelling
 from xdsl.utils.str_enum import StrEnum
 
@@ -1208,3 +1217,165 @@ def test_parse_identifier_or_str_literal(input: str, expected: str | None):
             parser.parse_identifier_or_str_literal()
     else:
         assert parser.parse_identifier_or_str_literal() == expected
+
+
+@pytest.mark.parametrize(
+    "text, type, values",
+    [
+        ("[1, 2, 3]", TensorType(i32, [3]), [1, 2, 3]),
+        ("[[1, -2], [- 3, 4]]", TensorType(i8, [2, 2]), [1, -2, -3, 4]),
+        ("[[255, 1]]", TensorType(i8, [1, 2]), [-1, 1]),
+        ("[1, 0]", TensorType(IntegerType(1), [2]), [-1, 0]),
+        ("[[[1.5]], [[-2.]], [[3]]]", TensorType(f64, [3, 1, 1]), [1.5, -2.0, 3.0]),
+        ("[-0, -0.0, 1.e2]", TensorType(f32, [3]), [0.0, -0.0, 100.0]),
+        ("[true, false]", TensorType(IntegerType(1), [2]), [-1, 0]),
+        ("[0x10, 2]", TensorType(i32, [2]), [16, 2]),
+    ],
+)
+def test_parse_dense_tensor_literal(
+    text: str, type: TensorType[IntegerType | AnyFloat], values: list[int | float]
+):
+    attr = Parser(Context(), f"dense<{text}> : {type}").parse_attribute()
+    assert attr == DenseIntOrFPElementsAttr.from_list(type, values)
+    assert str(attr.get_values()) == str(tuple(values))  # pyright: ignore
+
+
+@pytest.mark.parametrize(
+    "text, message",
+    [
+        ("dense<[1, 2]> : tensor<3xi32>", "Shape mismatch in dense literal"),
+        ("dense<[[1, 2], [3]]> : tensor<2x2xi32>", "inconsistent ranks"),
+        ("dense<[1 2]> : tensor<2xi32>", "']' expected"),
+        ("dense<[1.5]> : tensor<1xi32>", "Expected integer value"),
+        ("dense<[-1]> : tensor<1xui8>", "Expected non-negative integer values"),
+    ],
+)
+def test_parse_dense_tensor_literal_fail(text: str, message: str):
+    with pytest.raises(ParseError, match=re.escape(message)):
+        Parser(Context(), text).parse_attribute()
+
+
+def test_parse_input_view():
+    input = Input('"test.op"() : () -> ()\n// -----\n"test.op"() : () -> ()', "in")
+    first, second = input.split("// -----")
+    ctx = Context(allow_unregistered=True)
+    assert len(Parser(ctx, first).parse_module().ops) == 1
+    assert len(Parser(ctx, second).parse_module().ops) == 1
+
+    # The input ends within the first operation
+    with pytest.raises(ParseError, match="in:1:21"):
+        Parser(ctx, input.view(0, 20)).parse_module()
+
+
+def test_region_value_scopes():
+    ctx = Context()
+    ctx.load_dialect(Test)
+    program = """\
+%0 = "test.op"() ({
+  %1 = "test.op"() : () -> i32
+  "test.op"(%0, %1) : (i32, i32) -> ()
+}) : () -> i32
+%1 = "test.op"() ({
+  %2 = "test.op"(%0) : (i32) -> i32
+}) : () -> i32
+"""
+    parser = Parser(ctx, program)
+    parser.parse_module()
+    # Values of nested regions are removed with their region
+    assert set(parser.ssa_values) == {"0", "1"}
+    assert parser._ssa_value_scopes == [["0", "1"]]
+
+    with pytest.raises(ParseError, match="values used but not defined"):
+        Parser(
+            ctx,
+            """\
+"test.op"() ({
+  %1 = "test.op"() : () -> i32
+}) : () -> ()
+"test.op"(%1) : (i32) -> ()
+""",
+        ).parse_module()
+
+
+_LAZY_PROGRAM = """\
+builtin.module {
+  func.func @f(%a : i32, %b : i32) -> i32 {
+    %c = arith.addi %a, %b : i32 // a comment with a }
+    %d = "test.op"() {s = "}{"} : () -> i32
+    func.return %c : i32
+  }
+  func.func private @g(i32) -> ()
+}
+"""
+
+
+def _lazy_parsing_ctx() -> Context:
+    ctx = Context()
+    ctx.load_dialect(Arith)
+    ctx.load_dialect(Builtin)
+    ctx.load_dialect(Func)
+    ctx.load_dialect(Test)
+    return ctx
+
+
+def test_lazy_isolated_regions():
+    ctx = _lazy_parsing_ctx()
+    module = Parser(ctx, _LAZY_PROGRAM, lazy_isolated_regions=True).parse_module()
+    # Symbol tables are parsed eagerly
+    assert module.body.lazy_body is None
+
+    func = module.body.block.first_op
+    assert isinstance(func, FuncOp)
+    lazy_body = func.body.lazy_body
+    assert lazy_body is not None
+    # Function arguments are parsed with the function
+    assert lazy_body.entry_block is not None
+    assert [arg.name_hint for arg in lazy_body.entry_block.args] == ["a", "b"]
+
+    # The body is parsed on first access
+    ops = list(func.body.block.ops)
+    assert func.body.lazy_body is None
+    assert [op.name for op in ops] == ["arith.addi", "test.op", "func.return"]
+    assert func.body.block is lazy_body.entry_block
+    assert tuple(ops[0].operands) == func.args
+    module.verify()
+
+    eager_module = Parser(ctx, _LAZY_PROGRAM).parse_module()
+    assert module.is_structurally_equivalent(eager_module)
+    assert str(module) == str(eager_module)
+
+
+def test_lazy_isolated_regions_print_source():
+    ctx = _lazy_parsing_ctx()
+    module = Parser(ctx, _LAZY_PROGRAM, lazy_isolated_regions=True).parse_module()
+    func = module.body.block.first_op
+    assert isinstance(func, FuncOp)
+
+    # Bodies that were not parsed are printed from their source
+    printed = str(module)
+    assert "// a comment with a }" in printed
+    assert func.body.lazy_body is not None
+
+    # The source cannot be used if the region is printed differently
+    io = StringIO()
+    Printer(io, print_generic_format=True).print_op(module)
+    assert "// a comment" not in io.getvalue()
+    assert func.body.lazy_body is None
+
+
+def test_lazy_isolated_regions_error():
+    ctx = _lazy_parsing_ctx()
+    program = """\
+func.func @f() {
+  "test.op"(%x) : (i32) -> ()
+  func.return
+}
+"""
+    module = Parser(ctx, program, lazy_isolated_regions=True).parse_module()
+    func = module.body.block.first_op
+    assert isinstance(func, FuncOp)
+
+    with pytest.raises(
+        ParseError, match=re.escape("values used but not defined: [%x]")
+    ):
+        func.body.block
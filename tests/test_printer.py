@@ -12,6 +12,7 @@ from xdsl.dialects.builtin import (
     AnyFloat,
     Builtin,
     ComplexType,
+    DenseIntOrFPElementsAttr,
     FloatAttr,
     FunctionType,
     IndexType,
@@ -20,6 +21,7 @@ from xdsl.dialects.builtin import (
     ModuleOp,
     Signedness,
     SymbolRefAttr,
+    TensorType,
     UnitAttr,
     f32,
     i1,
@@ -1179,3 +1181,68 @@ def assert_print_op(
 
     printer.print_op(operation)
     assert file.getvalue().strip() == expected.strip()
+
+
+@pytest.mark.parametrize("print_generic_format", [False, True])
+def test_print_jobs(print_generic_format: bool):
+    """Test that printing in parallel processes prints as sequentially."""
+    ctx = Context(allow_unregistered=True)
+    ctx.load_dialect(Arith)
+    ctx.load_dialect(Builtin)
+    ctx.load_dialect(Func)
+    program = """\
+builtin.module {
+  func.func @f(%x : i32) -> i32 {
+    %y = arith.addi %x, %x : i32
+    func.return %y : i32
+  }
+  "test.op"() : () -> ()
+  func.func @g(%x : i32) -> i32 {
+    %0 = arith.constant 0 : i32
+    func.return %x : i32
+  }
+  func.func @h() {
+  ^bb0:
+    "test.termop"() [^bb1] : () -> ()
+  ^bb1:
+    func.return
+  }
+}
+"""
+    module = Parser(ctx, program).parse_module()
+
+    outputs: list[str] = []
+    for print_jobs in (1, 2):
+        output = StringIO()
+        printer = Printer(
+            output,
+            print_generic_format=print_generic_format,
+            print_jobs=print_jobs,
+        )
+        printer.print_op(module)
+        outputs.append(output.getvalue())
+
+    assert outputs[0] == outputs[1]
+
+
+@pytest.mark.parametrize(
+    "limit, values, expected",
+    [
+        (None, [1, 2, 3], "dense<[1, 2, 3]> : tensor<3xi32>"),
+        (3, [1, 2, 3], "dense<[1, 2, 3]> : tensor<3xi32>"),
+        (2, [1, 2, 3], "dense_resource<__elided__> : tensor<3xi32>"),
+        (2, [4, 4, 4], "dense<4> : tensor<3xi32>"),
+        (None, list(range(101)), None),
+    ],
+)
+def test_elide_large_elements_attrs(
+    limit: int | None, values: list[int], expected: str | None
+):
+    """Test the printing of large and elided dense elements attributes."""
+    attr = DenseIntOrFPElementsAttr.from_list(TensorType(i32, [len(values)]), values)
+    if expected is None:
+        expected = f'dense<"0x{attr.data.data.hex().upper()}"> : tensor<101xi32>'
+
+    output = StringIO()
+    Printer(output, elide_large_elements_attrs=limit).print_attribute(attr)
+    assert output.getvalue() == expected
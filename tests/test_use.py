@@ -1,5 +1,5 @@
 from xdsl.context import Context
-from xdsl.dialects.builtin import Builtin, ModuleOp
+from xdsl.dialects.builtin import Builtin, ModuleOp, i32
 from xdsl.dialects.test import Test, TestOp
 from xdsl.parser import Parser
 
@@ -69,6 +69,41 @@ def test_uses_methods():
     assert res1.get_user_of_unique_use() == op2
     assert res2.get_user_of_unique_use() is None
 
+    assert res0.uses.get_length() == 2
+    assert len(res1.uses) == 1
+    assert len(res2.uses) == 0
+
+    assert list(res0.users()) == [op1]
+    assert list(res1.users()) == [op2]
+    assert list(res2.users()) == []
+
+    assert res0.get_unique_user() == op1
+    assert res1.get_unique_user() == op2
+    assert res2.get_unique_user() is None
+
+
+def test_uses_count_and_users_after_modification():
+    val = TestOp(result_types=[i32]).results[0]
+    op1 = TestOp((val, val))
+    op2 = TestOp((val,))
+
+    assert len(val.uses) == 3
+    assert set(val.users()) == {op1, op2}
+    assert val.get_unique_user() is None
+
+    op2.operands = ()
+    assert len(val.uses) == 2
+    assert list(val.users()) == [op1]
+    assert val.get_unique_user() == op1
+
+    op1.operands[0] = TestOp(result_types=[i32]).results[0]
+    assert len(val.uses) == 1
+    assert list(val.users()) == [op1]
+
+    op1.operands = ()
+    assert len(val.uses) == 0
+    assert list(val.users()) == []
+
 
 test_prog_blocks = """
 "test.op"() ({
@@ -99,3 +134,8 @@ def test_predecessor():
     assert block2.predecessors() == (block1,)
     assert block3.predecessors() == (block1,)
     assert set(block4.predecessors()) == {block2, block3}
+
+    assert len(block4.uses) == 2
+    assert set(block4.users()) == {block2.last_op, block3.last_op}
+    assert block4.get_unique_user() is None
+    assert block2.get_unique_user() == block1.last_op
@@ -105,3 +105,19 @@ def test_preorder_walk():
         nested_block3,
         outer_block2,
     )
+
+
+def test_walk_ops_of_type():
+    inner = test.TestTermOp()
+    outer = test.TestOp(regions=(Region(Block([test.TestOp(), inner])),))
+    region = outer.regions[0]
+    block = region.block
+
+    assert list(outer.walk_ops_of_type(test.TestTermOp)) == [inner]
+    assert list(outer.walk_ops_of_type(test.TestOp)) == [outer, block.first_op]
+    assert list(outer.walk_ops_of_type(test.TestOp, region_first=True)) == [
+        block.first_op,
+        outer,
+    ]
+    assert list(region.walk_ops_of_type(test.TestOp)) == [block.first_op]
+    assert list(block.walk_ops_of_type(test.TestTermOp, reverse=True)) == [inner]
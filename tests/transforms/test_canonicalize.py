@@ -0,0 +1,23 @@
+from xdsl.dialects import arith, func, test
+from xdsl.transforms.canonicalize import CanonicalizationRewritePattern
+from xdsl.transforms.dead_code_elimination import may_be_trivially_dead
+
+
+def test_canonicalization_patterns_cached():
+    """Test that canonicalization patterns are created once per operation type."""
+    pattern = CanonicalizationRewritePattern()
+
+    addi_patterns = pattern.get_patterns_for_op_type(arith.AddiOp)
+    assert addi_patterns
+    assert pattern.get_patterns_for_op_type(arith.AddiOp) is addi_patterns
+    assert pattern.get_patterns_for_op_type(test.TestOp) == ()
+
+
+def test_may_be_trivially_dead():
+    assert may_be_trivially_dead(arith.AddiOp)
+    # Terminators and symbols are never dead
+    assert not may_be_trivially_dead(func.ReturnOp)
+    assert not may_be_trivially_dead(func.FuncOp)
+    # Operations with unknown effects are never dead
+    assert not may_be_trivially_dead(func.CallOp)
+    assert not may_be_trivially_dead(test.TestOp)
@@ -0,0 +1,76 @@
+import pytest
+
+from xdsl.dialects import test
+from xdsl.dialects.arith import ConstantOp
+from xdsl.dialects.builtin import IntegerAttr, i32
+from xdsl.ir import Block, Region
+from xdsl.irdl import IRDLOperation, irdl_op_definition, region_def, traits_def
+from xdsl.irdl.dominance import DominanceInfoCache
+from xdsl.traits import HasGraphRegions
+from xdsl.transforms.common_subexpression_elimination import KnownOps, cse
+
+
+@irdl_op_definition
+class GraphRegionOp(IRDLOperation):
+    name = "test.graph_region"
+
+    body = region_def()
+
+    traits = traits_def(HasGraphRegions())
+
+
+@irdl_op_definition
+class SSARegionOp(IRDLOperation):
+    name = "test.ssa_region"
+
+    body = region_def()
+
+
+@pytest.mark.parametrize(
+    "op_type, num_constants", [(SSARegionOp, 1), (GraphRegionOp, 2)]
+)
+def test_cse_multi_block_graph_region(
+    op_type: type[GraphRegionOp | SSARegionOp], num_constants: int
+):
+    """Test that blocks of graph regions are not simplified with dominance."""
+    successor_constant = ConstantOp(IntegerAttr(0, i32))
+    successor = Block(
+        [successor_constant, test.TestTermOp(operands=(successor_constant,))]
+    )
+    entry_constant = ConstantOp(IntegerAttr(0, i32))
+    entry = Block(
+        [
+            entry_constant,
+            test.TestTermOp(operands=(entry_constant,), successors=(successor,)),
+        ]
+    )
+    op = op_type.create(regions=[Region([entry, successor])])
+    cache = DominanceInfoCache()
+    cse(op, dominance_info_cache=cache)
+    assert len(list(op.walk_ops_of_type(ConstantOp))) == num_constants
+    # The dominance of SSA CFG regions is taken from the cache
+    assert (op.regions[0] in cache._dominance) is (op_type is SSARegionOp)  # pyright: ignore[reportPrivateUsage]
+
+
+def test_known_ops_scopes():
+    """Test that the changes made in a scope are undone when it is popped."""
+    first = ConstantOp(IntegerAttr(0, i32))
+    second = ConstantOp(IntegerAttr(0, i32))
+    other = ConstantOp(IntegerAttr(1, i32))
+    known_ops = KnownOps()
+    known_ops[first] = first
+
+    known_ops.push_scope()
+    known_ops[second] = second
+    known_ops[other] = other
+    assert known_ops[first] is second
+
+    known_ops.push_scope()
+    known_ops.pop(first)
+    assert first not in known_ops
+    known_ops.pop_scope()
+    assert known_ops[first] is second
+
+    known_ops.pop_scope()
+    assert known_ops[first] is first
+    assert other not in known_ops
@@ -0,0 +1,27 @@
+from xdsl.builder import ImplicitBuilder
+from xdsl.context import Context
+from xdsl.dialects.arith import AddiOp, ConstantOp
+from xdsl.dialects.builtin import IntegerAttr, ModuleOp, i32
+from xdsl.dialects.test import TestOp
+from xdsl.transforms.test_constant_folding import TestSpecialisedConstantFoldingPass
+
+
+def test_specialised_constant_folding_op_order():
+    module = ModuleOp([])
+    block = module.body.block
+    with ImplicitBuilder(block):
+        lhs = ConstantOp(IntegerAttr(1, i32))
+        rhs = ConstantOp(IntegerAttr(2, i32))
+        add = AddiOp(lhs, rhs)
+        TestOp((add.result,))
+
+    # Number the operations densely before the pass
+    assert block.get_operation_index(add) == 2
+
+    TestSpecialisedConstantFoldingPass().apply(Context(), module)
+
+    ops = list(block.ops)
+    assert isinstance(ops[2], ConstantOp)
+    assert ops[2].value == IntegerAttr(3, i32)
+    for index, op in enumerate(ops):
+        assert block.get_operation_index(op) == index
@@ -41,3 +41,19 @@ raw print!
 """
 
     assert output.getvalue() == EXPECTED
+
+
+def test_buffered():
+    output = StringIO()
+    printer = BasePrinter(stream=output, buffered=True)
+    printer.print_string("{")
+    with printer.indented():
+        printer.print_string("\nhello\nhow are you?")
+    printer.print_string("\n}")
+    assert printer._current_line == 3  # pyright: ignore[reportPrivateUsage]
+    assert printer._current_column == 1  # pyright: ignore[reportPrivateUsage]
+
+    # Nothing is written before the printer is flushed
+    assert output.getvalue() == ""
+    printer.flush()
+    assert output.getvalue() == "{\n  hello\n  how are you?\n}"
@@ -1,8 +1,15 @@
 from collections.abc import Iterable
 
 from xdsl.builder import ImplicitBuilder
-from xdsl.dialects.builtin import ModuleOp, StringAttr
+from xdsl.dialects.builtin import ModuleOp, StringAttr, i32, i64
 from xdsl.dialects.test import TestOp
+from xdsl.ir import Block, Operation, Region
+from xdsl.pattern_rewriter import (
+    PatternRewriter,
+    PatternRewriteWalker,
+    RewritePattern,
+)
+from xdsl.rewriter import BlockInsertPoint, InsertPoint, Rewriter
 from xdsl.utils.hashable_module import HashableModule
 
 
@@ -31,3 +38,162 @@ def test_hashable_module():
     assert hash(HashableModule(abra0)) == hash(HashableModule(abra1))
 
     assert HashableModule(a0) != HashableModule(abra1)
+
+
+def test_hashable_module_attributes():
+    ab0 = _gen_module("ab")
+    ba0 = _gen_module("ba")
+
+    # Same operation names, different attributes
+    assert HashableModule(ab0) != HashableModule(ba0)
+    assert hash(HashableModule(ab0)) != hash(HashableModule(ba0))
+
+
+def test_hashable_module_operand_wiring():
+    def gen_module(swap: bool):
+        module = ModuleOp([])
+        with ImplicitBuilder(module.body):
+            a = TestOp(result_types=[i32]).res[0]
+            b = TestOp(result_types=[i64]).res[0]
+            TestOp((b, a) if swap else (a, b))
+        return module
+
+    assert hash(HashableModule(gen_module(False))) == hash(
+        HashableModule(gen_module(False))
+    )
+    assert hash(HashableModule(gen_module(False))) != hash(
+        HashableModule(gen_module(True))
+    )
+
+
+class _RenameLabel(RewritePattern):
+    def match_and_rewrite(self, op: Operation, rewriter: PatternRewriter, /):
+        if op.attributes.get("label") == StringAttr("b"):
+            op.attributes["label"] = StringAttr("c")
+            rewriter.notify_op_modified(op)
+
+
+def test_hashable_module_invalidation():
+    module = ModuleOp([])
+    with ImplicitBuilder(module.body):
+        outer = TestOp(regions=[Region(Block())])
+    with ImplicitBuilder(outer.regions[0].block):
+        TestOp(attributes={"label": StringAttr("a")})
+        inner = TestOp(attributes={"label": StringAttr("b")})
+
+    initial_hash = hash(HashableModule(module))
+    module.structural_hash()
+    assert module._structural_hash is not None  # pyright: ignore[reportPrivateUsage]
+    assert inner._structural_hash is not None  # pyright: ignore[reportPrivateUsage]
+
+    PatternRewriteWalker(_RenameLabel(), apply_recursively=False).rewrite_module(module)
+
+    # The modified operation and its ancestors are invalidated
+    assert inner._structural_hash is None  # pyright: ignore[reportPrivateUsage]
+    assert outer._structural_hash is None  # pyright: ignore[reportPrivateUsage]
+    assert module._structural_hash is None  # pyright: ignore[reportPrivateUsage]
+
+    expected = ModuleOp([])
+    with ImplicitBuilder(expected.body):
+        expected_outer = TestOp(regions=[Region(Block())])
+    with ImplicitBuilder(expected_outer.regions[0].block):
+        TestOp(attributes={"label": StringAttr("a")})
+        TestOp(attributes={"label": StringAttr("c")})
+
+    assert hash(HashableModule(module)) != initial_hash
+    assert hash(HashableModule(module)) == hash(HashableModule(expected))
+    assert HashableModule(module) == HashableModule(expected)
+
+
+def test_hashable_module_direct_mutation():
+    module = _gen_module("ab")
+    hashable = HashableModule(module)
+    initial_hash = hash(hashable)
+    module.structural_hash()
+
+    # In-place changes to the attribute dictionary have to be invalidated
+    module.body.block.first_op.attributes["label"] = StringAttr("b")
+    assert hash(hashable) == initial_hash
+    module.body.block.first_op.invalidate_structural_hash()
+    assert hashable == HashableModule(_gen_module("bb"))
+    assert hash(hashable) == hash(HashableModule(_gen_module("bb")))
+    assert hash(hashable) != initial_hash
+
+    Rewriter.replace_op(
+        module.body.block.first_op, TestOp(attributes={"label": StringAttr("c")})
+    )
+    assert hashable == HashableModule(_gen_module("cb"))
+    assert hash(hashable) == hash(HashableModule(_gen_module("cb")))
+
+
+def _gen_nested_module() -> tuple[ModuleOp, TestOp, TestOp]:
+    """Create a module with two operations with a region each, and hash it."""
+    module = ModuleOp([])
+    with ImplicitBuilder(module.body):
+        lhs = TestOp(regions=[Region(Block(arg_types=[i32]))])
+        rhs = TestOp(regions=[Region(Block())])
+    with ImplicitBuilder(lhs.regions[0].block):
+        TestOp(result_types=[i32])
+        TestOp(result_types=[i64])
+    with ImplicitBuilder(rhs.regions[0].block):
+        TestOp(attributes={"label": StringAttr("a")})
+    hash(HashableModule(module))
+    return module, lhs, rhs
+
+
+def _check_cached_hash(module: ModuleOp):
+    assert hash(HashableModule(module)) == module.structural_hash(use_cache=False)
+
+
+def test_hashable_module_splice_ops():
+    module, lhs, rhs = _gen_nested_module()
+    first_op = lhs.regions[0].block.first_op
+    assert first_op is not None
+    rhs.regions[0].block.splice_ops(first_op, first_op)
+    _check_cached_hash(module)
+
+
+def test_hashable_module_inline_block():
+    module, lhs, rhs = _gen_nested_module()
+    Rewriter.inline_block(
+        rhs.regions[0].block, InsertPoint.at_end(lhs.regions[0].block)
+    )
+    _check_cached_hash(module)
+
+
+def test_hashable_module_inline_region():
+    module, lhs, rhs = _gen_nested_module()
+    Rewriter.inline_region(rhs.regions[0], BlockInsertPoint.at_end(lhs.regions[0]))
+    _check_cached_hash(module)
+
+
+def test_hashable_module_detach_region():
+    module, lhs, _ = _gen_nested_module()
+    lhs.detach_region(0)
+    _check_cached_hash(module)
+
+
+def test_hashable_module_add_region():
+    module, _, rhs = _gen_nested_module()
+    rhs.add_region(Region(Block([TestOp()])))
+    _check_cached_hash(module)
+
+
+def test_hashable_module_detach_block():
+    module, lhs, _ = _gen_nested_module()
+    lhs.regions[0].detach_block(0)
+    _check_cached_hash(module)
+
+
+def test_hashable_module_result_type():
+    module, lhs, _ = _gen_nested_module()
+    first_op = lhs.regions[0].block.first_op
+    assert first_op is not None
+    Rewriter.replace_value_with_new_type(first_op.results[0], i64)
+    _check_cached_hash(module)
+
+
+def test_hashable_module_block_argument_type():
+    module, lhs, _ = _gen_nested_module()
+    Rewriter.replace_value_with_new_type(lhs.regions[0].block.args[0], i64)
+    _check_cached_hash(module)
@@ -6,6 +6,7 @@ test functions below.
 import re
 from contextlib import redirect_stdout
 from io import StringIO
+from pathlib import Path
 from typing import IO
 
 import pytest
@@ -224,3 +225,86 @@ def test_split_input():
         expected = file.read()
 
     assert inp.strip() == expected.strip()
+
+
+def test_split_input_jobs(tmp_path: Path):
+    filename_in = tmp_path / "input.mlir"
+    filename_in.write_text(
+        "\n// -----\n".join(
+            [
+                '"test.op"() {"index" = 0} : () -> ()',
+                "%0 = test.op",
+                "builtin.module {}",
+            ]
+            * 3
+        )
+    )
+
+    outputs: list[tuple[str, str]] = []
+    for jobs in ("1", "2"):
+        filename_out = tmp_path / f"output_{jobs}.mlir"
+        opt = xDSLOptMain(
+            args=[
+                str(filename_in),
+                "--split-input-file",
+                "--allow-unregistered-dialect",
+                "--parsing-diagnostics",
+                "-j",
+                jobs,
+                "-o",
+                str(filename_out),
+            ]
+        )
+        f = StringIO("")
+        with redirect_stdout(f):
+            opt.run()
+        outputs.append((f.getvalue(), filename_out.read_text()))
+
+    assert outputs[0] == outputs[1]
+    assert outputs[1][0].count("input.mlir:") == 3
+    assert outputs[1][1].count("// -----") == 8
+
+    opt = xDSLOptMain(
+        args=[str(filename_in), "--split-input-file", "-j", "2", "-o", "/dev/null"]
+    )
+    with pytest.raises(ParseError, match="input.mlir:4:1"):
+        opt.run()
+
+
+def test_split_input_jobs_subclass_signature(tmp_path: Path):
+    filename_in = tmp_path / "input.mlir"
+    filename_in.write_text("builtin.module {}\n// -----\nbuiltin.module {}")
+
+    class OptMainWithOption(xDSLOptMain):
+        def __init__(self, option: int, args: list[str]):
+            super().__init__(args=args)
+
+    # Workers can only create the tool from its description and arguments
+    opt = OptMainWithOption(
+        0, [str(filename_in), "--split-input-file", "-j", "2", "-o", "/dev/null"]
+    )
+    with pytest.raises(ValueError, match="cannot run with --jobs"):
+        opt.run()
+
+
+def test_bytecode_target_and_frontend(tmp_path: Path):
+    filename_in = tmp_path / "input.mlir"
+    filename_in.write_text(
+        "func.func @f(%a : i32) -> i32 {\n  func.return %a : i32\n}\n// -----\n"
+    )
+    filename_bc = tmp_path / "output.mlirbc"
+
+    opt = xDSLOptMain(args=[str(filename_in), "-t", "mlirbc", "-o", str(filename_bc)])
+    opt.run()
+    assert filename_bc.read_bytes().startswith(b"ML\xefR")
+
+    f = StringIO("")
+    with redirect_stdout(f):
+        xDSLOptMain(args=[str(filename_bc), "--lazy-parsing"]).run()
+    assert "func.return %0 : i32" in f.getvalue()
+
+    opt = xDSLOptMain(
+        args=[str(filename_in), "--split-input-file", "-t", "mlirbc", "-o", "/dev/null"]
+    )
+    with pytest.raises(ValueError, match="cannot output multiple chunks"):
+        opt.run()
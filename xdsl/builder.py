@@ -26,7 +26,10 @@ class BuilderListener:
     block_creation_handler: list[Callable[[Block], None]] = field(
         default_factory=list[Callable[[Block], None]], kw_only=True
     )
-    """Callback that are called when a block is created by the builder."""
+    """
+    Callbacks that are called when a block is created by the builder, or moved to
+    another region by a rewriter.
+    """
 
     def handle_operation_insertion(self, op: Operation) -> None:
         """Pass the operation that was just inserted to callbacks."""
@@ -34,7 +37,7 @@ class BuilderListener:
             callback(op)
 
     def handle_block_creation(self, block: Block) -> None:
-        """Pass the block that was just created to callbacks."""
+        """Pass the block that was just created or moved to callbacks."""
         for callback in self.block_creation_handler:
             callback(block)
 
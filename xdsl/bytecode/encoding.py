@@ -0,0 +1,317 @@
+"""
+Definitions and primitive encodings of the MLIR bytecode format.
+
+See external [documentation](https://mlir.llvm.org/docs/BytecodeFormat/).
+"""
+
+from __future__ import annotations
+
+import mmap
+from enum import IntEnum, IntFlag
+
+from xdsl.dialects.builtin import (
+    Float16Type,
+    Float32Type,
+    Float64Type,
+    IndexType,
+    IntegerType,
+)
+from xdsl.ir import Attribute
+from xdsl.utils.exceptions import BytecodeError
+
+MAGIC = b"ML\xefR"
+"""The bytes at the beginning of every bytecode file."""
+
+ALIGNMENT_BYTE = 0xCB
+"""The byte used to pad data to its alignment."""
+
+
+class BytecodeVersion(IntEnum):
+    """The versions of the bytecode format, named after the feature they added."""
+
+    MIN_SUPPORTED = 0
+    DIALECT_VERSIONING = 1
+    LAZY_LOADING = 2
+    USE_LIST_ORDERING = 3
+    ELIDE_UNKNOWN_BLOCK_ARG_LOCATION = 4
+    NATIVE_PROPERTIES_ENCODING = 5
+    NATIVE_PROPERTIES_ODS_SEGMENT_SIZE = 6
+
+    CURRENT = 6
+
+
+class Section(IntEnum):
+    """The identifiers of the sections of a bytecode file."""
+
+    STRING = 0
+    DIALECT = 1
+    ATTR_TYPE = 2
+    ATTR_TYPE_OFFSET = 3
+    IR = 4
+    RESOURCE = 5
+    RESOURCE_OFFSET = 6
+    DIALECT_VERSIONS = 7
+    PROPERTIES = 8
+
+
+class OpEncodingMask(IntFlag):
+    """The flags indicating which components of an operation are encoded."""
+
+    HAS_ATTRS = 0x01
+    HAS_RESULTS = 0x02
+    HAS_OPERANDS = 0x04
+    HAS_SUCCESSORS = 0x08
+    HAS_INLINE_REGIONS = 0x10
+    HAS_USE_LIST_ORDERS = 0x20
+    HAS_PROPERTIES = 0x40
+
+
+class ResourceKind(IntEnum):
+    """The kinds of values of resource entries."""
+
+    BLOB = 0
+    BOOL = 1
+    STRING = 2
+
+
+class BuiltinAttrCode(IntEnum):
+    """The codes of the custom encodings of builtin attributes."""
+
+    ARRAY = 0
+    DICTIONARY = 1
+    STRING = 2
+    STRING_WITH_TYPE = 3
+    FLAT_SYMBOL_REF = 4
+    SYMBOL_REF = 5
+    TYPE = 6
+    UNIT = 7
+    INTEGER = 8
+    FLOAT = 9
+    CALL_SITE_LOC = 10
+    FILE_LINE_COL_LOC = 11
+    FUSED_LOC = 12
+    FUSED_LOC_WITH_METADATA = 13
+    NAME_LOC = 14
+    UNKNOWN_LOC = 15
+    DENSE_RESOURCE_ELEMENTS = 16
+    DENSE_ARRAY = 17
+    DENSE_INT_OR_FP_ELEMENTS = 18
+
+
+class BuiltinTypeCode(IntEnum):
+    """The codes of the custom encodings of builtin types."""
+
+    INTEGER = 0
+    INDEX = 1
+    FUNCTION = 2
+    BFLOAT16 = 3
+    FLOAT16 = 4
+    FLOAT32 = 5
+    FLOAT64 = 6
+    FLOAT80 = 7
+    FLOAT128 = 8
+    COMPLEX = 9
+    MEMREF = 10
+    MEMREF_WITH_MEMSPACE = 11
+    NONE = 12
+    RANKED_TENSOR = 13
+    RANKED_TENSOR_WITH_ENCODING = 14
+    TUPLE = 15
+    UNRANKED_MEMREF = 16
+    UNRANKED_MEMREF_WITH_MEMSPACE = 17
+    UNRANKED_TENSOR = 18
+    VECTOR = 19
+
+
+DYNAMIC_DIMENSION = -(2**63)
+"""The encoding of dynamic dimensions in shapes."""
+
+
+def has_dense_layout(element_type: Attribute) -> bool:
+    """
+    Return if the dense storage of elements of this type in xDSL is the raw data of
+    MLIR dense attributes, which packs `i1` elements and uses bytes for booleans.
+    """
+    if isinstance(element_type, IntegerType):
+        return element_type.width.data in (8, 16, 32, 64)
+    return isinstance(element_type, IndexType | Float16Type | Float32Type | Float64Type)
+
+
+class EncodingWriter:
+    """Writes the primitive encodings of the bytecode format to a byte buffer."""
+
+    data: bytearray
+    """The encoded bytes."""
+
+    required_alignment: int
+    """The alignment that the start of the buffer must have in the final file."""
+
+    def __init__(self) -> None:
+        self.data = bytearray()
+        self.required_alignment = 1
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def write_byte(self, value: int) -> None:
+        self.data.append(value)
+
+    def write_bytes(self, value: bytes | bytearray | memoryview) -> None:
+        self.data += value
+
+    def write_varint(self, value: int) -> None:
+        """
+        Write an unsigned integer of at most 64 bits, using as many bytes as needed
+        to store it in groups of 7 bits. The number of trailing zeros of the first
+        byte gives the number of additional bytes.
+        """
+        if value < 0x80:
+            self.data.append((value << 1) | 1)
+            return
+        num_bytes = (value.bit_length() + 6) // 7
+        if num_bytes > 8:
+            self.data.append(0)
+            self.data += value.to_bytes(8, "little")
+            return
+        encoded = (value << num_bytes) | (1 << (num_bytes - 1))
+        self.data += encoded.to_bytes(num_bytes, "little")
+
+    def write_signed_varint(self, value: int) -> None:
+        """Write a signed integer of at most 64 bits with zigzag encoding."""
+        self.write_varint(((value << 1) ^ (value >> 63)) & 0xFFFFFFFFFFFFFFFF)
+
+    def write_varint_with_flag(self, value: int, flag: bool) -> None:
+        self.write_varint((value << 1) | flag)
+
+    def write_nul_terminated_string(self, value: str) -> None:
+        self.data += value.encode()
+        self.data.append(0)
+
+    def write_blob(self, value: bytes | bytearray | memoryview) -> None:
+        """Write a blob of bytes prefixed by its size."""
+        self.write_varint(len(value))
+        self.data += value
+
+    def align_to(self, alignment: int) -> None:
+        """Pad the buffer up to a multiple of `alignment`."""
+        if alignment & (alignment - 1):
+            raise BytecodeError(
+                f"expected alignment to be a power of 2, got {alignment}"
+            )
+        padding = -len(self.data) % alignment
+        self.data += bytes((ALIGNMENT_BYTE,)) * padding
+        self.required_alignment = max(self.required_alignment, alignment)
+
+    def write_section(self, section: Section, contents: EncodingWriter) -> None:
+        """
+        Write a section, aligning its contents if they require it.
+        The high bit of the section identifier marks that an alignment follows.
+        """
+        code_offset = len(self.data)
+        self.data.append(section)
+        self.write_varint(len(contents))
+        alignment = contents.required_alignment
+        if alignment > 1:
+            if len(self.data) % alignment:
+                self.write_varint(alignment)
+                self.align_to(alignment)
+                self.data[code_offset] |= 0x80
+            self.required_alignment = max(self.required_alignment, alignment)
+        self.data += contents.data
+
+
+class EncodingReader:
+    """Reads the primitive encodings of the bytecode format from a byte buffer."""
+
+    buffer: bytes | bytearray | mmap.mmap
+    """The buffer being read."""
+
+    data: memoryview
+    """A view of the buffer, to read its parts without copying them."""
+
+    pos: int
+    """The position of the next byte to read."""
+
+    end: int
+    """The position of the end of the part of the buffer to read."""
+
+    def __init__(
+        self,
+        buffer: bytes | bytearray | mmap.mmap,
+        start: int = 0,
+        end: int | None = None,
+        data: memoryview | None = None,
+    ):
+        self.buffer = buffer
+        self.data = memoryview(buffer) if data is None else data
+        self.pos = start
+        self.end = len(buffer) if end is None else end
+
+    def empty(self) -> bool:
+        return self.pos >= self.end
+
+    def read_byte(self) -> int:
+        if self.pos >= self.end:
+            raise BytecodeError("attempting to read past the end of the buffer")
+        value = self.data[self.pos]
+        self.pos += 1
+        return value
+
+    def read_bytes(self, size: int) -> memoryview:
+        if self.pos + size > self.end:
+            raise BytecodeError("attempting to read past the end of the buffer")
+        value = self.data[self.pos : self.pos + size]
+        self.pos += size
+        return value
+
+    def read_varint(self) -> int:
+        first = self.read_byte()
+        if first & 1:
+            return first >> 1
+        if first == 0:
+            return int.from_bytes(self.read_bytes(8), "little")
+        num_bytes = (first & -first).bit_length() - 1
+        value = first | int.from_bytes(self.read_bytes(num_bytes), "little") << 8
+        return value >> (num_bytes + 1)
+
+    def read_signed_varint(self) -> int:
+        value = self.read_varint()
+        return (value >> 1) ^ -(value & 1)
+
+    def read_varint_with_flag(self) -> tuple[int, bool]:
+        value = self.read_varint()
+        return value >> 1, bool(value & 1)
+
+    def read_nul_terminated_string(self) -> str:
+        end = self.buffer.find(b"\0", self.pos, self.end)
+        if end == -1:
+            raise BytecodeError("expected a nul-terminated string")
+        value = str(self.data[self.pos : end], "utf-8")
+        self.pos = end + 1
+        return value
+
+    def read_blob(self) -> memoryview:
+        return self.read_bytes(self.read_varint())
+
+    def align_to(self, alignment: int) -> None:
+        """Skip the padding up to a multiple of `alignment` from the buffer start."""
+        if alignment & (alignment - 1):
+            raise BytecodeError(
+                f"expected alignment to be a power of 2, got {alignment}"
+            )
+        padding = -self.pos % alignment
+        if any(byte != ALIGNMENT_BYTE for byte in self.read_bytes(padding)):
+            raise BytecodeError("expected alignment byte (0xCB)")
+
+    def read_section(self) -> tuple[int, EncodingReader]:
+        """Read a section, and return its identifier and a reader of its contents."""
+        code = self.read_byte()
+        length = self.read_varint()
+        section = code & 0x7F
+        if section > max(Section):
+            raise BytecodeError(f"invalid section ID: {section}")
+        if code & 0x80:
+            self.align_to(self.read_varint())
+        start = self.pos
+        self.read_bytes(length)
+        return section, EncodingReader(self.buffer, start, self.pos, self.data)
@@ -0,0 +1,827 @@
+"""
+A reader of the MLIR bytecode format.
+
+See external [documentation](https://mlir.llvm.org/docs/BytecodeFormat/).
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import IO
+
+from xdsl.bytecode.encoding import (
+    DYNAMIC_DIMENSION,
+    MAGIC,
+    BuiltinAttrCode,
+    BuiltinTypeCode,
+    BytecodeVersion,
+    EncodingReader,
+    OpEncodingMask,
+    ResourceKind,
+    Section,
+    has_dense_layout,
+)
+from xdsl.context import Context
+from xdsl.dialect_interfaces import OpAsmDialectInterface
+from xdsl.dialects.builtin import (
+    DYNAMIC_INDEX,
+    ArrayAttr,
+    BFloat16Type,
+    BytesAttr,
+    ComplexType,
+    DenseArrayBase,
+    DenseIntOrFPElementsAttr,
+    DenseResourceAttr,
+    DictionaryAttr,
+    FileLineColLoc,
+    Float16Type,
+    Float32Type,
+    Float64Type,
+    Float80Type,
+    Float128Type,
+    FloatAttr,
+    FunctionType,
+    IndexType,
+    IntAttr,
+    IntegerAttr,
+    IntegerType,
+    MemRefType,
+    ModuleOp,
+    NoneType,
+    ShapedType,
+    Signedness,
+    StringAttr,
+    SymbolRefAttr,
+    TensorType,
+    UnitAttr,
+    UnknownLoc,
+    UnrankedTensorType,
+    VectorType,
+)
+from xdsl.ir import (
+    Attribute,
+    Block,
+    LazyRegionBody,
+    Operation,
+    Region,
+    SSAValue,
+)
+from xdsl.irdl import IRDLOperation
+from xdsl.parser import AttrParser, ForwardDeclaredValue, ParserState
+from xdsl.traits import SymbolTable
+from xdsl.utils.exceptions import BytecodeError
+from xdsl.utils.lexer import Input
+from xdsl.utils.mlir_lexer import MLIRLexer
+
+_FLOAT_TYPES: dict[int, Callable[[], Attribute]] = {
+    BuiltinTypeCode.BFLOAT16: BFloat16Type,
+    BuiltinTypeCode.FLOAT16: Float16Type,
+    BuiltinTypeCode.FLOAT32: Float32Type,
+    BuiltinTypeCode.FLOAT64: Float64Type,
+    BuiltinTypeCode.FLOAT80: Float80Type,
+    BuiltinTypeCode.FLOAT128: Float128Type,
+}
+
+
+@dataclass(frozen=True)
+class _Entry:
+    """An attribute or type entry of the attribute and type section."""
+
+    dialect: str
+    has_custom_encoding: bool
+    start: int
+    end: int
+
+
+@dataclass
+class _ValueScope:
+    """The values of the regions being read in a scope isolated from above."""
+
+    values: list[SSAValue | None] = field(default_factory=list[SSAValue | None])
+    """The values of the regions being read, indexed by their identifier."""
+
+    next_ids: list[int] = field(default_factory=list[int])
+    """The identifier of the next value defined in each region being read."""
+
+
+class _EntryReader(EncodingReader):
+    """Decodes attributes and types, referencing other entries by their index."""
+
+    bytecode: BytecodeReader
+
+    def __init__(self, bytecode: BytecodeReader, start: int, end: int):
+        super().__init__(bytecode.buffer, start, end, bytecode.data)
+        self.bytecode = bytecode
+
+    def read_attribute(self) -> Attribute:
+        return self.bytecode.get_attribute(self.read_varint())
+
+    def read_type(self) -> Attribute:
+        return self.bytecode.get_type(self.read_varint())
+
+    def read_string(self) -> str:
+        return self.bytecode.get_string(self.read_varint())
+
+    def read_apint(self, width: int) -> int:
+        """Read an integer of a known bitwidth, as its unsigned value."""
+        if width <= 8:
+            return self.read_byte() & ((1 << width) - 1)
+        if width <= 64:
+            return self.read_signed_varint() & ((1 << width) - 1)
+        value = 0
+        for i in range(self.read_varint()):
+            value |= (self.read_signed_varint() & 0xFFFFFFFFFFFFFFFF) << (64 * i)
+        return value & ((1 << width) - 1)
+
+
+class _LazyBytecodeRegionBody(LazyRegionBody):
+    """The contents of an isolated region that are read when first accessed."""
+
+    bytecode: BytecodeReader
+    start: int
+    end: int
+
+    def __init__(self, bytecode: BytecodeReader, start: int, end: int):
+        self.bytecode = bytecode
+        self.start = start
+        self.end = end
+        self.entry_block = None
+
+    def build(self, region: Region) -> None:
+        reader = EncodingReader(
+            self.bytecode.buffer, self.start, self.end, self.bytecode.data
+        )
+        self.bytecode._read_region(reader, region, _ValueScope())  # pyright: ignore[reportPrivateUsage]
+
+
+class BytecodeReader:
+    """
+    Reads an operation from the MLIR bytecode format.
+
+    Attributes and types are only decoded when they are first referenced, and
+    the regions of operations isolated from above can be read when their blocks
+    are first accessed.
+    Locations are not read, as xDSL operations do not have locations.
+
+    Properties can only be read when they are encoded as a dictionary attribute,
+    as done by `BytecodeWriter` and by MLIR for unregistered operations. The native
+    encodings that MLIR uses for the properties of its registered operations, such
+    as the value of `arith.constant`, are not supported, so most files written by
+    MLIR cannot be read.
+    """
+
+    ctx: Context
+    """The context used to create the operations, attributes, and types."""
+
+    buffer: bytes | bytearray | mmap.mmap
+    """The bytecode, which may be a memory map of a file."""
+
+    data: memoryview
+    """A view of the bytecode."""
+
+    name: str
+    """The name of the bytecode file, used in the errors of textual entries."""
+
+    lazy_isolated_regions: bool
+    """
+    Whether the regions of operations isolated from above that have a single
+    region and are not symbol tables are only read when their blocks are first
+    accessed.
+    """
+
+    version: int
+    """The version of the bytecode format of the file."""
+
+    producer: str
+    """The producer of the bytecode, as written in its header."""
+
+    _strings: list[str]
+    _dialects: list[str]
+    _op_names: list[tuple[str, bool]]
+    """The operation names, and whether they were registered when written."""
+
+    _attribute_entries: list[_Entry]
+    _attributes: list[Attribute | None]
+    _type_entries: list[_Entry]
+    _types: list[Attribute | None]
+
+    _resources: list[tuple[str, str]]
+    """The dialects and keys of the dialect resources, indexed by handle."""
+
+    _dialect_resources: set[tuple[str, str]]
+    """The resources declared when reading the file, shared with text parsers."""
+
+    _properties: list[tuple[int, int]]
+    """The start and end of the encoding of each operation properties."""
+
+    _sections: dict[int, EncodingReader]
+
+    def __init__(
+        self,
+        ctx: Context,
+        buffer: bytes | bytearray | mmap.mmap,
+        name: str = "<unknown>",
+        *,
+        lazy_isolated_regions: bool = False,
+    ):
+        self.ctx = ctx
+        self.buffer = buffer
+        self.data = memoryview(buffer)
+        self.name = name
+        self.lazy_isolated_regions = lazy_isolated_regions
+        self._dialect_resources = set()
+
+        reader = EncodingReader(buffer, data=self.data)
+        if len(buffer) < len(MAGIC) or reader.read_bytes(len(MAGIC)) != MAGIC:
+            raise BytecodeError("invalid bytecode magic number")
+        self.version = reader.read_varint()
+        if self.version > BytecodeVersion.CURRENT:
+            raise BytecodeError(
+                f"bytecode version {self.version} is newer than the supported "
+                f"version {BytecodeVersion.CURRENT:d}"
+            )
+        self.producer = reader.read_nul_terminated_string()
+
+        self._sections = {}
+        while not reader.empty():
+            section, contents = reader.read_section()
+            if section in self._sections:
+                raise BytecodeError(f"duplicate section: {Section(section).name}")
+            self._sections[section] = contents
+        required = [
+            Section.STRING,
+            Section.DIALECT,
+            Section.ATTR_TYPE,
+            Section.ATTR_TYPE_OFFSET,
+            Section.IR,
+        ]
+        if self.version >= BytecodeVersion.NATIVE_PROPERTIES_ENCODING:
+            required.append(Section.PROPERTIES)
+        for section in required:
+            if section not in self._sections:
+                raise BytecodeError(f"missing section: {section.name}")
+        if (Section.RESOURCE in self._sections) != (
+            Section.RESOURCE_OFFSET in self._sections
+        ):
+            raise BytecodeError("resource sections must be both present or absent")
+
+        self._read_string_section(self._sections[Section.STRING])
+        self._read_dialect_section(self._sections[Section.DIALECT])
+        self._read_attr_type_offset_section()
+        self._read_resource_sections()
+        self._read_properties_section()
+
+    def get_string(self, index: int) -> str:
+        if index >= len(self._strings):
+            raise BytecodeError(f"invalid string index: {index}")
+        return self._strings[index]
+
+    def get_attribute(self, index: int) -> Attribute:
+        if index >= len(self._attributes):
+            raise BytecodeError(f"invalid attribute index: {index}")
+        if (attr := self._attributes[index]) is None:
+            attr = self._attributes[index] = self._read_entry(
+                self._attribute_entries[index],
+                self._read_builtin_attribute,
+                AttrParser.parse_attribute,
+            )
+        return attr
+
+    def get_type(self, index: int) -> Attribute:
+        if index >= len(self._types):
+            raise BytecodeError(f"invalid type index: {index}")
+        if (type := self._types[index]) is None:
+            type = self._types[index] = self._read_entry(
+                self._type_entries[index],
+                self._read_builtin_type,
+                AttrParser.parse_type,
+            )
+        return type
+
+    def read_module(self) -> ModuleOp:
+        """
+        Read the operations of the file, and return them in a module, unless the
+        file contains a single module.
+        """
+        reader = self._sections[Section.IR]
+        scope = _ValueScope(next_ids=[0])
+        num_ops, has_args = reader.read_varint_with_flag()
+        if has_args:
+            raise BytecodeError("the top-level block cannot have arguments")
+        ops = [self._read_op(reader, [], scope) for _ in range(num_ops)]
+        if len(ops) == 1 and isinstance(ops[0], ModuleOp):
+            return ops[0]
+        return ModuleOp(ops)
+
+    def _read_string_section(self, reader: EncodingReader) -> None:
+        num_strings = reader.read_varint()
+        sizes = [reader.read_varint() for _ in range(num_strings)]
+        self._strings = [reader.read_nul_terminated_string() for _ in sizes]
+
+    def _read_dialect_section(self, reader: EncodingReader) -> None:
+        num_dialects = reader.read_varint()
+        self._dialects = []
+        for _ in range(num_dialects):
+            if self.version < BytecodeVersion.DIALECT_VERSIONING:
+                self._dialects.append(self.get_string(reader.read_varint()))
+                continue
+            name, has_version = reader.read_varint_with_flag()
+            self._dialects.append(self.get_string(name))
+            if has_version:
+                # Dialect versions are only used by custom encodings
+                section, _ = reader.read_section()
+                if section != Section.DIALECT_VERSIONS:
+                    raise BytecodeError("expected a dialect versions section")
+
+        if self.version >= BytecodeVersion.ELIDE_UNKNOWN_BLOCK_ARG_LOCATION:
+            reader.read_varint()
+        self._op_names = []
+        while not reader.empty():
+            dialect = self._get_dialect(reader.read_varint())
+            for _ in range(reader.read_varint()):
+                registered = False
+                if self.version >= BytecodeVersion.NATIVE_PROPERTIES_ENCODING:
+                    name, registered = reader.read_varint_with_flag()
+                else:
+                    name = reader.read_varint()
+                op_name = self.get_string(name)
+                full_name = f"{dialect}.{op_name}" if op_name else dialect
+                self._op_names.append((full_name, registered))
+
+    def _get_dialect(self, index: int) -> str:
+        if index >= len(self._dialects):
+            raise BytecodeError(f"invalid dialect index: {index}")
+        return self._dialects[index]
+
+    def _read_attr_type_offset_section(self) -> None:
+        reader = self._sections[Section.ATTR_TYPE_OFFSET]
+        data = self._sections[Section.ATTR_TYPE]
+        offset = data.pos
+        num_attributes = reader.read_varint()
+        num_types = reader.read_varint()
+
+        def read_entries(num_entries: int) -> list[_Entry]:
+            nonlocal offset
+            entries: list[_Entry] = []
+            while len(entries) < num_entries:
+                dialect = self._get_dialect(reader.read_varint())
+                for _ in range(reader.read_varint()):
+                    size, has_custom = reader.read_varint_with_flag()
+                    if offset + size > data.end:
+                        raise BytecodeError("attribute or type entry out of bounds")
+                    entries.append(_Entry(dialect, has_custom, offset, offset + size))
+                    offset += size
+            if len(entries) != num_entries:
+                raise BytecodeError("unexpected number of attribute or type entries")
+            return entries
+
+        self._attribute_entries = read_entries(num_attributes)
+        self._type_entries = read_entries(num_types)
+        self._attributes = [None] * num_attributes
+        self._types = [None] * num_types
+
+    def _read_resource_sections(self) -> None:
+        self._resources = []
+        if Section.RESOURCE_OFFSET not in self._sections:
+            return
+        offsets = self._sections[Section.RESOURCE_OFFSET]
+        data = self._sections[Section.RESOURCE]
+
+        def read_group() -> list[tuple[str, int, int, int]]:
+            entries: list[tuple[str, int, int, int]] = []
+            for _ in range(offsets.read_varint()):
+                key = self.get_string(offsets.read_varint())
+                size = offsets.read_varint()
+                kind = offsets.read_byte()
+                entries.append((key, kind, data.pos, data.pos + size))
+                data.read_bytes(size)
+            return entries
+
+        # External resources are not supported by xDSL, and are skipped
+        for _ in range(offsets.read_varint()):
+            offsets.read_varint()
+            read_group()
+
+        while not offsets.empty():
+            dialect_name = self._get_dialect(offsets.read_varint())
+            dialect = self.ctx.get_optional_dialect(dialect_name)
+            interface = (
+                dialect.get_interface(OpAsmDialectInterface)
+                if dialect is not None
+                else None
+            )
+            for key, kind, start, end in read_group():
+                self._resources.append((dialect_name, key))
+                if interface is None or kind != ResourceKind.BLOB:
+                    continue
+                entry = EncodingReader(self.buffer, start, end, self.data)
+                alignment = entry.read_varint()
+                size = entry.read_varint()
+                entry.align_to(alignment)
+                blob = alignment.to_bytes(4, "little") + entry.read_bytes(size)
+                # Equal keys of parsed resources refer to the same resource
+                if interface.lookup(key) is None:
+                    interface.declare_resource(key)
+                self._dialect_resources.add((dialect_name, key))
+                interface.parse_resource(key, "0x" + blob.hex().upper())
+
+    def _read_properties_section(self) -> None:
+        self._properties = []
+        if (reader := self._sections.get(Section.PROPERTIES)) is None:
+            return
+        for _ in range(reader.read_varint()):
+            size = reader.read_varint()
+            self._properties.append((reader.pos, reader.pos + size))
+            reader.read_bytes(size)
+
+    def _read_entry(
+        self,
+        entry: _Entry,
+        read_builtin: Callable[[_EntryReader], Attribute],
+        parse: Callable[[AttrParser], Attribute],
+    ) -> Attribute:
+        reader = _EntryReader(self, entry.start, entry.end)
+        if entry.has_custom_encoding:
+            if entry.dialect != "builtin":
+                raise BytecodeError(
+                    f"cannot read the custom encoding of a {entry.dialect} "
+                    "attribute or type"
+                )
+            return read_builtin(reader)
+        parser = AttrParser(
+            ParserState(
+                MLIRLexer(Input(reader.read_nul_terminated_string(), self.name))
+            ),
+            self.ctx,
+        )
+        parser.dialect_resources = self._dialect_resources
+        return parse(parser)
+
+    def _read_builtin_type(self, reader: _EntryReader) -> Attribute:
+        code = reader.read_varint()
+        match code:
+            case BuiltinTypeCode.INTEGER:
+                value = reader.read_varint()
+                return IntegerType(value >> 2, Signedness(value & 3))
+            case BuiltinTypeCode.INDEX:
+                return IndexType()
+            case BuiltinTypeCode.FUNCTION:
+                inputs = [reader.read_type() for _ in range(reader.read_varint())]
+                outputs = [reader.read_type() for _ in range(reader.read_varint())]
+                return FunctionType.from_lists(inputs, outputs)
+            case BuiltinTypeCode.NONE:
+                return NoneType()
+            case BuiltinTypeCode.COMPLEX:
+                return ComplexType(reader.read_type())  # pyright: ignore[reportArgumentType]
+            case BuiltinTypeCode.RANKED_TENSOR:
+                shape = self._read_shape(reader)
+                return TensorType(reader.read_type(), shape)
+            case BuiltinTypeCode.UNRANKED_TENSOR:
+                return UnrankedTensorType(reader.read_type())
+            case BuiltinTypeCode.VECTOR:
+                shape = self._read_shape(reader)
+                return VectorType(reader.read_type(), shape)
+            case _ if code in _FLOAT_TYPES:
+                return _FLOAT_TYPES[code]()
+            case _:
+                raise BytecodeError(f"unsupported encoding of builtin type: {code}")
+
+    @staticmethod
+    def _read_shape(reader: _EntryReader) -> list[int]:
+        shape = [reader.read_signed_varint() for _ in range(reader.read_varint())]
+        return [DYNAMIC_INDEX if dim == DYNAMIC_DIMENSION else dim for dim in shape]
+
+    def _read_builtin_attribute(self, reader: _EntryReader) -> Attribute:
+        code = reader.read_varint()
+        match code:
+            case BuiltinAttrCode.ARRAY:
+                return ArrayAttr(
+                    reader.read_attribute() for _ in range(reader.read_varint())
+                )
+            case BuiltinAttrCode.DICTIONARY:
+                entries: dict[str, Attribute] = {}
+                for _ in range(reader.read_varint()):
+                    name = reader.read_attribute()
+                    if not isinstance(name, StringAttr):
+                        raise BytecodeError(
+                            f"expected a string as dictionary key, got {name}"
+                        )
+                    entries[name.data] = reader.read_attribute()
+                return DictionaryAttr(entries)
+            case BuiltinAttrCode.STRING:
+                return StringAttr(reader.read_string())
+            case BuiltinAttrCode.FLAT_SYMBOL_REF:
+                return SymbolRefAttr(self._read_string_attr(reader))
+            case BuiltinAttrCode.SYMBOL_REF:
+                root = self._read_string_attr(reader)
+                nested: list[StringAttr] = []
+                for _ in range(reader.read_varint()):
+                    ref = reader.read_attribute()
+                    if not isinstance(ref, SymbolRefAttr):
+                        raise BytecodeError(f"expected a symbol reference, got {ref}")
+                    nested.append(ref.root_reference)
+                return SymbolRefAttr(root, nested)
+            case BuiltinAttrCode.TYPE:
+                return reader.read_type()
+            case BuiltinAttrCode.UNIT:
+                return UnitAttr()
+            case BuiltinAttrCode.INTEGER:
+                type = reader.read_type()
+                if isinstance(type, IndexType):
+                    value = reader.read_apint(64)
+                    return IntegerAttr(value - ((value >> 63) << 64), type)
+                if not isinstance(type, IntegerType):
+                    raise BytecodeError(f"expected an integer type, got {type}")
+                width = type.width.data
+                value = reader.read_apint(width)
+                if width and type.signedness.data != Signedness.UNSIGNED:
+                    value -= (value >> (width - 1)) << width
+                return IntegerAttr(value, type)
+            case BuiltinAttrCode.FLOAT:
+                type = reader.read_type()
+                if not isinstance(type, Float16Type | Float32Type | Float64Type):
+                    raise BytecodeError(f"unsupported float attribute type: {type}")
+                bits = reader.read_apint(type.bitwidth)
+                size = type.bitwidth // 8
+                (value,) = struct.unpack(type.format, bits.to_bytes(size, "little"))
+                return FloatAttr(value, type)
+            case BuiltinAttrCode.UNKNOWN_LOC:
+                return UnknownLoc()
+            case BuiltinAttrCode.FILE_LINE_COL_LOC:
+                filename = self._read_string_attr(reader)
+                line = reader.read_varint()
+                column = reader.read_varint()
+                return FileLineColLoc(filename, IntAttr(line), IntAttr(column))
+            case BuiltinAttrCode.DENSE_RESOURCE_ELEMENTS:
+                type = reader.read_type()
+                index = reader.read_varint()
+                if index >= len(self._resources):
+                    raise BytecodeError(f"invalid resource index: {index}")
+                dialect, key = self._resources[index]
+                if dialect != "builtin" or not isinstance(type, ShapedType):
+                    raise BytecodeError("invalid dense resource elements attribute")
+                return DenseResourceAttr.from_params(key, type)
+            case BuiltinAttrCode.DENSE_ARRAY:
+                element_type = reader.read_type()
+                reader.read_varint()
+                data = bytes(reader.read_blob())
+                return DenseArrayBase(element_type, BytesAttr(data))
+            case BuiltinAttrCode.DENSE_INT_OR_FP_ELEMENTS:
+                type = reader.read_type()
+                data = bytes(reader.read_blob())
+                if not isinstance(type, TensorType | VectorType | MemRefType):
+                    raise BytecodeError(f"expected a shaped type, got {type}")
+                element_type = type.get_element_type()
+                if not has_dense_layout(element_type):
+                    raise BytecodeError(
+                        f"unsupported dense elements type: {element_type}"
+                    )
+                # The data of a single element is splat to the whole shape
+                num_elements = type.element_count()
+                if num_elements > 1 and len(data) == struct.calcsize(
+                    element_type.format
+                ):
+                    data *= num_elements
+                return DenseIntOrFPElementsAttr(type, BytesAttr(data))
+            case _:
+                raise BytecodeError(
+                    f"unsupported encoding of builtin attribute: {code}"
+                )
+
+    @staticmethod
+    def _read_string_attr(reader: _EntryReader) -> StringAttr:
+        attr = reader.read_attribute()
+        if not isinstance(attr, StringAttr):
+            raise BytecodeError(f"expected a string attribute, got {attr}")
+        return attr
+
+    def _get_value(self, scope: _ValueScope, index: int) -> SSAValue:
+        if index >= len(scope.values):
+            raise BytecodeError(f"invalid value index: {index}")
+        if (value := scope.values[index]) is None:
+            # The actual type of the value is only known when it is defined
+            value = scope.values[index] = ForwardDeclaredValue(NoneType())
+        return value
+
+    def _define_value(self, scope: _ValueScope, value: SSAValue) -> None:
+        index = scope.next_ids[-1]
+        if index >= len(scope.values):
+            raise BytecodeError("more values are defined than declared in region")
+        scope.next_ids[-1] += 1
+        if isinstance(forward_value := scope.values[index], ForwardDeclaredValue):
+            forward_value.replace_by(value)
+        scope.values[index] = value
+
+    def _skip_use_list_orders(self, reader: EncodingReader, num_values: int) -> None:
+        """Skip the use-list orders of values, which xDSL does not preserve."""
+        num_orders = reader.read_varint() if num_values > 1 else 1
+        for _ in range(num_orders):
+            if num_values > 1:
+                reader.read_varint()
+            num_uses, _ = reader.read_varint_with_flag()
+            for _ in range(num_uses):
+                reader.read_varint()
+
+    def _read_region(
+        self, reader: EncodingReader, region: Region, scope: _ValueScope
+    ) -> None:
+        num_blocks = reader.read_varint()
+        if not num_blocks:
+            return
+        num_values = reader.read_varint()
+        first_id = len(scope.values)
+        scope.values.extend([None] * num_values)
+        scope.next_ids.append(first_id)
+
+        blocks = [Block() for _ in range(num_blocks)]
+        region.add_block(blocks)
+        for block in blocks:
+            self._read_block(reader, block, blocks, scope)
+
+        if any(isinstance(v, ForwardDeclaredValue) for v in scope.values[first_id:]):
+            raise BytecodeError("values are used but not defined in region")
+        del scope.values[first_id:]
+        scope.next_ids.pop()
+
+    def _read_block(
+        self,
+        reader: EncodingReader,
+        block: Block,
+        blocks: list[Block],
+        scope: _ValueScope,
+    ) -> None:
+        num_ops, has_args = reader.read_varint_with_flag()
+        if has_args:
+            num_args = reader.read_varint()
+            for _ in range(num_args):
+                if self.version >= BytecodeVersion.ELIDE_UNKNOWN_BLOCK_ARG_LOCATION:
+                    type, has_location = reader.read_varint_with_flag()
+                    if has_location:
+                        reader.read_varint()
+                else:
+                    type = reader.read_varint()
+                    reader.read_varint()
+                arg = block.insert_arg(self.get_type(type), len(block.args))
+                self._define_value(scope, arg)
+            if self.version >= BytecodeVersion.USE_LIST_ORDERING:
+                if reader.read_byte():
+                    self._skip_use_list_orders(reader, num_args)
+        for _ in range(num_ops):
+            block.add_op(self._read_op(reader, blocks, scope))
+
+    def _read_op(
+        self, reader: EncodingReader, blocks: list[Block], scope: _ValueScope
+    ) -> Operation:
+        index = reader.read_varint()
+        if index >= len(self._op_names):
+            raise BytecodeError(f"invalid operation name index: {index}")
+        name, registered = self._op_names[index]
+        mask = OpEncodingMask(reader.read_byte())
+        # xDSL operations do not have locations
+        reader.read_varint()
+
+        attributes: dict[str, Attribute] = {}
+        if OpEncodingMask.HAS_ATTRS in mask:
+            attributes = dict(self._read_dictionary(reader.read_varint()).data)
+
+        properties: dict[str, Attribute] = {}
+        if OpEncodingMask.HAS_PROPERTIES in mask:
+            index = reader.read_varint()
+            if index >= len(self._properties):
+                raise BytecodeError(f"invalid properties index: {index}")
+            if registered:
+                raise BytecodeError(
+                    f"cannot read the natively encoded properties of {name}, only "
+                    "properties written as a dictionary attribute are supported"
+                )
+            start, end = self._properties[index]
+            properties_reader = EncodingReader(self.buffer, start, end, self.data)
+            properties_dict = self._read_dictionary(properties_reader.read_varint())
+            properties = dict(properties_dict.data)
+
+        result_types: list[Attribute] = []
+        if OpEncodingMask.HAS_RESULTS in mask:
+            result_types = [
+                self.get_type(reader.read_varint()) for _ in range(reader.read_varint())
+            ]
+
+        operands: list[SSAValue] = []
+        if OpEncodingMask.HAS_OPERANDS in mask:
+            operands = [
+                self._get_value(scope, reader.read_varint())
+                for _ in range(reader.read_varint())
+            ]
+
+        successors: list[Block] = []
+        if OpEncodingMask.HAS_SUCCESSORS in mask:
+            for _ in range(reader.read_varint()):
+                if (block_index := reader.read_varint()) >= len(blocks):
+                    raise BytecodeError(f"invalid successor index: {block_index}")
+                successors.append(blocks[block_index])
+
+        if OpEncodingMask.HAS_USE_LIST_ORDERS in mask:
+            self._skip_use_list_orders(reader, len(result_types))
+
+        op_type = self.ctx.get_optional_op(name)
+        if op_type is None:
+            raise BytecodeError(f"operation {name} is not registered")
+
+        regions: list[Region] = []
+        if OpEncodingMask.HAS_INLINE_REGIONS in mask:
+            num_regions, isolated = reader.read_varint_with_flag()
+            # Symbol tables are read eagerly, as their symbols are looked up often
+            lazy = isolated and not op_type.has_trait(SymbolTable)
+            regions = self._read_regions(reader, num_regions, isolated, lazy, scope)
+
+        # Without a properties section, properties are extracted from the
+        # attribute dictionary by name
+        if self.version < BytecodeVersion.NATIVE_PROPERTIES_ENCODING and issubclass(
+            op_type, IRDLOperation
+        ):
+            op_def = op_type.get_irdl_definition()
+            for attr_name in tuple(attributes):
+                if attr_name in op_def.properties:
+                    properties[attr_name] = attributes.pop(attr_name)
+
+        op = op_type.create(
+            operands=operands,
+            result_types=result_types,
+            properties=properties,
+            attributes=attributes,
+            successors=successors,
+            regions=regions,
+        )
+        for result in op.results:
+            self._define_value(scope, result)
+        return op
+
+    def _read_regions(
+        self,
+        reader: EncodingReader,
+        num_regions: int,
+        isolated: bool,
+        lazy: bool,
+        scope: _ValueScope,
+    ) -> list[Region]:
+        if not isolated:
+            regions = [Region() for _ in range(num_regions)]
+            for region in regions:
+                self._read_region(reader, region, scope)
+            return regions
+
+        if self.version >= BytecodeVersion.LAZY_LOADING:
+            # Isolated regions are in their own section, to be read lazily
+            section, reader = reader.read_section()
+            if section != Section.IR:
+                raise BytecodeError("expected an IR section for isolated regions")
+            if lazy and self.lazy_isolated_regions and num_regions == 1:
+                body = _LazyBytecodeRegionBody(self, reader.pos, reader.end)
+                return [Region.lazy(body)]
+
+        regions = [Region() for _ in range(num_regions)]
+        isolated_scope = _ValueScope()
+        for region in regions:
+            self._read_region(reader, region, isolated_scope)
+        return regions
+
+    def _read_dictionary(self, index: int) -> DictionaryAttr:
+        attr = self.get_attribute(index)
+        if not isinstance(attr, DictionaryAttr):
+            raise BytecodeError(f"expected a dictionary attribute, got {attr}")
+        return attr
+
+
+def read_bytecode(
+    ctx: Context,
+    buffer: bytes | bytearray | mmap.mmap,
+    name: str = "<unknown>",
+    *,
+    lazy_isolated_regions: bool = False,
+) -> ModuleOp:
+    """Read a module from the MLIR bytecode format."""
+    return BytecodeReader(
+        ctx, buffer, name, lazy_isolated_regions=lazy_isolated_regions
+    ).read_module()
+
+
+def read_bytecode_stream(
+    ctx: Context,
+    stream: IO[bytes],
+    name: str = "<unknown>",
+    *,
+    lazy_isolated_regions: bool = False,
+) -> ModuleOp:
+    """
+    Read a module from a stream in the MLIR bytecode format.
+    Regular files are memory-mapped, so that the parts of the file that are not
+    decoded, such as lazily loaded regions, are not read.
+    """
+    try:
+        buffer = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        # Streams without file descriptors, pipes, and empty files
+        buffer = stream.read()
+    return read_bytecode(ctx, buffer, name, lazy_isolated_regions=lazy_isolated_regions)
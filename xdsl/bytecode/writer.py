@@ -0,0 +1,719 @@
+"""
+A writer of the MLIR bytecode format.
+
+See external [documentation](https://mlir.llvm.org/docs/BytecodeFormat/).
+"""
+
+from __future__ import annotations
+
+import struct
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from io import StringIO
+from typing import IO
+
+from typing_extensions import TypeVar
+
+from xdsl.bytecode.encoding import (
+    DYNAMIC_DIMENSION,
+    MAGIC,
+    BuiltinAttrCode,
+    BuiltinTypeCode,
+    BytecodeVersion,
+    EncodingWriter,
+    OpEncodingMask,
+    ResourceKind,
+    Section,
+    has_dense_layout,
+)
+from xdsl.dialect_interfaces import OpAsmDialectInterface
+from xdsl.dialects.builtin import (
+    DYNAMIC_INDEX,
+    ArrayAttr,
+    BFloat16Type,
+    ComplexType,
+    DenseArrayBase,
+    DenseIntOrFPElementsAttr,
+    DictionaryAttr,
+    FileLineColLoc,
+    Float16Type,
+    Float32Type,
+    Float64Type,
+    Float80Type,
+    Float128Type,
+    FloatAttr,
+    FunctionType,
+    IndexType,
+    IntegerAttr,
+    IntegerType,
+    NoneAttr,
+    NoneType,
+    StringAttr,
+    SymbolRefAttr,
+    TensorType,
+    UnitAttr,
+    UnknownLoc,
+    UnrankedTensorType,
+    UnregisteredOp,
+)
+from xdsl.ir import (
+    Attribute,
+    Block,
+    BuiltinAttribute,
+    Dialect,
+    Operation,
+    Region,
+    SSAValue,
+    TypeAttribute,
+)
+from xdsl.printer import Printer
+from xdsl.traits import IsolatedFromAbove
+from xdsl.utils.exceptions import BytecodeError
+
+_FLOAT_TYPE_CODES: dict[type[Attribute], BuiltinTypeCode] = {
+    BFloat16Type: BuiltinTypeCode.BFLOAT16,
+    Float16Type: BuiltinTypeCode.FLOAT16,
+    Float32Type: BuiltinTypeCode.FLOAT32,
+    Float64Type: BuiltinTypeCode.FLOAT64,
+    Float80Type: BuiltinTypeCode.FLOAT80,
+    Float128Type: BuiltinTypeCode.FLOAT128,
+}
+
+
+class _AttrTypeWriter:
+    """
+    The interface used to encode attributes and types, either to an actual buffer,
+    or to collect the attributes, types, and strings they reference.
+    """
+
+    def write_varint(self, value: int) -> None: ...
+
+    def write_signed_varint(self, value: int) -> None: ...
+
+    def write_byte(self, value: int) -> None: ...
+
+    def write_blob(self, value: bytes | bytearray | memoryview) -> None: ...
+
+    def write_attribute(self, attr: Attribute) -> None: ...
+
+    def write_type(self, type: Attribute) -> None: ...
+
+    def write_string(self, value: str) -> None: ...
+
+    def write_apint(self, value: int, width: int) -> None:
+        """
+        Write an integer of a known bitwidth, as a byte, a signed varint, or a list
+        of 64-bit words depending on its width.
+        """
+        value &= (1 << width) - 1
+        if width <= 8:
+            self.write_byte(value)
+        elif width <= 64:
+            self.write_signed_varint(value - ((value >> 63) << 64))
+        else:
+            words: list[int] = []
+            while value:
+                words.append(value & 0xFFFFFFFFFFFFFFFF)
+                value >>= 64
+            self.write_varint(len(words))
+            for word in words:
+                self.write_signed_varint(word - ((word >> 63) << 64))
+
+
+class _EntryWriter(EncodingWriter, _AttrTypeWriter):
+    """Encodes attributes and types, referencing other entries by their index."""
+
+    numbering: _Numbering
+
+    def __init__(self, numbering: _Numbering):
+        super().__init__()
+        self.numbering = numbering
+
+    def write_attribute(self, attr: Attribute) -> None:
+        self.write_varint(self.numbering.attributes[attr])
+
+    def write_type(self, type: Attribute) -> None:
+        self.write_varint(self.numbering.types[type])
+
+    def write_string(self, value: str) -> None:
+        self.write_varint(self.numbering.strings[value])
+
+
+class _Numbering(_AttrTypeWriter):
+    """
+    Collects the strings, dialects, operation names, attributes, and types of the
+    IR, and assigns them the indices they have in the bytecode.
+    """
+
+    strings: dict[str, int]
+    dialects: dict[str, int]
+    op_names: dict[str, int]
+    attributes: dict[Attribute, int]
+    types: dict[Attribute, int]
+
+    def __init__(self):
+        self.strings = {}
+        self.dialects = {}
+        self.op_names = {}
+        self.attributes = {}
+        self.types = {}
+
+    def write_attribute(self, attr: Attribute) -> None:
+        if attr in self.attributes:
+            return
+        self.attributes[attr] = -1
+        self.number_dialect(_attribute_dialect_name(attr))
+        _write_builtin_attribute(attr, self)
+
+    def write_type(self, type: Attribute) -> None:
+        if type in self.types:
+            return
+        self.types[type] = -1
+        self.number_dialect(_type_dialect_name(type))
+        _write_builtin_type(type, self)
+
+    def write_string(self, value: str) -> None:
+        if value not in self.strings:
+            self.strings[value] = len(self.strings)
+
+    def number_dialect(self, name: str) -> None:
+        if name not in self.dialects:
+            self.dialects[name] = len(self.dialects)
+
+    def number_op_name(self, name: str) -> None:
+        if name not in self.op_names:
+            self.number_dialect(_op_dialect_name(name))
+            self.op_names[name] = -1
+
+    def finalize(self) -> None:
+        """
+        Assign the final indices, where the entries of each dialect are contiguous.
+        """
+        _sort_by_dialect(self.op_names, _op_dialect_name, self.dialects)
+        _sort_by_dialect(self.attributes, _attribute_dialect_name, self.dialects)
+        _sort_by_dialect(self.types, _type_dialect_name, self.dialects)
+
+
+_EntryT = TypeVar("_EntryT", str, Attribute)
+
+
+def _sort_by_dialect(
+    entries: dict[_EntryT, int],
+    dialect_name: Callable[[_EntryT], str],
+    dialects: dict[str, int],
+) -> None:
+    """Assign the indices of entries in the order of their dialects."""
+    ordered = sorted(entries, key=lambda entry: dialects[dialect_name(entry)])
+    entries.clear()
+    entries.update((entry, i) for i, entry in enumerate(ordered))
+
+
+def _group_by_dialect(
+    entries: Iterable[_EntryT],
+    dialect_name: Callable[[_EntryT], str],
+    dialects: dict[str, int],
+) -> list[tuple[int, list[_EntryT]]]:
+    """Group entries ordered by dialect into the entries of each dialect."""
+    groups: list[tuple[int, list[_EntryT]]] = []
+    for entry in entries:
+        dialect = dialects[dialect_name(entry)]
+        if not groups or groups[-1][0] != dialect:
+            groups.append((dialect, []))
+        groups[-1][1].append(entry)
+    return groups
+
+
+def _op_dialect_name(name: str) -> str:
+    return name.partition(".")[0]
+
+
+def _type_dialect_name(type: Attribute) -> str:
+    if isinstance(type, BuiltinAttribute):
+        return "builtin"
+    return type.name.partition(".")[0]
+
+
+def _attribute_dialect_name(attr: Attribute) -> str:
+    # Types used as attributes are wrapped in a builtin attribute
+    if isinstance(attr, TypeAttribute):
+        return "builtin"
+    return _type_dialect_name(attr)
+
+
+def _write_builtin_type(type: Attribute, writer: _AttrTypeWriter) -> bool:
+    """
+    Write the custom encoding of a builtin type.
+    Return `False` if the type has no custom encoding, and is written as text.
+    """
+    if isinstance(type, IntegerType):
+        writer.write_varint(BuiltinTypeCode.INTEGER)
+        writer.write_varint((type.width.data << 2) | type.signedness.data.value)
+    elif isinstance(type, IndexType):
+        writer.write_varint(BuiltinTypeCode.INDEX)
+    elif (code := _FLOAT_TYPE_CODES.get(type.__class__)) is not None:
+        writer.write_varint(code)
+    elif isinstance(type, NoneType):
+        writer.write_varint(BuiltinTypeCode.NONE)
+    elif isinstance(type, FunctionType):
+        writer.write_varint(BuiltinTypeCode.FUNCTION)
+        for types in (type.inputs.data, type.outputs.data):
+            writer.write_varint(len(types))
+            for t in types:
+                writer.write_type(t)
+    elif isinstance(type, ComplexType):
+        writer.write_varint(BuiltinTypeCode.COMPLEX)
+        writer.write_type(type.element_type)
+    elif isinstance(type, TensorType) and isinstance(type.encoding, NoneAttr):
+        writer.write_varint(BuiltinTypeCode.RANKED_TENSOR)
+        writer.write_varint(len(type.shape.data))
+        for dim in type.shape.data:
+            writer.write_signed_varint(
+                DYNAMIC_DIMENSION if dim.data == DYNAMIC_INDEX else dim.data
+            )
+        writer.write_type(type.element_type)
+    elif isinstance(type, UnrankedTensorType):
+        writer.write_varint(BuiltinTypeCode.UNRANKED_TENSOR)
+        writer.write_type(type.element_type)
+    else:
+        return False
+    return True
+
+
+def _write_builtin_attribute(attr: Attribute, writer: _AttrTypeWriter) -> bool:
+    """
+    Write the custom encoding of a builtin attribute.
+    Return `False` if the attribute has no custom encoding, and is written as text.
+    """
+    if isinstance(attr, TypeAttribute):
+        writer.write_varint(BuiltinAttrCode.TYPE)
+        writer.write_type(attr)
+    elif isinstance(attr, ArrayAttr):
+        writer.write_varint(BuiltinAttrCode.ARRAY)
+        writer.write_varint(len(attr.data))
+        for element in attr.data:
+            writer.write_attribute(element)
+    elif isinstance(attr, DictionaryAttr):
+        writer.write_varint(BuiltinAttrCode.DICTIONARY)
+        writer.write_varint(len(attr.data))
+        for name, value in attr.data.items():
+            writer.write_attribute(StringAttr(name))
+            writer.write_attribute(value)
+    elif isinstance(attr, StringAttr):
+        writer.write_varint(BuiltinAttrCode.STRING)
+        writer.write_string(attr.data)
+    elif isinstance(attr, SymbolRefAttr):
+        if attr.nested_references.data:
+            writer.write_varint(BuiltinAttrCode.SYMBOL_REF)
+            writer.write_attribute(attr.root_reference)
+            writer.write_varint(len(attr.nested_references.data))
+            for nested in attr.nested_references.data:
+                writer.write_attribute(SymbolRefAttr(nested))
+        else:
+            writer.write_varint(BuiltinAttrCode.FLAT_SYMBOL_REF)
+            writer.write_attribute(attr.root_reference)
+    elif isinstance(attr, UnitAttr):
+        writer.write_varint(BuiltinAttrCode.UNIT)
+    elif isinstance(attr, IntegerAttr):
+        writer.write_varint(BuiltinAttrCode.INTEGER)
+        writer.write_type(attr.type)
+        width = 64 if isinstance(attr.type, IndexType) else attr.type.width.data
+        writer.write_apint(attr.value.data, width)
+    elif isinstance(attr, FloatAttr) and isinstance(
+        attr.type, Float16Type | Float32Type | Float64Type
+    ):
+        writer.write_varint(BuiltinAttrCode.FLOAT)
+        writer.write_type(attr.type)
+        bits = struct.pack(attr.type.format, attr.value.data)
+        writer.write_apint(int.from_bytes(bits, "little"), attr.type.bitwidth)
+    elif isinstance(attr, UnknownLoc):
+        writer.write_varint(BuiltinAttrCode.UNKNOWN_LOC)
+    elif isinstance(attr, FileLineColLoc):
+        writer.write_varint(BuiltinAttrCode.FILE_LINE_COL_LOC)
+        writer.write_attribute(attr.filename)
+        writer.write_varint(attr.line.data)
+        writer.write_varint(attr.column.data)
+    elif isinstance(attr, DenseArrayBase) and has_dense_layout(attr.elt_type):
+        writer.write_varint(BuiltinAttrCode.DENSE_ARRAY)
+        writer.write_type(attr.elt_type)
+        writer.write_varint(len(attr))
+        writer.write_blob(attr.data.data)
+    elif isinstance(attr, DenseIntOrFPElementsAttr) and has_dense_layout(
+        attr.get_element_type()
+    ):
+        writer.write_varint(BuiltinAttrCode.DENSE_INT_OR_FP_ELEMENTS)
+        writer.write_type(attr.type)
+        writer.write_blob(attr.data.data)
+    else:
+        return False
+    return True
+
+
+@dataclass(eq=False, repr=False)
+class BytecodeWriter:
+    """
+    Writes an operation in the MLIR bytecode format.
+
+    Builtin attributes and types are written with the custom encodings of MLIR,
+    and other ones as their textual form.
+    Operations are written as unregistered, and their properties as a dictionary
+    attribute in the properties section, as MLIR does for operations that are not
+    registered. Versions without a properties section write the properties in the
+    attribute dictionary instead, as when printed with
+    `print_properties_as_attributes`.
+
+    The output is only checked to be read back by xDSL, not by MLIR, and operations
+    registered in MLIR may expect their properties in their native encoding.
+    """
+
+    stream: IO[bytes]
+    """The stream to write the bytecode to."""
+
+    dialects: Iterable[Dialect] = ()
+    """The dialects whose resources can be referenced by the operation."""
+
+    producer: str = "xDSL"
+    """The name of the producer of the bytecode, written in its header."""
+
+    version: int = field(default=BytecodeVersion.CURRENT, kw_only=True)
+    """The version of the bytecode format to write."""
+
+    _numbering: _Numbering = field(default_factory=_Numbering, init=False)
+
+    _printer: Printer = field(init=False)
+    """The printer of the textual entries, collecting the referenced resources."""
+
+    _text: StringIO = field(default_factory=StringIO, init=False)
+
+    _value_ids: list[dict[SSAValue, int]] = field(
+        default_factory=list[dict[SSAValue, int]], init=False
+    )
+    """The identifiers of the values in each scope isolated from above."""
+
+    _block_ids: dict[Block, int] = field(default_factory=dict[Block, int], init=False)
+    """The indices of the blocks in their region."""
+
+    _properties: list[EncodingWriter] = field(
+        default_factory=list[EncodingWriter], init=False
+    )
+    """The encoded properties of the operations."""
+
+    _properties_ids: dict[DictionaryAttr, int] = field(
+        default_factory=dict[DictionaryAttr, int], init=False
+    )
+
+    def __post_init__(self):
+        if not BytecodeVersion.MIN_SUPPORTED <= self.version <= BytecodeVersion.CURRENT:
+            raise BytecodeError(f"unsupported bytecode version: {self.version}")
+        self._printer = Printer(stream=self._text)
+
+    def write(self, op: Operation) -> None:
+        """Write the bytecode of an operation, which must not have results."""
+        if op.results:
+            raise BytecodeError("cannot write an operation with results as bytecode")
+
+        self._number_op(op)
+        numbering = self._numbering
+        numbering.finalize()
+
+        dialect_section = self._write_dialect_section()
+
+        ir_section = EncodingWriter()
+        ir_section.write_varint_with_flag(1, False)
+        self._value_ids.append({})
+        self._write_op(ir_section, op)
+        self._value_ids.pop()
+
+        attr_type_section, attr_type_offset_section = self._write_attr_type_sections()
+        resource_section, resource_offset_section = self._write_resource_sections()
+
+        # The string section is written last, as the other sections add strings
+        string_section = EncodingWriter()
+        string_section.write_varint(len(numbering.strings))
+        for string in reversed(numbering.strings):
+            string_section.write_varint(len(string.encode()) + 1)
+        for string in numbering.strings:
+            string_section.write_nul_terminated_string(string)
+
+        output = EncodingWriter()
+        output.write_bytes(MAGIC)
+        output.write_varint(self.version)
+        output.write_nul_terminated_string(self.producer)
+        output.write_section(Section.STRING, string_section)
+        output.write_section(Section.DIALECT, dialect_section)
+        output.write_section(Section.ATTR_TYPE, attr_type_section)
+        output.write_section(Section.ATTR_TYPE_OFFSET, attr_type_offset_section)
+        output.write_section(Section.IR, ir_section)
+        if resource_section is not None and resource_offset_section is not None:
+            output.write_section(Section.RESOURCE, resource_section)
+            output.write_section(Section.RESOURCE_OFFSET, resource_offset_section)
+        if self.version >= BytecodeVersion.NATIVE_PROPERTIES_ENCODING:
+            properties_section = EncodingWriter()
+            properties_section.write_varint(len(self._properties))
+            for properties in self._properties:
+                properties_section.write_varint(len(properties))
+                properties_section.write_bytes(properties.data)
+            output.write_section(Section.PROPERTIES, properties_section)
+        self.stream.write(output.data)
+
+    def _op_name(self, op: Operation) -> str:
+        if isinstance(op, UnregisteredOp):
+            return op.op_name.data
+        return op.name
+
+    def _has_properties_section(self, op: Operation) -> bool:
+        """
+        Return if the properties of an operation are written in the properties
+        section, which only exists from version 5.
+        """
+        return (
+            bool(op.properties)
+            and self.version >= BytecodeVersion.NATIVE_PROPERTIES_ENCODING
+        )
+
+    def _attr_dict(self, op: Operation) -> DictionaryAttr:
+        if self._has_properties_section(op):
+            attributes = dict(op.attributes)
+        else:
+            # Without a properties section, properties are encoded in the attribute
+            # dictionary, and extracted by name when reading, so they cannot share a
+            # name with an attribute.
+            if clashes := op.properties.keys() & op.attributes.keys():
+                raise BytecodeError(
+                    f"cannot write {op.name} as bytecode, as it has both a property "
+                    f"and an attribute named {', '.join(sorted(clashes))}"
+                )
+            attributes = {**op.properties, **op.attributes}
+        if isinstance(op, UnregisteredOp):
+            del attributes["op_name__"]
+        return DictionaryAttr(attributes)
+
+    def _number_op(self, root: Operation) -> None:
+        numbering = self._numbering
+        numbering.write_attribute(UnknownLoc())
+        for op in root.walk():
+            numbering.number_op_name(self._op_name(op))
+            if (attr_dict := self._attr_dict(op)).data:
+                numbering.write_attribute(attr_dict)
+            if self._has_properties_section(op):
+                numbering.write_attribute(DictionaryAttr(op.properties))
+            for result in op.results:
+                numbering.write_type(result.type)
+            for region in op.regions:
+                for block in region.blocks:
+                    for arg in block.args:
+                        numbering.write_type(arg.type)
+
+    def _write_dialect_section(self) -> EncodingWriter:
+        numbering = self._numbering
+        section = EncodingWriter()
+        section.write_varint(len(numbering.dialects))
+        for dialect in numbering.dialects:
+            numbering.write_string(dialect)
+            if self.version >= BytecodeVersion.DIALECT_VERSIONING:
+                section.write_varint_with_flag(numbering.strings[dialect], False)
+            else:
+                section.write_varint(numbering.strings[dialect])
+        if self.version >= BytecodeVersion.ELIDE_UNKNOWN_BLOCK_ARG_LOCATION:
+            section.write_varint(len(numbering.op_names))
+
+        groups = _group_by_dialect(
+            numbering.op_names, _op_dialect_name, numbering.dialects
+        )
+        for dialect, names in groups:
+            section.write_varint(dialect)
+            section.write_varint(len(names))
+            for name in names:
+                numbering.write_string(op_name := name.partition(".")[2])
+                if self.version >= BytecodeVersion.NATIVE_PROPERTIES_ENCODING:
+                    section.write_varint_with_flag(numbering.strings[op_name], False)
+                else:
+                    section.write_varint(numbering.strings[op_name])
+        return section
+
+    def _write_attr_type_sections(self) -> tuple[EncodingWriter, EncodingWriter]:
+        numbering = self._numbering
+        # Strings referenced by entries are numbered when writing the entries
+        data = _EntryWriter(numbering)
+        offsets = EncodingWriter()
+        offsets.write_varint(len(numbering.attributes))
+        offsets.write_varint(len(numbering.types))
+
+        for entries, dialect_name, write_builtin in (
+            (numbering.attributes, _attribute_dialect_name, _write_builtin_attribute),
+            (numbering.types, _type_dialect_name, _write_builtin_type),
+        ):
+            groups = _group_by_dialect(entries, dialect_name, numbering.dialects)
+            for dialect, group in groups:
+                offsets.write_varint(dialect)
+                offsets.write_varint(len(group))
+                for entry in group:
+                    start = len(data)
+                    has_custom = write_builtin(entry, data)
+                    if not has_custom:
+                        self._text.seek(0)
+                        self._text.truncate()
+                        self._printer.print_attribute(entry)
+                        data.write_nul_terminated_string(self._text.getvalue())
+                    offsets.write_varint_with_flag(len(data) - start, has_custom)
+        return data, offsets
+
+    def _write_resource_sections(
+        self,
+    ) -> tuple[EncodingWriter | None, EncodingWriter | None]:
+        numbering = self._numbering
+        referenced = self._printer._dialect_resources  # pyright: ignore[reportPrivateUsage]
+        interfaces = {
+            dialect.name: dialect.get_interface(OpAsmDialectInterface)
+            for dialect in self.dialects
+            if dialect.has_interface(OpAsmDialectInterface)
+        }
+        data = EncodingWriter()
+        offsets = EncodingWriter()
+        # No external resources are written
+        offsets.write_varint(0)
+        for dialect, index in numbering.dialects.items():
+            if (interface := interfaces.get(dialect)) is None:
+                continue
+            if dialect not in referenced:
+                continue
+            resources = interface.build_resources(sorted(referenced[dialect]))
+            if not resources:
+                continue
+            offsets.write_varint(index)
+            offsets.write_varint(len(resources))
+            for key, value in resources.items():
+                blob = bytes.fromhex(value[2:])
+                alignment = int.from_bytes(blob[:4], "little")
+                start = len(data)
+                data.write_varint(alignment)
+                data.write_varint(len(blob) - 4)
+                data.align_to(alignment)
+                data.write_bytes(blob[4:])
+                numbering.write_string(key)
+                offsets.write_varint(numbering.strings[key])
+                offsets.write_varint(len(data) - start)
+                offsets.write_byte(ResourceKind.BLOB)
+        if not len(data):
+            return None, None
+        return data, offsets
+
+    def _write_op(self, writer: EncodingWriter, op: Operation) -> None:
+        numbering = self._numbering
+        writer.write_varint(numbering.op_names[self._op_name(op)])
+        mask_offset = len(writer)
+        writer.write_byte(0)
+        writer.write_varint(numbering.attributes[UnknownLoc()])
+
+        mask = OpEncodingMask(0)
+        if (attr_dict := self._attr_dict(op)).data:
+            mask |= OpEncodingMask.HAS_ATTRS
+            writer.write_varint(numbering.attributes[attr_dict])
+        if self._has_properties_section(op):
+            mask |= OpEncodingMask.HAS_PROPERTIES
+            properties = DictionaryAttr(op.properties)
+            if (index := self._properties_ids.get(properties)) is None:
+                index = self._properties_ids[properties] = len(self._properties)
+                encoded = EncodingWriter()
+                encoded.write_varint(numbering.attributes[properties])
+                self._properties.append(encoded)
+            writer.write_varint(index)
+        if op.results:
+            mask |= OpEncodingMask.HAS_RESULTS
+            writer.write_varint(len(op.results))
+            for result in op.results:
+                writer.write_varint(numbering.types[result.type])
+        if op.operands:
+            mask |= OpEncodingMask.HAS_OPERANDS
+            writer.write_varint(len(op.operands))
+            value_ids = self._value_ids[-1]
+            for operand in op.operands:
+                if (value_id := value_ids.get(operand)) is None:
+                    raise BytecodeError(
+                        f"operand of {self._op_name(op)} is not defined in its scope"
+                    )
+                writer.write_varint(value_id)
+        if op.successors:
+            mask |= OpEncodingMask.HAS_SUCCESSORS
+            writer.write_varint(len(op.successors))
+            for successor in op.successors:
+                writer.write_varint(self._block_ids[successor])
+        if op.regions:
+            mask |= OpEncodingMask.HAS_INLINE_REGIONS
+        writer.data[mask_offset] = mask
+
+        if not op.regions:
+            return
+        isolated = op.has_trait(IsolatedFromAbove)
+        writer.write_varint_with_flag(len(op.regions), isolated)
+        if isolated:
+            self._value_ids.append({})
+            if self.version >= BytecodeVersion.LAZY_LOADING:
+                # Isolated regions are written in their own section to load them lazily
+                section = EncodingWriter()
+                for region in op.regions:
+                    self._write_region(section, region)
+                writer.write_section(Section.IR, section)
+            else:
+                for region in op.regions:
+                    self._write_region(writer, region)
+            self._value_ids.pop()
+        else:
+            for region in op.regions:
+                self._write_region(writer, region)
+
+    def _write_region(self, writer: EncodingWriter, region: Region) -> None:
+        blocks = list(region.blocks)
+        writer.write_varint(len(blocks))
+        if not blocks:
+            return
+
+        # The values of a region are numbered after the ones of its parent regions
+        value_ids = self._value_ids[-1]
+        first_id = next_id = len(value_ids)
+        for i, block in enumerate(blocks):
+            self._block_ids[block] = i
+            for arg in block.args:
+                value_ids[arg] = next_id
+                next_id += 1
+            for op in block.ops:
+                for result in op.results:
+                    value_ids[result] = next_id
+                    next_id += 1
+        writer.write_varint(next_id - first_id)
+
+        numbering = self._numbering
+        for block in blocks:
+            writer.write_varint_with_flag(len(block.ops), bool(block.args))
+            if block.args:
+                writer.write_varint(len(block.args))
+                for arg in block.args:
+                    if self.version >= BytecodeVersion.ELIDE_UNKNOWN_BLOCK_ARG_LOCATION:
+                        writer.write_varint_with_flag(numbering.types[arg.type], False)
+                    else:
+                        writer.write_varint(numbering.types[arg.type])
+                        writer.write_varint(numbering.attributes[UnknownLoc()])
+                if self.version >= BytecodeVersion.USE_LIST_ORDERING:
+                    writer.write_byte(0)
+            for op in block.ops:
+                self._write_op(writer, op)
+
+        for block in blocks:
+            for arg in block.args:
+                del value_ids[arg]
+            for op in block.ops:
+                for result in op.results:
+                    del value_ids[result]
+
+
+def write_bytecode(
+    op: Operation,
+    stream: IO[bytes],
+    dialects: Iterable[Dialect] = (),
+    *,
+    version: int = BytecodeVersion.CURRENT,
+) -> None:
+    """
+    Write an operation in the MLIR bytecode format, along with the resources of
+    `dialects` it references.
+    """
+    BytecodeWriter(stream, dialects, version=version).write(op)
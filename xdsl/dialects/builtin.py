@@ -69,6 +69,7 @@ from xdsl.irdl import (
     var_result_def,
 )
 from xdsl.traits import (
+    HasGraphRegions,
     IsolatedFromAbove,
     NoMemoryEffect,
     NoTerminator,
@@ -1629,6 +1630,10 @@ class DenseArrayBase(
             elt_type = self.elt_type
             if isinstance(elt_type, IntegerType):
                 int_self: DenseArrayBase[IntegerType] = self  # pyright: ignore[reportAssignmentType]
+                if elt_type != i1:
+                    # Format all the values at once rather than one by one
+                    printer.print_string(", ".join(map(str, int_self.iter_values())))
+                    return
                 printer.print_list(
                     int_self.iter_values(),
                     lambda x: printer.print_int(x, elt_type),
@@ -2183,6 +2188,7 @@ class ModuleOp(IRDLOperation):
     body = region_def("single_block")
 
     traits = traits_def(
+        HasGraphRegions(),
         IsolatedFromAbove(),
         NoTerminator(),
         OptionalSymbolOpInterface(),
@@ -2728,8 +2734,9 @@ class DenseIntOrFPElementsAttr(
         Return whether or not this dense attribute is defined entirely
         by a single value (splat).
         """
-        values = self.get_values()
-        return values.count(values[0]) == len(values)
+        data = self.data.data
+        elt_size = self.type.element_type.compile_time_size
+        return data == data[:elt_size] * (len(data) // elt_size)
 
     @staticmethod
     def parse_with_type(parser: AttrParser, type: Attribute) -> TypedAttribute:
@@ -2775,20 +2782,29 @@ class DenseIntOrFPElementsAttr(
         printer.print_string("]")
 
     def print_without_type(self, printer: Printer):
-        printer.print_string("dense")
         length = len(self)
-        data = self.get_values()
-        shape = self.get_shape() if self.shape_is_complete else (length,)
-        assert shape is not None, "If shape is complete, then it cannot be None"
+        is_splat = length != 0 and self.is_splat()
+        limit = printer.elide_large_elements_attrs
+        if limit is not None and length > limit and not is_splat:
+            printer.print_string("dense_resource<__elided__>")
+            return
+        printer.print_string("dense")
         with printer.in_angle_brackets():
             if length == 0:
                 pass
-            elif self.is_splat():
-                self._print_one_elem(data[0], printer)
+            elif is_splat:
+                # Only unpack the first element of the splat
+                element_type = self.get_element_type()
+                value = element_type.unpack(
+                    self.data.data[: element_type.compile_time_size], 1
+                )[0]
+                self._print_one_elem(value, printer)
             elif length > 100:
+                # Large attributes are printed as a hex blob, as done by MLIR
                 printer.print_string(f'"0x{self.data.data.hex().upper()}"')
             else:
-                self._print_dense_list(data, shape, printer)
+                shape = self.get_shape() if self.shape_is_complete else (length,)
+                self._print_dense_list(self.get_values(), shape, printer)
 
     def print_builtin(self, printer: Printer):
         self.print_without_type(printer)
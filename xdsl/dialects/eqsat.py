@@ -78,7 +78,7 @@ class EClassOp(IRDLOperation):
                 )
 
             if not operand.has_one_use():
-                if len(set(use.operation for use in operand.uses)) == 1:
+                if operand.get_unique_user() is not None:
                     raise VerifyException(
                         "Eclass operands must only be used once by the eclass."
                     )
@@ -194,17 +194,22 @@ def print_func_op_like(
 ):
     printer.print_string(" ")
     printer.print_symbol_name(sym_name.data)
-    if body.blocks:
+    # Avoid parsing a lazily parsed body that has its arguments parsed already
+    if (lazy_body := body.lazy_body) is not None and lazy_body.entry_block is not None:
+        entry_block = lazy_body.entry_block
+    else:
+        entry_block = body.blocks.first
+    if entry_block is not None:
         with printer.in_parens():
             if arg_attrs is not None:
                 printer.print_list(
-                    zip(body.blocks[0].args, arg_attrs),
+                    zip(entry_block.args, arg_attrs),
                     lambda arg_with_attrs: print_func_argument(
                         printer, arg_with_attrs[0], arg_with_attrs[1]
                     ),
                 )
             else:
-                printer.print_list(body.blocks[0].args, printer.print_block_argument)
+                printer.print_list(entry_block.args, printer.print_block_argument)
 
         if function_type.outputs:
             printer.print_string(" -> ")
@@ -228,7 +233,7 @@ def print_func_op_like(
     )
     printer.print_string(" ", indent=0)
 
-    if body.blocks:
+    if entry_block is not None:
         printer.print_region(body, False, False)
 
 
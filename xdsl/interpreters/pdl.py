@@ -236,6 +236,7 @@ class PDLRewritePattern(RewritePattern):
         self.interpreter = Interpreter(pdl_module, file=file)
         self.interpreter.register_implementations(self.functions)
         self.pdl_rewrite_op = pdl_rewrite_op
+        self.benefit = pdl_pattern.benefit.value.data
         if native_constraints is None:
             native_constraints = {}
         self.native_constraints = native_constraints
@@ -27,6 +27,7 @@ from typing import (
     get_origin,
     overload,
 )
+from weakref import WeakValueDictionary
 
 from typing_extensions import Self, TypeVar
 
@@ -446,6 +447,28 @@ class ParametrizedAttribute(Attribute):
             ),
         )
 
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.parameters == cast(ParametrizedAttribute, other).parameters
+
+    def __hash__(self) -> int:
+        # Attributes are immutable, so their hash is computed only once.
+        # It is stored in the instance dictionary, as the dataclass is frozen.
+        attr_dict = self.__dict__
+        if (attr_hash := attr_dict.get("_hash")) is None:
+            attr_hash = hash((self.__class__, self.parameters))
+            attr_dict["_hash"] = attr_hash
+        return attr_hash
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The cached hash depends on the interpreter, so it should not be pickled.
+        state = self.__dict__.copy()
+        state.pop("_hash", None)
+        return state
+
     @classmethod
     def new(cls: type[Self], params: Sequence[Attribute]) -> Self:
         """
@@ -490,6 +513,41 @@ class ParametrizedAttribute(Attribute):
         super()._verify()
 
 
+_uniqued_attributes: WeakValueDictionary[tuple[Any, ...], Attribute] = (
+    WeakValueDictionary()
+)
+"""
+The attributes that were uniqued with `get_unique_attribute`, indexed by their class
+and parameters. Entries are removed once the attribute is not referenced anymore.
+"""
+
+
+def get_unique_attribute(attr: AttributeInvT) -> AttributeInvT:
+    """
+    Return an attribute equal to `attr`, that is shared by all previous callers
+    uniquing an equal attribute.
+    Uniquing attributes reduces memory usage when the same attributes are created
+    many times, and speeds up equality checks, which short-circuit on identity.
+
+    Only types and attributes wrapping a string are uniqued, as other attributes may
+    be equal without being interchangeable (e.g. `0.0` and `-0.0` floats).
+    """
+    if isinstance(attr, ParametrizedAttribute):
+        if not isinstance(attr, TypeAttribute):
+            return attr
+        key = (attr.__class__, *attr.parameters)
+    elif isinstance(attr, Data) and isinstance(data := attr.data, str):
+        key = (attr.__class__, data)
+    else:
+        return attr
+
+    unique_attr = _uniqued_attributes.get(key)
+    if unique_attr is None:
+        _uniqued_attributes[key] = attr
+        return attr
+    return cast(AttributeInvT, unique_attr)
+
+
 class TypedAttribute(ParametrizedAttribute, ABC):
     """
     An attribute with a type.
@@ -515,7 +573,7 @@ class TypedAttribute(ParametrizedAttribute, ABC):
     def print_without_type(self, printer: Printer): ...
 
 
-@dataclass
+@dataclass(slots=True)
 class Use:
     """The use of a SSA value."""
 
@@ -548,7 +606,7 @@ class Use:
         return self is other
 
 
-@dataclass
+@dataclass(slots=True)
 class IRUses(Iterable[Use]):
     """
     Multi-pass iterable of the uses of an IR value (SSAValue or Block).
@@ -566,21 +624,25 @@ class IRUses(Iterable[Use]):
         """Returns `True` if there are operations in this block."""
         return self.ir.first_use is not None
 
+    def __len__(self) -> int:
+        """Returns the number of uses, which is maintained by the value."""
+        return self.ir._num_uses  # pyright: ignore[reportPrivateUsage]
+
     def get_length(self) -> int:
-        """
-        Returns the number of uses.
-        We do not expose it as `__len__` as it is expensive to compute `O(len)`.
-        """
-        return len(tuple(self))
+        """Returns the number of uses."""
+        return self.ir._num_uses  # pyright: ignore[reportPrivateUsage]
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class IRWithUses(ABC):
     """IRNode which stores a list of its uses."""
 
     first_use: Use | None = field(init=False, default=None, repr=False)
     """The first use of the value in the use list."""
 
+    _num_uses: int = field(init=False, default=0, repr=False)
+    """The number of uses in the use list."""
+
     @property
     def uses(self) -> IRUses:
         """Returns an iterable of all uses of the value."""
@@ -594,6 +656,7 @@ class IRWithUses(ABC):
         if first_use is not None:
             first_use._prev_use = use  # pyright: ignore[reportPrivateUsage]
         self.first_use = use
+        self._num_uses += 1
 
     def remove_use(self, use: Use):
         """Remove a use of the value."""
@@ -606,6 +669,41 @@ class IRWithUses(ABC):
 
         if prev_use is None:
             self.first_use = next_use
+        self._num_uses -= 1
+
+    @abstractmethod
+    def _references_in(self, op: Operation) -> Sequence[IRWithUses]:
+        """
+        The operands or successors of an operation, depending on which of them can
+        refer to the value, indexed like the uses of the value.
+        """
+        ...
+
+    def users(self) -> Iterator[Operation]:
+        """
+        Iterate over the distinct operations using the value.
+        An operation using the value several times is only returned for its use with
+        the lowest index, so that no set of visited operations is needed.
+        """
+        use = self.first_use
+        while use is not None:
+            op = use._operation  # pyright: ignore[reportPrivateUsage]
+            if self._references_in(op).index(self) == use._index:  # pyright: ignore[reportPrivateUsage]
+                yield op
+            use = use._next_use  # pyright: ignore[reportPrivateUsage]
+
+    def get_unique_user(self) -> Operation | None:
+        """
+        Returns the operation using the value if all its uses are from the same
+        operation, or None if there are no uses or several users.
+        """
+        if (use := self.first_use) is None:
+            return None
+        op = use._operation  # pyright: ignore[reportPrivateUsage]
+        while (use := use._next_use) is not None:  # pyright: ignore[reportPrivateUsage]
+            if use._operation is not op:  # pyright: ignore[reportPrivateUsage]
+                return None
+        return op
 
     def has_one_use(self) -> bool:
         """Returns true if the value has exactly one use."""
@@ -641,7 +739,7 @@ class IRWithUses(ABC):
         return None
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class SSAValue(Generic[AttributeCovT], IRWithUses, ABC):
     """
     A reference to an SSA variable.
@@ -750,6 +848,9 @@ class SSAValue(Generic[AttributeCovT], IRWithUses, ABC):
             )
         self.replace_by(ErasedSSAValue(self.type, self))
 
+    def _references_in(self, op: Operation) -> Sequence[IRWithUses]:
+        return op._operands  # pyright: ignore[reportPrivateUsage]
+
     def __hash__(self):
         """
         Make SSAValue hashable. Two SSA Values are never the same, therefore
@@ -761,7 +862,7 @@ class SSAValue(Generic[AttributeCovT], IRWithUses, ABC):
         return self is other
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class OpResult(Generic[AttributeCovT], SSAValue[AttributeCovT]):
     """A reference to an SSA variable defined by an operation result."""
 
@@ -784,7 +885,7 @@ class OpResult(Generic[AttributeCovT], SSAValue[AttributeCovT]):
         )
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class BlockArgument(Generic[AttributeCovT], SSAValue[AttributeCovT]):
     """A reference to an SSA variable defined by a basic block argument."""
 
@@ -806,7 +907,7 @@ class BlockArgument(Generic[AttributeCovT], SSAValue[AttributeCovT]):
         )
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class ErasedSSAValue(SSAValue):
     """
     An erased SSA variable.
@@ -822,6 +923,8 @@ class ErasedSSAValue(SSAValue):
 
 @dataclass(init=False)
 class _IRNode(ABC):
+    __slots__ = ()
+
     def is_ancestor(self, op: IRNode) -> bool:
         "Returns true if `self` is an ancestor of `op`."
         curr = op
@@ -853,6 +956,28 @@ class _IRNode(ABC):
     @abstractmethod
     def parent_node(self) -> IRNode | None: ...
 
+    @abstractmethod
+    def walk(
+        self, *, reverse: bool = False, region_first: bool = False
+    ) -> Iterable[Operation]:
+        """Iterate all operations contained in the node."""
+        ...
+
+    def walk_ops_of_type(
+        self,
+        op_type: type[OpT],
+        *,
+        reverse: bool = False,
+        region_first: bool = False,
+    ) -> Iterator[OpT]:
+        """
+        Iterate all operations of the given type contained in the node, in the same
+        order as `walk`.
+        """
+        for op in self.walk(reverse=reverse, region_first=region_first):
+            if isinstance(op, op_type):
+                yield op
+
     def __eq__(self, other: object) -> bool:
         return self is other
 
@@ -860,7 +985,7 @@ class _IRNode(ABC):
         return id(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class OpOperands(Sequence[SSAValue]):
     """
     A view of the operand list of an operation.
@@ -886,6 +1011,7 @@ class OpOperands(Sequence[SSAValue]):
         operand.add_use(operand_uses[idx])
         new_operands = (*operands[:idx], operand, *operands[idx + 1 :])
         self._op._operands = new_operands  # pyright: ignore[reportPrivateUsage]
+        self._op.invalidate_structural_hash()
 
     def __iter__(self) -> Iterator[SSAValue]:
         return iter(self._op._operands)  # pyright: ignore[reportPrivateUsage]
@@ -994,6 +1120,19 @@ class Operation(_IRNode):
     _prev_op: Operation | None = field(default=None, repr=False)
     """Previous operation in block containing this operation."""
 
+    _order_index: int = field(default=-1, repr=False)
+    """
+    Sparse position of the operation in its parent block, used to answer ordering
+    queries in constant time.
+    Only meaningful when the order of the parent block is valid.
+    """
+
+    _structural_hash: int | None = field(default=None, repr=False)
+    """
+    The cached structural hash of the operation, or `None` if it has to be
+    recomputed. See `structural_hash`.
+    """
+
     traits: ClassVar[OpTraits]
     """
     Traits attached to an operation definition.
@@ -1086,6 +1225,7 @@ class Operation(_IRNode):
             operand.add_use(use)
         self._operands = new
         self._operand_uses = new_uses
+        self.invalidate_structural_hash()
 
     @property
     def successors(self) -> OpSuccessors:
@@ -1101,6 +1241,7 @@ class Operation(_IRNode):
             successor.add_use(use)
         self._successors = new
         self._successor_uses = new_uses
+        self.invalidate_structural_hash()
 
     def __post_init__(self):
         assert self.name != ""
@@ -1165,6 +1306,7 @@ class Operation(_IRNode):
             )
         self.regions += (region,)
         region.parent = self
+        self.invalidate_structural_hash()
 
     def get_region_index(self, region: Region) -> int:
         """Get the region position in the operation."""
@@ -1186,6 +1328,7 @@ class Operation(_IRNode):
             region = self.regions[region_idx]
         region.parent = None
         self.regions = self.regions[:region_idx] + self.regions[region_idx + 1 :]
+        self.invalidate_structural_hash()
         return region
 
     def drop_all_references(self) -> None:
@@ -1245,12 +1388,9 @@ class Operation(_IRNode):
         ) is None or other_op.parent_block() is not parent_block:
             return False
 
-        op = self.next_op
-        while op is not None:
-            if op is other_op:
-                return True
-            op = op.next_op
-        return False
+        if parent_block._op_order == _OP_ORDER_INVALID:  # pyright: ignore[reportPrivateUsage]
+            parent_block._recompute_op_order()  # pyright: ignore[reportPrivateUsage]
+        return self._order_index < other_op._order_index
 
     def verify(self, verify_nested_ops: bool = True) -> None:
         for operand in self.operands:
@@ -1385,6 +1525,73 @@ class Operation(_IRNode):
             )
         return op
 
+    def _clone_nested(
+        self,
+        value_mapper: dict[SSAValue, SSAValue],
+        block_mapper: dict[Block, Block],
+        clone_name_hints: bool,
+    ) -> Self:
+        """
+        Clone an operation nested in a region that is being cloned.
+        The source operation is already well-formed, so the fields are copied
+        directly instead of going through `create`, which checks its arguments,
+        fills in default attributes and notifies implicit builders.
+        """
+        cls = type(self)
+        op = cls.__new__(cls)
+
+        # Empty operands, results, successors and regions are left to the class
+        # defaults
+        if self._operands:
+            operands = tuple(
+                [value_mapper.get(operand, operand) for operand in self._operands]
+            )
+            operand_uses = tuple([Use(op, idx) for idx in range(len(operands))])
+            for operand, use in zip(operands, operand_uses):
+                operand.add_use(use)
+            op._operands = operands
+            op._operand_uses = operand_uses
+
+        if self.results:
+            results: list[OpResult] = []
+            for result in self.results:
+                new_result = OpResult(result.type, op, result.index)
+                value_mapper[result] = new_result
+                if clone_name_hints:
+                    new_result._name = result._name  # pyright: ignore[reportPrivateUsage]
+                results.append(new_result)
+            op.results = tuple(results)
+
+        if self._successors:
+            successors = tuple(
+                [
+                    block_mapper.get(successor, successor)
+                    for successor in self._successors
+                ]
+            )
+            successor_uses = tuple([Use(op, idx) for idx in range(len(successors))])
+            for successor, use in zip(successors, successor_uses):
+                successor.add_use(use)
+            op._successors = successors
+            op._successor_uses = successor_uses
+
+        op.properties = self.properties.copy()
+        op.attributes = self.attributes.copy()
+
+        if self.regions:
+            regions = tuple(Region() for _ in self.regions)
+            op.regions = regions
+            for region, new_region in zip(self.regions, regions):
+                new_region.parent = op
+                region.clone_into(
+                    new_region,
+                    0,
+                    value_mapper,
+                    block_mapper,
+                    clone_name_hints=clone_name_hints,
+                )
+        return op
+
     @classmethod
     def has_trait(
         cls,
@@ -1439,6 +1646,62 @@ class Operation(_IRNode):
             raise ValueError("Cannot detach a toplevel operation.")
         self.parent.detach_op(self)
 
+    def structural_hash(self, use_cache: bool = True) -> int:
+        """
+        Get a hash of the operation that is consistent with
+        `is_structurally_equivalent`.
+        It combines the operation name, attributes, properties, result types,
+        operand types and producers, successors, and the hashes of the nested
+        regions.
+        If `use_cache` is set, the hash is cached on the operation. The cache is
+        invalidated when operands, successors, regions, blocks, or nested
+        operations are changed through the IR API, but
+        `invalidate_structural_hash` should be called after mutating the
+        attributes or properties dictionaries in place.
+        """
+        if not use_cache or (structural_hash := self._structural_hash) is None:
+            operands = tuple(
+                (operand.type, operand.owner.name, operand.index)
+                if isinstance(operand, OpResult)
+                else (operand.type, operand.index)
+                if isinstance(operand, BlockArgument)
+                else operand
+                for operand in self._operands
+            )
+            successors = tuple(
+                successor.parent.get_block_index(successor)
+                if successor.parent is not None
+                else successor
+                for successor in self._successors
+            )
+            structural_hash = hash(
+                (
+                    self.name,
+                    frozenset(self.attributes.items()),
+                    frozenset(self.properties.items()),
+                    tuple(result.type for result in self.results),
+                    operands,
+                    successors,
+                    tuple(region.structural_hash(use_cache) for region in self.regions),
+                )
+            )
+            if use_cache:
+                self._structural_hash = structural_hash
+        return structural_hash
+
+    def invalidate_structural_hash(self) -> None:
+        """
+        Invalidate the cached structural hash of this operation and of its
+        ancestors.
+        Ancestors are only cached if their nested operations are, so the
+        invalidation stops at the first ancestor that has no cached hash.
+        """
+        self._structural_hash = None
+        op = self.parent_op()
+        while op is not None and op._structural_hash is not None:
+            op._structural_hash = None
+            op = op.parent_op()
+
     def is_structurally_equivalent(
         self,
         other: IRNode,
@@ -1463,6 +1726,7 @@ class Operation(_IRNode):
             or len(self.successors) != len(other.successors)
             or self.attributes != other.attributes
             or self.properties != other.properties
+            or self.result_types != other.result_types
         ):
             return False
         if (
@@ -1512,8 +1776,9 @@ class Operation(_IRNode):
         from xdsl.printer import Printer
 
         res = StringIO()
-        printer = Printer(stream=res)
+        printer = Printer(stream=res, buffered=True)
         printer.print_op(self)
+        printer.flush()
         return res.getvalue()
 
     def __format__(self, format_spec: str, /) -> str:
@@ -1528,8 +1793,26 @@ class Operation(_IRNode):
 
 OperationInvT = TypeVar("OperationInvT", bound=Operation)
 
+_OP_ORDER_STRIDE = 5
+"""
+The distance between the order indices of consecutive operations when a block is
+renumbered, leaving room to insert operations without renumbering.
+"""
 
-@dataclass
+_OP_ORDER_INVALID = 0
+"""The `_order_index` of the operations of a block are not known to be increasing."""
+
+_OP_ORDER_VALID = 1
+"""The `_order_index` of the operations of a block are increasing."""
+
+_OP_ORDER_DENSE = 2
+"""
+The `_order_index` of each operation of a block is exactly its position in the
+block multiplied by `_OP_ORDER_STRIDE`, which implies that they are increasing.
+"""
+
+
+@dataclass(slots=True)
 class _BlockOpsIterator(Iterator[Operation]):
     """
     Single-pass iterable of the operations in a block. Follows the next_op for
@@ -1549,7 +1832,7 @@ class _BlockOpsIterator(Iterator[Operation]):
         return next_op
 
 
-@dataclass
+@dataclass(slots=True)
 class _BlockOpsReverseIterator(Iterator[Operation]):
     """
     Single-pass iterable of the operations in a block. Follows the prev_op for
@@ -1569,7 +1852,7 @@ class _BlockOpsReverseIterator(Iterator[Operation]):
         return prev_op
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockOps(Reversible[Operation], Iterable[Operation]):
     """
     Multi-pass iterable of the operations in a block. Follows the next_op for
@@ -1613,18 +1896,39 @@ class BlockOps(Reversible[Operation], Iterable[Operation]):
 class Block(_IRNode, IRWithUses):
     """A sequence of operations"""
 
+    # Fields are stored in slots rather than in an instance dictionary, to reduce
+    # the memory footprint of blocks. As a consequence, fields cannot have class
+    # level defaults, and are all initialized in `__init__`.
+    __slots__ = (
+        "_args",
+        "_first_op",
+        "_last_op",
+        "_next_block",
+        "_prev_block",
+        "parent",
+        "_op_order",
+    )
+
     _args: tuple[BlockArgument, ...]
     """The basic block arguments."""
 
-    _first_op: Operation | None = field(repr=False)
-    _last_op: Operation | None = field(repr=False)
+    _first_op: Operation | None
+    _last_op: Operation | None
 
-    _next_block: Block | None = field(default=None, repr=False)
-    _prev_block: Block | None = field(default=None, repr=False)
+    _next_block: Block | None
+    _prev_block: Block | None
 
-    parent: Region | None = field(default=None, repr=False)
+    parent: Region | None
     """Parent region containing the block."""
 
+    _op_order: int
+    """
+    The state of the `_order_index` of the operations in the block, one of
+    `_OP_ORDER_INVALID`, `_OP_ORDER_VALID`, and `_OP_ORDER_DENSE`, in increasing
+    order of guarantees.
+    The order is recomputed lazily when an operation cannot be numbered on insertion.
+    """
+
     def __init__(
         self,
         ops: Iterable[Operation] = (),
@@ -1638,6 +1942,10 @@ class Block(_IRNode, IRWithUses):
         )
         self._first_op = None
         self._last_op = None
+        self._next_block = None
+        self._prev_block = None
+        self.parent = None
+        self._op_order = _OP_ORDER_DENSE
 
         self.add_ops(ops)
 
@@ -1645,6 +1953,9 @@ class Block(_IRNode, IRWithUses):
     def arg_types(self) -> Sequence[Attribute]:
         return tuple(arg.type for arg in self._args)
 
+    def _references_in(self, op: Operation) -> Sequence[IRWithUses]:
+        return op._successors  # pyright: ignore[reportPrivateUsage]
+
     @property
     def parent_node(self) -> IRNode | None:
         return self.parent
@@ -1699,7 +2010,10 @@ class Block(_IRNode, IRWithUses):
         new_arg = BlockArgument(arg_type, self, index)
         for arg in self._args[index:]:
             arg.index += 1
+            for use in arg.uses:
+                use.operation.invalidate_structural_hash()
         self._args = tuple(chain(self._args[:index], [new_arg], self._args[index:]))
+        self._invalidate_structural_hash()
         return new_arg
 
     def erase_arg(self, arg: BlockArgument, safe_erase: bool = True) -> None:
@@ -1712,8 +2026,16 @@ class Block(_IRNode, IRWithUses):
             raise ValueError("Attempting to delete an argument of the wrong block")
         for block_arg in self._args[arg.index + 1 :]:
             block_arg.index -= 1
+            for use in block_arg.uses:
+                use.operation.invalidate_structural_hash()
         self._args = tuple(chain(self._args[: arg.index], self._args[arg.index + 1 :]))
         arg.erase(safe_erase=safe_erase)
+        self._invalidate_structural_hash()
+
+    def _invalidate_structural_hash(self) -> None:
+        """Invalidate the cached structural hash of the operations containing the block."""
+        if (op := self.parent_op()) is not None:
+            op.invalidate_structural_hash()
 
     def _attach_op(self, operation: Operation) -> None:
         """Attach an operation to the block, and check that it has no parents."""
@@ -1726,6 +2048,63 @@ class Block(_IRNode, IRWithUses):
                 "Can't add an operation to a block contained in the operation."
             )
         operation.parent = self
+        self._invalidate_structural_hash()
+
+    def _recompute_op_order(self) -> None:
+        """Densely renumber the operations of the block."""
+        index = 0
+        op = self._first_op
+        while op is not None:
+            op._order_index = index  # pyright: ignore[reportPrivateUsage]
+            index += _OP_ORDER_STRIDE
+            op = op._next_op  # pyright: ignore[reportPrivateUsage]
+        self._op_order = _OP_ORDER_DENSE
+
+    def _invalidate_op_order(self) -> None:
+        """Mark the order of the operations as unknown, to recompute it lazily."""
+        self._op_order = _OP_ORDER_INVALID
+
+    def _update_op_order(self, op: Operation) -> None:
+        """
+        Number an operation that was just linked in the block, using the gap between
+        its neighbours. The block order is invalidated if there is no gap left.
+        """
+        if self._op_order == _OP_ORDER_INVALID:
+            return
+        prev_op = op._prev_op  # pyright: ignore[reportPrivateUsage]
+        next_op = op._next_op  # pyright: ignore[reportPrivateUsage]
+        prev_index = -1 if prev_op is None else prev_op._order_index  # pyright: ignore[reportPrivateUsage]
+        if next_op is None:
+            # Appending an operation keeps the numbering dense.
+            op._order_index = (  # pyright: ignore[reportPrivateUsage]
+                0 if prev_op is None else prev_index + _OP_ORDER_STRIDE
+            )
+            return
+        next_index = next_op._order_index  # pyright: ignore[reportPrivateUsage]
+        if next_index - prev_index > 1:
+            op._order_index = (prev_index + next_index) // 2  # pyright: ignore[reportPrivateUsage]
+            self._op_order = _OP_ORDER_VALID
+        else:
+            self._op_order = _OP_ORDER_INVALID
+
+    def _append_cloned_ops(self, ops: Iterable[Operation]) -> None:
+        """
+        Link freshly cloned operations at the end of this empty block, numbering
+        them densely. The operations are not checked for an existing parent.
+        """
+        prev_op: Operation | None = None
+        order_index = 0
+        for op in ops:
+            op.parent = self
+            op._order_index = order_index  # pyright: ignore[reportPrivateUsage]
+            order_index += _OP_ORDER_STRIDE
+            if prev_op is None:
+                self._first_op = op
+            else:
+                prev_op._next_op = op  # pyright: ignore[reportPrivateUsage]
+                op._prev_op = prev_op  # pyright: ignore[reportPrivateUsage]
+            prev_op = op
+        self._last_op = prev_op
 
     @property
     def is_empty(self) -> bool:
@@ -1759,6 +2138,7 @@ class Block(_IRNode, IRWithUses):
         if next_op is None:
             # No `next_op`, means `prev_op` is the last op in the block.
             self._last_op = new_op
+        self._update_op_order(new_op)
 
     def insert_op_before(self, new_op: Operation, existing_op: Operation) -> None:
         """
@@ -1777,6 +2157,7 @@ class Block(_IRNode, IRWithUses):
         if prev_op is None:
             # No `prev_op`, means `next_op` is the first op in the block.
             self._first_op = new_op
+        self._update_op_order(new_op)
 
     def add_op(self, operation: Operation) -> None:
         """
@@ -1787,6 +2168,7 @@ class Block(_IRNode, IRWithUses):
             self._attach_op(operation)
             self._first_op = operation
             self._last_op = operation
+            self._update_op_order(operation)
         else:
             self.insert_op_after(operation, self._last_op)
 
@@ -1812,6 +2194,93 @@ class Block(_IRNode, IRWithUses):
 
             existing_op = op
 
+    def splice_ops(
+        self,
+        first: Operation,
+        last: Operation,
+        insert_before: Operation | None = None,
+    ) -> None:
+        """
+        Move the operations from `first` to `last` included, which should be
+        contiguous in a block, into this block before `insert_before`, or at the end
+        of this block if `insert_before` is `None`.
+        The range is unlinked and relinked as a whole, so that only the parent of the
+        moved operations has to be updated, and only if they change block.
+        """
+        source = first.parent
+        if source is None or last.parent is not source:
+            raise ValueError("Can't splice operations that are not in the same block.")
+        if insert_before is not None and insert_before.parent is not self:
+            raise ValueError(
+                "Can't insert operations before an operation not in this block."
+            )
+
+        # The destination should not be in the moved range, or nested in it.
+        if self is source:
+            inner = insert_before
+        elif (parent_op := self.parent_op()) is not None:
+            inner = source.find_ancestor_op_in_block(parent_op)
+        else:
+            inner = None
+        if (
+            inner is not None
+            and not inner.is_before_in_block(first)
+            and not last.is_before_in_block(inner)
+        ):
+            raise ValueError(
+                "Can't splice operations into a block contained in the operations."
+            )
+
+        # Unlink the range from the source block.
+        prev_op = first._prev_op  # pyright: ignore[reportPrivateUsage]
+        next_op = last._next_op  # pyright: ignore[reportPrivateUsage]
+        if prev_op is None:
+            source._first_op = next_op
+        else:
+            prev_op._next_op = next_op  # pyright: ignore[reportPrivateUsage]
+        if next_op is None:
+            source._last_op = prev_op
+        else:
+            next_op._prev_op = prev_op  # pyright: ignore[reportPrivateUsage]
+            source._op_order = min(source._op_order, _OP_ORDER_VALID)
+
+        # Link the range in this block.
+        after = self._last_op if insert_before is None else insert_before._prev_op  # pyright: ignore[reportPrivateUsage]
+        first._prev_op = after  # pyright: ignore[reportPrivateUsage]
+        last._next_op = insert_before  # pyright: ignore[reportPrivateUsage]
+        if after is None:
+            self._first_op = first
+        else:
+            after._next_op = first  # pyright: ignore[reportPrivateUsage]
+        if insert_before is None:
+            self._last_op = last
+        else:
+            insert_before._prev_op = last  # pyright: ignore[reportPrivateUsage]
+
+        self._invalidate_structural_hash()
+        if self is source:
+            self._op_order = _OP_ORDER_INVALID
+            return
+
+        # Update the parent of the moved operations, numbering them on the way when
+        # they are appended to a block with a valid order.
+        renumber = insert_before is None and self._op_order != _OP_ORDER_INVALID
+        order_index = (
+            0 if after is None else after._order_index + _OP_ORDER_STRIDE  # pyright: ignore[reportPrivateUsage]
+        )
+        op: Operation | None = first
+        while op is not None:
+            op.parent = self
+            if renumber:
+                op._order_index = order_index  # pyright: ignore[reportPrivateUsage]
+                order_index += _OP_ORDER_STRIDE
+            if op is last:
+                break
+            op = op._next_op  # pyright: ignore[reportPrivateUsage]
+        if not renumber:
+            self._op_order = _OP_ORDER_INVALID
+        source._invalidate_structural_hash()
+
     def split_before(
         self,
         b_first: Operation,
@@ -1828,7 +2297,6 @@ class Block(_IRNode, IRWithUses):
         The newly formed block is inserted into the parent region immediately after `self`
         and returned.
         """
-        # Use `a` for new contents of `self`, and `b` for new block.
         if b_first.parent is not self:
             raise ValueError("Cannot split block on operation outside of the block.")
 
@@ -1836,43 +2304,12 @@ class Block(_IRNode, IRWithUses):
         if parent is None:
             raise ValueError("Cannot split block with no parent.")
 
-        first_of_self = self._first_op
-        assert first_of_self is not None
-
         last_of_self = self._last_op
         assert last_of_self is not None
 
-        a_last = b_first.prev_op
-        b_last = last_of_self
-        if a_last is None:
-            # `before` is the first op in the Block, so all the ops move to the new block
-            a_first = None
-        else:
-            a_first = first_of_self
-
-        # Update first and last ops of self
-        self._first_op = a_first
-        self._last_op = a_last
-
         b = Block(arg_types=arg_types)
-        a_index = parent.get_block_index(self)
-        parent.insert_block(b, a_index + 1)
-
-        b._first_op = b_first
-        b._last_op = b_last
-
-        # Update parent for moved ops
-        b_iter: Operation | None = b_first
-        while b_iter is not None:
-            b_iter.parent = b
-            b_iter = b_iter.next_op
-
-        # Update next op for self.last
-        if a_last is not None:
-            a_last._next_op = None  # pyright: ignore[reportPrivateUsage]
-
-        # Update previous op for b.first
-        b_first._prev_op = None  # pyright: ignore[reportPrivateUsage]
+        parent.insert_block_after(b, self)
+        b.splice_ops(b_first, last_of_self)
 
         return b
 
@@ -1880,7 +2317,9 @@ class Block(_IRNode, IRWithUses):
         """Get the operation position in a block."""
         if op.parent is not self:
             raise ValueError("Operation is not a child of the block.")
-        return next(idx for idx, block_op in enumerate(self.ops) if block_op is op)
+        if self._op_order != _OP_ORDER_DENSE:
+            self._recompute_op_order()
+        return op._order_index // _OP_ORDER_STRIDE  # pyright: ignore[reportPrivateUsage]
 
     def detach_op(self, op: Operation) -> Operation:
         """
@@ -1890,6 +2329,7 @@ class Block(_IRNode, IRWithUses):
         if op.parent is not self:
             raise ValueError("Cannot detach operation from a different block.")
         op.parent = None
+        self._invalidate_structural_hash()
 
         prev_op = op.prev_op
         next_op = op.next_op
@@ -1914,6 +2354,10 @@ class Block(_IRNode, IRWithUses):
             assert self._last_op is op
             self._last_op = prev_op
 
+        if next_op is not None:
+            # Removing an operation keeps the order valid, but leaves a hole.
+            self._op_order = min(self._op_order, _OP_ORDER_VALID)
+
         return op
 
     def erase_op(self, op: Operation, safe_erase: bool = True) -> None:
@@ -2007,6 +2451,19 @@ class Block(_IRNode, IRWithUses):
         for op in self.ops:
             op.erase(safe_erase=safe_erase, drop_references=False)
 
+    def structural_hash(self, use_cache: bool = True) -> int:
+        """
+        Get a hash of the block that is consistent with `is_structurally_equivalent`.
+        It combines the argument types with the structural hashes of the block
+        operations.
+        """
+        return hash(
+            (
+                tuple(arg.type for arg in self._args),
+                tuple(op.structural_hash(use_cache) for op in self.ops),
+            )
+        )
+
     def is_structurally_equivalent(
         self,
         other: IRNode,
@@ -2039,7 +2496,7 @@ class Block(_IRNode, IRWithUses):
         return True
 
 
-@dataclass
+@dataclass(slots=True)
 class _RegionBlocksIterator(Iterator[Block]):
     """
     Single-pass iterable of the blocks in a region. Follows the next_block for
@@ -2059,7 +2516,7 @@ class _RegionBlocksIterator(Iterator[Block]):
         return next_block
 
 
-@dataclass
+@dataclass(slots=True)
 class OpSuccessors(Sequence[Block]):
     """
     A view of the successor list of an operation.
@@ -2085,6 +2542,7 @@ class OpSuccessors(Sequence[Block]):
         successor.add_use(successor_uses[idx])
         new_successors = (*successors[:idx], successor, *successors[idx + 1 :])
         self._op._successors = new_successors  # pyright: ignore[reportPrivateUsage]
+        self._op.invalidate_structural_hash()
 
     def __iter__(self) -> Iterator[Block]:
         return iter(self._op._successors)  # pyright: ignore[reportPrivateUsage]
@@ -2104,7 +2562,7 @@ class OpSuccessors(Sequence[Block]):
         return hash(self._op._successors)  # pyright: ignore[reportPrivateUsage]
 
 
-@dataclass
+@dataclass(slots=True)
 class _RegionBlocksReverseIterator(Iterator[Block]):
     """
     Single-pass iterable of the blocks in a region. Follows the prev_block for
@@ -2124,7 +2582,7 @@ class _RegionBlocksReverseIterator(Iterator[Block]):
         return prev_block
 
 
-@dataclass
+@dataclass(slots=True)
 class RegionBlocks(Sequence[Block], Reversible[Block]):
     """
     Multi-pass iterable of the blocks in a region.
@@ -2186,6 +2644,34 @@ class RegionBlocks(Sequence[Block], Reversible[Block]):
         return self._region.last_block
 
 
+class LazyRegionBody(ABC):
+    """
+    The contents of a region that are only built when the region blocks are first
+    accessed, for instance by parsing them from their source text.
+    """
+
+    entry_block: Block | None
+    """
+    The entry block of the region, if it is known before the contents are built.
+    Its arguments can then be accessed without building the region, and it only
+    gets its operations when the contents are built.
+    """
+
+    @abstractmethod
+    def build(self, region: Region) -> None:
+        """Build the blocks of `region`, which has no blocks yet."""
+        ...
+
+    def get_source_text(self, entry_arg_names: Sequence[str]) -> str | None:
+        """
+        Get the source text of the region, from its opening to its closing brace, if
+        the region can be printed from it without being built.
+        `entry_arg_names` are the names with which the arguments of `entry_block`
+        were printed.
+        """
+        return None
+
+
 @dataclass(init=False, eq=False, unsafe_hash=False)
 class Region(_IRNode):
     """A region contains a CFG of blocks. Regions are contained in operations."""
@@ -2196,19 +2682,53 @@ class Region(_IRNode):
         single-block region should be constructed.
         """
 
-    _first_block: Block | None = field(default=None, repr=False)
+    # As for blocks, fields are stored in slots and initialized in `__init__`.
+    __slots__ = ("_first_block", "_last_block", "parent", "_lazy_body")
+
+    _first_block: Block | None
     """The first block in the region. This is the entry block if it is present."""
 
-    _last_block: Block | None = field(default=None, repr=False)
+    _last_block: Block | None
     """The last block in the region."""
 
-    parent: Operation | None = field(default=None, repr=False)
+    parent: Operation | None
     """Operation containing the region."""
 
+    _lazy_body: LazyRegionBody | None
+    """
+    The contents of the region if they are not built yet.
+    They are built by the accessors of the region blocks.
+    """
+
     def __init__(self, blocks: Block | Iterable[Block] = ()):
         super().__init__()
+        self._first_block = None
+        self._last_block = None
+        self.parent = None
+        self._lazy_body = None
         self.add_block(blocks)
 
+    @staticmethod
+    def lazy(body: LazyRegionBody) -> Region:
+        """
+        Create a region whose contents are built from `body` when its blocks are
+        first accessed.
+        """
+        region = Region()
+        region._lazy_body = body
+        return region
+
+    @property
+    def lazy_body(self) -> LazyRegionBody | None:
+        """The contents of the region if they are not built yet."""
+        return self._lazy_body
+
+    def _build_lazy_body(self) -> None:
+        """Build the contents of the region if they are not built yet."""
+        if (lazy_body := self._lazy_body) is not None:
+            self._lazy_body = None
+            lazy_body.build(self)
+
     @property
     def parent_node(self) -> IRNode | None:
         return self.parent
@@ -2251,11 +2771,15 @@ class Region(_IRNode):
     @property
     def first_block(self) -> Block | None:
         """First block in this region. This is the entry block if present."""
+        if self._lazy_body is not None:
+            self._build_lazy_body()
         return self._first_block
 
     @property
     def last_block(self) -> Block | None:
         """Last block in this region."""
+        if self._lazy_body is not None:
+            self._build_lazy_body()
         return self._last_block
 
     def __repr__(self) -> str:
@@ -2297,6 +2821,8 @@ class Region(_IRNode):
         Get the block of a single-block region.
         Returns an exception if the region is not single-block.
         """
+        if self._lazy_body is not None:
+            self._build_lazy_body()
         if self._first_block is None or self._first_block is not self._last_block:
             raise ValueError(
                 "'block' property of Region class is only available "
@@ -2313,6 +2839,12 @@ class Region(_IRNode):
         if block.is_ancestor(self):
             raise ValueError("Can't add a block to a region contained in the block.")
         block.parent = self
+        self._invalidate_structural_hash()
+
+    def _invalidate_structural_hash(self) -> None:
+        """Invalidate the cached structural hash of the operations containing the region."""
+        if (op := self.parent) is not None:
+            op.invalidate_structural_hash()
 
     def add_block(self, block: Block | Iterable[Block]) -> None:
         """
@@ -2449,6 +2981,7 @@ class Region(_IRNode):
                 raise ValueError("Block is not a child of the region.")
 
         block.parent = None
+        self._invalidate_structural_hash()
         if (prev_block := block.prev_block) is None:
             self._first_block = block.next_block
         else:
@@ -2513,18 +3046,20 @@ class Region(_IRNode):
 
         # Populate the blocks with the cloned operations
         for block, new_block in zip(self.blocks, new_blocks):
-            for idx, block_arg in enumerate(block.args):
-                new_block.insert_arg(block_arg.type, idx)
-                new_arg = new_block.args[idx]
+            block_args = block.args
+            new_args = tuple(
+                BlockArgument(block_arg.type, new_block, idx)
+                for idx, block_arg in enumerate(block_args)
+            )
+            for block_arg, new_arg in zip(block_args, new_args):
                 value_mapper[block_arg] = new_arg
                 if clone_name_hints:
-                    new_arg.name_hint = block_arg.name_hint
-            for op in block.ops:
-                new_block.add_op(
-                    op.clone(
-                        value_mapper, block_mapper, clone_name_hints=clone_name_hints
-                    )
-                )
+                    new_arg._name = block_arg._name  # pyright: ignore[reportPrivateUsage]
+            new_block._args = new_args  # pyright: ignore[reportPrivateUsage]
+            new_block._append_cloned_ops(
+                op._clone_nested(value_mapper, block_mapper, clone_name_hints)  # pyright: ignore[reportPrivateUsage]
+                for op in block.ops
+            )
 
     def walk(
         self, *, reverse: bool = False, region_first: bool = False
@@ -2552,6 +3087,8 @@ class Region(_IRNode):
         This function is called prior to deleting a region.
         """
         self.parent = None
+        # Contents that were not built cannot refer to other operations.
+        self._lazy_body = None
         for block in self.blocks:
             block.drop_all_references()
 
@@ -2570,6 +3107,7 @@ class Region(_IRNode):
         """
         if region is self:
             raise ValueError("Cannot move region into itself.")
+        self._build_lazy_body()
         self_first_block = self._first_block
         if self_first_block is None:
             return
@@ -2592,6 +3130,8 @@ class Region(_IRNode):
 
         self._first_block = None
         self._last_block = None
+        self._invalidate_structural_hash()
+        region._invalidate_structural_hash()
 
     def move_blocks_before(self, target: Block) -> None:
         """
@@ -2604,6 +3144,7 @@ class Region(_IRNode):
         if region is None:
             raise ValueError("Cannot inline region before a block with no parent")
 
+        self._build_lazy_body()
         first_block = self._first_block
         if not first_block:
             return
@@ -2628,6 +3169,16 @@ class Region(_IRNode):
 
         self._first_block = None
         self._last_block = None
+        self._invalidate_structural_hash()
+        region._invalidate_structural_hash()
+
+    def structural_hash(self, use_cache: bool = True) -> int:
+        """
+        Get a hash of the region that is consistent with
+        `is_structurally_equivalent`.
+        It combines the structural hashes of the region blocks.
+        """
+        return hash(tuple(block.structural_hash(use_cache) for block in self.blocks))
 
     def is_structurally_equivalent(
         self,
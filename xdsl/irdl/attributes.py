@@ -308,11 +308,28 @@ def get_accessors_from_param_attr_def(attr_def: ParamAttrDef) -> dict[str, Any]:
     return {"get_irdl_definition": get_irdl_definition}
 
 
+def _get_eq_and_hash_from_param_attr(
+    cls: type[ParametrizedAttribute],
+) -> dict[str, Any]:
+    """
+    Use the cached hash and identity-aware equality of `ParametrizedAttribute`,
+    unless the definition overrides them, instead of the ones generated by
+    `dataclass`.
+    """
+    new_fields: dict[str, Any] = {}
+    if "__eq__" not in cls.__dict__:
+        new_fields["__eq__"] = ParametrizedAttribute.__eq__
+        if "__hash__" not in cls.__dict__:
+            new_fields["__hash__"] = ParametrizedAttribute.__hash__
+    return new_fields
+
+
 def irdl_param_attr_definition(cls: _PAttrTT) -> _PAttrTT:
     """Decorator used on classes to define a new attribute definition."""
 
     attr_def = ParamAttrDef.from_pyrdl(cls)
     new_fields = get_accessors_from_param_attr_def(attr_def)
+    new_fields.update(_get_eq_and_hash_from_param_attr(cls))
 
     if issubclass(cls, TypedAttribute):
         type_indexes = tuple(
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import inspect
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
 from typing import Any, ClassVar, Literal, cast
 
@@ -122,6 +122,32 @@ class FormatProgram:
 
         return FormatParser(input, op_def).parse_format()
 
+    def compile_parse(
+        self, op_def: OpDef
+    ) -> Callable[[Parser, type[IRDLOperation]], IRDLOperation]:
+        """
+        Return a function parsing operations with this format.
+        The function is generated from the program when possible, and otherwise
+        interprets it, for instance when the program has custom directives.
+        """
+        from xdsl.irdl.declarative_assembly_format_compiler import (
+            compile_format_parser,
+        )
+
+        return compile_format_parser(self, op_def) or self.parse
+
+    def compile_print(self, op_def: OpDef) -> Callable[[Printer, IRDLOperation], None]:
+        """
+        Return a function printing operations with this format.
+        The function is generated from the program when possible, and otherwise
+        interprets it, for instance when the program has custom directives.
+        """
+        from xdsl.irdl.declarative_assembly_format_compiler import (
+            compile_format_printer,
+        )
+
+        return compile_format_printer(self, op_def) or self.print
+
     def parse(
         self, parser: Parser, op_type: type[IRDLOperationInvT]
     ) -> IRDLOperationInvT:
@@ -0,0 +1,1102 @@
+"""
+This file compiles the programs of the MLIR declarative assembly format to Python
+functions that parse and print operations:
+https://mlir.llvm.org/docs/DefiningDialects/Operations/#declarative-assembly-format
+
+`FormatProgram` interprets its directives for every operation it parses or prints.
+The functions generated here inline the effect of each directive instead, and
+resolve once everything that only depends on the operation definition, such as
+the constraints to verify, the accessors of the operation fields, and the
+spacing between printed punctuations and keywords.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from xdsl.dialects.builtin import UnitAttr
+from xdsl.ir import Region
+from xdsl.irdl import (
+    AttrSizedSegments,
+    ConstraintContext,
+    IRDLOperation,
+    OpDef,
+    OptionalDef,
+    SameVariadicSize,
+    VariadicDef,
+)
+from xdsl.irdl.declarative_assembly_format import (
+    AttrDictDirective,
+    AttributeVariable,
+    DenseArrayAttributeVariable,
+    Directive,
+    FormatProgram,
+    FunctionalTypeDirective,
+    KeywordDirective,
+    OperandsDirective,
+    OperandsOrResultDirective,
+    OperandVariable,
+    OptionalGroupDirective,
+    OptionalOperandVariable,
+    OptionalRegionVariable,
+    OptionalResultVariable,
+    OptionalSuccessorVariable,
+    OptionalUnitAttrVariable,
+    PunctuationDirective,
+    RegionVariable,
+    ResultsDirective,
+    ResultVariable,
+    SuccessorVariable,
+    SymbolNameAttributeVariable,
+    TypeableDirective,
+    TypedAttributeVariable,
+    TypeDirective,
+    UniqueBaseAttributeVariable,
+    VariadicOperandVariable,
+    VariadicRegionVariable,
+    VariadicResultVariable,
+    VariadicSuccessorVariable,
+    WhitespaceDirective,
+)
+from xdsl.parser import Parser
+from xdsl.printer import Printer
+from xdsl.utils.mlir_lexer import MLIRTokenKind, PunctuationSpelling
+
+FormatParseFunction = Callable[[Parser, type[IRDLOperation]], IRDLOperation]
+"""A function parsing an operation of the given type with an assembly format."""
+
+FormatPrintFunction = Callable[[Printer, IRDLOperation], None]
+"""A function printing an operation with an assembly format."""
+
+
+class _NotCompilableError(Exception):
+    """Raised on directives that can only be interpreted, such as custom ones."""
+
+
+_ATTRIBUTE_VARIABLES_WITH_CUSTOM_SYNTAX = (
+    UniqueBaseAttributeVariable,
+    TypedAttributeVariable,
+    DenseArrayAttributeVariable,
+    SymbolNameAttributeVariable,
+)
+"""The attribute variables whose `parse_attr` and `print_attr` are called."""
+
+_CLOSING_PUNCTUATIONS = (">", ")", "}", "]", ",")
+_OPENING_PUNCTUATIONS = ("<", "(", "{", "[")
+
+
+@dataclass
+class _CodeBuilder:
+    """Builds the source of a Python function, and the globals it refers to."""
+
+    lines: list[str] = field(default_factory=list[str])
+    namespace: dict[str, Any] = field(default_factory=dict[str, Any])
+    indent: int = 0
+    num_names: int = 0
+
+    def line(self, text: str) -> None:
+        self.lines.append("    " * self.indent + text)
+
+    @contextmanager
+    def block(self, header: str) -> Iterator[None]:
+        """Emit a compound statement, such as an `if`, with the body in context."""
+        with self.capture() as body:
+            yield
+        self.emit_block(header, body)
+
+    @contextmanager
+    def capture(self) -> Iterator[list[str]]:
+        """Collect the lines of a body emitted in context, instead of emitting them."""
+        lines = self.lines
+        self.lines = captured = list[str]()
+        self.indent += 1
+        try:
+            yield captured
+        finally:
+            self.indent -= 1
+            self.lines = lines
+
+    def emit_block(self, header: str, body: list[str]) -> None:
+        self.line(header)
+        self.lines += body or ["    " * (self.indent + 1) + "pass"]
+
+    def fresh(self, prefix: str) -> str:
+        """Return a new local variable name."""
+        self.num_names += 1
+        return f"{prefix}_{self.num_names}"
+
+    def const(self, value: Any, prefix: str) -> str:
+        """Return the name of a new global bound to `value`."""
+        name = self.fresh(f"_{prefix}")
+        self.namespace[name] = value
+        return name
+
+    def build(self, name: str, filename: str) -> Callable[..., Any]:
+        """Execute the source, and return the function it defines."""
+        source = "\n".join(self.lines)
+        exec(compile(source, filename, "exec"), self.namespace)
+        return self.namespace[name]
+
+
+def _is_single(defs: Sequence[tuple[str, Any]]) -> bool:
+    """Return if no definition is variadic or optional."""
+    return not any(isinstance(d, VariadicDef) for _, d in defs)
+
+
+def _punctuation_kind(punctuation: str) -> MLIRTokenKind:
+    assert MLIRTokenKind.is_spelling_of_punctuation(punctuation)
+    return MLIRTokenKind.get_punctuation_kind_from_name(punctuation)
+
+
+class _FormatParserCompiler:
+    """
+    Generates a function parsing an operation with an assembly format.
+    The fields of the `ParsingState` are locals of the function.
+    """
+
+    program: FormatProgram
+    op_def: OpDef
+    code: _CodeBuilder
+
+    def __init__(self, program: FormatProgram, op_def: OpDef):
+        self.program = program
+        self.op_def = op_def
+        self.code = _CodeBuilder()
+
+    def compile(self) -> FormatParseFunction:
+        code = self.code
+        op_def = self.op_def
+        with code.block("def parse_with_format(parser, op_type):"):
+            for i in range(len(op_def.operands)):
+                code.line(f"operand_{i} = None")
+                code.line(f"operand_type_{i} = None")
+            for i in range(len(op_def.results)):
+                code.line(f"result_type_{i} = None")
+            for i in range(len(op_def.regions)):
+                code.line(f"region_{i} = None")
+            for i in range(len(op_def.successors)):
+                code.line(f"successor_{i} = None")
+            code.line("attributes = {}")
+            code.line("properties = {}")
+            for stmt in self.program.stmts:
+                self.parse(stmt, None)
+            self.resolve()
+            self.build()
+        return code.build("parse_with_format", f"<format parser of {op_def.name}>")
+
+    def parse_optional_punctuation(self, punctuation: str) -> str:
+        kind = self.code.const(_punctuation_kind(punctuation), "kind")
+        return f"parser._parse_optional_token({kind})"
+
+    def set_consumed(self, consumed: str | None, value: str) -> None:
+        if consumed is not None:
+            self.code.line(f"{consumed} = {value}")
+
+    def parse(self, directive: Directive, consumed: str | None) -> None:
+        """
+        Emit the parsing of a directive, which sets `consumed`, if given, to
+        whether input was consumed.
+        """
+        code = self.code
+        match directive:
+            case WhitespaceDirective():
+                self.set_consumed(consumed, "False")
+            case PunctuationDirective(punctuation=punctuation):
+                parse = self.parse_optional_punctuation(punctuation)
+                if consumed is None:
+                    code.line(parse)
+                else:
+                    code.line(f"{consumed} = {parse} is not None")
+            case KeywordDirective(keyword=keyword):
+                parse = f"parser.parse_optional_keyword({keyword!r})"
+                if consumed is None:
+                    code.line(parse)
+                else:
+                    code.line(f"{consumed} = {parse} is not None")
+            case AttrDictDirective():
+                self.parse_attr_dict(directive, consumed)
+            case OperandVariable(index=index):
+                code.line(f"operand_{index} = (parser.parse_unresolved_operand(),)")
+                self.set_consumed(consumed, "True")
+            case VariadicOperandVariable(index=index):
+                code.line(
+                    f"operand_{index} = "
+                    "parser.parse_optional_undelimited_comma_separated_list("
+                    "parser.parse_optional_unresolved_operand, "
+                    "parser.parse_unresolved_operand) or []"
+                )
+                self.set_consumed(consumed, f"bool(operand_{index})")
+            case OptionalOperandVariable(index=index):
+                operand = code.fresh("operand")
+                code.line(f"{operand} = parser.parse_optional_unresolved_operand()")
+                code.line(
+                    f"operand_{index} = () if {operand} is None else ({operand},)"
+                )
+                self.set_consumed(consumed, f"{operand} is not None")
+            case OperandsDirective():
+                start = code.fresh("start")
+                operands = code.fresh("operands")
+                code.line(f"{start} = parser.pos")
+                code.line(
+                    f"{operands} = "
+                    "parser.parse_optional_undelimited_comma_separated_list("
+                    "parser.parse_optional_unresolved_operand, "
+                    "parser.parse_unresolved_operand) or []"
+                )
+                self.set_using_variadic_index(
+                    directive, "operand", "operands", operands, start
+                )
+                self.set_consumed(consumed, f"bool({operands})")
+            case TypeDirective(inner=inner):
+                self.parse_types(inner, consumed)
+            case FunctionalTypeDirective(
+                operand_typeable_directive=operands,
+                result_typeable_directive=results,
+            ):
+                with code.block(
+                    f"if {self.parse_optional_punctuation('(')} is not None:"
+                ):
+                    self.parse_types(operands, None)
+                    code.line('parser.parse_punctuation(")")')
+                    code.line('parser.parse_punctuation("->")')
+                    with code.block(
+                        f"if {self.parse_optional_punctuation('(')} is not None:"
+                    ):
+                        self.parse_types(results, None)
+                        code.line('parser.parse_punctuation(")")')
+                    with code.block("else:"):
+                        self.parse_single_type(results)
+                    self.set_consumed(consumed, "True")
+                if consumed is not None:
+                    with code.block("else:"):
+                        code.line(f"{consumed} = False")
+            case RegionVariable(index=index):
+                code.line(f"region_{index} = (parser.parse_region(),)")
+                self.set_consumed(consumed, "True")
+            case VariadicRegionVariable(index=index):
+                region = code.fresh("region")
+                code.line(f"region_{index} = []")
+                with code.block(
+                    f"while ({region} := parser.parse_optional_region()) is not None:"
+                ):
+                    code.line(f"region_{index}.append({region})")
+                self.set_consumed(consumed, f"bool(region_{index})")
+            case OptionalRegionVariable(index=index):
+                region = code.fresh("region")
+                code.line(f"{region} = parser.parse_optional_region()")
+                code.line(f"region_{index} = () if {region} is None else ({region},)")
+                self.set_consumed(consumed, f"{region} is not None")
+            case SuccessorVariable(index=index):
+                code.line(f"successor_{index} = (parser.parse_successor(),)")
+                self.set_consumed(consumed, "True")
+            case VariadicSuccessorVariable(index=index):
+                code.line(
+                    f"successor_{index} = "
+                    "parser.parse_optional_undelimited_comma_separated_list("
+                    "parser.parse_optional_successor, parser.parse_successor) or []"
+                )
+                self.set_consumed(consumed, f"bool(successor_{index})")
+            case OptionalSuccessorVariable(index=index):
+                successor = code.fresh("successor")
+                code.line(f"{successor} = parser.parse_optional_successor()")
+                code.line(
+                    f"successor_{index} = () if {successor} is None else ({successor},)"
+                )
+                self.set_consumed(consumed, f"{successor} is not None")
+            case OptionalUnitAttrVariable():
+                unit = code.const(UnitAttr(), "unit")
+                container = "properties" if directive.is_property else "attributes"
+                code.line(f"{container}[{directive.name!r}] = {unit}")
+                self.set_consumed(consumed, "True")
+            case AttributeVariable():
+                self.parse_attribute_variable(directive, consumed)
+            case OptionalGroupDirective():
+                then_consumed = code.fresh("consumed")
+                self.parse(directive.then_first, then_consumed)
+                with code.block(f"if {then_consumed}:"):
+                    for element in directive.then_elements:
+                        self.parse(element, None)
+                    for element in directive.else_elements:
+                        self.set_empty(element)
+                with code.block("else:"):
+                    for element in directive.then_elements:
+                        self.set_empty(element)
+                    for element in directive.else_elements:
+                        self.parse(element, None)
+                self.set_consumed(consumed, then_consumed)
+            case _:
+                raise _NotCompilableError(directive)
+
+    def parse_attr_dict(
+        self, directive: AttrDictDirective, consumed: str | None
+    ) -> None:
+        code = self.code
+        parsed = code.fresh("attr_dict")
+        if directive.with_keyword:
+            code.line(f"{parsed} = parser.parse_optional_attr_dict_with_keyword()")
+            code.line(f"{parsed} = {{}} if {parsed} is None else dict({parsed}.data)")
+        else:
+            code.line(f"{parsed} = parser.parse_optional_attr_dict()")
+        if directive.reserved_attr_names:
+            reserved = code.const(directive.reserved_attr_names, "reserved")
+            defined = code.fresh("defined")
+            with code.block(f"if {defined} := {reserved} & {parsed}.keys():"):
+                code.line(
+                    "parser.raise_error("
+                    f"f\"attributes {{', '.join({defined})}} are defined in other "
+                    "parts of the assembly format, and thus should not be defined "
+                    'in the attribute dictionary.")'
+                )
+        props = code.fresh("props")
+        if directive.expected_properties:
+            expected = code.const(directive.expected_properties, "expected")
+            name = code.fresh("name")
+            code.line(f"{props} = tuple(k for k in {parsed} if k in {expected})")
+            with code.block(f"for {name} in {props}:"):
+                code.line(f"properties[{name}] = {parsed}.pop({name})")
+        else:
+            code.line(f"{props} = ()")
+        code.line(f"attributes |= {parsed}")
+        self.set_consumed(consumed, f"bool({parsed}) or bool({props})")
+
+    def parse_attribute_variable(
+        self, directive: AttributeVariable, consumed: str | None
+    ) -> None:
+        code = self.code
+        attr = code.fresh("attr")
+        if type(directive) is AttributeVariable:
+            if directive.is_optional:
+                code.line(f"{attr} = parser.parse_optional_attribute()")
+            else:
+                code.line(f"{attr} = parser.parse_attribute()")
+        elif type(directive) in _ATTRIBUTE_VARIABLES_WITH_CUSTOM_SYNTAX:
+            parse_attr = code.const(directive.parse_attr, "parse_attr")
+            code.line(f"{attr} = {parse_attr}(parser)")
+        else:
+            raise _NotCompilableError(directive)
+        container = "properties" if directive.is_property else "attributes"
+        with code.block(f"if {attr} is not None:"):
+            code.line(f"{container}[{directive.name!r}] = {attr}")
+        self.set_consumed(consumed, f"{attr} is not None")
+
+    def set_using_variadic_index(
+        self,
+        directive: OperandsOrResultDirective,
+        prefix: str,
+        field_name: str,
+        values: str,
+        error_start: str | None,
+    ) -> None:
+        """
+        Emit the distribution of the values parsed by an `operands` or `results`
+        directive to the fields, reporting errors from `error_start` if given.
+        """
+        code = self.code
+        num_fields = (
+            len(self.op_def.operands)
+            if prefix.startswith("operand")
+            else len(self.op_def.results)
+        )
+        fields = [f"{prefix}_{i}" for i in range(num_fields)]
+        fields_list = code.fresh("fields")
+        error = code.fresh("error")
+        set_fields = code.const(
+            directive._set_using_variadic_index,  # pyright: ignore[reportPrivateUsage]
+            "set_fields",
+        )
+        code.line(f"{fields_list} = [{', '.join(fields)}]")
+        code.line(f"{error} = {set_fields}({fields_list}, {field_name!r}, {values})")
+        if error_start is not None:
+            with code.block(f"if {error}:"):
+                code.line(
+                    f"parser.raise_error({error}, at_position={error_start}, "
+                    "end_position=parser.pos)"
+                )
+        if fields:
+            code.line(f"{''.join(f'{f}, ' for f in fields)}= {fields_list}")
+
+    def set_types(
+        self, directive: TypeableDirective, types: str, error_start: str | None
+    ) -> None:
+        match directive:
+            case OperandsDirective():
+                self.set_using_variadic_index(
+                    directive, "operand_type", "operand types", types, error_start
+                )
+            case ResultsDirective():
+                self.set_using_variadic_index(
+                    directive, "result_type", "result types", types, error_start
+                )
+            case (
+                OperandVariable(index=index)
+                | VariadicOperandVariable(index=index)
+                | OptionalOperandVariable(index=index)
+            ):
+                self.code.line(f"operand_type_{index} = {types}")
+            case (
+                ResultVariable(index=index)
+                | VariadicResultVariable(index=index)
+                | OptionalResultVariable(index=index)
+            ):
+                self.code.line(f"result_type_{index} = {types}")
+            case _:
+                raise _NotCompilableError(directive)
+
+    def parse_types(self, directive: TypeableDirective, consumed: str | None) -> None:
+        code = self.code
+        match directive:
+            case OperandVariable() | ResultVariable():
+                self.set_types(directive, "(parser.parse_type(),)", None)
+                self.set_consumed(consumed, "True")
+            case VariadicOperandVariable() | VariadicResultVariable():
+                types = code.fresh("types")
+                code.line(
+                    f"{types} = parser.parse_optional_undelimited_comma_separated_list("
+                    "parser.parse_optional_type, parser.parse_type)"
+                )
+                self.set_types(directive, f"() if {types} is None else {types}", None)
+                self.set_consumed(consumed, f"{types} is None")
+            case OptionalOperandVariable() | OptionalResultVariable():
+                type = code.fresh("type")
+                code.line(f"{type} = parser.parse_optional_type()")
+                self.set_types(directive, f"() if {type} is None else ({type},)", None)
+                # The interpreter reports optional operand types as consumed when
+                # they are absent, which is kept for equivalence
+                if isinstance(directive, OptionalOperandVariable):
+                    self.set_consumed(consumed, f"{type} is None")
+                else:
+                    self.set_consumed(consumed, f"{type} is not None")
+            case OperandsDirective() | ResultsDirective():
+                start = code.fresh("start")
+                types = code.fresh("types")
+                code.line(f"{start} = parser.pos")
+                code.line(
+                    f"{types} = parser.parse_optional_undelimited_comma_separated_list("
+                    "parser.parse_optional_type, parser.parse_type) or []"
+                )
+                self.set_types(directive, types, start)
+                self.set_consumed(consumed, f"bool({types})")
+            case _:
+                raise _NotCompilableError(directive)
+
+    def parse_single_type(self, directive: TypeableDirective) -> None:
+        if isinstance(directive, OperandsDirective | ResultsDirective):
+            start = self.code.fresh("start")
+            self.code.line(f"{start} = parser.pos")
+            self.set_types(directive, "(parser.parse_type(),)", start)
+        else:
+            self.set_types(directive, "(parser.parse_type(),)", None)
+
+    def set_empty(self, directive: Directive) -> None:
+        """Emit the setting of the fields of a directive that was not parsed."""
+        code = self.code
+        match directive:
+            case TypeDirective(inner=inner):
+                self.set_types(inner, "()", None)
+            case (
+                VariadicOperandVariable(index=index)
+                | OptionalOperandVariable(index=index)
+            ):
+                code.line(f"operand_{index} = ()")
+            case OperandsDirective():
+                for i in range(len(self.op_def.operands)):
+                    code.line(f"operand_{i} = ()")
+            case RegionVariable(index=index):
+                region = code.const(Region, "Region")
+                code.line(f"region_{index} = ({region}(),)")
+            case (
+                VariadicRegionVariable(index=index)
+                | OptionalRegionVariable(index=index)
+            ):
+                code.line(f"region_{index} = ()")
+            case (
+                VariadicSuccessorVariable(index=index)
+                | OptionalSuccessorVariable(index=index)
+            ):
+                code.line(f"successor_{index} = ()")
+            case OptionalGroupDirective():
+                self.set_empty(directive.then_first)
+                for element in (*directive.then_elements, *directive.else_elements):
+                    self.set_empty(element)
+            case (
+                WhitespaceDirective()
+                | PunctuationDirective()
+                | KeywordDirective()
+                | AttrDictDirective()
+                | FunctionalTypeDirective()
+                | OperandVariable()
+                | SuccessorVariable()
+                | AttributeVariable()
+            ):
+                pass
+            case _:
+                raise _NotCompilableError(directive)
+
+    def resolve(self) -> None:
+        """
+        Emit the verification of the parsed fields against the constraints of the
+        operation definition, and the inference of the missing types.
+        """
+        code = self.code
+        op_def = self.op_def
+        context = code.const(ConstraintContext, "ConstraintContext")
+        code.line(f"ctx = {context}()")
+
+        operand_constrs = [
+            code.const(operand_def.constr, "constr")
+            for _, operand_def in op_def.operands
+        ]
+        result_constrs = [
+            code.const(result_def.constr, "constr") for _, result_def in op_def.results
+        ]
+
+        for i, constr in enumerate(operand_constrs):
+            code.line(
+                f"{constr}.verify_length("
+                f"1 if operand_{i} is None else len(operand_{i}), ctx)"
+            )
+            with code.block(f"if operand_type_{i} is not None:"):
+                code.line(f"{constr}.verify(operand_type_{i}, ctx)")
+
+        for i, constr in enumerate(result_constrs):
+            with code.block(f"if result_type_{i} is not None:"):
+                code.line(f"{constr}.verify(result_type_{i}, ctx)")
+
+        for container, defs in (
+            ("properties", op_def.properties),
+            ("attributes", op_def.attributes),
+        ):
+            for name, attr_def in defs.items():
+                if isinstance(attr_def, OptionalDef) and attr_def.default_value is None:
+                    continue
+                constr = code.const(attr_def.constr, "constr")
+                attr = code.fresh("attr")
+                if attr_def.default_value is None:
+                    code.line(f"{attr} = {container}.get({name!r})")
+                else:
+                    default = code.const(attr_def.default_value, "default")
+                    code.line(f"{attr} = {container}.get({name!r}, {default})")
+                with code.block(f"if {attr} is not None:"):
+                    code.line(f"{constr}.verify({attr}, ctx)")
+
+        for i, constr in enumerate(operand_constrs):
+            with code.block(f"if operand_type_{i} is None:"):
+                code.line(
+                    f"operand_type_{i} = {constr}.infer(ctx, length=len(operand_{i}))"
+                )
+
+        for i, constr in enumerate(result_constrs):
+            with code.block(f"if result_type_{i} is None:"):
+                code.line(f"result_type_{i} = {constr}.infer(ctx, length=None)")
+
+    def build(self) -> None:
+        """Emit the creation of the operation from the parsed fields."""
+        code = self.code
+        op_def = self.op_def
+        code.line("pos = parser.pos")
+        for i in range(len(op_def.operands)):
+            code.line(
+                f"operand_{i} = "
+                f"parser.resolve_operands(operand_{i}, operand_type_{i}, pos)"
+            )
+
+        # Without variadic definitions, the builder would only check that each
+        # field has a single element, so the operation is created directly
+        create = (
+            _is_single(op_def.operands)
+            and _is_single(op_def.results)
+            and _is_single(op_def.regions)
+            and _is_single(op_def.successors)
+            and not any(
+                isinstance(option, AttrSizedSegments | SameVariadicSize)
+                for option in op_def.options
+            )
+        )
+        star = "*" if create else ""
+
+        def fields(prefix: str, num_fields: int) -> str:
+            return "".join(f"{star}{prefix}_{i}, " for i in range(num_fields))
+
+        code.line(f"return op_type.{'create' if create else 'build'}(")
+        code.line(f"    operands=({fields('operand', len(op_def.operands))}),")
+        code.line(f"    result_types=({fields('result_type', len(op_def.results))}),")
+        code.line("    attributes=attributes,")
+        code.line("    properties=properties,")
+        code.line(f"    regions=({fields('region', len(op_def.regions))}),")
+        code.line(f"    successors=({fields('successor', len(op_def.successors))}),")
+        code.line(")")
+
+
+@dataclass(frozen=True)
+class _PrintingState:
+    """A `PrintingState` known when the printing function is generated."""
+
+    should_emit_space: bool
+    last_was_punctuation: bool
+
+
+_INITIAL_STATE = _PrintingState(should_emit_space=True, last_was_punctuation=False)
+
+
+class _FormatPrinterCompiler:
+    """
+    Generates a function printing an operation with an assembly format.
+
+    The `PrintingState` is tracked during generation, so that the spaces around
+    punctuations and keywords are decided once. It is only stored in the
+    `should_emit_space` and `last_was_punctuation` locals of the function after
+    conditionally printed directives that leave it in different states.
+    """
+
+    program: FormatProgram
+    op_def: OpDef
+    code: _CodeBuilder
+    state: _PrintingState | None
+    """The printing state, or None if it is only known at runtime."""
+    pending: list[str]
+    """The constant strings to print before the next printer call."""
+
+    def __init__(self, program: FormatProgram, op_def: OpDef):
+        self.program = program
+        self.op_def = op_def
+        self.code = _CodeBuilder()
+        self.state = _INITIAL_STATE
+        self.pending = []
+
+    def compile(self) -> FormatPrintFunction:
+        code = self.code
+        with code.block("def print_with_format(printer, op):"):
+            code.line("print_string = printer.print_string")
+            for stmt in self.program.stmts:
+                self.print(stmt)
+            self.flush()
+        return code.build(
+            "print_with_format", f"<format printer of {self.op_def.name}>"
+        )
+
+    def print_string(self, text: str) -> None:
+        """Print a constant string, merged with the adjacent constant strings."""
+        if "\n" in text:
+            self.flush()
+            self.code.line(f"print_string({text!r})")
+        elif text:
+            self.pending.append(text)
+
+    def flush(self) -> None:
+        if self.pending:
+            self.code.line(f"print_string({''.join(self.pending)!r})")
+            self.pending.clear()
+
+    def call(self, statement: str) -> None:
+        """Emit a statement, after printing the pending strings."""
+        self.flush()
+        self.code.line(statement)
+
+    def print_space_if(self, condition: str) -> None:
+        self.flush()
+        with self.code.block(f"if {condition}:"):
+            self.code.line("print_string(' ')")
+
+    def branch(
+        self,
+        condition: str,
+        then_fn: Callable[[], None],
+        else_fn: Callable[[], None] | None = None,
+    ) -> None:
+        """Emit the printing with `then_fn` if the condition holds at runtime."""
+        code = self.code
+        self.flush()
+        start = self.state
+
+        with code.capture() as then_lines:
+            then_fn()
+            self.flush()
+        then_state = self.state
+
+        self.state = start
+        with code.capture() as else_lines:
+            if else_fn is not None:
+                else_fn()
+                self.flush()
+        else_state = self.state
+
+        # Store the state at the end of the branches if they end in different ones
+        self.state = then_state if then_state == else_state else None
+        if self.state is None:
+            for lines, state in ((then_lines, then_state), (else_lines, else_state)):
+                if state is not None:
+                    with code.capture() as store_lines:
+                        code.line(f"should_emit_space = {state.should_emit_space}")
+                        code.line(
+                            f"last_was_punctuation = {state.last_was_punctuation}"
+                        )
+                    lines += store_lines
+
+        code.emit_block(f"if {condition}:", then_lines)
+        if else_lines:
+            code.emit_block("else:", else_lines)
+
+    def print_whitespace(self) -> None:
+        """Print the space of `PrintingState.print_whitespace`."""
+        state = self.state
+        if state is None:
+            self.print_space_if("should_emit_space or not last_was_punctuation")
+        elif state.should_emit_space or not state.last_was_punctuation:
+            self.print_string(" ")
+        self.state = _PrintingState(should_emit_space=True, last_was_punctuation=False)
+
+    def variable(self, directive: Directive) -> str:
+        """Return the expression getting the field of a variable directive."""
+        op_def = self.op_def
+        match directive:
+            # Without variadic definitions, fields are at the index of their definition
+            case OperandVariable(index=index) if _is_single(op_def.operands):
+                return f"op.operands[{index}]"
+            case ResultVariable(index=index) if _is_single(op_def.results):
+                return f"op.results[{index}]"
+            case RegionVariable(index=index) if _is_single(op_def.regions):
+                return f"op.regions[{index}]"
+            case SuccessorVariable(index=index) if _is_single(op_def.successors):
+                return f"op.successors[{index}]"
+            case (
+                OperandVariable(name=name)
+                | VariadicOperandVariable(name=name)
+                | OptionalOperandVariable(name=name)
+                | ResultVariable(name=name)
+                | VariadicResultVariable(name=name)
+                | OptionalResultVariable(name=name)
+                | RegionVariable(name=name)
+                | VariadicRegionVariable(name=name)
+                | OptionalRegionVariable(name=name)
+                | SuccessorVariable(name=name)
+                | VariadicSuccessorVariable(name=name)
+                | OptionalSuccessorVariable(name=name)
+            ):
+                return f"getattr(op, {name!r})"
+            case _:
+                raise _NotCompilableError(directive)
+
+    def attribute(self, directive: AttributeVariable) -> str:
+        container = "op.properties" if directive.is_property else "op.attributes"
+        return f"{container}.get({directive.name!r})"
+
+    def attribute_is_present(self, directive: AttributeVariable, attr: str) -> str:
+        """Return the condition for printing the attribute in `attr`."""
+        if directive.default_value is None:
+            return f"{attr} is not None"
+        default = self.code.const(directive.default_value, "default")
+        return f"{attr} is not None and {attr} != {default}"
+
+    def is_present(self, directive: Directive) -> str:
+        """Return the expression of `directive.is_present(op)`."""
+        match directive:
+            case TypeDirective(inner=inner):
+                return self.is_present(inner)
+            case (
+                VariadicOperandVariable()
+                | VariadicResultVariable()
+                | VariadicRegionVariable()
+                | VariadicSuccessorVariable()
+            ):
+                return f"bool({self.variable(directive)})"
+            case (
+                OptionalOperandVariable()
+                | OptionalResultVariable()
+                | OptionalRegionVariable()
+                | OptionalSuccessorVariable()
+            ):
+                return f"{self.variable(directive)} is not None"
+            case OperandsDirective():
+                return "bool(op.operands)"
+            case ResultsDirective():
+                return "bool(op.results)"
+            case RegionVariable():
+                return f"bool({self.variable(directive)}.blocks)"
+            case AttributeVariable(default_value=None):
+                return f"{self.attribute(directive)} is not None"
+            case AttributeVariable():
+                attr = self.code.fresh("attr")
+                default = self.code.const(directive.default_value, "default")
+                return (
+                    f"({attr} := {self.attribute(directive)}) is not None "
+                    f"and {attr} != {default}"
+                )
+            case _ if type(directive).is_present is Directive.is_present:
+                return "True"
+            case _:
+                raise _NotCompilableError(directive)
+
+    def types(self, directive: TypeableDirective) -> tuple[str, bool]:
+        """
+        Return the expression getting the types of a typeable directive, and
+        whether it is a single type rather than a sequence of types.
+        """
+        match directive:
+            case OperandVariable() | ResultVariable():
+                return f"{self.variable(directive)}.type", True
+            case VariadicOperandVariable() | VariadicResultVariable():
+                return f"{self.variable(directive)}.types", False
+            case OptionalOperandVariable() | OptionalResultVariable():
+                value = self.code.fresh("value")
+                return (
+                    f"(({value}.type,) if ({value} := {self.variable(directive)}) "
+                    "else ())",
+                    False,
+                )
+            case OperandsDirective():
+                return "op.operand_types", False
+            case ResultsDirective():
+                return "op.result_types", False
+            case _:
+                raise _NotCompilableError(directive)
+
+    def print_types(self, types: str, single: bool) -> None:
+        if single:
+            self.call(f"printer.print_attribute({types})")
+        else:
+            self.call(f"printer.print_list({types}, printer.print_attribute)")
+
+    def print_function(self, directive: Directive) -> str:
+        match directive:
+            case (
+                OperandVariable()
+                | VariadicOperandVariable()
+                | OptionalOperandVariable()
+                | OperandsDirective()
+            ):
+                return "printer.print_ssa_value"
+            case RegionVariable() | VariadicRegionVariable() | OptionalRegionVariable():
+                return "printer.print_region"
+            case _:
+                return "printer.print_block_name"
+
+    def print(self, directive: Directive) -> None:
+        """Emit the printing of a directive."""
+        code = self.code
+        match directive:
+            case WhitespaceDirective(whitespace=whitespace):
+                self.print_string(whitespace)
+                self.state = _PrintingState(
+                    should_emit_space=False, last_was_punctuation=whitespace == ""
+                )
+            case PunctuationDirective(punctuation=punctuation):
+                self.print_punctuation(punctuation)
+            case KeywordDirective(keyword=keyword):
+                if self.state is None:
+                    self.print_space_if("should_emit_space")
+                elif self.state.should_emit_space:
+                    self.print_string(" ")
+                self.print_string(keyword)
+                self.state = _PrintingState(
+                    should_emit_space=True, last_was_punctuation=False
+                )
+            case AttrDictDirective():
+                self.print_attr_dict(directive)
+            case TypeDirective(inner=inner):
+                types, single = self.types(inner)
+                if single:
+                    self.print_whitespace()
+                    self.print_types(types, True)
+                    return
+                value = code.fresh("types")
+                self.call(f"{value} = {types}")
+
+                def print_types():
+                    self.print_whitespace()
+                    self.print_types(value, False)
+
+                self.branch(value, print_types)
+            case OperandVariable() | RegionVariable() | SuccessorVariable():
+                self.print_whitespace()
+                self.call(
+                    f"{self.print_function(directive)}({self.variable(directive)})"
+                )
+            case (
+                VariadicOperandVariable()
+                | OptionalOperandVariable()
+                | VariadicRegionVariable()
+                | OptionalRegionVariable()
+                | VariadicSuccessorVariable()
+                | OptionalSuccessorVariable()
+            ):
+                value = code.fresh("value")
+                print_fn = self.print_function(directive)
+                self.call(f"{value} = {self.variable(directive)}")
+
+                def print_value():
+                    self.print_whitespace()
+                    if isinstance(directive, VariadicRegionVariable):
+                        self.call(
+                            f"printer.print_list({value}, {print_fn}, delimiter=' ')"
+                        )
+                    elif isinstance(
+                        directive, VariadicOperandVariable | VariadicSuccessorVariable
+                    ):
+                        self.call(f"printer.print_list({value}, {print_fn})")
+                    else:
+                        self.call(f"{print_fn}({value})")
+
+                self.branch(value, print_value)
+            case OperandsDirective():
+                self.print_whitespace()
+                self.call("printer.print_list(op.operands, printer.print_ssa_value)")
+            case FunctionalTypeDirective(
+                operand_typeable_directive=operands,
+                result_typeable_directive=results,
+            ):
+                self.print_whitespace()
+                self.print_string("(")
+                self.print_types(*self.types(operands))
+                self.print_string(") -> ")
+                result_types, single = self.types(results)
+                if single:
+                    self.print_types(result_types, True)
+                    return
+                value = code.fresh("types")
+                self.call(f"{value} = {result_types}")
+                with code.block(f"if len({value}) == 1:"):
+                    code.line(f"printer.print_attribute({value}[0])")
+                with code.block("else:"):
+                    code.line("print_string('(')")
+                    code.line(f"printer.print_list({value}, printer.print_attribute)")
+                    code.line("print_string(')')")
+            case OptionalUnitAttrVariable():
+                pass
+            case AttributeVariable():
+                self.print_attribute_variable(directive)
+            case OptionalGroupDirective():
+                present = self.is_present(directive.anchor)
+
+                def print_then():
+                    for element in (
+                        *directive.then_whitespace,
+                        directive.then_first,
+                        *directive.then_elements,
+                    ):
+                        self.print(element)
+
+                def print_else():
+                    for element in directive.else_elements:
+                        self.print(element)
+
+                self.branch(present, print_then, print_else)
+            case _:
+                raise _NotCompilableError(directive)
+
+    def print_punctuation(self, punctuation: PunctuationSpelling) -> None:
+        state = self.state
+        if state is None:
+            if punctuation in _OPENING_PUNCTUATIONS:
+                self.print_space_if("should_emit_space and last_was_punctuation")
+            elif punctuation not in _CLOSING_PUNCTUATIONS:
+                self.print_space_if("should_emit_space")
+        elif state.should_emit_space:
+            if state.last_was_punctuation:
+                emit_space = punctuation not in _CLOSING_PUNCTUATIONS
+            else:
+                emit_space = (
+                    punctuation not in _OPENING_PUNCTUATIONS + _CLOSING_PUNCTUATIONS
+                )
+            if emit_space:
+                self.print_string(" ")
+        self.print_string(punctuation)
+        self.state = _PrintingState(
+            should_emit_space=punctuation not in _OPENING_PUNCTUATIONS,
+            last_was_punctuation=True,
+        )
+
+    def print_attribute_variable(self, directive: AttributeVariable) -> None:
+        code = self.code
+        attr = code.fresh("attr")
+        if type(directive) is AttributeVariable:
+            print_attr = f"printer.print_attribute({attr})"
+        elif type(directive) in _ATTRIBUTE_VARIABLES_WITH_CUSTOM_SYNTAX:
+            print_fn = code.const(directive.print_attr, "print_attr")
+            print_attr = f"{print_fn}(printer, {attr})"
+        else:
+            raise _NotCompilableError(directive)
+
+        self.call(f"{attr} = {self.attribute(directive)}")
+
+        def print_present_attr():
+            self.print_whitespace()
+            self.call(print_attr)
+
+        self.branch(self.attribute_is_present(directive, attr), print_present_attr)
+
+    def print_attr_dict(self, directive: AttrDictDirective) -> None:
+        code = self.code
+        op_def = self.op_def
+        expected = directive.expected_properties
+        if expected:
+            expected_names = code.const(frozenset(expected), "expected")
+            self.flush()
+            with code.block(
+                f"if not op.attributes.keys().isdisjoint({expected_names}):"
+            ):
+                code.line(
+                    "raise ValueError('Cannot print attributes and properties with "
+                    "the same name in a single dictionary')"
+                )
+            code.line(
+                "dictionary = op.attributes | {k: v for k, v in "
+                f"op.properties.items() if k in {expected_names}}}"
+            )
+        else:
+            self.call("dictionary = op.attributes")
+
+        defs = {x: op_def.properties[x] for x in expected} | op_def.attributes
+        defaults = {
+            name: d.default_value
+            for name, d in defs.items()
+            if d.default_value is not None
+        }
+        reserved = code.const(frozenset(directive.reserved_attr_names), "reserved")
+        if defaults:
+            defaults_name = code.const(defaults, "defaults")
+            code.line(
+                f"reserved = {reserved}.union(name for name, default in "
+                f"{defaults_name}.items() if dictionary.get(name) == default)"
+            )
+        else:
+            code.line(f"reserved = {reserved}")
+
+        def set_state():
+            self.state = _PrintingState(
+                should_emit_space=True, last_was_punctuation=False
+            )
+
+        self.branch(
+            "printer.print_op_attributes(dictionary, reserved_attr_names=reserved, "
+            f"print_keyword={directive.with_keyword})",
+            set_state,
+        )
+
+
+def compile_format_parser(
+    program: FormatProgram, op_def: OpDef
+) -> FormatParseFunction | None:
+    """
+    Compile an assembly format program to a function parsing operations, or
+    return None if the program uses directives that can only be interpreted.
+    """
+    try:
+        return _FormatParserCompiler(program, op_def).compile()
+    except _NotCompilableError:
+        return None
+
+
+def compile_format_printer(
+    program: FormatProgram, op_def: OpDef
+) -> FormatPrintFunction | None:
+    """
+    Compile an assembly format program to a function printing operations, or
+    return None if the program uses directives that can only be interpreted.
+    """
+    try:
+        return _FormatPrinterCompiler(program, op_def).compile()
+    except _NotCompilableError:
+        return None
@@ -108,7 +108,8 @@ class FormatLexer(MLIRLexer):
         if current_char in ("`", "$", "\\", "^"):
             self._consume_chars()
             return self._form_token(MLIRTokenKind.BARE_IDENT, start_pos)
-        return super().lex()
+        # The fast path of the MLIR lexer does not use the bare identifier regex.
+        return self._lex_slow()
 
     # Authorize `-` in bare identifier
     bare_identifier_suffix_regex = re.compile(r"[a-zA-Z0-9_$.\-]*")
@@ -1,61 +1,184 @@
-from xdsl.ir import Block, Region
+from __future__ import annotations
 
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
 
-class DominanceInfo:
-    """
-    Computes and exposes the dominance relation amongst blocks of a region.
+from xdsl.ir import Block, Operation, Region
 
-    See external [documentation](https://en.wikipedia.org/w/index.php?title=Dominator_(graph_theory)&oldid=1189814332).
+
+def _successors(block: Block) -> Sequence[Block]:
+    """The successors of a block in the control flow graph of its region."""
+    if (last_op := block.last_op) is None:
+        return ()
+    return last_op.successors
+
+
+class _DominatorTree:
     """
+    A dominator tree of the blocks of a region, computed with the iterative
+    algorithm of Cooper, Harvey, and Kennedy on the reverse post-order of the
+    graph.
 
-    _dominance: dict[Block, set[Block]]
+    See external [documentation](https://www.cs.tufts.edu/comp/150FA/handouts/dominance.pdf).
 
-    def __init__(self, region: Region):
-        """
-        Compute (improper) dominance.
+    The graph is given by a successor function, and can have several roots, in
+    which case they are all connected to a virtual root.
+    Blocks that are not reachable from the roots are not part of the tree.
+    """
 
-        See external [documentation](https://en.wikipedia.org/w/index.php?title=Dominator_(graph_theory)&oldid=1189814332).
-        """
+    _idom: dict[Block, Block | None]
+    """
+    The immediate dominator of each reachable block, `None` for the blocks only
+    dominated by the virtual root.
+    """
 
-        self._dominance = {}
+    _children: dict[Block, list[Block]]
+    """The children of each reachable block in the tree."""
 
-        # No block, no work
-        if not (region.blocks):
-            return
+    _intervals: dict[Block, tuple[int, int]]
+    """
+    The preorder and postorder numbers of each block in a depth-first traversal
+    of the tree, used to answer dominance queries in constant time.
+    """
+
+    def __init__(
+        self,
+        roots: Iterable[Block],
+        successors: Callable[[Block], Iterable[Block]],
+    ):
+        roots = list(dict.fromkeys(roots))
 
-        # Build the preceding relationship
-        pred: dict[Block, set[Block]] = {}
-        for b in region.blocks:
-            pred[b] = set()
-        for b in region.blocks:
-            if b.last_op is not None:
-                for s in b.last_op.successors:
-                    pred[s].add(b)
+        # Number the reachable blocks in post-order, with an explicit stack
+        post_order: list[Block] = []
+        seen = set(roots)
+        for root in roots:
+            stack = [(root, iter(successors(root)))]
+            while stack:
+                block, it = stack[-1]
+                for succ in it:
+                    if succ not in seen:
+                        seen.add(succ)
+                        stack.append((succ, iter(successors(succ))))
+                        break
+                else:
+                    stack.pop()
+                    post_order.append(block)
+        index = {block: i for i, block in enumerate(post_order)}
 
-        # Get entry and other blocks
-        entry, *blocks = region.blocks
+        predecessors: dict[Block, list[Block]] = {block: [] for block in post_order}
+        for block in post_order:
+            for succ in successors(block):
+                predecessors[succ].append(block)
 
-        # The entry block is only dominated by itself
-        self._dominance[entry] = {entry}
+        # The virtual root is represented by `None`, and is the last in post-order.
+        virtual_index = len(post_order)
+        idom: dict[Block, Block | None] = {root: None for root in roots}
 
-        # Instantiate other blocks dominators to all blocks
-        for b in blocks:
-            self._dominance[b] = set(region.blocks)
+        def intersect(a: Block | None, b: Block | None) -> Block | None:
+            while a is not b:
+                while (virtual_index if a is None else index[a]) < (
+                    virtual_index if b is None else index[b]
+                ):
+                    a = idom[a]  # pyright: ignore[reportArgumentType]
+                while (virtual_index if b is None else index[b]) < (
+                    virtual_index if a is None else index[a]
+                ):
+                    b = idom[b]  # pyright: ignore[reportArgumentType]
+            return a
 
-        # Iteratively filter out dominators until it converges
+        root_set = set(roots)
         changed = True
         while changed:
             changed = False
-            for b in blocks:
-                old = self._dominance[b].copy()
-                self._dominance[b] = {b} | (
-                    set[Block].intersection(*(self._dominance[p] for p in pred[b]))
-                    if pred[b]
-                    else set()
-                )
-                if old != self._dominance[b]:
+            for block in reversed(post_order):
+                if block in root_set:
+                    continue
+                new_idom: Block | None = None
+                found = False
+                for pred in predecessors[block]:
+                    if pred not in idom:
+                        continue
+                    if not found:
+                        new_idom = pred
+                        found = True
+                    else:
+                        new_idom = intersect(pred, new_idom)
+                if block not in idom or idom[block] is not new_idom:
+                    idom[block] = new_idom
                     changed = True
 
+        # Blocks immediately dominated by the virtual root are the tree roots
+        tree_roots: list[Block] = []
+        children: dict[Block, list[Block]] = {block: [] for block in post_order}
+        for block in reversed(post_order):
+            if (parent := idom[block]) is None:
+                tree_roots.append(block)
+            else:
+                children[parent].append(block)
+
+        # Number the tree nodes to answer dominance queries in constant time
+        intervals: dict[Block, tuple[int, int]] = {}
+        counter = 0
+        for root in tree_roots:
+            stack: list[tuple[Block, bool]] = [(root, False)]
+            while stack:
+                block, visited = stack.pop()
+                if visited:
+                    intervals[block] = (intervals[block][0], counter)
+                else:
+                    intervals[block] = (counter, -1)
+                    stack.append((block, True))
+                    stack.extend((child, False) for child in reversed(children[block]))
+                counter += 1
+
+        self._idom = idom
+        self._children = children
+        self._intervals = intervals
+
+    def is_reachable(self, block: Block) -> bool:
+        return block in self._idom
+
+    def immediate_dominator(self, block: Block) -> Block | None:
+        return self._idom.get(block)
+
+    def children(self, block: Block) -> Sequence[Block]:
+        return self._children.get(block, ())
+
+    def dominates(self, a: Block, b: Block) -> bool:
+        if a is b:
+            return True
+        if (a_interval := self._intervals.get(a)) is None or (
+            b_interval := self._intervals.get(b)
+        ) is None:
+            return False
+        return a_interval[0] < b_interval[0] and b_interval[1] < a_interval[1]
+
+
+class DominanceInfo:
+    """
+    Computes and exposes the dominance relation amongst blocks of a region.
+
+    See external [documentation](https://en.wikipedia.org/w/index.php?title=Dominator_(graph_theory)&oldid=1189814332).
+
+    Blocks that are not reachable from the entry block are only dominated by
+    themselves.
+    """
+
+    region: Region
+    """The region whose blocks are analysed."""
+
+    _tree: _DominatorTree
+
+    def __init__(self, region: Region):
+        """
+        Compute (improper) dominance.
+
+        See external [documentation](https://en.wikipedia.org/w/index.php?title=Dominator_(graph_theory)&oldid=1189814332).
+        """
+        self.region = region
+        entry = region.first_block
+        self._tree = _DominatorTree(() if entry is None else (entry,), _successors)
+
     def strictly_dominates(self, a: Block, b: Block) -> bool:
         """
         Return if `a` *strictly* dominates `b`.
@@ -69,7 +192,152 @@ class DominanceInfo:
         """
         Return if `a` dominates `b`.
         """
-        return a in self._dominance[b]
+        return self._tree.dominates(a, b)
+
+    def is_reachable(self, block: Block) -> bool:
+        """Return if the block is reachable from the entry block of the region."""
+        return self._tree.is_reachable(block)
+
+    def immediate_dominator(self, block: Block) -> Block | None:
+        """
+        Return the immediate dominator of a block, or `None` for the entry block
+        and unreachable blocks.
+        """
+        return self._tree.immediate_dominator(block)
+
+    def dominator_tree_children(self, block: Block) -> Sequence[Block]:
+        """Return the blocks immediately dominated by a block."""
+        return self._tree.children(block)
+
+
+class PostDominanceInfo:
+    """
+    Computes and exposes the post-dominance relation amongst blocks of a region.
+
+    A block `a` post-dominates `b` if all paths from `b` to a block without
+    successors go through `a`.
+    Blocks that cannot reach a block without successors are only post-dominated
+    by themselves.
+    """
+
+    region: Region
+    """The region whose blocks are analysed."""
+
+    _tree: _DominatorTree
+
+    def __init__(self, region: Region):
+        self.region = region
+        predecessors: dict[Block, list[Block]] = {block: [] for block in region.blocks}
+        exits: list[Block] = []
+        for block in region.blocks:
+            successors = _successors(block)
+            if not successors:
+                exits.append(block)
+            for succ in successors:
+                predecessors[succ].append(block)
+        self._tree = _DominatorTree(exits, predecessors.__getitem__)
+
+    def strictly_post_dominates(self, a: Block, b: Block) -> bool:
+        """
+        Return if `a` *strictly* post-dominates `b`.
+        i.e., if it post-dominates `b` and is not `b`.
+        """
+        if a is b:
+            return False
+        return self.post_dominates(a, b)
+
+    def post_dominates(self, a: Block, b: Block) -> bool:
+        """
+        Return if `a` post-dominates `b`.
+        """
+        return self._tree.dominates(a, b)
+
+    def immediate_post_dominator(self, block: Block) -> Block | None:
+        """
+        Return the immediate post-dominator of a block, or `None` if there is no
+        unique one.
+        """
+        return self._tree.immediate_dominator(block)
+
+
+@dataclass(eq=False)
+class DominanceInfoCache:
+    """
+    Caches the dominance and post-dominance information of regions.
+    The cached information of a region is invalidated when its control flow graph
+    may change, as reported to its handlers: when a block is created in it or
+    removed from it, or when an operation with successors or a terminator is
+    inserted, modified, moved, or removed. A `PatternRewriteWalker` given the cache
+    calls these handlers.
+    """
+
+    _dominance: dict[Region, DominanceInfo] = field(
+        default_factory=dict[Region, DominanceInfo], init=False
+    )
+    _post_dominance: dict[Region, PostDominanceInfo] = field(
+        default_factory=dict[Region, PostDominanceInfo], init=False
+    )
+
+    def dominance(self, region: Region) -> DominanceInfo:
+        """Get the dominance information of a region."""
+        if (info := self._dominance.get(region)) is None:
+            info = self._dominance[region] = DominanceInfo(region)
+        return info
+
+    def post_dominance(self, region: Region) -> PostDominanceInfo:
+        """Get the post-dominance information of a region."""
+        if (info := self._post_dominance.get(region)) is None:
+            info = self._post_dominance[region] = PostDominanceInfo(region)
+        return info
+
+    def invalidate(self, region: Region) -> None:
+        """Invalidate the cached information of a region."""
+        self._dominance.pop(region, None)
+        self._post_dominance.pop(region, None)
+
+    def handle_block_creation(self, block: Block) -> None:
+        """Handle the creation of a block, or its move to another region."""
+        if (region := block.parent) is not None:
+            self.invalidate(region)
+
+    def handle_block_removal(self, block: Block) -> None:
+        """Handle the removal of a block from its region."""
+        if (region := block.parent) is not None:
+            self.invalidate(region)
+        # The block may be erased, and the regions of its operations with it
+        if self._dominance or self._post_dominance:
+            for op in block.ops:
+                self._invalidate_nested_regions(op)
+
+    def handle_operation_change(self, op: Operation) -> None:
+        """Handle the insertion or modification of an operation."""
+        if (block := op.parent) is None or (region := block.parent) is None:
+            return
+        if op.successors or block.last_op is op:
+            self.invalidate(region)
+
+    def handle_operations_move(
+        self, first: Operation, last: Operation, source: Block
+    ) -> None:
+        """Handle the move of a range of operations out of a block."""
+        # Only the last operation of a moved range can be a terminator
+        self.handle_operation_change(last)
+        # The source block may have lost its terminator
+        if source is not last.parent and (region := source.parent) is not None:
+            self.invalidate(region)
+
+    def handle_operation_removal(self, op: Operation) -> None:
+        """Handle the removal of an operation."""
+        self.handle_operation_change(op)
+        # Regions of removed operations do not exist anymore
+        if self._dominance or self._post_dominance:
+            self._invalidate_nested_regions(op)
+
+    def _invalidate_nested_regions(self, op: Operation) -> None:
+        """Invalidate the cached information of the regions nested in an operation."""
+        for nested_op in op.walk():
+            for region in nested_op.regions:
+                self.invalidate(region)
 
 
 def _strictly_dominates_block(a: Block, b: Block) -> bool:
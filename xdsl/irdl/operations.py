@@ -906,6 +906,20 @@ class OpDef:
     custom_directives: dict[str, type[CustomDirective]] = field(
         default_factory=lambda: {}
     )
+    format_parser: Callable[[Parser, type[IRDLOperation]], IRDLOperation] | None = (
+        field(default=None, repr=False, compare=False)
+    )
+    """
+    The function parsing the operation with its assembly format.
+    It is generated from the assembly format on first use.
+    """
+    format_printer: Callable[[Printer, IRDLOperation], None] | None = field(
+        default=None, repr=False, compare=False
+    )
+    """
+    The function printing the operation with its assembly format.
+    It is generated from the assembly format on first use.
+    """
 
     @staticmethod
     def from_pyrdl(pyrdl_def: type[IRDLOperationInvT]) -> OpDef:
@@ -1986,10 +2000,14 @@ def get_accessors_from_op_def(
         def parse_with_format(
             cls: type[IRDLOperationInvT], parser: Parser
         ) -> IRDLOperationInvT:
-            return assembly_program.parse(parser, cls)
+            if (parse := op_def.format_parser) is None:
+                parse = op_def.format_parser = assembly_program.compile_parse(op_def)
+            return cast(IRDLOperationInvT, parse(parser, cls))
 
         def print_with_format(self: IRDLOperation, printer: Printer):
-            return assembly_program.print(printer, self)
+            if (print_ := op_def.format_printer) is None:
+                print_ = op_def.format_printer = assembly_program.compile_print(op_def)
+            return print_(printer, self)
 
         new_attrs["parse"] = parse_with_format
         new_attrs["print"] = print_with_format
@@ -62,7 +62,13 @@ from xdsl.dialects.builtin import (
     VectorType,
     i64,
 )
-from xdsl.ir import Attribute, Data, ParametrizedAttribute, TypeAttribute
+from xdsl.ir import (
+    Attribute,
+    Data,
+    ParametrizedAttribute,
+    TypeAttribute,
+    get_unique_attribute,
+)
 from xdsl.ir.affine import AffineMap, AffineSet
 from xdsl.irdl import base
 from xdsl.utils.bitwise_casts import (
@@ -70,6 +76,7 @@ from xdsl.utils.bitwise_casts import (
     convert_u32_to_f32,
     convert_u64_to_f64,
 )
+from xdsl.utils.comparisons import signed_value_range, unsigned_value_range
 from xdsl.utils.exceptions import ParseError, VerifyException
 from xdsl.utils.lexer import Position, Span
 from xdsl.utils.mlir_lexer import MLIRTokenKind, StringLiteral
@@ -128,8 +135,12 @@ class AttrParser(BaseParser):
         if (
             token := self._parse_optional_token(MLIRTokenKind.EXCLAMATION_IDENT)
         ) is not None:
-            return self._parse_extended_type_or_attribute(token.text[1:], True)
-        return self._parse_optional_builtin_type()
+            return get_unique_attribute(
+                self._parse_extended_type_or_attribute(token.text[1:], True)
+            )
+        if (attr := self._parse_optional_builtin_type()) is not None:
+            return get_unique_attribute(attr)
+        return None
 
     def parse_type(self) -> TypeAttribute:
         """
@@ -642,7 +653,7 @@ class AttrParser(BaseParser):
 
         # String literal
         if (str_lit := self.parse_optional_str_literal()) is not None:
-            return StringAttr(str_lit)
+            return get_unique_attribute(StringAttr(str_lit))
         # Bytes literal
         if (bytes_lit := self.parse_optional_bytes_literal()) is not None:
             return BytesAttr(bytes_lit)
@@ -765,6 +776,36 @@ class AttrParser(BaseParser):
     def parse_dense_int_or_fp_elements_attr(
         self, type: RankedStructure[AnyDenseElement] | None
     ) -> DenseIntOrFPElementsAttr:
+        self.parse_punctuation("<", " in dense attribute")
+
+        # Fast path for tensor literals of numbers
+        literal_pos = self.pos
+        if (
+            numeric_literal := self._parse_optional_numeric_tensor_literal()
+        ) is not None:
+            self.parse_punctuation(">", " in dense attribute")
+            literal_type = type
+            if literal_type is None:
+                self.parse_punctuation(":", " in dense attribute")
+                literal_type = self._parse_dense_literal_type()
+            if (
+                attr := self._dense_attr_from_numeric_literal(
+                    literal_type, *numeric_literal
+                )
+            ) is not None:
+                return attr
+            # Parse the literal again to report errors and handle the edge cases
+            self._resume_from(literal_pos)
+
+        return self._parse_dense_int_or_fp_elements_attr_contents(type)
+
+    def _parse_dense_int_or_fp_elements_attr_contents(
+        self, type: RankedStructure[AnyDenseElement] | None
+    ) -> DenseIntOrFPElementsAttr:
+        """
+        Parse the contents of a dense attribute after its opening `<`, and its type if
+        `type` is not given.
+        """
         dense_contents: (
             tuple[list[AttrParser._TensorLiteralElement], list[int]] | str | None
         )
@@ -777,7 +818,6 @@ class AttrParser(BaseParser):
         everywhere.
         """
 
-        self.parse_punctuation("<", " in dense attribute")
         if self.parse_optional_punctuation(">") is not None:
             # Empty case
             dense_contents = None
@@ -854,6 +894,107 @@ class AttrParser(BaseParser):
             new_data = cast(Sequence[int], data_values)
             return DenseIntOrFPElementsAttr.from_list(new_type, new_data)
 
+    _numeric_tensor_literal_regex = re.compile(r"\[[\s\[\],0-9.eE+-]*\]")
+    """Matches the characters of a tensor literal of numbers."""
+
+    _number_regex = re.compile(r"-?\s*[0-9]+(?:\.[0-9]*(?:[eE][+-]?[0-9]+)?)?")
+    """Matches a possibly negated integer or float literal."""
+
+    _whitespace_regex = re.compile(r"\s+")
+
+    _negative_integer_zero_regex = re.compile(r"-0+(?![0-9.])")
+
+    def _parse_optional_numeric_tensor_literal(
+        self,
+    ) -> tuple[list[str], list[int]] | None:
+        """
+        Parse a non-empty tensor literal that only contains integer and float
+        literals, if present, and return the spelling of its elements and its shape.
+        This scans the whole literal at once, instead of parsing each element.
+        Returns None and consumes nothing for other tensor literals, or if the
+        literal is not well-formed, in which case the general parsing reports the
+        error.
+        """
+        if self._current_token.kind != MLIRTokenKind.L_SQUARE:
+            return None
+        input = self.lexer.input
+        match = self._numeric_tensor_literal_regex.match(
+            input.content, self.pos, input.len
+        )
+        if match is None:
+            return None
+        text = match.group()
+
+        # Replace each number by `0`, and check that the remaining structure is a
+        # well-formed literal of some shape.
+        skeleton = self._whitespace_regex.sub("", self._number_regex.sub("0", text))
+        rank = len(skeleton) - len(skeleton.lstrip("["))
+        num_elements = skeleton.count("0")
+        if not num_elements:
+            return None
+        # The number of lists at each depth, as each list ends with its last element
+        # and as many `]` as its depth from the innermost lists.
+        num_lists = [
+            skeleton.count("0" + "]" * (rank - depth)) for depth in range(rank)
+        ]
+        num_lists.append(num_elements)
+        if num_lists[0] != 1 or any(
+            num_lists[depth + 1] % num_lists[depth] for depth in range(rank)
+        ):
+            return None
+        shape = [num_lists[depth + 1] // num_lists[depth] for depth in range(rank)]
+        expected_skeleton = "0"
+        for dim in reversed(shape):
+            expected_skeleton = "[" + ",".join([expected_skeleton] * dim) + "]"
+        if skeleton != expected_skeleton:
+            return None
+
+        self._resume_from(match.end())
+        numbers = self._number_regex.findall(self._whitespace_regex.sub("", text))
+        return numbers, shape
+
+    def _dense_attr_from_numeric_literal(
+        self,
+        type: RankedStructure[AnyDenseElement],
+        numbers: list[str],
+        shape: list[int],
+    ) -> DenseIntOrFPElementsAttr | None:
+        """
+        Create a dense attribute from the elements of a tensor literal of numbers,
+        converting them all at once.
+        Returns None if the literal is invalid for the type, or if its elements
+        need to be converted individually.
+        """
+        if list(type.get_shape()) != shape:
+            return None
+        element_type = type.element_type
+
+        if isinstance(element_type, AnyFloat):
+            # Negated integer zeros are parsed as positive zeros
+            if self._negative_integer_zero_regex.search(",".join(numbers)):
+                return None
+            float_values = list(map(float, numbers))
+            return DenseIntOrFPElementsAttr(
+                type, BytesAttr(element_type.pack(float_values))
+            )
+
+        if not isinstance(element_type, IntegerType | IndexType):
+            return None
+        try:
+            int_values = list(map(int, numbers))
+        except ValueError:
+            # Float literals are not valid integers
+            return None
+        if isinstance(element_type, IntegerType):
+            # Values outside of the signed range need to be normalized
+            if element_type.signedness.data == Signedness.UNSIGNED:
+                min_value, max_value = unsigned_value_range(element_type.bitwidth)
+            else:
+                min_value, max_value = signed_value_range(element_type.bitwidth)
+            if not (min_value <= min(int_values) and max(int_values) < max_value):
+                return None
+        return DenseIntOrFPElementsAttr(type, BytesAttr(element_type.pack(int_values)))
+
     def _parse_builtin_dense_attr(self) -> DenseIntOrFPElementsAttr:
         return self.parse_dense_int_or_fp_elements_attr(None)
 
@@ -1344,7 +1485,9 @@ class AttrParser(BaseParser):
         """
         token = self._parse_optional_token(MLIRTokenKind.STRING_LIT)
         return (
-            StringAttr(token.kind.get_string_literal_value(token.span))
+            get_unique_attribute(
+                StringAttr(token.kind.get_string_literal_value(token.span))
+            )
             if token is not None
             else None
         )
@@ -13,11 +13,13 @@ from xdsl.dialects.builtin import DictionaryAttr, ModuleOp
 from xdsl.ir import (
     Attribute,
     Block,
+    LazyRegionBody,
     Operation,
     Region,
     SSAValue,
 )
 from xdsl.irdl import IRDLOperation
+from xdsl.traits import IsolatedFromAbove, SymbolTable
 from xdsl.utils.exceptions import MultipleSpansParseError
 from xdsl.utils.lexer import Input, Span
 from xdsl.utils.mlir_lexer import MLIRLexer, MLIRTokenKind
@@ -26,7 +28,7 @@ from .attribute_parser import AttrParser  # noqa: TID251
 from .generic_parser import ParserState, Position  # noqa: TID251
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class ForwardDeclaredValue(SSAValue):
     """
     An SSA value that is used before it is defined.
@@ -80,6 +82,12 @@ class Parser(AttrParser):
     """
 
     ssa_values: dict[str, tuple[SSAValue, ...]]
+    _ssa_value_scopes: list[list[str]]
+    """
+    The names of the SSA values defined in each region being parsed, from the
+    outermost to the innermost one.
+    They are removed from `ssa_values` when the region is closed.
+    """
     blocks: dict[str, tuple[Block, Span | None]]
     forward_block_references: dict[str, list[Span]]
     """
@@ -91,18 +99,33 @@ class Parser(AttrParser):
     SSA values that are referenced, but are not yet defined.
     This field map a name and a tuple index to the forward declared SSA value.
     """
+    lazy_isolated_regions: bool
+    """
+    Whether the regions of operations isolated from above, other than symbol tables,
+    are only parsed when their blocks are first accessed.
+    Errors in these regions are then only reported at that point.
+    """
+    _parse_regions_lazily: bool
+    """Whether the regions of the operation being parsed are parsed lazily."""
 
     def __init__(
         self,
         ctx: Context,
-        input: str,
+        input: str | Input,
         name: str = "<unknown>",
+        *,
+        lazy_isolated_regions: bool = False,
     ) -> None:
-        super().__init__(ParserState(MLIRLexer(Input(input, name))), ctx)
+        if not isinstance(input, Input):
+            input = Input(input, name)
+        super().__init__(ParserState(MLIRLexer(input)), ctx)
         self.ssa_values = dict()
+        self._ssa_value_scopes = [[]]
         self.blocks = dict()
         self.forward_block_references = defaultdict(list)
         self.forward_ssa_references = dict()
+        self.lazy_isolated_regions = lazy_isolated_regions
+        self._parse_regions_lazily = False
 
     def parse_module(self, allow_implicit_module: bool = True) -> ModuleOp:
         module_op: Operation
@@ -372,6 +395,7 @@ class Parser(AttrParser):
 
         # Register the SSA values in the context
         self.ssa_values[name] = tuple(values)
+        self._ssa_value_scopes[-1].append(name)
 
         tuple_size = len(values)
         # Check for forward references of this value
@@ -509,16 +533,38 @@ class Parser(AttrParser):
         only block in the region.
         """
         # Check if a region is present.
-        if self.parse_optional_punctuation("{") is None:
+        if self._current_token.kind != MLIRTokenKind.L_BRACE:
             return None
 
+        if self._parse_regions_lazily and (
+            region := self._parse_optional_lazy_region(arguments)
+        ):
+            return region
+
+        self._consume_token(MLIRTokenKind.L_BRACE)
         region = Region()
+        self._parse_region_body(region, arguments)
+        return region
 
+    def _parse_region_body(
+        self,
+        region: Region,
+        arguments: Iterable[Argument] | None,
+        entry_block: Block | None = None,
+    ) -> None:
+        """
+        Parse the blocks of a region and its closing brace, after its opening brace,
+        and add them to `region`.
+        If `arguments` is provided, `entry_block` is the entry block with these
+        arguments if it was already created.
+        """
         # Create a new scope for values and blocks.
         # Outside blocks cannot be referenced from inside the region, and vice versa.
         # Outside values can be referenced from inside the region, but the region
         # values cannot be referred to from outside the region.
-        old_ssa_values = self.ssa_values.copy()
+        # Since values cannot be shadowed, the region values are only recorded to be
+        # removed when the region is closed.
+        self._ssa_value_scopes.append([])
         old_blocks = self.blocks
         old_forward_blocks = self.forward_block_references
         self.blocks = dict()
@@ -537,7 +583,8 @@ class Parser(AttrParser):
                 self.raise_error("invalid block name in region with named arguments")
 
             # Set the block arguments in the context
-            entry_block = Block(arg_types=arg_types)
+            if entry_block is None:
+                entry_block = Block(arg_types=arg_types)
             for block_arg, arg in zip(entry_block.args, arguments):
                 self._register_ssa_definition(arg.name.text[1:], (block_arg,), arg.name)
 
@@ -583,11 +630,64 @@ class Parser(AttrParser):
             )
 
         # Close the value and block scope.
-        self.ssa_values = old_ssa_values
+        ssa_values = self.ssa_values
+        for name in self._ssa_value_scopes.pop():
+            del ssa_values[name]
         self.blocks = old_blocks
         self.forward_block_references = old_forward_blocks
 
-        return region
+    _lazy_region_scan_regex = re.compile(r'[{}]|"(?:[^"\\\n]|\\.)*"|//[^\n]*')
+    """
+    Matches the braces of a region, and the string literals and comments that can
+    contain unbalanced braces.
+    """
+
+    def _parse_optional_lazy_region(
+        self, arguments: Iterable[Argument] | None
+    ) -> Region | None:
+        """
+        Skip a region starting at the current opening brace, and return a region
+        that parses it when its blocks are first accessed.
+        The entry block is created with `arguments` if they are provided, so that
+        they can be accessed without parsing the region.
+        Returns None and skips nothing if the closing brace is not found.
+        """
+        input = self.lexer.input
+        start = self.pos
+        depth = 0
+        for match in self._lazy_region_scan_regex.finditer(
+            input.content, start, input.len
+        ):
+            brace = match.group()
+            if brace == "{":
+                depth += 1
+            elif brace == "}":
+                depth -= 1
+                if not depth:
+                    break
+        else:
+            return None
+        end = match.end()
+
+        entry_block = None
+        if arguments is not None:
+            arguments = list(arguments)
+            entry_block = Block(arg_types=[arg.type for arg in arguments])
+            for block_arg, arg in zip(entry_block.args, arguments):
+                if SSAValue.is_valid_name(name := arg.name.text[1:]):
+                    block_arg.name_hint = name
+
+        self._resume_from(end)
+        return Region.lazy(
+            _LazyParsedRegionBody(
+                self.ctx,
+                Span(start, end, input),
+                arguments,
+                entry_block,
+                tuple(self._parser_state.dialect_stack),
+                self.attribute_aliases,
+            )
+        )
 
     def parse_region(self, arguments: Iterable[Argument] | None = None) -> Region:
         """
@@ -708,7 +808,9 @@ class Parser(AttrParser):
             op_type = self._get_op_by_name(op_name.text)
             dialect_name = op_type.dialect_name()
             self._parser_state.dialect_stack.append(dialect_name)
+            parse_regions_lazily = self._enter_operation_regions(op_type)
             op = op_type.parse(self)
+            self._parse_regions_lazily = parse_regions_lazily
             self._parser_state.dialect_stack.pop()
         else:
             # Generic operation format
@@ -718,7 +820,9 @@ class Parser(AttrParser):
             op_type = self._get_op_by_name(op_name)
             dialect_name = op_type.dialect_name()
             self._parser_state.dialect_stack.append(dialect_name)
+            parse_regions_lazily = self._enter_operation_regions(op_type)
             op = self._parse_generic_operation(op_type)
+            self._parse_regions_lazily = parse_regions_lazily
             self._parser_state.dialect_stack.pop()
 
         n_bound_results = sum(r[1] for r in bound_results)
@@ -740,6 +844,20 @@ class Parser(AttrParser):
 
         return op
 
+    def _enter_operation_regions(self, op_type: type[Operation]) -> bool:
+        """
+        Set whether the regions of an operation of the given type that is about to
+        be parsed are parsed lazily.
+        Returns the previous setting, to restore once the operation is parsed.
+        """
+        parse_regions_lazily = self._parse_regions_lazily
+        self._parse_regions_lazily = (
+            self.lazy_isolated_regions
+            and op_type.has_trait(IsolatedFromAbove)
+            and not op_type.has_trait(SymbolTable)
+        )
+        return parse_regions_lazily
+
     def _get_op_by_name(self, name: str) -> type[Operation]:
         """
         Get an operation type by its name.
@@ -1015,3 +1133,58 @@ class Parser(AttrParser):
         self.parse_comma_separated_list(
             self.Delimiter.METADATA_TOKEN, self._parse_metadata_element
         )
+
+
+@dataclass(eq=False, repr=False)
+class _LazyParsedRegionBody(LazyRegionBody):
+    """The contents of a region that are parsed when its blocks are first accessed."""
+
+    ctx: Context
+    """The context used to parse the region."""
+
+    span: Span
+    """The source text of the region, including its braces."""
+
+    arguments: list[Parser.Argument] | None
+    """The arguments of the entry block if they are parsed outside of the region."""
+
+    entry_block: Block | None
+
+    dialect_stack: tuple[str, ...]
+    """The default dialects for operation names in the region."""
+
+    attribute_aliases: dict[str, Attribute]
+    """The attribute and type aliases of the input."""
+
+    def build(self, region: Region) -> None:
+        input = self.span.input
+        parser = Parser(self.ctx, input, lazy_isolated_regions=True)
+        parser.attribute_aliases = self.attribute_aliases
+        parser._parser_state.dialect_stack = list(self.dialect_stack)  # pyright: ignore[reportPrivateUsage]
+        parser._resume_from(self.span.start)  # pyright: ignore[reportPrivateUsage]
+        parser._consume_token(MLIRTokenKind.L_BRACE)  # pyright: ignore[reportPrivateUsage]
+        parser._parse_region_body(region, self.arguments, self.entry_block)  # pyright: ignore[reportPrivateUsage]
+
+        if parser.forward_ssa_references:
+            value_names = ", ".join(
+                "%" + name for name in parser.forward_ssa_references.keys()
+            )
+            parser.raise_error(
+                f"values used but not defined: [{value_names}]", self.span
+            )
+
+    def get_source_text(self, entry_arg_names: Sequence[str]) -> str | None:
+        if self.arguments is None:
+            if entry_arg_names:
+                return None
+        elif tuple(entry_arg_names) != tuple(
+            arg.name.text[1:] for arg in self.arguments
+        ):
+            return None
+        text = self.span.text
+        # Aliases and resources are not printed, so they cannot be referenced.
+        if "dense_resource" in text or any(
+            alias in text for alias in self.attribute_aliases
+        ):
+            return None
+        return text
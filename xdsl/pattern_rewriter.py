@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import inspect
+import json
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Iterable, Sequence
-from dataclasses import dataclass, field
-from functools import wraps
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from functools import partial, wraps
+from time import perf_counter
 from types import UnionType
-from typing import Union, final, get_args, get_origin
+from typing import IO, Union, cast, final, get_args, get_origin
 
 from typing_extensions import TypeVar
 
@@ -24,7 +27,9 @@ from xdsl.ir import (
     SSAValue,
 )
 from xdsl.irdl import AttrConstraint, base
+from xdsl.irdl.dominance import DominanceInfoCache
 from xdsl.rewriter import BlockInsertPoint, InsertPoint, Rewriter
+from xdsl.utils.exceptions import PassFailedException
 from xdsl.utils.hints import isa
 
 
@@ -50,6 +55,26 @@ class PatternRewriterListener(BuilderListener):
     )
     """Callbacks that are called when an operation is replaced."""
 
+    operations_move_handler: list[Callable[[Operation, Operation, Block], None]] = (
+        field(
+            default_factory=list[Callable[[Operation, Operation, Block], None]],
+            kw_only=True,
+        )
+    )
+    """
+    Callbacks that are called when a range of operations is moved to another
+    location, with the first and last operations of the range, and the block they
+    were moved from.
+    """
+
+    block_removal_handler: list[Callable[[Block], None]] = field(
+        default_factory=list[Callable[[Block], None]], kw_only=True
+    )
+    """
+    Callbacks that are called when a block is about to be removed from its region,
+    either to be erased or moved to another region.
+    """
+
     def handle_operation_removal(self, op: Operation) -> None:
         """Pass the operation that will be removed to the registered callbacks."""
         for handler in self.operation_removal_handler:
@@ -67,6 +92,21 @@ class PatternRewriterListener(BuilderListener):
         for handler in self.operation_replacement_handler:
             handler(op, new_results)
 
+    def handle_operations_move(
+        self, first: Operation, last: Operation, source: Block
+    ) -> None:
+        """
+        Pass the first and last operations of a range that was just moved, and the
+        block they were moved from, to the registered callbacks.
+        """
+        for handler in self.operations_move_handler:
+            handler(first, last, source)
+
+    def handle_block_removal(self, block: Block) -> None:
+        """Pass the block that will be removed to the registered callbacks."""
+        for handler in self.block_removal_handler:
+            handler(block)
+
     def extend_from_listener(self, listener: BuilderListener | PatternRewriterListener):
         """Forward all callbacks from `listener` to this listener."""
         super().extend_from_listener(listener)
@@ -78,6 +118,8 @@ class PatternRewriterListener(BuilderListener):
             self.operation_replacement_handler.extend(
                 listener.operation_replacement_handler
             )
+            self.operations_move_handler.extend(listener.operations_move_handler)
+            self.block_removal_handler.extend(listener.block_removal_handler)
 
 
 @dataclass(eq=False, init=False)
@@ -257,6 +299,17 @@ class PatternRewriter(Builder, PatternRewriterListener):
         Move the block operations to the specified insertion point.
         """
         self.has_done_action = True
+        first_op = block.first_op
+        last_op = block.last_op
+        if first_op is not None and last_op is not None:
+            # Move the operations before the block is erased, so that the listeners
+            # can still see where they were moved from.
+            insertion_point.block.splice_ops(
+                first_op, last_op, insertion_point.insert_before
+            )
+            self.handle_operations_move(first_op, last_op, block)
+        if block.parent is not None:
+            self.handle_block_removal(block)
         Rewriter.inline_block(block, insertion_point, arg_values=arg_values)
 
     def inline_block_before_matched_op(
@@ -281,15 +334,44 @@ class PatternRewriter(Builder, PatternRewriterListener):
             block, InsertPoint.after(self.current_operation), arg_values=arg_values
         )
 
+    def erase_block(self, block: Block, safe_erase: bool = True) -> None:
+        """
+        Erase a block and its operations.
+        If safe_erase is True, check that the operations have no uses outside of the
+        block. Otherwise, replace these uses with ErasedSSAValue.
+        """
+        self.has_done_action = True
+        for op in reversed(block.ops):
+            self.handle_operation_removal(op)
+        if (region := block.parent) is not None:
+            self.handle_block_removal(block)
+            region.detach_block(block)
+        block.erase(safe_erase=safe_erase)
+
+    def detach_block(self, block: Block) -> Block:
+        """Detach a block from its region, and return it."""
+        self.has_done_action = True
+        if (region := block.parent) is None:
+            raise ValueError("Cannot detach a block without a parent region.")
+        self.handle_block_removal(block)
+        return region.detach_block(block)
+
     def move_region_contents_to_new_regions(self, region: Region) -> Region:
         """Move the region blocks to a new region."""
         self.has_done_action = True
+        for block in region.blocks:
+            self.handle_block_removal(block)
         return Rewriter.move_region_contents_to_new_regions(region)
 
     def inline_region(self, region: Region, insertion_point: BlockInsertPoint) -> None:
         """Move the region blocks to the specified insertion point."""
         self.has_done_action = True
+        blocks = list(region.blocks)
+        for block in blocks:
+            self.handle_block_removal(block)
         Rewriter.inline_region(region, insertion_point)
+        for block in blocks:
+            self.handle_block_creation(block)
 
     def notify_op_modified(self, op: Operation) -> None:
         """
@@ -305,6 +387,12 @@ class RewritePattern(ABC):
     A side-effect free rewrite pattern matching on a DAG.
     """
 
+    benefit: int = 1
+    """
+    The expected benefit of applying the pattern. Pattern appliers try patterns with
+    a higher benefit first, and patterns of equal benefit in order.
+    """
+
     # The / in the function signature makes the previous arguments positional, see
     # https://peps.python.org/pep-0570/
     # This is used by the op_type_rewrite_pattern
@@ -367,9 +455,21 @@ def op_type_rewrite_pattern(
         if isinstance(op, expected_type):
             func(self, op, rewriter)
 
+    # Record the matched operation types, so that pattern appliers can skip the
+    # pattern on other operations without calling it
+    impl.root_op_types = expected_types  # pyright: ignore[reportFunctionMemberAccess]
     return impl
 
 
+def get_root_op_types(pattern: RewritePattern) -> tuple[type[Operation], ...] | None:
+    """
+    Get the operation types a pattern can match, as declared by the type hint of a
+    `match_and_rewrite` method decorated with `op_type_rewrite_pattern`.
+    Returns `None` if the pattern may match any operation.
+    """
+    return getattr(type(pattern).match_and_rewrite, "root_op_types", None)
+
+
 @dataclass
 class TypeConversionPattern(RewritePattern):
     """
@@ -528,23 +628,129 @@ def attr_type_rewrite_pattern(
     return attr_constr_rewrite_pattern(constr)(func)
 
 
+@dataclass(eq=False)
+class _PatternHitRate:
+    """The number of match attempts and successes of a pattern."""
+
+    pattern: RewritePattern
+    attempts: int = 0
+    successes: int = 0
+
+    def precedes(self, other: _PatternHitRate) -> bool:
+        """
+        Return if the pattern should be tried before the other one, that is if it
+        has a higher benefit, or an equal benefit and a higher or equal hit rate.
+        """
+        if self.pattern.benefit != other.pattern.benefit:
+            return self.pattern.benefit > other.pattern.benefit
+        return self.successes * other.attempts >= other.successes * self.attempts
+
+
 @dataclass(eq=False, repr=False)
 class GreedyRewritePatternApplier(RewritePattern):
     """
-    Apply a list of patterns in order until one pattern matches,
-    and then use this rewrite.
+    Apply a list of patterns in order of decreasing benefit, and then in list order,
+    until one pattern matches, and then use this rewrite.
+    Patterns matching specific operation types, as declared with
+    `op_type_rewrite_pattern`, are only applied on operations of these types.
     """
 
     rewrite_patterns: list[RewritePattern]
     """The list of rewrites to apply in order."""
 
+    order_by_hit_rate: bool = field(default=False, kw_only=True)
+    """
+    Among patterns of equal benefit, first try the patterns that succeeded the most
+    often on operations of the same type, instead of following the list order.
+    This wastes fewer match attempts, and should only be used when the result does
+    not depend on the order of patterns of equal benefit.
+    """
+
+    _patterns_by_op_type: dict[type[Operation], tuple[RewritePattern, ...]] = field(
+        default_factory=dict[type[Operation], tuple[RewritePattern, ...]], init=False
+    )
+    """
+    The rewrites that can match each operation type, in order.
+    It is filled on the first application on an operation of each type, so
+    `rewrite_patterns` should not be modified afterwards.
+    """
+
+    _hit_rates_by_op_type: dict[type[Operation], list[_PatternHitRate]] = field(
+        default_factory=dict[type[Operation], list[_PatternHitRate]], init=False
+    )
+    """
+    The match statistics of the rewrites of each operation type, ordered by benefit
+    and then by hit rate, when ordering by hit rate.
+    """
+
+    def get_patterns_for_op_type(
+        self, op_type: type[Operation]
+    ) -> tuple[RewritePattern, ...]:
+        """
+        Get the rewrites that can match operations of the given type, in order.
+        These are the rewrites matching a parent class of the type, and the
+        rewrites that may match any operation.
+        """
+        if (patterns := self._patterns_by_op_type.get(op_type)) is None:
+            patterns = tuple(
+                sorted(
+                    (
+                        pattern
+                        for pattern in self.rewrite_patterns
+                        if (root_op_types := get_root_op_types(pattern)) is None
+                        or issubclass(op_type, root_op_types)
+                    ),
+                    key=lambda pattern: -pattern.benefit,
+                )
+            )
+            self._patterns_by_op_type[op_type] = patterns
+        return patterns
+
     def match_and_rewrite(self, op: Operation, rewriter: PatternRewriter) -> None:
-        for pattern in self.rewrite_patterns:
-            pattern.match_and_rewrite(op, rewriter)
+        if self.order_by_hit_rate:
+            self._match_and_rewrite_by_hit_rate(op, rewriter)
+            return
+        patterns = self._patterns_by_op_type.get(type(op))
+        if patterns is None:
+            patterns = self.get_patterns_for_op_type(type(op))
+        statistics = _pattern_statistics
+        for pattern in patterns:
+            if statistics is None:
+                pattern.match_and_rewrite(op, rewriter)
+            else:
+                statistics.match_and_rewrite(pattern, op, rewriter)
             if rewriter.has_done_action:
                 return
         return
 
+    def _match_and_rewrite_by_hit_rate(
+        self, op: Operation, rewriter: PatternRewriter
+    ) -> None:
+        hit_rates = self._hit_rates_by_op_type.get(type(op))
+        if hit_rates is None:
+            hit_rates = self._hit_rates_by_op_type[type(op)] = [
+                _PatternHitRate(pattern)
+                for pattern in self.get_patterns_for_op_type(type(op))
+            ]
+        statistics = _pattern_statistics
+        for index, hit_rate in enumerate(hit_rates):
+            hit_rate.attempts += 1
+            if statistics is None:
+                hit_rate.pattern.match_and_rewrite(op, rewriter)
+            else:
+                statistics.match_and_rewrite(hit_rate.pattern, op, rewriter)
+            if rewriter.has_done_action:
+                hit_rate.successes += 1
+                # Move the pattern before the patterns of equal benefit that
+                # succeed less often
+                while index > 0 and not hit_rates[index - 1].precedes(hit_rate):
+                    hit_rates[index - 1], hit_rates[index] = (
+                        hit_rate,
+                        hit_rates[index - 1],
+                    )
+                    index -= 1
+                return
+
 
 @dataclass(eq=False)
 class Worklist:
@@ -600,6 +806,114 @@ class Worklist:
             del self._map[op]
 
 
+@dataclass(eq=False)
+class OperationTypeIndex:
+    """
+    An index from operation types to the operations nested in a root operation.
+    It allows iterating the operations of a given type without walking the whole
+    IR. The index is kept up to date by attaching its `listener` to the rewriters
+    modifying the IR, for instance with
+    `PatternRewriteWalker(pattern, listener=index.listener)`.
+    """
+
+    root: Operation
+    """The operation whose nested operations are indexed, including itself."""
+
+    _ops: dict[type[Operation], dict[Operation, None]] = field(
+        default_factory=dict[type[Operation], dict[Operation, None]], init=False
+    )
+    """
+    The operations of each concrete operation type, as ordered sets.
+    They are in walk order for operations present when the index was created,
+    followed by operations in insertion order.
+    """
+
+    listener: PatternRewriterListener = field(init=False)
+    """The listener updating the index on operation insertions, removals and moves."""
+
+    def __post_init__(self):
+        self._add_nested_ops(self.root)
+        self.listener = PatternRewriterListener(
+            operation_insertion_handler=[self._add_nested_ops],
+            operation_removal_handler=[self._remove_nested_ops],
+            operations_move_handler=[self._handle_operations_move],
+            block_creation_handler=[self._add_block_ops],
+            block_removal_handler=[self._remove_block_ops],
+        )
+
+    def _add_nested_ops(self, op: Operation) -> None:
+        """Add an operation and its nested operations to the index."""
+        ops = self._ops
+        for sub_op in op.walk():
+            if (type_ops := ops.get(type(sub_op))) is None:
+                type_ops = ops[type(sub_op)] = {}
+            type_ops[sub_op] = None
+
+    def _handle_operations_move(
+        self, first: Operation, last: Operation, source: Block
+    ) -> None:
+        """
+        Add a range of moved operations and their nested operations to the index if
+        they were moved in the root operation, as they may come from a block that was
+        not indexed, and remove them otherwise.
+        """
+        update = (
+            self._add_nested_ops
+            if self.root.is_ancestor(first)
+            else self._remove_nested_ops
+        )
+        op = first
+        while op is not None:
+            update(op)
+            if op is last:
+                break
+            op = op.next_op
+
+    def _add_block_ops(self, block: Block) -> None:
+        """
+        Add the operations of a block created or moved in the root operation to the
+        index.
+        """
+        if self.root.is_ancestor(block):
+            for op in block.ops:
+                self._add_nested_ops(op)
+
+    def _remove_block_ops(self, block: Block) -> None:
+        """Remove the operations of a block removed from its region from the index."""
+        for op in block.ops:
+            self._remove_nested_ops(op)
+
+    def _remove_nested_ops(self, op: Operation) -> None:
+        """Remove an operation and its nested operations from the index."""
+        ops = self._ops
+        for sub_op in op.walk():
+            if (type_ops := ops.get(type(sub_op))) is not None:
+                type_ops.pop(sub_op, None)
+
+    def walk_ops_of_type(
+        self, op_type: type[_OperationT], *, nested_in: Operation | None = None
+    ) -> Iterator[_OperationT]:
+        """
+        Iterate the indexed operations of the given type, including subclasses.
+        If `nested_in` is given, only the operations nested in it, including itself,
+        are yielded.
+        The operations are grouped by concrete type. The IR can be modified while
+        iterating, as the operations are collected before being yielded.
+        """
+        matched_ops = [
+            op
+            for cls, type_ops in self._ops.items()
+            if issubclass(cls, op_type)
+            for op in type_ops
+        ]
+        ancestor = self.root if nested_in is None else nested_in
+        for op in matched_ops:
+            # Skip operations detached, or nested in an operation detached, without
+            # notifying the listener
+            if ancestor.is_ancestor(op):
+                yield cast(_OperationT, op)
+
+
 @dataclass(eq=False, repr=False)
 class PatternRewriteWalker:
     """
@@ -637,9 +951,55 @@ class PatternRewriteWalker:
     listener: PatternRewriterListener = field(default_factory=PatternRewriterListener)
     """The listener that will be called when an operation or block is modified."""
 
+    dominance_info_cache: DominanceInfoCache | None = field(default=None)
+    """
+    The cached dominance information to invalidate when the control flow of a region
+    may change, if any.
+    """
+
+    incremental: bool = field(default=False)
+    """
+    Populate the worklist with all operations only once, and then only process the
+    operations added by the rewriter listener until the worklist is empty, as done
+    by MLIR's greedy pattern rewrite driver. Otherwise, the worklist is populated
+    again after each walk that modified the IR.
+    In this mode, the parents of inserted, removed, and moved operations are also
+    added to the worklist. The worklist is still populated again with all operations
+    if the post walk function modified the IR, or if a rewrite did not notify the
+    listener.
+    """
+
+    max_iterations: int | None = field(default=None)
+    """
+    The maximum number of walks of the IR, or of worklist drains in incremental
+    mode. A `PassFailedException` is raised if the IR is still modified in the last
+    one.
+    """
+
+    max_num_rewrites: int | None = field(default=None)
+    """
+    The maximum number of successful pattern applications. A `PassFailedException`
+    is raised if more rewrites are applied.
+    """
+
     _worklist: Worklist = field(default_factory=Worklist, init=False)
     """The worklist of operations to walk over."""
 
+    _num_rewrites: int = field(default=0, init=False)
+    """The number of successful pattern applications in the current rewrite."""
+
+    _notified: bool = field(default=False, init=False)
+    """Whether the listener was notified since the last successful rewrite."""
+
+    _requires_full_walk: bool = field(default=False, init=False)
+    """
+    Whether the IR was modified in a way that the worklist does not track, so that
+    all operations have to be walked again in incremental mode.
+    """
+
+    _root: Operation | None = field(default=None, init=False)
+    """The operation owning the region being rewritten."""
+
     def _add_operands_to_worklist(self, operands: Iterable[SSAValue]) -> None:
         """
         Add defining operations of SSA values to the worklist if they have only
@@ -654,14 +1014,32 @@ class PatternRewriteWalker:
             ):
                 self._worklist.push(op)
 
+    def _push_parent_op(self, node: Operation | Block) -> None:
+        """
+        In incremental mode, add the parent of a modified operation or block to the
+        worklist, as changes to its body may enable rewrites on it.
+        """
+        if (
+            self.incremental
+            and (parent := node.parent_op()) is not None
+            and parent is not self._root
+        ):
+            self._worklist.push(parent)
+
     def _handle_operation_insertion(self, op: Operation) -> None:
         """Handle insertion of an operation."""
+        self._notified = True
+        op.invalidate_structural_hash()
         if self.apply_recursively:
+            self._push_parent_op(op)
             self._worklist.push(op)
 
     def _handle_operation_removal(self, op: Operation) -> None:
         """Handle removal of an operation."""
+        self._notified = True
+        op.invalidate_structural_hash()
         if self.apply_recursively:
+            self._push_parent_op(op)
             self._add_operands_to_worklist(op.operands)
         if op.regions:
             for sub_op in op.walk():
@@ -671,13 +1049,47 @@ class PatternRewriteWalker:
 
     def _handle_operation_modification(self, op: Operation) -> None:
         """Handle modification of an operation."""
+        self._notified = True
+        op.invalidate_structural_hash()
         if self.apply_recursively:
             self._worklist.push(op)
 
+    def _handle_operations_move(
+        self, first: Operation, last: Operation, source: Block
+    ) -> None:
+        """Handle move of a range of operations."""
+        self._notified = True
+        if self.apply_recursively:
+            # The moved operations, and their old and new parents, may now match
+            self._push_parent_op(source)
+            self._push_parent_op(first)
+            op = first
+            while op is not None:
+                self._worklist.push(op)
+                if op is last:
+                    break
+                op = op.next_op
+
+    def _handle_block_creation(self, block: Block) -> None:
+        """Handle creation of a block, or its move to another region."""
+        self._notified = True
+        if self.apply_recursively:
+            # The operations of moved blocks, and their new parent, may now match
+            self._push_parent_op(block)
+            for op in block.ops:
+                self._worklist.push(op)
+
+    def _handle_block_removal(self, block: Block) -> None:
+        """Handle removal of a block."""
+        self._notified = True
+        if self.apply_recursively:
+            self._push_parent_op(block)
+
     def _handle_operation_replacement(
         self, op: Operation, new_results: Sequence[SSAValue | None]
     ) -> None:
         """Handle replacement of an operation."""
+        self._notified = True
         if self.apply_recursively:
             for result in op.results:
                 for user in result.uses:
@@ -689,7 +1101,7 @@ class PatternRewriteWalker:
         It will take care of adding operations to the worklist, and calling the
         listener passed as configuration to the walker.
         """
-        return PatternRewriterListener(
+        listener = PatternRewriterListener(
             operation_insertion_handler=[
                 *self.listener.operation_insertion_handler,
                 self._handle_operation_insertion,
@@ -706,8 +1118,29 @@ class PatternRewriteWalker:
                 *self.listener.operation_replacement_handler,
                 self._handle_operation_replacement,
             ],
-            block_creation_handler=self.listener.block_creation_handler,
+            operations_move_handler=[
+                *self.listener.operations_move_handler,
+                self._handle_operations_move,
+            ],
+            block_creation_handler=[
+                *self.listener.block_creation_handler,
+                self._handle_block_creation,
+            ],
+            block_removal_handler=[
+                *self.listener.block_removal_handler,
+                self._handle_block_removal,
+            ],
         )
+        if (cache := self.dominance_info_cache) is not None:
+            listener.operation_insertion_handler.append(cache.handle_operation_change)
+            listener.operation_modification_handler.append(
+                cache.handle_operation_change
+            )
+            listener.operation_removal_handler.append(cache.handle_operation_removal)
+            listener.operations_move_handler.append(cache.handle_operations_move)
+            listener.block_creation_handler.append(cache.handle_block_creation)
+            listener.block_removal_handler.append(cache.handle_block_removal)
+        return listener
 
     def rewrite_module(self, module: ModuleOp) -> bool:
         """
@@ -722,22 +1155,44 @@ class PatternRewriteWalker:
         pattern. Returns `True` if the IR was mutated.
         """
         pattern_listener = self._get_rewriter_listener()
+        self._num_rewrites = 0
+        self._requires_full_walk = False
+        self._root = region.parent
 
         self._populate_worklist(region)
         op_was_modified = self._process_worklist(pattern_listener)
-        if self.post_walk_func is not None:
-            op_was_modified |= self.post_walk_func(region, pattern_listener)
+        if self.post_walk_func is not None and self.post_walk_func(
+            region, pattern_listener
+        ):
+            op_was_modified = self._requires_full_walk = True
 
         if not self.apply_recursively:
             return op_was_modified
 
         result = op_was_modified
+        num_iterations = 1
 
         while op_was_modified:
-            self._populate_worklist(region)
+            if not self.incremental or self._requires_full_walk:
+                self._requires_full_walk = False
+                self._populate_worklist(region)
+            elif self._worklist.is_empty():
+                # All the operations to revisit were added by the rewriter listener
+                break
+            if (
+                self.max_iterations is not None
+                and num_iterations >= self.max_iterations
+            ):
+                raise PassFailedException(
+                    "Pattern rewriting did not converge after "
+                    f"{num_iterations} iterations"
+                )
+            num_iterations += 1
             op_was_modified = self._process_worklist(pattern_listener)
-            if self.post_walk_func is not None:
-                op_was_modified |= self.post_walk_func(region, pattern_listener)
+            if self.post_walk_func is not None and self.post_walk_func(
+                region, pattern_listener
+            ):
+                op_was_modified = self._requires_full_walk = True
 
         return result
 
@@ -765,6 +1220,18 @@ class PatternRewriteWalker:
         rewriter = PatternRewriter(op)
         rewriter.extend_from_listener(listener)
 
+        # Only record statistics when collecting them, to keep the loop unchanged
+        # otherwise
+        match_and_rewrite = self.pattern.match_and_rewrite
+        if (statistics := _pattern_statistics) is not None:
+            match_and_rewrite = partial(statistics.match_and_rewrite, self.pattern)
+            rewriter.operation_insertion_handler.append(
+                statistics.handle_operation_insertion
+            )
+            rewriter.operation_removal_handler.append(
+                statistics.handle_operation_removal
+            )
+
         # do/while loop
         while True:
             # Reset the rewriter on `op`
@@ -774,15 +1241,161 @@ class PatternRewriteWalker:
 
             # Apply the pattern on the operation
             try:
-                self.pattern.match_and_rewrite(op, rewriter)
+                match_and_rewrite(op, rewriter)
             except Exception as err:
                 op.emit_error(
                     f"Error while applying pattern: {err}",
                     underlying_error=err,
                 )
-            rewriter_has_done_action |= rewriter.has_done_action
+            if rewriter.has_done_action:
+                # Not all rewriter actions notify the listener, so conservatively
+                # invalidate the hashes of the matched operation and its ancestors
+                op.invalidate_structural_hash()
+                if not self._notified:
+                    # The rewrite is not tracked by the worklist
+                    self._requires_full_walk = True
+                self._notified = False
+                rewriter_has_done_action = True
+                self._num_rewrites += 1
+                if (
+                    self.max_num_rewrites is not None
+                    and self._num_rewrites > self.max_num_rewrites
+                ):
+                    raise PassFailedException(
+                        "Pattern rewriting did not converge after "
+                        f"{self.max_num_rewrites} rewrites"
+                    )
 
             # If the worklist is empty, we are done
             op = self._worklist.pop()
             if op is None:
                 return rewriter_has_done_action
+
+
+@dataclass
+class PatternStatistic:
+    """The statistics of the applications of a pattern class."""
+
+    attempts: int = 0
+    """The number of operations the pattern was applied on."""
+
+    successes: int = 0
+    """The number of applications that modified the IR."""
+
+    match_time: float = 0.0
+    """The cumulative time spent applying the pattern, in seconds."""
+
+    ops_created: int = 0
+    """The number of operations inserted by the pattern."""
+
+    ops_erased: int = 0
+    """The number of operations erased by the pattern."""
+
+
+@dataclass(eq=False)
+class PatternStatistics:
+    """
+    The statistics of pattern applications, per pattern class.
+    They are recorded by the pattern rewrite walkers run in a
+    `collect_pattern_statistics` context.
+    """
+
+    statistics: dict[type[RewritePattern], PatternStatistic] = field(
+        default_factory=dict[type[RewritePattern], PatternStatistic]
+    )
+
+    _current: PatternStatistic | None = field(default=None, init=False)
+    """The statistic of the pattern being applied, if any."""
+
+    def match_and_rewrite(
+        self, pattern: RewritePattern, op: Operation, rewriter: PatternRewriter
+    ) -> None:
+        """
+        Apply a pattern on an operation, and record its statistics.
+        A `GreedyRewritePatternApplier` is not recorded itself, as it records the
+        statistics of each of its patterns when applying them.
+        """
+        if isinstance(pattern, GreedyRewritePatternApplier):
+            pattern.match_and_rewrite(op, rewriter)
+            return
+
+        if (statistic := self.statistics.get(type(pattern))) is None:
+            statistic = self.statistics[type(pattern)] = PatternStatistic()
+        previous, self._current = self._current, statistic
+        statistic.attempts += 1
+        start = perf_counter()
+        try:
+            pattern.match_and_rewrite(op, rewriter)
+        finally:
+            statistic.match_time += perf_counter() - start
+            self._current = previous
+        if rewriter.has_done_action:
+            statistic.successes += 1
+
+    def handle_operation_insertion(self, op: Operation) -> None:
+        """Record the insertion of an operation by the pattern being applied."""
+        if self._current is not None:
+            self._current.ops_created += 1
+
+    def handle_operation_removal(self, op: Operation) -> None:
+        """Record the removal of an operation by the pattern being applied."""
+        if self._current is not None:
+            self._current.ops_erased += 1
+
+    def _sorted_statistics(self) -> list[tuple[type[RewritePattern], PatternStatistic]]:
+        """Get the statistics by decreasing match time."""
+        return sorted(self.statistics.items(), key=lambda item: -item[1].match_time)
+
+    def print_text(self, stream: IO[str]) -> None:
+        """Print the statistics as a table, by decreasing match time."""
+        header = ("Pattern", "Attempts", "Successes", "Time (ms)", "Created", "Erased")
+        rows = [
+            (
+                pattern.__name__,
+                str(statistic.attempts),
+                str(statistic.successes),
+                f"{statistic.match_time * 1000:.3f}",
+                str(statistic.ops_created),
+                str(statistic.ops_erased),
+            )
+            for pattern, statistic in self._sorted_statistics()
+        ]
+        widths = [max(len(row[i]) for row in (header, *rows)) for i in range(6)]
+        print("Pattern statistics:", file=stream)
+        for row in (header, *rows):
+            cells = [row[0].ljust(widths[0])]
+            cells.extend(cell.rjust(width) for cell, width in zip(row[1:], widths[1:]))
+            print("  " + "  ".join(cells).rstrip(), file=stream)
+
+    def print_json(self, stream: IO[str]) -> None:
+        """Print the statistics as a JSON list, by decreasing match time."""
+        statistics = [
+            {"pattern": f"{pattern.__module__}.{pattern.__qualname__}"}
+            | asdict(statistic)
+            for pattern, statistic in self._sorted_statistics()
+        ]
+        json.dump(statistics, stream, indent=2)
+        print(file=stream)
+
+
+_pattern_statistics: PatternStatistics | None = None
+"""The statistics recorded by the pattern rewrite walkers, if any."""
+
+
+@contextmanager
+def collect_pattern_statistics(
+    statistics: PatternStatistics | None = None,
+) -> Iterator[PatternStatistics]:
+    """
+    Record the statistics of the patterns applied by all pattern rewrite walkers
+    run in this context, in the given statistics or in new ones.
+    Walkers run outside of such a context do not record anything.
+    """
+    global _pattern_statistics
+    if statistics is None:
+        statistics = PatternStatistics()
+    previous, _pattern_statistics = _pattern_statistics, statistics
+    try:
+        yield statistics
+    finally:
+        _pattern_statistics = previous
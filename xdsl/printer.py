@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import json
 import math
+import multiprocessing
 from collections.abc import Callable, Iterable, Mapping, Sequence
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from io import StringIO
 from itertools import chain
 from typing import Any, cast
 
@@ -31,6 +34,7 @@ from xdsl.ir import (
     BlockArgument,
     Data,
     Dialect,
+    LazyRegionBody,
     OpaqueSyntaxAttribute,
     Operation,
     ParametrizedAttribute,
@@ -50,6 +54,19 @@ from xdsl.utils.diagnostic import Diagnostic
 from xdsl.utils.hints import isa
 from xdsl.utils.mlir_lexer import MLIRLexer
 
+_PARALLEL_PRINTING_STATE: tuple[Printer, Sequence[Operation]] | None = None
+"""
+The printer and the operations it prints in parallel.
+Worker processes are forked, and so inherit them.
+"""
+
+
+def _print_op_in_worker(index: int) -> tuple[str, dict[str, set[str]]]:
+    """Print one of the operations printed in parallel, in a worker process."""
+    assert _PARALLEL_PRINTING_STATE is not None
+    printer, ops = _PARALLEL_PRINTING_STATE
+    return printer._print_isolated_op(ops[index])  # pyright: ignore[reportPrivateUsage]
+
 
 @dataclass(eq=False, repr=False)
 class Printer(BasePrinter):
@@ -78,6 +95,19 @@ class Printer(BasePrinter):
     resources that were referenced in the ir
     """
 
+    print_jobs: int = field(default=1, kw_only=True)
+    """
+    The number of processes printing in parallel the operations of a block that are
+    isolated from above, such as the functions of a module.
+    """
+
+    elide_large_elements_attrs: int | None = field(default=None, kw_only=True)
+    """
+    If set, non-splat dense elements attributes with more elements than this limit
+    are printed as `dense_resource<__elided__>`, as with MLIR's
+    `--mlir-elide-elementsattrs-if-larger`.
+    """
+
     @property
     def ssa_names(self):
         return self._ssa_names[-1]
@@ -203,6 +233,10 @@ class Printer(BasePrinter):
             self.print_string(":")
 
         with self.indented():
+            if self.print_jobs > 1 and self._print_ops_in_parallel(
+                block, print_block_terminator
+            ):
+                return
             for op in block.ops:
                 if not print_block_terminator and op.has_trait(
                     IsTerminator, value_if_unregistered=False
@@ -211,6 +245,87 @@ class Printer(BasePrinter):
                 self._print_new_line()
                 self.print_op(op)
 
+    def _print_ops_in_parallel(
+        self, block: Block, print_block_terminator: bool
+    ) -> bool:
+        """
+        Print the operations of a block, with those isolated from above printed by a
+        pool of `print_jobs` processes, and return whether they were printed.
+        This is only done if no operation of the block defines or uses values, and
+        the operations that are not isolated have no regions, so that each isolated
+        operation is printed with the same names as when printed sequentially.
+        """
+        if (
+            self.diagnostic.op_messages
+            or "fork" not in multiprocessing.get_all_start_methods()
+        ):
+            return False
+
+        ops = [
+            op
+            for op in block.ops
+            if print_block_terminator
+            or not op.has_trait(IsTerminator, value_if_unregistered=False)
+        ]
+        isolated = [bool(op.get_traits_of_type(IsolatedFromAbove)) for op in ops]
+        isolated_ops = [op for op, is_isolated in zip(ops, isolated) if is_isolated]
+        if len(isolated_ops) < 2 or any(
+            op.operands
+            or op.results
+            or op.successors
+            or (op.regions and not is_isolated)
+            for op, is_isolated in zip(ops, isolated)
+        ):
+            return False
+
+        global _PARALLEL_PRINTING_STATE
+        _PARALLEL_PRINTING_STATE = (self, isolated_ops)
+        jobs = min(self.print_jobs, len(isolated_ops))
+        try:
+            with ProcessPoolExecutor(
+                jobs, mp_context=multiprocessing.get_context("fork")
+            ) as executor:
+                results = executor.map(
+                    _print_op_in_worker,
+                    range(len(isolated_ops)),
+                    chunksize=max(1, len(isolated_ops) // (jobs * 4)),
+                )
+                for op, is_isolated in zip(ops, isolated):
+                    self._print_new_line()
+                    if not is_isolated:
+                        self.print_op(op)
+                        continue
+                    text, dialect_resources = next(results)
+                    self.print_string(text, indent=0)
+                    for dialect, handles in dialect_resources.items():
+                        self._dialect_resources.setdefault(dialect, set()).update(
+                            handles
+                        )
+        finally:
+            _PARALLEL_PRINTING_STATE = None
+        return True
+
+    def _print_isolated_op(self, op: Operation) -> tuple[str, dict[str, set[str]]]:
+        """
+        Print an operation isolated from above with a copy of this printer, and
+        return the printed text and the resources it references.
+        """
+        stream = StringIO()
+        printer = replace(
+            self, stream=stream, buffered=True, print_jobs=1, _dialect_resources={}
+        )
+        printer._indent = self._indent
+        printer._current_line = self._current_line
+        printer._current_column = self._current_column
+        printer._ssa_values = self._ssa_values
+        printer._ssa_names = [self.ssa_names.copy()]
+        printer._block_names = [self.block_names.copy()]
+        printer._next_valid_name_id = [self._next_valid_name_id[-1]]
+        printer._next_valid_block_id = [self._next_valid_block_id[-1]]
+        printer.print_op(op)
+        printer.flush()
+        return stream.getvalue(), printer._dialect_resources
+
     def print_block_argument(self, arg: BlockArgument, print_type: bool = True) -> None:
         """
         Print a block argument with its type, e.g. `%arg : i32`
@@ -238,6 +353,11 @@ class Printer(BasePrinter):
         * If `print_empty_block` is False, empty entry blocks are not printed.
         * If `print_block_terminators` is False, the block terminators are not printed.
         """
+        if region.lazy_body is not None and self._print_lazy_region(
+            region.lazy_body, print_entry_block_args, print_block_terminators
+        ):
+            return
+
         # Empty region
         with self.in_braces():
             if (entry_block := region.blocks.first) is None:
@@ -262,6 +382,42 @@ class Printer(BasePrinter):
 
             self._print_new_line()
 
+    def _print_lazy_region(
+        self,
+        lazy_body: LazyRegionBody,
+        print_entry_block_args: bool,
+        print_block_terminators: bool,
+    ) -> bool:
+        """
+        Print the source text of a region that was not parsed yet, if it is printed
+        the same way as the parsed region would be.
+        Returns whether the region was printed.
+        """
+        if (
+            self.print_generic_format
+            or self.print_properties_as_attributes
+            or self.print_debuginfo
+            or not print_block_terminators
+        ):
+            return False
+        if (entry_block := lazy_body.entry_block) is None:
+            # The entry block arguments are part of the source text
+            if not print_entry_block_args:
+                return False
+            entry_arg_names: list[str] = []
+        else:
+            if print_entry_block_args and entry_block.args:
+                return False
+            entry_arg_names = []
+            for arg in entry_block.args:
+                if (name := self._ssa_values.get(arg)) is None:
+                    return False
+                entry_arg_names.append(name)
+        if (text := lazy_body.get_source_text(entry_arg_names)) is None:
+            return False
+        self.print_string(text, indent=0)
+        return True
+
     def print_regions(self, regions: Sequence[Region]) -> None:
         if len(regions) == 0:
             return
@@ -188,6 +188,7 @@ class Rewriter:
             new_value = OpResult(new_type, operation, val.index)
             results = operation.results
             operation.results = (*results[:index], new_value, *results[index + 1 :])
+            operation.invalidate_structural_hash()
         elif isinstance(val, BlockArgument):
             block = val.block
             index = val.index
@@ -198,6 +199,8 @@ class Rewriter:
                 new_value,
                 *args[index + 1 :],
             )
+            if (parent_op := block.parent_op()) is not None:
+                parent_op.invalidate_structural_hash()
         else:
             raise ValueError(
                 f"Expected OpResult or BlockArgument, got {type(val).__name__}"
@@ -253,14 +256,9 @@ class Rewriter:
 
         # Move operations from the source block to the dest block and erase the
         # source block.
-        ops = list(source.ops)
-        for block_op in ops:
-            block_op.detach()
-
-        if (insert_before := insertion_point.insert_before) is not None:
-            dest.insert_ops_before(ops, insert_before)
-        else:
-            dest.add_ops(ops)
+        if (first_op := source.first_op) is not None:
+            assert (last_op := source.last_op) is not None
+            dest.splice_ops(first_op, last_op, insertion_point.insert_before)
 
         parent_region = source.parent
         if parent_region is not None:
@@ -2,12 +2,14 @@ import argparse
 import os
 import sys
 from collections.abc import Callable
-from typing import IO
+from typing import IO, TextIO, cast
 
+from xdsl.bytecode.reader import read_bytecode_stream
 from xdsl.context import Context
 from xdsl.dialects import get_all_dialects
 from xdsl.dialects.builtin import ModuleOp
 from xdsl.parser import Parser
+from xdsl.utils.lexer import InputStream
 
 
 class CommandLineTool:
@@ -24,6 +26,12 @@ class CommandLineTool:
     file type.
     """
 
+    binary_frontends: frozenset[str] = frozenset({"mlirbc"})
+    """
+    The file extensions of the frontends that read the binary stream underlying
+    their input stream.
+    """
+
     def register_all_arguments(self, arg_parser: argparse.ArgumentParser):
         arg_parser.add_argument(
             "input_file", type=str, nargs="?", help="path to input file"
@@ -56,6 +64,15 @@ class CommandLineTool:
             help="Disable implicit addition of a top-level module op during parsing.",
         )
 
+        arg_parser.add_argument(
+            "--lazy-parsing",
+            default=False,
+            action="store_true",
+            help="Parse the regions of operations isolated from above, such as "
+            "function bodies, only when they are first accessed. Regions that are "
+            "not accessed are printed from their source.",
+        )
+
     def get_input_stream(self) -> tuple[IO[str], str]:
         """
         Get the input stream to parse from, along with the file extension.
@@ -91,11 +108,21 @@ class CommandLineTool:
         def parse_mlir(io: IO[str]):
             return Parser(
                 self.ctx,
-                io.read(),
+                io.input if isinstance(io, InputStream) else io.read(),
                 self.get_input_name(),
+                lazy_isolated_regions=self.args.lazy_parsing,
             ).parse_module(not self.args.no_implicit_module)
 
+        def parse_mlirbc(io: IO[str]):
+            return read_bytecode_stream(
+                self.ctx,
+                cast(TextIO, io).buffer,
+                self.get_input_name(),
+                lazy_isolated_regions=self.args.lazy_parsing,
+            )
+
         self.available_frontends["mlir"] = parse_mlir
+        self.available_frontends["mlirbc"] = parse_mlirbc
 
     def parse_chunk(
         self, chunk: IO[str], file_extension: str, start_offset: int = 0
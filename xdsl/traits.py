@@ -207,6 +207,18 @@ def ensure_terminator(op: Operation, trait: SingleBlockImplicitTerminator) -> No
                     trait.op_type.create()
 
 
+class HasGraphRegions(OpTrait):
+    """
+    The regions of the operation are graph regions, which have no SSA dominance:
+    values can be used before their definition, and the order of the blocks is not a
+    control flow.
+
+    This corresponds to MLIR's `RegionKindInterface` returning `RegionKind::Graph`.
+
+    See external [documentation](https://mlir.llvm.org/docs/LangRef/#graph-regions).
+    """
+
+
 class IsolatedFromAbove(OpTrait):
     """
     Constrains the contained operations to use only values defined inside this
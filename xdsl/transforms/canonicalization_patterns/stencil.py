@@ -84,8 +84,7 @@ class ApplyUnusedResults(RewritePattern):
         if not unused:
             return
 
-        block = op.region.block
-        op.region.detach_block(block)
+        block = rewriter.detach_block(op.region.block)
         old_return = cast(stencil.ReturnOp, block.last_op)
 
         results = list(op.res)
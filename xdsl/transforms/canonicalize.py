@@ -1,10 +1,11 @@
+from dataclasses import dataclass, field
+
 from xdsl.context import Context
 from xdsl.dialects import builtin
 from xdsl.ir import Operation
 from xdsl.passes import ModulePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
-    PatternRewriter,
     PatternRewriteWalker,
     RewritePattern,
 )
@@ -12,18 +13,35 @@ from xdsl.traits import HasCanonicalizationPatternsTrait
 from xdsl.transforms.dead_code_elimination import RemoveUnusedOperations, region_dce
 
 
-class CanonicalizationRewritePattern(RewritePattern):
-    """Rewrite pattern that applies a canonicalization pattern."""
+@dataclass(eq=False, repr=False)
+class CanonicalizationRewritePattern(GreedyRewritePatternApplier):
+    """
+    Rewrite pattern that applies the canonicalization patterns of each operation.
+    The patterns of an operation type are created on the first operation of this
+    type.
+    """
+
+    rewrite_patterns: list[RewritePattern] = field(
+        default_factory=list[RewritePattern], init=False
+    )
 
-    def match_and_rewrite(self, op: Operation, rewriter: PatternRewriter, /):
-        trait = op.get_trait(HasCanonicalizationPatternsTrait)
-        if trait is None:
-            return
-        patterns = trait.get_canonicalization_patterns()
-        if len(patterns) == 1:
-            patterns[0].match_and_rewrite(op, rewriter)
-            return
-        GreedyRewritePatternApplier(list(patterns)).match_and_rewrite(op, rewriter)
+    def get_patterns_for_op_type(
+        self, op_type: type[Operation]
+    ) -> tuple[RewritePattern, ...]:
+        if (patterns := self._patterns_by_op_type.get(op_type)) is None:
+            trait = op_type.get_trait(HasCanonicalizationPatternsTrait)
+            patterns = (
+                ()
+                if trait is None
+                else tuple(
+                    sorted(
+                        trait.get_canonicalization_patterns(),
+                        key=lambda pattern: -pattern.benefit,
+                    )
+                )
+            )
+            self._patterns_by_op_type[op_type] = patterns
+        return patterns
 
 
 class CanonicalizePass(ModulePass):
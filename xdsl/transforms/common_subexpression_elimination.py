@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 
 from typing_extensions import TypeVar
@@ -5,10 +6,12 @@ from typing_extensions import TypeVar
 from xdsl.context import Context
 from xdsl.dialects.builtin import ModuleOp, UnregisteredOp
 from xdsl.ir import Block, Operation, Region, Use
+from xdsl.irdl.dominance import DominanceInfoCache
 from xdsl.passes import ModulePass
 from xdsl.pattern_rewriter import PatternRewriter
 from xdsl.rewriter import Rewriter
 from xdsl.traits import (
+    HasGraphRegions,
     IsolatedFromAbove,
     IsTerminator,
     MemoryEffectKind,
@@ -73,21 +76,58 @@ class KnownOps:
     Cache dictionary for known operations used in CSE.
     It quacks like a dict[Operation, Operation], but uses OperationInfo of an Operation
     as the actual key.
+    Like MLIR's ScopedHashTable, it can be scoped with `push_scope` and `pop_scope`:
+    the changes made in a scope are undone when it is popped, so that entering a
+    scope does not copy the dictionary.
     """
 
     _known_ops: dict[OperationInfo, Operation]
 
+    _undo_log: list[tuple[OperationInfo, Operation | None]]
+    """
+    The keys changed in the open scopes, in order, with their previous values, or
+    `None` if they were not set.
+    """
+
+    _scopes: list[int]
+    """The length of the undo log when each open scope was pushed."""
+
     def __init__(self, known_ops: "KnownOps | None" = None):
         if known_ops is None:
             self._known_ops = {}
         else:
             self._known_ops = dict(known_ops._known_ops)
+        self._undo_log = []
+        self._scopes = []
+
+    def push_scope(self) -> None:
+        """Open a scope, whose changes are undone by the matching `pop_scope`."""
+        self._scopes.append(len(self._undo_log))
+
+    def pop_scope(self) -> None:
+        """Undo the changes made since the last `push_scope`, and close its scope."""
+        scope_start = self._scopes.pop()
+        undo_log = self._undo_log
+        known_ops = self._known_ops
+        while len(undo_log) > scope_start:
+            info, previous = undo_log.pop()
+            if previous is None:
+                del known_ops[info]
+            else:
+                known_ops[info] = previous
+
+    def _log_change(self, info: OperationInfo) -> None:
+        """Record the value of a key before it is changed in an open scope."""
+        if self._scopes:
+            self._undo_log.append((info, self._known_ops.get(info)))
 
     def __getitem__(self, k: Operation):
         return self._known_ops[OperationInfo(k)]
 
     def __setitem__(self, k: Operation, v: Operation):
-        self._known_ops[OperationInfo(k)] = v
+        info = OperationInfo(k)
+        self._log_change(info)
+        self._known_ops[info] = v
 
     def __contains__(self, k: Operation):
         return OperationInfo(k) in self._known_ops
@@ -96,7 +136,11 @@ class KnownOps:
         return self._known_ops.get(OperationInfo(k), default)
 
     def pop(self, k: Operation):
-        return self._known_ops.pop(OperationInfo(k))
+        info = OperationInfo(k)
+        value = self._known_ops.pop(info)
+        if self._scopes:
+            self._undo_log.append((info, value))
+        return value
 
 
 def has_other_side_effecting_op_in_between(
@@ -126,6 +170,9 @@ class CSEDriver:
     _rewriter: Rewriter | PatternRewriter = field(default_factory=Rewriter)
     _to_erase: set[Operation] = field(default_factory=set[Operation])
     _known_ops: KnownOps = field(default_factory=KnownOps)
+    _dominance_info_cache: DominanceInfoCache = field(
+        default_factory=DominanceInfoCache
+    )
 
     def _mark_erasure(self, op: Operation):
         self._to_erase.add(op)
@@ -225,16 +272,37 @@ class CSEDriver:
             self._simplify_operation(op)
 
     def _simplify_region(self, region: Region):
-        if not region.blocks:
+        if (entry := region.first_block) is None:
             return
 
-        if len(region.blocks) == 1:
-            old_scope = self._known_ops
-            self._known_ops = KnownOps(self._known_ops)
+        known_ops = self._known_ops
 
-            self._simplify_block(region.block)
+        if entry.next_block is None:
+            known_ops.push_scope()
+            self._simplify_block(entry)
+            known_ops.pop_scope()
+            return
+
+        # Graph regions have no dominance between their blocks, so none of their
+        # operations can replace an operation of another block.
+        if (parent := region.parent) is not None and parent.has_trait(HasGraphRegions):
+            return
 
-            self._known_ops = old_scope
+        # Simplify the blocks reachable from the entry block in a depth-first walk of
+        # the dominator tree, each block seeing the operations known in the blocks
+        # dominating it.
+        dominance = self._dominance_info_cache.dominance(region)
+        known_ops.push_scope()
+        self._simplify_block(entry)
+        stack: list[Iterator[Block]] = [iter(dominance.dominator_tree_children(entry))]
+        while stack:
+            if (child := next(stack[-1], None)) is None:
+                stack.pop()
+                known_ops.pop_scope()
+                continue
+            known_ops.push_scope()
+            self._simplify_block(child)
+            stack.append(iter(dominance.dominator_tree_children(child)))
 
     def simplify(self, thing: Operation | Block | Region):
         match thing:
@@ -251,11 +319,15 @@ class CSEDriver:
 def cse(
     thing: Operation | Block | Region,
     rewriter: Rewriter | PatternRewriter | None = None,
+    dominance_info_cache: DominanceInfoCache | None = None,
 ):
-    if rewriter is not None:
-        CSEDriver(_rewriter=rewriter).simplify(thing)
-    else:
-        CSEDriver().simplify(thing)
+    if rewriter is None:
+        rewriter = Rewriter()
+    if dominance_info_cache is None:
+        dominance_info_cache = DominanceInfoCache()
+    CSEDriver(_rewriter=rewriter, _dominance_info_cache=dominance_info_cache).simplify(
+        thing
+    )
 
 
 class CommonSubexpressionElimination(ModulePass):
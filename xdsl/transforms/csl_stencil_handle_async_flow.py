@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from xdsl.builder import ImplicitBuilder
 from xdsl.context import Context
@@ -22,6 +22,7 @@ from xdsl.ir import (
 from xdsl.passes import ModulePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
+    OperationTypeIndex,
     PatternRewriter,
     PatternRewriteWalker,
     RewritePattern,
@@ -105,6 +106,12 @@ class ConvertForLoopToCallGraphPass(RewritePattern):
 
     task_ids: list[int]
 
+    index: OperationTypeIndex | None = field(default=None)
+    """
+    An index of the operations of the module, kept up to date by the rewrites, used
+    to find the `csl_stencil.apply` ops nested in loops without walking each loop.
+    """
+
     @op_type_rewrite_pattern
     def match_and_rewrite(self, op: scf.ForOp, rewriter: PatternRewriter, /):
         if not self._is_inside_wrapper_outside_apply(op):
@@ -244,12 +251,10 @@ class ConvertForLoopToCallGraphPass(RewritePattern):
         )
         rewriter.erase_matched_op()
 
-    @staticmethod
-    def _is_inside_wrapper_outside_apply(op: Operation):
+    def _is_inside_wrapper_outside_apply(self, op: Operation):
         """Returns if the op is inside `csl_wrapper.module` and contains a `csl_stencil.apply`."""
         is_inside_wrapper = False
         is_inside_apply = False
-        has_apply_inside = False
 
         parent_op = op.parent_op()
         while parent_op:
@@ -259,10 +264,11 @@ class ConvertForLoopToCallGraphPass(RewritePattern):
                 is_inside_apply = True
             parent_op = parent_op.parent_op()
 
-        for child_op in op.walk():
-            if isinstance(child_op, csl_stencil.ApplyOp):
-                has_apply_inside = True
-                break
+        if self.index is None:
+            applies = op.walk_ops_of_type(csl_stencil.ApplyOp)
+        else:
+            applies = self.index.walk_ops_of_type(csl_stencil.ApplyOp, nested_in=op)
+        has_apply_inside = any(applies)
 
         return is_inside_wrapper and not is_inside_apply and has_apply_inside
 
@@ -304,14 +310,16 @@ class CslStencilHandleAsyncControlFlow(ModulePass):
     """
 
     def apply(self, ctx: Context, op: ModuleOp) -> None:
+        index = OperationTypeIndex(op)
         module_pass = PatternRewriteWalker(
             GreedyRewritePatternApplier(
                 [
-                    ConvertForLoopToCallGraphPass(0, list(self.task_ids)),
+                    ConvertForLoopToCallGraphPass(0, list(self.task_ids), index),
                     HandleCslStencilApplyAsyncCF(0),
                 ]
             ),
             apply_recursively=False,
+            listener=index.listener,
         )
         module_pass.rewrite_module(op)
         PatternRewriteWalker(
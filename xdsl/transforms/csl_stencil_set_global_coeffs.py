@@ -133,21 +133,18 @@ class GenerateCoeffAPICalls(RewritePattern):
         global_coeffs = []
 
         # check that all apply ops have the same coefficients
-        for apply in op.walk():
-            if isinstance(apply, csl_stencil.ApplyOp):
-                # if we have not encountered any apply op before, coeffs are simply stored, not compared
-                if not applies:
-                    if apply.coeffs:
-                        global_coeffs = sorted(
-                            apply.coeffs.data, key=lambda x: x.offset
-                        )
-                elif global_coeffs != (
-                    sorted(apply.coeffs.data, key=lambda x: x.offset)
-                    if apply.coeffs
-                    else []
-                ):
-                    return
-                applies.append(apply)
+        for apply in op.walk_ops_of_type(csl_stencil.ApplyOp):
+            # if we have not encountered any apply op before, coeffs are simply stored, not compared
+            if not applies:
+                if apply.coeffs:
+                    global_coeffs = sorted(apply.coeffs.data, key=lambda x: x.offset)
+            elif global_coeffs != (
+                sorted(apply.coeffs.data, key=lambda x: x.offset)
+                if apply.coeffs
+                else []
+            ):
+                return
+            applies.append(apply)
 
         # do nothing if there are no apply ops or no coefficients
         if not global_coeffs or not applies:
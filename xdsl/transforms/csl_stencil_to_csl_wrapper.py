@@ -179,11 +179,7 @@ class ConvertStencilFuncToModuleWrappedPattern(RewritePattern):
     def get_csl_stencil_apply_ops(
         self, op: func.FuncOp
     ) -> Sequence[csl_stencil.ApplyOp]:
-        result: list[csl_stencil.ApplyOp] = []
-        for apply_op in op.body.walk():
-            if isinstance(apply_op, csl_stencil.ApplyOp):
-                result.append(apply_op)
-        return result
+        return list(op.body.walk_ops_of_type(csl_stencil.ApplyOp))
 
     def _translate_function_args(
         self, args: Sequence[BlockArgument], attrs: ArrayAttr[DictionaryAttr] | None
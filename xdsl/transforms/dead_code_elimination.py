@@ -13,6 +13,7 @@ from xdsl.pattern_rewriter import (
 )
 from xdsl.traits import (
     IsTerminator,
+    MemoryEffect,
     MemoryEffectKind,
     SymbolOpInterface,
     get_effects,
@@ -68,13 +69,41 @@ def result_only_effects(rootOp: Operation) -> bool:
     )
 
 
+def may_be_trivially_dead(op_type: type[Operation]) -> bool:
+    """
+    Returns if operations of the given type can be trivially dead, given their traits.
+    Operations without memory effect traits, terminators and symbols never are.
+    """
+    return (
+        not op_type.get_trait(IsTerminator)
+        and not op_type.get_trait(SymbolOpInterface)
+        and bool(op_type.get_traits_of_type(MemoryEffect))
+    )
+
+
+@dataclass(eq=False)
 class RemoveUnusedOperations(RewritePattern):
     """
     Removes operations annotated with the `Pure` trait, where results have no uses.
     """
 
+    _may_be_dead: dict[type[Operation], bool] = field(
+        default_factory=dict[type[Operation], bool], init=False
+    )
+    """
+    Whether operations of each type can be trivially dead, computed from their
+    traits on the first operation of each type.
+    """
+
     def match_and_rewrite(self, op: Operation, rewriter: PatternRewriter):
-        if is_trivially_dead(op) and op.parent is not None:
+        if (may_be_dead := self._may_be_dead.get(type(op))) is None:
+            may_be_dead = self._may_be_dead[type(op)] = may_be_trivially_dead(type(op))
+        if (
+            may_be_dead
+            and all(result.first_use is None for result in op.results)
+            and result_only_effects(op)
+            and op.parent is not None
+        ):
             rewriter.erase_op(op)
 
 
@@ -136,6 +165,8 @@ class LiveSet:
             if not any(self.is_live(op) for op in block.ops) and block != first:
                 # If block is not the entry block and has no live ops then delete it
                 self.changed = True
+                if listener is not None:
+                    listener.handle_block_removal(block)
                 region.erase_block(block, safe_erase=False)
                 continue
 
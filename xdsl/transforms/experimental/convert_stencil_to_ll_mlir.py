@@ -434,20 +434,19 @@ class ApplyOpToParallel(RewritePattern):
             steps=tiled_steps,
             body=Region(body),
         )
-        for index in body.walk():
-            if isinstance(index, IndexOp):
-                offset = list(index.offset)
-                ops: list[Operation] = []
-                res: list[SSAValue] = [body.args[index.dim.value.data]]
-                if offset[index.dim.value.data] != 0:
-                    ops = [
-                        cst := arith.ConstantOp.from_int_and_width(
-                            offset[index.dim.value.data], builtin.IndexType()
-                        ),
-                        add := arith.AddiOp(body.args[index.dim.value.data], cst),
-                    ]
-                    res = [add.result]
-                rewriter.replace_op(index, ops, res)
+        for index in body.walk_ops_of_type(IndexOp):
+            offset = list(index.offset)
+            ops: list[Operation] = []
+            res: list[SSAValue] = [body.args[index.dim.value.data]]
+            if offset[index.dim.value.data] != 0:
+                ops = [
+                    cst := arith.ConstantOp.from_int_and_width(
+                        offset[index.dim.value.data], builtin.IndexType()
+                    ),
+                    add := arith.AddiOp(body.args[index.dim.value.data], cst),
+                ]
+                res = [add.result]
+            rewriter.replace_op(index, ops, res)
 
         # Get the maybe updated results
         new_results = self.return_targets[op] if op in self.return_targets else []
@@ -625,10 +624,7 @@ def _get_use_target(use: Use) -> SSAValue | None:
 def return_target_analysis(module: builtin.ModuleOp):
     return_targets: dict[ApplyOp, list[SSAValue | None]] = {}
 
-    for op in module.walk():
-        if not isinstance(op, ReturnOp):
-            continue
-
+    for op in module.walk_ops_of_type(ReturnOp):
         apply = op.parent_op()
         assert isinstance(apply, ApplyOp)
 
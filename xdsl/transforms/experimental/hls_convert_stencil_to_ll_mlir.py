@@ -853,7 +853,7 @@ class StencilAccessOpToReadBlockOp(RewritePattern):
 class StencilStoreToSubview(RewritePattern):
     @op_type_rewrite_pattern
     def match_and_rewrite(self, op: FuncOp, rewriter: PatternRewriter, /):
-        stores = [o for o in op.walk() if isinstance(o, stencil.StoreOp)]
+        stores = list(op.walk_ops_of_type(stencil.StoreOp))
 
         for store in stores:
             field = store.field
@@ -218,13 +218,12 @@ class ApplyOpTensorize(RewritePattern):
             access_patterns = dict[Operand, AccessPattern](
                 zip(op.region.block.args, op.get_accesses())
             )
-            for access_op in op.region.walk():
-                if isinstance(access_op, AccessOp):
-                    z_shift = -access_patterns[access_op.temp].halo_in_axis(2)[0]
-                    access_op.offset = IndexAttr.get(
-                        *access_op.offset.array.data[:-1],
-                        access_op.offset.array.data[-1].data + z_shift,
-                    )
+            for access_op in op.region.walk_ops_of_type(AccessOp):
+                z_shift = -access_patterns[access_op.temp].halo_in_axis(2)[0]
+                access_op.offset = IndexAttr.get(
+                    *access_op.offset.array.data[:-1],
+                    access_op.offset.array.data[-1].data + z_shift,
+                )
 
             body = Block(arg_types=op.operand_types)
             rewriter.inline_block(
@@ -49,7 +49,7 @@ class FuseMultiplyAddPass(RewritePattern):
         if (
             len(mul.res) != 1
             or self.require_erasable_mul
-            and len(set(use.operation for use in mul.res[0].uses)) != 1
+            and mul.res[0].get_unique_user() is None
         ):
             return
 
@@ -9,11 +9,14 @@ once.
 """
 
 from collections import deque
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
 
 from xdsl.builder import Builder
 from xdsl.context import Context
 from xdsl.dialects import builtin, scf
-from xdsl.ir import Operation, Region
+from xdsl.ir import Block, Operation, Region
+from xdsl.irdl.dominance import DominanceInfo, DominanceInfoCache
 from xdsl.passes import ModulePass
 from xdsl.pattern_rewriter import (
     PatternRewriter,
@@ -48,9 +51,39 @@ def can_be_hoisted(op: Operation, target_region: Region) -> bool | None:
     return True
 
 
-def _move_loop_invariant_code(region: Region, builder: Builder):
-    # add top-level operations in the loop body to the worklist
-    worklist = deque(op for block in region.blocks for op in block.ops)
+def _dominance_order(region: Region, dominance: DominanceInfo) -> Iterator[Block]:
+    """
+    Iterate the blocks of a region in a preorder of its dominator tree, followed by
+    the unreachable blocks.
+    """
+    entry = region.first_block
+    assert entry is not None
+    stack = [entry]
+    while stack:
+        block = stack.pop()
+        yield block
+        stack.extend(reversed(dominance.dominator_tree_children(block)))
+    for block in region.blocks:
+        if not dominance.is_reachable(block):
+            yield block
+
+
+def _move_loop_invariant_code(
+    region: Region,
+    builder: Builder,
+    dominance_info_cache: DominanceInfoCache | None = None,
+):
+    # add top-level operations in the loop body to the worklist, with the blocks of
+    # multi-block bodies in dominance order so that operations are visited after
+    # the operations they depend on, and hoisted in a single pass
+    blocks: Iterable[Block]
+    if len(region.blocks) < 2:
+        blocks = region.blocks
+    else:
+        if dominance_info_cache is None:
+            dominance_info_cache = DominanceInfoCache()
+        blocks = _dominance_order(region, dominance_info_cache.dominance(region))
+    worklist = deque(op for block in blocks for op in block.ops)
 
     while worklist:
         op = worklist.popleft()
@@ -78,15 +111,21 @@ def _move_loop_invariant_code(region: Region, builder: Builder):
                     worklist.append(user)
 
 
-def move_loop_invariant_code(loop: scf.ForOp):
+def move_loop_invariant_code(
+    loop: scf.ForOp, dominance_info_cache: DominanceInfoCache | None = None
+):
     builder = Builder(InsertPoint.before(loop))
-    _move_loop_invariant_code(loop.body, builder)
+    _move_loop_invariant_code(loop.body, builder, dominance_info_cache)
 
 
+@dataclass
 class LoopInvariantCodeMotion(RewritePattern):
+    dominance_info_cache: DominanceInfoCache | None = field(default=None)
+    """The cached dominance information of the loop bodies, if any."""
+
     @op_type_rewrite_pattern
     def match_and_rewrite(self, op: scf.ForOp, rewriter: PatternRewriter) -> None:
-        move_loop_invariant_code(op)
+        move_loop_invariant_code(op, self.dominance_info_cache)
 
 
 class LoopInvariantCodeMotionPass(ModulePass):
@@ -98,8 +137,10 @@ class LoopInvariantCodeMotionPass(ModulePass):
     name = "licm"
 
     def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
+        dominance_info_cache = DominanceInfoCache()
         PatternRewriteWalker(
-            LoopInvariantCodeMotion(),
+            LoopInvariantCodeMotion(dominance_info_cache),
             apply_recursively=False,
             walk_regions_first=True,
+            dominance_info_cache=dominance_info_cache,
         ).rewrite_module(op)
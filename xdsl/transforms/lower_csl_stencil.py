@@ -214,10 +214,9 @@ class GenerateCoeffAPICalls(RewritePattern):
     def match_and_rewrite(self, op: csl_wrapper.ModuleOp, rewriter: PatternRewriter, /):
         applies: list[csl_stencil.ApplyOp] = []
         has_coeffs = False
-        for apply in op.walk():
-            if isinstance(apply, csl_stencil.ApplyOp):
-                applies.append(apply)
-                has_coeffs = has_coeffs or apply.coeffs
+        for apply in op.walk_ops_of_type(csl_stencil.ApplyOp):
+            applies.append(apply)
+            has_coeffs = has_coeffs or apply.coeffs
 
         if not has_coeffs:
             return
@@ -318,9 +317,7 @@ class FullStencilAccessImmediateReductionOptimization(RewritePattern):
         pattern = wrapper.get_param_value("pattern").value.data
 
         # get csl_stencil.access ops and offsets
-        access_ops: list[csl_stencil.AccessOp] = [
-            a for a in op.receive_chunk.walk() if isinstance(a, csl_stencil.AccessOp)
-        ]
+        access_ops = list(op.receive_chunk.walk_ops_of_type(csl_stencil.AccessOp))
         offsets = set(tuple(a.offset) for a in access_ops)
 
         # this rewrite only works if all points in the stencil shape are accessed
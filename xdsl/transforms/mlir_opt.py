@@ -30,8 +30,11 @@ class MLIROptPass(ModulePass):
             raise ValueError(f"{self.executable} is not available")
 
         stream = StringIO()
-        printer = Printer(print_generic_format=self.generic, stream=stream)
+        printer = Printer(
+            print_generic_format=self.generic, stream=stream, buffered=True
+        )
         printer.print_op(op)
+        printer.flush()
 
         my_string = stream.getvalue()
 
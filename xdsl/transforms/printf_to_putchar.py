@@ -214,9 +214,7 @@ class PrintfToPutcharPass(ModulePass):
     # lower to func.call
     def apply(self, ctx: Context, op: ModuleOp) -> None:
         # Check if there are any printints
-        contains_printint = any(
-            isinstance(op_in_module, PrintIntOp) for op_in_module in op.walk()
-        )
+        contains_printint = any(op.walk_ops_of_type(PrintIntOp))
         if contains_printint:
             print_int_walker = PatternRewriteWalker(
                 ConvertPrintIntToItoa(),
@@ -228,9 +226,7 @@ class PrintfToPutcharPass(ModulePass):
             # Add function implementation for mlir_itoa if it isn't there already
             SymbolTable.insert_or_update(op, get_mlir_itoa())
         # Check if there are any printchars
-        contains_printchar = any(
-            isinstance(op_in_module, PrintCharOp) for op_in_module in op.walk()
-        )
+        contains_printchar = any(op.walk_ops_of_type(PrintCharOp))
         if contains_printchar:
             print_char_walker = PatternRewriteWalker(
                 LowerPrintCharToPutchar(),
@@ -117,8 +117,7 @@ def is_inlining_possible(producer: ApplyOp, consumer: ApplyOp):
     # Don't inline any producer with conditional writes.
     r = not any(
         store_result.arg is None
-        for store_result in producer.walk()
-        if isinstance(store_result, StoreResultOp)
+        for store_result in producer.walk_ops_of_type(StoreResultOp)
     ) and not any(
         # Don't inline any dynamic accesses.
         isinstance(use.operation, DynAccessOp)
@@ -158,6 +158,8 @@ class TestSpecialisedConstantFoldingPass(ModulePass):
                     if prev_op is None:
                         # No `prev_op`, means `next_op` is the first op in the block.
                         old_op.parent._first_op = new_op  # pyright: ignore[reportOptionalMemberAccess,reportPrivateUsage]
+                    ## Elide numbering the new operation, renumber lazily instead
+                    old_op.parent._invalidate_op_order()  # pyright: ignore[reportOptionalMemberAccess,reportPrivateUsage]
 
                     ## There are no callbacks, so can elide `rewriter.handle_operation_replacement(op_)`
 
@@ -179,6 +181,7 @@ class TestSpecialisedConstantFoldingPass(ModulePass):
 
                         if prev_use is None:
                             operands[use.index].first_use = next_use
+                        operands[use.index]._num_uses -= 1  # pyright: ignore[reportPrivateUsage]
                         ## Inline `new_result.add_use(Use(use.operation, use.index))`
                         first_use = new_result.first_use
                         use._next_use = first_use  # pyright: ignore[reportPrivateUsage]
@@ -186,6 +189,7 @@ class TestSpecialisedConstantFoldingPass(ModulePass):
                         if first_use is not None:
                             first_use._prev_use = use  # pyright: ignore[reportPrivateUsage]
                         new_result.first_use = use
+                        new_result._num_uses += 1  # pyright: ignore[reportPrivateUsage]
                         new_operands = (
                             *operands[: use.index],
                             new_result,
@@ -236,6 +240,7 @@ class TestSpecialisedConstantFoldingPass(ModulePass):
 
                         if prev_use is None:
                             operand.first_use = next_use
+                        operand._num_uses -= 1  # pyright: ignore[reportPrivateUsage]
                     ## This application has no regions, so no recursive drops
 
                     for result in old_op.results:
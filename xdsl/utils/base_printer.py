@@ -3,15 +3,31 @@ from __future__ import annotations
 from collections.abc import Callable, Iterable
 from contextlib import contextmanager
 from dataclasses import dataclass, field
+from functools import cache
 from typing import IO, Any
 
 from typing_extensions import TypeVar
 
+_MAX_BUFFERED_STRINGS = 1 << 14
+"""The number of strings a buffered printer collects before writing them."""
+
+
+@cache
+def _new_line(num_spaces: int) -> str:
+    """Return a newline followed by the indentation of `num_spaces` spaces."""
+    return "\n" + " " * num_spaces
+
 
 @dataclass(eq=False, repr=False)
 class BasePrinter:
     stream: IO[str] | None = field(default=None)
     indent_num_spaces: int = field(default=2, kw_only=True)
+    buffered: bool = field(default=False, kw_only=True)
+    """
+    Collect the printed strings, and write them to the stream in large chunks,
+    instead of writing each of them.
+    The printer should then be flushed once printing is done.
+    """
     _indent: int = field(default=0, init=False)
     _current_line: int = field(default=0, init=False)
     _current_column: int = field(default=0, init=False)
@@ -19,6 +35,24 @@ class BasePrinter:
     _next_line_callback: list[Callable[[], None]] = field(
         default_factory=list[Callable[[], None]], init=False
     )
+    _buffer: list[str] = field(default_factory=list[str], init=False)
+
+    def _write(self, text: str) -> None:
+        """Write a string to the stream, bypassing line and column tracking."""
+        if not self.buffered:
+            print(text, end="", file=self.stream)
+            return
+        buffer = self._buffer
+        buffer.append(text)
+        if len(buffer) >= _MAX_BUFFERED_STRINGS:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the strings collected by a buffered printer to the stream."""
+        if self._buffer:
+            text = "".join(self._buffer)
+            self._buffer.clear()
+            print(text, end="", file=self.stream)
 
     def print_string(self, text: str, *, indent: int | None = None) -> None:
         """
@@ -30,32 +64,33 @@ class BasePrinter:
         then the `Printer` instance's indentation level is used.
         """
 
-        num_newlines = text.count("\n")
-
-        if not num_newlines:
+        if "\n" not in text:
             self._current_column += len(text)
-            print(text, end="", file=self.stream)
+            self._write(text)
             return
 
         indent = self._indent if indent is None else indent
-        lines = text.split("\n")
 
-        if indent == 0 and not self._next_line_callback:
-            # No indent and no callback to print after the next newline, the text
-            # can be printed directly.
-            self._current_line += num_newlines
-            self._current_column = len(lines[-1])
-            print(text, end="", file=self.stream)
+        if not self._next_line_callback:
+            # No callback to print after the next newline, the text can be printed
+            # at once, with the indentation inserted after each newline.
+            num_spaces = indent * self.indent_num_spaces
+            self._current_line += text.count("\n")
+            self._current_column = num_spaces + len(text) - text.rfind("\n") - 1
+            if num_spaces:
+                text = text.replace("\n", _new_line(num_spaces))
+            self._write(text)
             return
 
         # Line and column information is not computed ahead of time
         # as indent-aware newline printing may use it as part of
         # callbacks.
-        print(lines[0], end="", file=self.stream)
+        lines = text.split("\n")
+        self._write(lines[0])
         self._current_column += len(lines[0])
         for line in lines[1:]:
             self._print_new_line(indent=indent)
-            print(line, end="", file=self.stream)
+            self._write(line)
             self._current_column += len(line)
 
     T = TypeVar("T")
@@ -90,16 +125,19 @@ class BasePrinter:
         self, indent: int | None = None, print_message: bool = True
     ) -> None:
         indent = self._indent if indent is None else indent
-        # Prints a newline, bypassing the `print_string` method
-        print(file=self.stream)
+        num_spaces = indent * self.indent_num_spaces
         self._current_line += 1
-        if print_message:
+        if print_message and self._next_line_callback:
+            # Prints a newline, bypassing the `print_string` method
+            self._write("\n")
             for callback in self._next_line_callback:
                 callback()
             self._next_line_callback = []
-        num_spaces = indent * self.indent_num_spaces
-        # Prints indentation, bypassing the `print_string` method
-        print(" " * num_spaces, end="", file=self.stream)
+            # Prints indentation, bypassing the `print_string` method
+            self._write(" " * num_spaces)
+        else:
+            # Prints a newline and indentation, bypassing the `print_string` method
+            self._write(_new_line(num_spaces))
         self._current_column = num_spaces
 
     @contextmanager
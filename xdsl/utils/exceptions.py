@@ -137,6 +137,10 @@ class MultipleSpansParseError(ParseError):
         return res
 
 
+class BytecodeError(Exception):
+    """An error in the encoding of an MLIR bytecode file."""
+
+
 class PassPipelineParseError(BaseException):
     def __init__(self, token: Token, msg: str):
         super().__init__(
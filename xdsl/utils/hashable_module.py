@@ -2,7 +2,6 @@ from collections.abc import Hashable
 from dataclasses import dataclass
 
 from xdsl.dialects.builtin import ModuleOp
-from xdsl.utils.hasher import Hasher
 
 
 @dataclass(frozen=True)
@@ -21,11 +20,11 @@ class HashableModule(Hashable):
 
     def __hash__(self) -> int:
         """
-        The hash of the module is a hash of the ordered combination of operation names.
-        As most transformations on IR modify at least one operation, this should be
-        enough to minimise collisions.
+        The hash of the module is its structural hash, which combines the names,
+        attributes, properties, types, and operand wiring of all nested operations.
+        It is cached on the operations, so only the operations that were
+        invalidated since the last hash are rehashed. In-place changes to the
+        attributes or properties dictionaries of an operation are not tracked, and
+        should be followed by `Operation.invalidate_structural_hash`.
         """
-        hasher = Hasher()
-        for op in self.module.walk():
-            hasher.combine(op.name)
-        return hasher.hash
+        return self.module.structural_hash()
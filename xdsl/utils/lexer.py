@@ -3,8 +3,8 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from io import StringIO
-from typing import Generic, NamedTuple
+from io import StringIO, TextIOBase
+from typing import IO, Generic, NamedTuple
 
 from typing_extensions import TypeVar
 
@@ -32,34 +32,72 @@ class Location(NamedTuple):
 class Input:
     """
     Used to keep track of the input when parsing.
+    An input can be a view of a part of its content, from `start` to `len`, in which
+    case positions are still given relative to the whole content.
     """
 
     content: str = field(repr=False)
     name: str
+    start: Position = field(default=0, kw_only=True)
+    """The position of the beginning of the input in the content."""
+    end: Position | None = field(default=None, kw_only=True, repr=False)
+    """
+    The position of the end of the input in the content, or `None` for the end of
+    the content.
+    """
     len: int = field(init=False, repr=False)
+    """The position of the end of the input in the content."""
 
     def __post_init__(self):
-        object.__setattr__(self, "len", len(self.content))
+        object.__setattr__(
+            self, "len", len(self.content) if self.end is None else self.end
+        )
 
     def __len__(self):
         return self.len
 
+    @staticmethod
+    def from_stream(stream: IO[str], name: str) -> Input:
+        """
+        Read the whole content of a text stream.
+        The content is read once, and can then be split into views without copies.
+        """
+        return Input(stream.read(), name)
+
+    def view(self, start: Position, end: Position) -> Input:
+        """
+        Get the part of the input between `start` and `end`, without copying it.
+        """
+        return Input(self.content, self.name, start=start, end=end)
+
+    def split(self, separator: str) -> list[Input]:
+        """
+        Split the input into views around each occurrence of `separator`.
+        """
+        views: list[Input] = []
+        start = self.start
+        while (end := self.content.find(separator, start, self.len)) != -1:
+            views.append(self.view(start, end))
+            start = end + len(separator)
+        views.append(self.view(start, self.len))
+        return views
+
     def get_start_of_line(self, pos: Position) -> Position:
         """
-        Returns the location of the last newline before `pos`, or 0 if there are no
-        previous newlines.
+        Returns the location of the last newline before `pos`, or the start of the
+        input if there are no previous newlines.
         """
         # Returns -1 if not found, meaning on first line
-        pos = self.content.rfind("\n", 0, pos)
+        pos = self.content.rfind("\n", self.start, pos)
         # If the result is not the beginning of the input, go past the matching newline
-        return pos + 1
+        return self.start if pos == -1 else pos + 1
 
     def get_end_of_line(self, pos: Position) -> Position:
         """
         Returns the position of the first newline after `pos`, or the length of the
         file if there are no more newlines.
         """
-        pos = self.content.find("\n", pos)
+        pos = self.content.find("\n", pos, self.len)
         # If the result is at the end of the input, return the length for correct slice
         # indexing
         return self.len if pos == -1 else pos
@@ -75,6 +113,44 @@ class Input:
         return self.content[start:end]
 
 
+class InputStream(TextIOBase):
+    """
+    A read-only text stream over an input.
+    Parsers taking an `Input` can use it directly, without reading the stream.
+    """
+
+    input: Input
+    """The input being read."""
+
+    _pos: Position
+
+    def __init__(self, input: Input):
+        super().__init__()
+        self.input = input
+        self._pos = input.start
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int | None = -1) -> str:
+        end = self.input.len
+        if size is not None and size >= 0:
+            end = min(end, self._pos + size)
+        res = self.input.content[self._pos : end]
+        self._pos = end
+        return res
+
+    def readline(self, size: int | None = -1) -> str:
+        end = self.input.get_end_of_line(self._pos)
+        if end < self.input.len:
+            end += 1
+        if size is not None and size >= 0:
+            end = min(end, self._pos + size)
+        res = self.input.content[self._pos : end]
+        self._pos = end
+        return res
+
+
 @dataclass(frozen=True)
 class Span:
     """
@@ -113,7 +189,9 @@ class Span:
 
     def get_location(self) -> Location:
         line_start = self.input.get_start_of_line(self.start)
-        line_index_in_source = self.input.content.count("\n", 0, line_start) + 1
+        line_index_in_source = (
+            self.input.content.count("\n", self.input.start, line_start) + 1
+        )
         line_index = line_index_in_source + self.line_offset
         column_index = self.start - line_start + 1
         return Location(self.input.name, line_index, column_index)
@@ -178,6 +256,9 @@ class Lexer(Generic[TokenKindT], ABC):
     The position can be out of bounds, in which case the lexer is in EOF state.
     """
 
+    def __post_init__(self):
+        self.pos = self.input.start
+
     def _form_token(self, kind: TokenKindT, start_pos: Position) -> Token[TokenKindT]:
         """
         Return a token with the given kind, and the start position.
@@ -4,7 +4,7 @@ import re
 from dataclasses import dataclass
 from enum import Enum
 from string import hexdigits
-from typing import Literal, TypeAlias, TypeGuard, cast, overload
+from typing import ClassVar, Literal, TypeAlias, TypeGuard, cast, overload
 
 from xdsl.utils.exceptions import ParseError
 from xdsl.utils.lexer import Lexer, Position, Span, Token
@@ -251,7 +251,7 @@ class MLIRLexer(Lexer[MLIRTokenKind]):
         Advance the lexer position to the end of the next match of the given
         regular expression.
         """
-        match = regex.match(self.input.content, self.pos)
+        match = regex.match(self.input.content, self.pos, self.input.len)
         if match is None:
             return None
         self.pos = match.end()
@@ -271,10 +271,79 @@ class MLIRLexer(Lexer[MLIRTokenKind]):
         """
         return MLIRToken(kind, Span(start_pos, self.pos, self.input))
 
+    _token_regex = re.compile(
+        r"""(?:\s|//[^\n]*(?![^\n]))*
+        (?:
+          (?P<BARE_IDENT>[a-zA-Z_][a-zA-Z0-9_$.]*)
+        | (?P<PERCENT_IDENT>%(?:[0-9]+|[a-zA-Z$._-][a-zA-Z0-9$._-]*))
+        | (?P<FILE_METADATA_END>\#-\})
+        | (?P<HASH_IDENT>\#(?:[0-9]+|[a-zA-Z$._-][a-zA-Z0-9$._-]*))
+        | (?P<EXCLAMATION_IDENT>!(?:[0-9]+|[a-zA-Z$._-][a-zA-Z0-9$._-]*))
+        | (?P<CARET_IDENT>\^(?:[0-9]+|[a-zA-Z$._-][a-zA-Z0-9$._-]*))
+        | (?P<AT_IDENT>@(?:[a-zA-Z_][a-zA-Z0-9_$.]*|"[^"\\\n\v\f]*(?:\\[nt"\\][^"\\\n\v\f]*)*"))
+        | (?P<STRING_LIT>"[^"\\\n\v\f]*(?:\\[nt"\\][^"\\\n\v\f]*)*")
+        | (?P<INTEGER_LIT_HEX>0x[0-9a-fA-F]+)
+        | (?P<FLOAT_LIT>[0-9]+\.[0-9]*(?:[eE][+-]?[0-9]+)?)
+        | (?P<INTEGER_LIT>[0-9]+)
+        | (?P<ARROW>->)
+        | (?P<FILE_METADATA_BEGIN>\{-\#)
+        | (?P<PUNCTUATION>[:,()}\[\]<>=+*?|{-])
+        | (?P<ELLIPSIS>\.\.\.)
+        | (?P<EOF>\Z)
+        )""",
+        re.ASCII | re.VERBOSE,
+    )
+    """
+    Matches the whitespace and comments before a token, and the token itself for
+    the common cases.
+    Whitespace and comments can only be matched in one way, so that a failed match
+    does not backtrack over them.
+    The kind of the token is given by the name of the matched group.
+    Tokens that are not matched, such as bytes literals or invalid tokens, are
+    lexed character by character.
+    """
+
+    _token_group_kinds: ClassVar[dict[str, MLIRTokenKind]] = {
+        "BARE_IDENT": MLIRTokenKind.BARE_IDENT,
+        "PERCENT_IDENT": MLIRTokenKind.PERCENT_IDENT,
+        "FILE_METADATA_END": MLIRTokenKind.FILE_METADATA_END,
+        "HASH_IDENT": MLIRTokenKind.HASH_IDENT,
+        "EXCLAMATION_IDENT": MLIRTokenKind.EXCLAMATION_IDENT,
+        "CARET_IDENT": MLIRTokenKind.CARET_IDENT,
+        "AT_IDENT": MLIRTokenKind.AT_IDENT,
+        "STRING_LIT": MLIRTokenKind.STRING_LIT,
+        "INTEGER_LIT_HEX": MLIRTokenKind.INTEGER_LIT,
+        "FLOAT_LIT": MLIRTokenKind.FLOAT_LIT,
+        "INTEGER_LIT": MLIRTokenKind.INTEGER_LIT,
+        "ARROW": MLIRTokenKind.ARROW,
+        "FILE_METADATA_BEGIN": MLIRTokenKind.FILE_METADATA_BEGIN,
+        "ELLIPSIS": MLIRTokenKind.ELLIPSIS,
+        "EOF": MLIRTokenKind.EOF,
+    }
+
+    _punctuation_kinds: ClassVar[dict[str, MLIRTokenKind]] = (
+        MLIRTokenKind.get_punctuation_spelling_to_kind_dict()
+    )
+
     def lex(self) -> MLIRToken:
         """
         Lex a token from the input, and returns it.
         """
+        match = self._token_regex.match(self.input.content, self.pos, self.input.len)
+        if match is None or (group := match.lastgroup) is None:
+            return self._lex_slow()
+        end = self.pos = match.end()
+        if group == "PUNCTUATION":
+            kind = self._punctuation_kinds[match.group(group)]
+        else:
+            kind = self._token_group_kinds[group]
+        return MLIRToken(kind, Span(match.start(group), end, self.input))
+
+    def _lex_slow(self) -> MLIRToken:
+        """
+        Lex a token from the input character by character, and returns it.
+        This handles all tokens, and reports errors for invalid ones.
+        """
         # First, skip whitespaces
         self._consume_whitespace()
 
@@ -1,20 +1,26 @@
+from __future__ import annotations
+
 import argparse
+import inspect
 import sys
 from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import redirect_stdout
 from importlib.metadata import version
-from io import StringIO
-from itertools import accumulate
-from typing import IO, Any
+from io import BytesIO, StringIO
+from itertools import accumulate, repeat
+from typing import IO, Any, TextIO, cast
 
+from xdsl.bytecode.writer import write_bytecode
 from xdsl.context import Context
 from xdsl.dialects.builtin import ModuleOp
 from xdsl.passes import ModulePass, PassPipeline
+from xdsl.pattern_rewriter import collect_pattern_statistics
 from xdsl.printer import Printer
 from xdsl.tools.command_line_tool import CommandLineTool
 from xdsl.transforms import get_all_passes
 from xdsl.utils.exceptions import DiagnosticException, ParseError, ShrinkException
-from xdsl.utils.lexer import Span
+from xdsl.utils.lexer import Input, InputStream, Span
 
 
 class xDSLOptMain(CommandLineTool):
@@ -29,17 +35,33 @@ class xDSLOptMain(CommandLineTool):
     stream.
     """
 
+    available_binary_targets: dict[str, Callable[[ModuleOp, IO[bytes]], None]]
+    """
+    A mapping from target names to functions that serialize a ModuleOp into a
+    binary stream.
+    """
+
     pipeline: PassPipeline
     """ The pass-pipeline to be applied. """
 
+    _description: str
+    """The description given to this tool, to create it in worker processes."""
+
+    _arguments: list[str]
+    """The arguments given to this tool, to create it in worker processes."""
+
     def __init__(
         self,
         description: str = "xDSL modular optimizer driver",
         args: Sequence[str] | None = None,
     ):
+        self._description = description
+        self._arguments = sys.argv[1:] if args is None else list(args)
+
         self.available_frontends = {}
         self.available_passes = {}
         self.available_targets = {}
+        self.available_binary_targets = {}
 
         self.ctx = Context()
         self.register_all_dialects()
@@ -61,36 +83,21 @@ class xDSLOptMain(CommandLineTool):
         Executes the different steps.
         """
         chunks, file_extension = self.prepare_input()
+        if self.args.target in self.available_binary_targets and len(chunks) > 1:
+            for chunk, _ in chunks:
+                chunk.close()
+            raise ValueError(
+                f"Target '{self.args.target}' cannot output multiple chunks"
+            )
         output_stream = self.prepare_output()
         try:
-            for i, (chunk, offset) in enumerate(chunks):
-                try:
+            if self.args.jobs > 1 and len(chunks) > 1:
+                self.run_chunks_in_parallel(chunks, file_extension, output_stream)
+            else:
+                for i, (chunk, offset) in enumerate(chunks):
                     if i > 0:
                         output_stream.write("// -----\n")
-                    module = self.parse_chunk(chunk, file_extension, offset)
-
-                    if module is not None:
-                        if self.apply_passes(module):
-                            output_stream.write(self.output_resulting_program(module))
-                    output_stream.flush()
-                except ParseError as e:
-                    s = e.span
-                    e.span = Span(s.start, s.end, s.input, offset)
-                    if self.args.parsing_diagnostics:
-                        print(e)
-                    else:
-                        raise
-                except DiagnosticException as e:
-                    if self.args.verify_diagnostics:
-                        print(e)
-                        # __notes__ only in Python 3.11 and above
-                        if hasattr(e, "__notes__"):
-                            for e in getattr(e, "__notes__"):
-                                print(e)
-                    else:
-                        raise
-                finally:
-                    chunk.close()
+                    self.run_chunk(chunk, file_extension, offset, output_stream)
         except ShrinkException:
             assert self.args.shrink
             print("Success, can shrink")
@@ -104,6 +111,116 @@ class xDSLOptMain(CommandLineTool):
             # Exit with non-0 value to let shrinkray know that it cannot shrink
             exit(1)
 
+    def run_chunk(
+        self,
+        chunk: IO[str],
+        file_extension: str,
+        offset: int,
+        output_stream: IO[str],
+    ) -> None:
+        """
+        Parse a chunk of the input, apply the passes, and write the resulting program
+        to the output stream.
+        Diagnostics are printed instead of raised if requested.
+        """
+        try:
+            module = self.parse_chunk(chunk, file_extension, offset)
+
+            if module is not None:
+                if self.apply_passes(module):
+                    _write_output(output_stream, self.output_resulting_program(module))
+            output_stream.flush()
+        except ParseError as e:
+            s = e.span
+            e.span = Span(s.start, s.end, s.input, offset)
+            if self.args.parsing_diagnostics:
+                print(e)
+            else:
+                raise
+        except DiagnosticException as e:
+            if self.args.verify_diagnostics:
+                print(e)
+                # __notes__ only in Python 3.11 and above
+                if hasattr(e, "__notes__"):
+                    for e in getattr(e, "__notes__"):
+                        print(e)
+            else:
+                raise
+        finally:
+            chunk.close()
+
+    def run_chunks_in_parallel(
+        self,
+        chunks: list[tuple[IO[str], int]],
+        file_extension: str,
+        output_stream: IO[str],
+    ) -> None:
+        """
+        Process the chunks of the input in a pool of `--jobs` worker processes.
+        The chunks must be views of a single input, as created by `prepare_input`.
+        The input is given once to each worker, which inherits it when forked, and
+        the chunks are sent as their positions in it.
+
+        Each worker creates its own instance of this tool, and so its own context and
+        pipeline, by calling `type(self)(description=..., args=...)` with the
+        description and arguments this tool was created with. Subclasses must
+        therefore accept these two keyword arguments, and register their dialects,
+        passes, and targets in their constructor rather than after it.
+
+        The standard output and the resulting program of each chunk are written in
+        the order of the chunks, and the first error is raised after the output of
+        the previous chunks.
+        """
+        try:
+            inspect.signature(type(self)).bind(
+                description=self._description, args=self._arguments
+            )
+        except TypeError as e:
+            raise ValueError(
+                f"{type(self).__name__} cannot run with --jobs, as its workers are "
+                "created with the description and arguments of the tool"
+            ) from e
+
+        input: Input | None = None
+        positions: list[tuple[int, int]] = []
+        offsets: list[int] = []
+        for chunk, offset in chunks:
+            if not isinstance(chunk, InputStream) or (
+                input is not None and chunk.input.content is not input.content
+            ):
+                raise ValueError(
+                    "Only the chunks of a single input can run in parallel"
+                )
+            input = chunk.input
+            positions.append((chunk.input.start, chunk.input.len))
+            offsets.append(offset)
+            chunk.close()
+        assert input is not None
+
+        jobs = min(self.args.jobs, len(chunks))
+        with ProcessPoolExecutor(
+            jobs,
+            initializer=_init_worker,
+            initargs=(type(self), self._description, self._arguments, input),
+        ) as executor:
+            try:
+                results = executor.map(
+                    _run_chunk_in_worker,
+                    positions,
+                    repeat(file_extension),
+                    offsets,
+                    chunksize=max(1, len(chunks) // (jobs * 4)),
+                )
+                for i, (printed, output) in enumerate(results):
+                    if i > 0:
+                        output_stream.write("// -----\n")
+                    sys.stdout.write(printed)
+                    output_stream.write(output)
+                    output_stream.flush()
+            except BaseException:
+                executor.shutdown(cancel_futures=True)
+                raise
+
     def register_all_arguments(self, arg_parser: argparse.ArgumentParser):
         """
         Registers all the command line arguments that are used by this tool.
@@ -112,7 +229,7 @@ class xDSLOptMain(CommandLineTool):
         """
         super().register_all_arguments(arg_parser)
 
-        targets = [name for name in self.available_targets]
+        targets = [*self.available_targets, *self.available_binary_targets]
         arg_parser.add_argument(
             "-t",
             "--target",
@@ -168,6 +285,43 @@ class xDSLOptMain(CommandLineTool):
             "independently by using `// -----`",
         )
 
+        arg_parser.add_argument(
+            "-j",
+            "--jobs",
+            type=int,
+            default=1,
+            help="Process the chunks of a split input file in this number of "
+            "parallel processes, each creating its own instance of this tool",
+        )
+
+        arg_parser.add_argument(
+            "--print-jobs",
+            type=int,
+            default=1,
+            help="Print the operations isolated from above of a module, such as "
+            "functions, in this number of parallel processes",
+        )
+
+        arg_parser.add_argument(
+            "--pattern-statistics",
+            nargs="?",
+            const="text",
+            choices=("text", "json"),
+            default=None,
+            help="Print to stderr the number of attempts, successes, time, and "
+            "created and erased operations of each rewrite pattern applied by the "
+            "passes, as a text table (default) or as JSON",
+        )
+
+        arg_parser.add_argument(
+            "--elide-large-elements-attrs",
+            type=int,
+            default=None,
+            metavar="N",
+            help="Print dense elements attributes with more than N elements as "
+            "dense_resource<__elided__>",
+        )
+
         arg_parser.add_argument(
             "--print-op-generic",
             default=False,
@@ -234,9 +388,13 @@ class xDSLOptMain(CommandLineTool):
                 print_generic_format=self.args.print_op_generic,
                 print_properties_as_attributes=self.args.print_no_properties,
                 print_debuginfo=self.args.print_debuginfo,
+                buffered=True,
+                print_jobs=self.args.print_jobs,
+                elide_large_elements_attrs=self.args.elide_large_elements_attrs,
             )
             printer.print_op(prog)
             printer.print_metadata(self.ctx.loaded_dialects)
+            printer.flush()
             print("\n", file=output)
 
         def _output_riscv_asm(prog: ModuleOp, output: IO[str]):
@@ -296,6 +454,11 @@ class xDSLOptMain(CommandLineTool):
         self.available_targets["wgsl"] = _output_wgsl
         self.available_targets["x86-asm"] = _output_x86_asm
 
+        def _output_mlirbc(prog: ModuleOp, output: IO[bytes]):
+            write_bytecode(prog, output, self.ctx.loaded_dialects)
+
+        self.available_binary_targets["mlirbc"] = _output_mlirbc
+
     def setup_pipeline(self):
         """
         Creates a pipeline that consists of all the passes specified.
@@ -310,8 +473,13 @@ class xDSLOptMain(CommandLineTool):
                 module.verify()
             if self.args.print_between_passes:
                 print(f"IR after {previous_pass.name}:")
-                printer = Printer(stream=sys.stdout)
+                printer = Printer(
+                    stream=sys.stdout,
+                    buffered=True,
+                    elide_large_elements_attrs=self.args.elide_large_elements_attrs,
+                )
                 printer.print_op(module)
+                printer.flush()
                 print("\n\n\n")
 
         self.pipeline = PassPipeline.parse_spec(
@@ -329,27 +497,31 @@ class xDSLOptMain(CommandLineTool):
         # when using the split input flag, program is split into multiple chunks
         # it's used for split input file
 
-        chunks: list[tuple[IO[str], int]] = []
         f, file_extension = self.get_input_stream()
-        chunks = [(f, 0)]
-        if self.args.split_input_file:
-            chunks_str = [chunk for chunk in f.read().split("// -----")]
-            chunks_off = accumulate(
-                [0, *[chunk.count("\n") for chunk in chunks_str[:-1]]]
-            )
-            chunks = [
-                (StringIO(chunk), off)
-                for chunk, off in zip(chunks_str, chunks_off, strict=True)
-            ]
-            f.close()
         if self.args.frontend:
             file_extension = self.args.frontend
 
         if file_extension not in self.available_frontends:
-            for chunk, _ in chunks:
-                chunk.close()
+            f.close()
             raise ValueError(f"Unrecognized file extension '{file_extension}'")
 
+        if file_extension in self.binary_frontends:
+            # Binary inputs are read by their frontend, and cannot be split
+            return [(f, 0)], file_extension
+
+        input = Input.from_stream(f, self.get_input_name())
+        f.close()
+        views = [input]
+        if self.args.split_input_file:
+            # Chunks are views of the input rather than copies
+            views = input.split("// -----")
+        chunks_off = accumulate(
+            [0, *[input.content.count("\n", v.start, v.len) for v in views[:-1]]]
+        )
+        chunks: list[tuple[IO[str], int]] = [
+            (InputStream(view), off)
+            for view, off in zip(views, chunks_off, strict=True)
+        ]
         return chunks, file_extension
 
     def prepare_output(self) -> IO[str]:
@@ -362,18 +534,41 @@ class xDSLOptMain(CommandLineTool):
         """Apply passes in order."""
         if not self.args.disable_verify:
             prog.verify()
-        self.pipeline.apply(self.ctx, prog)
+        if self.args.pattern_statistics is None:
+            self.pipeline.apply(self.ctx, prog)
+        else:
+            with collect_pattern_statistics() as statistics:
+                try:
+                    self.pipeline.apply(self.ctx, prog)
+                finally:
+                    if self.args.pattern_statistics == "json":
+                        statistics.print_json(sys.stderr)
+                    else:
+                        statistics.print_text(sys.stderr)
         if not self.args.disable_verify:
             prog.verify()
         return True
 
-    def output_resulting_program(self, prog: ModuleOp) -> str:
-        """Get the resulting program."""
+    def output_resulting_program(self, prog: ModuleOp) -> str | bytes:
+        """Get the resulting program, which is binary for binary targets."""
+        if (target := self.available_binary_targets.get(self.args.target)) is not None:
+            binary_output = BytesIO()
+            target(prog, binary_output)
+            return binary_output.getvalue()
         output = StringIO()
         self.available_targets[self.args.target](prog, output)
         return output.getvalue()
 
 
+def _write_output(output_stream: IO[str], output: str | bytes) -> None:
+    """Write a resulting program, writing binary ones to the underlying buffer."""
+    if isinstance(output, str):
+        output_stream.write(output)
+    else:
+        output_stream.flush()
+        cast(TextIO, output_stream).buffer.write(output)
+
+
 class VersionAction(argparse.Action):
     def __init__(self, *args: Any, **kwargs: Any):
         super().__init__(nargs=0, *args, **kwargs)
@@ -387,3 +582,38 @@ class VersionAction(argparse.Action):
     ) -> None:
         print(f"xdsl-opt built from xdsl version {version('xdsl')}\n")
         parser.exit()
+
+
+_worker_main: xDSLOptMain | None = None
+"""The instance of the tool of the current `xdsl-opt --jobs` worker process."""
+
+_worker_input: Input | None = None
+"""The input whose chunks are processed by the current worker process."""
+
+
+def _init_worker(
+    cls: type[xDSLOptMain], description: str, arguments: Sequence[str], input: Input
+) -> None:
+    global _worker_main, _worker_input
+    _worker_main = cls(description=description, args=arguments)
+    # The worker processes a single chunk at a time
+    _worker_main.args.jobs = 1
+    _worker_input = input
+
+
+def _run_chunk_in_worker(
+    position: tuple[int, int], file_extension: str, offset: int
+) -> tuple[str, str]:
+    """
+    Process the chunk of the input between the given positions in a worker process,
+    and return what it printed to the standard output along with the resulting
+    program.
+    """
+    assert _worker_main is not None
+    assert _worker_input is not None
+    input = _worker_input.view(*position)
+    printed = StringIO()
+    output = StringIO()
+    with redirect_stdout(printed):
+        _worker_main.run_chunk(InputStream(input), file_extension, offset, output)
+    return printed.getvalue(), output.getvalue()